@@ -0,0 +1,172 @@
+"""Benchmark dos perfis de PRAGMA SQLite nos padrões de escrita do app.
+
+Para cada perfil (legacy, balanced, durable) mede:
+    - status: transações curtas alternando status de HabitInstance
+      (cada clique na TUI é um commit)
+    - timer: ciclo start/stop de TimeLog (insert + update por ciclo)
+    - concurrent: dois processos (CLI e TUI) gravando ao mesmo tempo
+      enquanto um terceiro lê; conta erros "database is locked"
+
+Uso:
+    python scripts/bench_sqlite_profiles.py
+    python scripts/bench_sqlite_profiles.py --ops 2000 --profiles legacy balanced
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+from datetime import date, datetime
+from datetime import time as dt_time
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session, SQLModel
+
+from timeblock.database.engine import dispose_engines, get_engine
+from timeblock.database.pragmas import PROFILES
+from timeblock.models import Habit, HabitInstance, Recurrence, Routine, TimeLog
+from timeblock.models.enums import Status, TimerStatus
+
+
+def _use(db_path: Path, profile: str) -> None:
+    """Aponta o registro de engines para o banco e perfil indicados."""
+    os.environ["TIMEBLOCK_DB_PATH"] = str(db_path)
+    os.environ["ATOMVS_SQLITE_PROFILE"] = profile
+    dispose_engines()
+
+
+def setup(db_path: Path, profile: str) -> int:
+    """Cria schema, uma rotina com hábito e uma instância; retorna o id."""
+    _use(db_path, profile)
+    engine = get_engine()
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        routine = Routine(name="Bench")
+        session.add(routine)
+        session.commit()
+        habit = Habit(
+            routine_id=routine.id,
+            title="Bench",
+            scheduled_start=dt_time(8, 0),
+            scheduled_end=dt_time(9, 0),
+            recurrence=Recurrence.EVERYDAY,
+        )
+        session.add(habit)
+        session.commit()
+        instance = HabitInstance(
+            habit_id=habit.id,
+            date=date.today(),
+            scheduled_start=dt_time(8, 0),
+            scheduled_end=dt_time(9, 0),
+        )
+        session.add(instance)
+        session.commit()
+        assert instance.id is not None
+        return instance.id
+
+
+def bench_status(instance_id: int, ops: int) -> float:
+    """ops/s alternando status com um commit por operação."""
+    engine = get_engine()
+    start = time.perf_counter()
+    for i in range(ops):
+        with Session(engine) as session:
+            instance = session.get(HabitInstance, instance_id)
+            assert instance is not None
+            instance.status = Status.DONE if i % 2 else Status.PENDING
+            session.commit()
+    return ops / (time.perf_counter() - start)
+
+
+def bench_timer(instance_id: int, ops: int) -> float:
+    """ciclos/s de start (insert) + stop (update) de timer."""
+    engine = get_engine()
+    start = time.perf_counter()
+    for _ in range(ops // 2):
+        with Session(engine) as session:
+            timelog = TimeLog(habit_instance_id=instance_id, start_time=datetime.now())
+            session.add(timelog)
+            session.commit()
+            timelog.status = TimerStatus.DONE
+            timelog.end_time = datetime.now()
+            session.commit()
+    return (ops // 2) / (time.perf_counter() - start)
+
+
+def _writer(db_path: str, profile: str, ops: int, results: multiprocessing.Queue) -> None:
+    _use(Path(db_path), profile)
+    engine = get_engine()
+    errors = 0
+    for i in range(ops):
+        try:
+            # Padrão do ORM: lê e depois grava na mesma transação
+            with engine.begin() as conn:
+                conn.execute(text("SELECT status FROM habitinstance")).all()
+                conn.execute(
+                    text("UPDATE habitinstance SET status = :s"),
+                    {"s": "DONE" if i % 2 else "PENDING"},
+                )
+        except OperationalError:
+            errors += 1
+    dispose_engines()
+    results.put(errors)
+
+
+def _reader(db_path: str, profile: str, seconds: float) -> None:
+    _use(Path(db_path), profile)
+    engine = get_engine()
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT count(*) FROM habitinstance")).scalar()
+        except OperationalError:
+            pass
+    dispose_engines()
+
+
+def bench_concurrent(db_path: Path, profile: str, ops: int) -> tuple[float, int]:
+    """(segundos, erros de lock) para dois escritores + um leitor."""
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    writers = [
+        ctx.Process(target=_writer, args=(str(db_path), profile, ops, results)) for _ in "ab"
+    ]
+    reader = ctx.Process(target=_reader, args=(str(db_path), profile, 2.0))
+    start = time.perf_counter()
+    reader.start()
+    for proc in writers:
+        proc.start()
+    for proc in writers:
+        proc.join()
+    elapsed = time.perf_counter() - start
+    reader.join()
+    return elapsed, sum(results.get() for _ in writers)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=1000)
+    parser.add_argument("--profiles", nargs="+", default=list(PROFILES), choices=list(PROFILES))
+    args = parser.parse_args()
+
+    print(f"{'perfil':>10}  {'status op/s':>12}  {'timer ciclo/s':>13}  {'concorrente':>12}  locks")
+    with tempfile.TemporaryDirectory() as tmp:
+        for profile in args.profiles:
+            db_path = Path(tmp) / f"bench_{profile}.db"
+            instance_id = setup(db_path, profile)
+            status = bench_status(instance_id, args.ops)
+            timer = bench_timer(instance_id, args.ops)
+            dispose_engines()
+            elapsed, locks = bench_concurrent(db_path, profile, args.ops)
+            print(f"{profile:>10}  {status:>12.0f}  {timer:>13.0f}  {elapsed:>11.2f}s  {locks:>5}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,102 @@
+"""Benchmark do painel de tasks do dashboard com histórico crescente.
+
+Mede o tempo de leitura do TasksPanel (pendentes + concluídas/canceladas
+nas últimas 24h) com 1k, 10k e 100k tasks encerradas no histórico e uma
+fila ativa constante. Com os índices parciais da migração 006, o tempo
+deve permanecer praticamente constante; com --no-indexes os índices são
+removidos para comparação (full scan cresce linearmente).
+
+Uso:
+    python scripts/bench_task_panel.py
+    python scripts/bench_task_panel.py --sizes 1000 100000 --no-indexes
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import insert, text
+from sqlmodel import Session, SQLModel, create_engine
+
+from timeblock.database.migrations.migration_006_task_partial_indexes import INDEXES
+from timeblock.models import Task
+from timeblock.tui.screens.dashboard.loader import _read_tasks
+
+ACTIVE_TASKS = 20
+RECENT_TASKS = 5
+
+
+def _row(title: str, when: datetime, completed=None, cancelled=None) -> dict:
+    """Linha de task para insert em lote (chaves uniformes para executemany)."""
+    return {
+        "title": title,
+        "scheduled_datetime": when,
+        "original_scheduled_datetime": when,
+        "completed_datetime": completed,
+        "cancelled_datetime": cancelled,
+        "postponement_count": 0,
+    }
+
+
+def build_db(path: Path, history: int, with_indexes: bool):
+    """Cria banco com `history` tasks encerradas e fila ativa fixa."""
+    engine = create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(engine)
+    now = datetime.now()
+    rows = []
+    for i in range(history):
+        when = now - timedelta(days=2 + i % 900, minutes=i % 1440)
+        if i % 10 == 0:
+            rows.append(_row(f"Histórico {i}", when, cancelled=when))
+        else:
+            rows.append(_row(f"Histórico {i}", when, completed=when))
+    for i in range(ACTIVE_TASKS):
+        rows.append(_row(f"Ativa {i}", now + timedelta(hours=i - ACTIVE_TASKS // 2)))
+    for i in range(RECENT_TASKS):
+        when = now - timedelta(hours=i + 1)
+        rows.append(_row(f"Recente {i}", when, completed=when))
+    with engine.begin() as conn:
+        conn.execute(insert(Task), rows)
+        if not with_indexes:
+            for name in INDEXES:
+                conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        conn.execute(text("ANALYZE"))
+    return engine
+
+
+def measure(engine, repeat: int) -> float:
+    """Mediana (ms) de `repeat` leituras do painel, cada uma em sessão nova."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with Session(engine) as session:
+            _read_tasks(session)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--no-indexes", action="store_true", help="Remove índices parciais")
+    args = parser.parse_args()
+
+    print(f"{'histórico':>10}  {'mediana (ms)':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            engine = build_db(Path(tmp) / f"bench_{size}.db", size, not args.no_indexes)
+            try:
+                print(f"{size:>10}  {measure(engine, args.repeat):>12.2f}")
+            finally:
+                engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
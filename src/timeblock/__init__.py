@@ -1,6 +1,12 @@
 """ATOMVS Time Planner Terminal - CLI/TUI offline-first time planner tool."""
 
-from importlib.metadata import version
-
-__version__ = version("atomvs-timeblock-terminal")
 __author__ = "Fábio de Lima"
+
+
+def __getattr__(name: str) -> str:
+    # importlib.metadata custa dezenas de ms; só carrega quando pedido
+    if name == "__version__":
+        from importlib.metadata import version
+
+        return version("atomvs-timeblock-terminal")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,6 @@
 """Comandos para instâncias de hábitos (atom)."""
 
+from collections import Counter
 from datetime import date
 from datetime import time as dt_time
 
@@ -61,6 +62,8 @@ def atom_list(
     pending: bool = typer.Option(False, "--pending", "-P", help="Apenas PENDING"),
     done: bool = typer.Option(False, "--done", "-C", help="Apenas DONE"),
     all_status: bool = typer.Option(False, "--all", "-a", help="Todos status"),
+    limit: int = typer.Option(50, "--limit", "-n", help="Instâncias por página"),
+    after: int = typer.Option(None, "--after", help="ID da última instância da página anterior"),
 ):
     """
     Lista instâncias de hábitos (BR-HABITINSTANCE-006).
@@ -74,25 +77,37 @@ def atom_list(
         timeblock habit atom list 1            # Todas do hábito 1
         timeblock habit atom list -T           # Hoje, todos status
         timeblock habit atom list -T -C        # Hoje, completadas
+        timeblock habit atom list 1 --after 42 # Próxima página
     """
     try:
         date_start, date_end = _resolve_date_range(today, week, habit_id)
         status_filter = _resolve_status_filter(pending, done, all_status, habit_id)
 
+        if limit < 1:
+            raise ValueError("--limit deve ser >= 1")
+
         with get_engine_context() as engine, Session(engine) as session:
             service = HabitInstanceService()
 
-            instances = service.list_instances(
+            # Uma linha extra indica se há próxima página
+            instances = service.list_instances_page(
                 habit_id=habit_id,
                 date_start=date_start,
                 date_end=date_end,
+                status=status_filter,
+                limit=limit + 1,
+                after=after,
                 session=session,
             )
 
-            if status_filter is not None:
-                instances = [i for i in instances if i.status == status_filter]
-
-            display_instances(instances, today, week, habit_id, status_filter)
+            display_instances(
+                instances[:limit],
+                today,
+                week,
+                habit_id,
+                status_filter,
+                has_more=len(instances) > limit,
+            )
 
     except ValueError as e:
         console.print(f"[red]Erro: {e}[/red]")
@@ -134,20 +149,21 @@ def atom_generate(
             start_date = date.today()
             end_date = start_date + relativedelta(months=months) if months > 0 else start_date
 
-            total = 0
+            created = HabitInstanceService.generate_instances_bulk(
+                habit_ids=[h.id for h in habits if h.id is not None],
+                start_date=start_date,
+                end_date=end_date,
+                session=session,
+            )
+            created_by_habit = Counter(inst.habit_id for inst in created)
+
+            total = len(created)
             for habit in habits:
-                assert habit.id is not None
-                created = HabitInstanceService.generate_instances(
-                    habit_id=habit.id,
-                    start_date=start_date,
-                    end_date=end_date,
-                    session=session,
-                )
-                if created:
-                    total += len(created)
+                count = created_by_habit[habit.id] if habit.id is not None else 0
+                if count:
                     console.print(
                         f"  [green]\u2713[/green] {habit.title} ({habit.recurrence.value})"
-                        f" \u2192 {len(created)} instância(s)"
+                        f" \u2192 {count} instância(s)"
                     )
 
             if total:
@@ -1,6 +1,8 @@
 """Helpers de formatação para comandos de habit."""
 
+from collections.abc import Iterable
 from datetime import date
+from itertools import chain
 
 from rich.console import Console
 
@@ -46,26 +48,29 @@ def _resolve_status_filter(
 
 
 def display_instances(
-    instances: list,
+    instances: Iterable[HabitInstance],
     today: bool,
     week: bool,
     habit_id: int | None,
     status_filter: Status | None,
+    has_more: bool = False,
 ) -> None:
-    """Formata e exibe instâncias agrupadas por data."""
-    if not instances:
+    """Exibe instâncias agrupadas por data, à medida que são lidas.
+
+    Espera instâncias ordenadas por (date, scheduled_start), como em
+    HabitInstanceService.list_instances_page: cada grupo é impresso ao
+    mudar a data, sem acumular a lista. Com has_more, indica o --after
+    da próxima página.
+    """
+    rows = iter(instances)
+    first = next(rows, None)
+    if first is None:
         if habit_id:
             console.print(f"Nenhuma instância encontrada para hábito {habit_id}.")
         else:
             console.print("Nenhuma instância encontrada.")
         return
 
-    instances_by_date: dict[date, list] = {}
-    for inst in instances:
-        if inst.date not in instances_by_date:
-            instances_by_date[inst.date] = []
-        instances_by_date[inst.date].append(inst)
-
     period_desc = "hoje" if today else "semana atual" if week or habit_id is None else "todas"
     status_desc = (
         "pendentes"
@@ -78,11 +83,22 @@ def display_instances(
 
     weekdays = ["Segunda", "Terça", "Quarta", "Quinta", "Sexta", "Sábado", "Domingo"]
 
-    for dt in sorted(instances_by_date.keys()):
-        console.print(f"[cyan]{weekdays[dt.weekday()]}, {dt.strftime('%d/%m')}:[/cyan]")
-        for inst in sorted(instances_by_date[dt], key=lambda x: x.scheduled_start):
-            _display_single_instance(inst)
-        console.print()
+    current: date | None = None
+    last = first
+    for inst in chain([first], rows):
+        if inst.date != current:
+            if current is not None:
+                console.print()
+            current = inst.date
+            console.print(
+                f"[cyan]{weekdays[current.weekday()]}, {current.strftime('%d/%m')}:[/cyan]"
+            )
+        _display_single_instance(inst)
+        last = inst
+    console.print()
+
+    if has_more:
+        console.print(f"[dim]Mais instâncias: use --after {last.id}[/dim]")
 
 
 def _display_single_instance(inst: HabitInstance) -> None:
@@ -0,0 +1,84 @@
+"""Comando para visualizar métricas de completude da rotina."""
+
+from datetime import date, timedelta
+
+import typer
+from rich.console import Console
+from rich.table import Table
+from sqlmodel import Session
+
+from timeblock.database import get_engine_context
+from timeblock.services.metrics_service import MetricsService
+from timeblock.services.routine_service import RoutineService
+from timeblock.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+console = Console()
+
+DEFAULT_WINDOWS = [7, 14, 30, 90, 365]
+
+
+def show_metrics(
+    routine_id: int = typer.Option(None, "--routine", "-r", help="ID da rotina (padrão: ativa)"),
+    windows: list[int] | None = typer.Option(  # noqa: B008
+        None, "--window", "-w", help="Janela em dias (repetível; padrão: 7/14/30/90/365)"
+    ),
+    history: bool = typer.Option(False, "--history", help="Listar todas as sequências"),
+):
+    """
+    Mostra completude por janela, streak atual e melhor streak.
+
+    Exemplos:
+        timeblock metrics
+        timeblock metrics --window 7 --window 90
+        timeblock metrics --routine 2 --history
+    """
+    windows = windows or DEFAULT_WINDOWS
+    if any(w < 1 for w in windows):
+        console.print("[red]✗ --window deve ser >= 1[/red]")
+        raise typer.Exit(1)
+
+    today = date.today()
+    with get_engine_context() as engine, Session(engine) as session:
+        service = RoutineService(session)
+        routine = (
+            service.get_routine(routine_id)
+            if routine_id is not None
+            else service.get_active_routine()
+        )
+        if routine is None or routine.id is None:
+            console.print("[red]✗ Rotina não encontrada[/red]")
+            raise typer.Exit(1)
+
+        # Um build O(dias) do histórico inteiro; cada janela custa O(1)
+        completion = MetricsService.load_history(routine.id, end=today, session=session)
+
+    streaks = completion.streak_history()
+    best = max((s.length for s in streaks), default=0)
+
+    table = Table(title=f"Métricas — {routine.name}")
+    table.add_column("Janela", justify="right")
+    table.add_column("Completude", justify="right")
+    table.add_column("Dias com dados", justify="right")
+    table.add_column("Melhor streak", justify="right")
+    for window in sorted(set(windows)):
+        table.add_row(
+            f"{window}d",
+            f"{completion.completion_rate(window)}%",
+            str(completion.active_days(window)),
+            str(completion.best_streak_between(today - timedelta(days=window - 1), today)),
+        )
+    console.print(table)
+    console.print(f"Streak atual: [bold]{completion.current_streak(today)}[/bold] dias")
+    console.print(f"Melhor streak: [bold]{max(best, routine.best_streak or 0)}[/bold] dias")
+
+    if history:
+        if not streaks:
+            console.print("[yellow]Nenhuma sequência registrada.[/yellow]")
+            return
+        console.print("\n[bold]Sequências[/bold]")
+        for streak in reversed(streaks):
+            console.print(
+                f"  {streak.start:%d/%m/%Y} → {streak.end:%d/%m/%Y}  ({streak.length} dias)"
+            )
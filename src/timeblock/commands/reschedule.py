@@ -6,7 +6,7 @@ import typer
 from rich.console import Console
 
 from timeblock.services.event_reordering_service import EventReorderingService
-from timeblock.utils.conflict_display import display_conflicts
+from timeblock.utils.conflict_display import display_conflicts, display_conflicts_by_day
 from timeblock.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -22,6 +22,8 @@ def show_conflicts(
     event_id: int = typer.Option(None, "--event-id", help="ID do evento específico"),
     event_type: str = typer.Option(None, "--event-type", help="Tipo: task, habit_instance, event"),
     date: str = typer.Option(None, "--date", help="Data específica (YYYY-MM-DD)"),
+    from_date: str = typer.Option(None, "--from", help="Início do período (YYYY-MM-DD)"),
+    to_date: str = typer.Option(None, "--to", help="Fim do período (YYYY-MM-DD)"),
 ):
     """
     Visualiza conflitos detectados.
@@ -29,6 +31,7 @@ def show_conflicts(
     Exemplos:
         timeblock reschedule conflicts --event-id 42 --event-type task
         timeblock reschedule conflicts --date 2025-11-08
+        timeblock reschedule conflicts --from 2025-11-01 --to 2025-11-30
     """
     if event_id and event_type:
         # Conflitos de um evento específico
@@ -49,11 +52,26 @@ def show_conflicts(
             console.print("[red]✗ Formato de data inválido. Use YYYY-MM-DD[/red]")
             raise typer.Exit(1)
 
+    elif from_date and to_date:
+        # Conflitos de um período, agrupados por dia
+        try:
+            start = datetime.strptime(from_date, "%Y-%m-%d").date()
+            end = datetime.strptime(to_date, "%Y-%m-%d").date()
+        except ValueError:
+            console.print("[red]✗ Formato de data inválido. Use YYYY-MM-DD[/red]")
+            raise typer.Exit(1)
+        if start > end:
+            console.print("[red]✗ --from deve ser anterior ou igual a --to[/red]")
+            raise typer.Exit(1)
+        conflicts_by_day = EventReorderingService.get_conflicts_for_range(start, end)
+        display_conflicts_by_day(conflicts_by_day, console)
+
     else:
         console.print(
-            "[red]✗ Especifique --event-id e --event-type OU --date[/red]\n"
+            "[red]✗ Especifique --event-id e --event-type, --date OU --from e --to[/red]\n"
             "\nExemplos:\n"
             "  timeblock reschedule conflicts --event-id 42 --event-type task\n"
-            "  timeblock reschedule conflicts --date 2025-11-08"
+            "  timeblock reschedule conflicts --date 2025-11-08\n"
+            "  timeblock reschedule conflicts --from 2025-11-01 --to 2025-11-30"
         )
         raise typer.Exit(1)
@@ -53,26 +53,54 @@ def list_tasks(
     start: str = typer.Option(None, "--from", help="Data início (YYYY-MM-DD HH:MM)"),
     end: str = typer.Option(None, "--to", help="Data fim (YYYY-MM-DD HH:MM)"),
     pending: bool = typer.Option(False, "--pending", "-p", help="Apenas pendentes"),
+    completed: bool = typer.Option(False, "--completed", "-C", help="Apenas concluídas"),
+    cancelled: bool = typer.Option(False, "--cancelled", "-X", help="Apenas canceladas"),
+    limit: int = typer.Option(50, "--limit", "-n", help="Tarefas por página"),
+    after: int = typer.Option(None, "--after", help="ID da última tarefa da página anterior"),
 ):
-    """Lista tarefas."""
+    """
+    Lista tarefas por data agendada, em páginas de --limit.
+
+    Exemplos:
+        timeblock task list
+        timeblock task list --pending
+        timeblock task list --after 120
+    """
     try:
+        flags = {"pending": pending, "completed": completed, "cancelled": cancelled}
+        selected = [name for name, on in flags.items() if on]
+        if len(selected) > 1:
+            raise ValueError("--pending, --completed e --cancelled são mutuamente exclusivos")
+        status = selected[0] if selected else None
+        if limit < 1:
+            raise ValueError("--limit deve ser >= 1")
+
         start_dt = datetime.fromisoformat(start) if start else None
         end_dt = datetime.fromisoformat(end) if end else None
 
-        if pending:
-            tasks = TaskService.list_pending_tasks()
-            title = "Tarefas Pendentes"
-        else:
-            tasks = TaskService.list_tasks(start_dt, end_dt)
-            if start_dt and end_dt:
-                title = f"Tarefas ({start_dt.strftime('%d/%m/%Y')} a {end_dt.strftime('%d/%m/%Y')})"
-            else:
-                title = "Tarefas"
+        # Uma linha extra indica se há próxima página
+        tasks = TaskService.list_tasks_page(
+            start_dt, end_dt, status=status, limit=limit + 1, after=after
+        )
+        has_more = len(tasks) > limit
+        tasks = tasks[:limit]
 
         if not tasks:
             console.print("[yellow]Nenhuma tarefa encontrada.[/yellow]")
             return
 
+        titles = {
+            "pending": "Tarefas Pendentes",
+            "completed": "Tarefas Concluídas",
+            "cancelled": "Tarefas Canceladas",
+        }
+        if status:
+            title = titles[status]
+        elif start_dt and end_dt:
+            title = f"Tarefas ({start_dt.strftime('%d/%m/%Y')} a {end_dt.strftime('%d/%m/%Y')})"
+        else:
+            title = "Tarefas"
+
         table = Table(title=title)
         table.add_column("ID", style="cyan", no_wrap=True)
         table.add_column("Título", style="white")
@@ -80,16 +108,23 @@ def list_tasks(
         table.add_column("Status", style="green")
 
         for t in tasks:
-            status = "✓ Completa" if t.completed_datetime else "○ Pendente"
+            if t.cancelled_datetime:
+                status_text = "✗ Cancelada"
+            elif t.completed_datetime:
+                status_text = "✓ Completa"
+            else:
+                status_text = "○ Pendente"
             table.add_row(
                 str(t.id),
                 t.title,
                 t.scheduled_datetime.strftime("%d/%m/%Y %H:%M"),
-                status,
+                status_text,
             )
 
         console.print()
         console.print(table)
+        if has_more:
+            console.print(f"[dim]Mais tarefas: use --after {tasks[-1].id}[/dim]")
         console.print()
 
     except ValueError as e:
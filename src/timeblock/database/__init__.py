@@ -1,5 +1,19 @@
 """Database utilities."""
 
-from .engine import create_db_and_tables, get_db_path, get_engine, get_engine_context
+from .engine import (
+    create_db_and_tables,
+    dispose_engines,
+    get_db_path,
+    get_engine,
+    get_engine_context,
+    invalidate_engine,
+)
 
-__all__ = ["create_db_and_tables", "get_db_path", "get_engine", "get_engine_context"]
+__all__ = [
+    "create_db_and_tables",
+    "dispose_engines",
+    "get_db_path",
+    "get_engine",
+    "get_engine_context",
+    "invalidate_engine",
+]
@@ -0,0 +1,88 @@
+"""Detecção de mudanças no banco feitas por outras conexões.
+
+`PRAGMA data_version` devolve um contador que muda quando outra conexão
+(outro processo, como a CLI, ou outra conexão do pool) faz commit no
+arquivo. O valor só tem significado dentro de uma mesma conexão, então
+o watcher mantém uma conexão própria aberta enquanto viver.
+
+A leitura não toca as tabelas nem abre transação: em WAL consulta o
+índice do WAL em memória compartilhada. Um poll sem mudança custa
+microssegundos.
+
+Uso:
+    watcher = DataVersionWatcher.open()
+    if watcher is not None and watcher.changed():
+        recarregar()
+
+    # após escrita própria, antes de reler
+    watcher.mark_seen()
+"""
+
+import sqlite3
+from contextlib import suppress
+from pathlib import Path
+
+from timeblock.database.engine import MEMORY_DB_PATH, get_db_path
+from timeblock.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DataVersionWatcher:
+    """Observa `PRAGMA data_version` numa conexão dedicada.
+
+    Não é thread-safe: deve ser consultado sempre da mesma thread
+    (o event loop da TUI).
+    """
+
+    def __init__(self, db_path: str | Path) -> None:
+        self.db_path = Path(db_path)
+        self._conn: sqlite3.Connection | None = sqlite3.connect(self.db_path)
+        self._version = _data_version(self._conn)
+
+    @classmethod
+    def open(cls) -> "DataVersionWatcher | None":
+        """Cria watcher para o banco atual; None para ':memory:' ou sem arquivo."""
+        db_path = get_db_path()
+        if db_path == MEMORY_DB_PATH or not Path(db_path).exists():
+            return None
+        return cls(db_path)
+
+    def changed(self) -> bool:
+        """True se outra conexão fez commit desde a última chamada."""
+        if self._conn is None:
+            return False
+        try:
+            version = _data_version(self._conn)
+        except sqlite3.Error:
+            logger.debug("data_version indisponível em %s", self.db_path, exc_info=True)
+            return False
+        if version == self._version:
+            return False
+        self._version = version
+        return True
+
+    def mark_seen(self) -> None:
+        """Absorve os commits feitos até agora sem reportá-los.
+
+        Para quem vai reler o banco logo em seguida: commits próprios
+        (ou externos já cobertos pela releitura) não geram recarga extra.
+        """
+        if self._conn is None:
+            return
+        try:
+            self._version = _data_version(self._conn)
+        except sqlite3.Error:
+            logger.debug("data_version indisponível em %s", self.db_path, exc_info=True)
+
+    def close(self) -> None:
+        """Fecha a conexão dedicada (idempotente)."""
+        if self._conn is not None:
+            with suppress(sqlite3.Error):
+                self._conn.close()
+            self._conn = None
+
+
+def _data_version(conn: sqlite3.Connection) -> int:
+    """Contador de commits de outras conexões, visto por conn."""
+    return int(conn.execute("PRAGMA data_version").fetchone()[0])
@@ -1,13 +1,53 @@
-"""Conexão e operações de banco de dados."""
+"""Conexão e operações de banco de dados.
 
+Engines são mantidas num registro por processo, indexado pelo caminho
+do banco. Cada engine carrega seu próprio pool de conexões SQLite e é
+reutilizada por todas as chamadas de get_engine()/get_engine_context(),
+evitando create_engine() + dispose() a cada operação.
+
+Invalidação:
+    - Troca de TIMEBLOCK_DB_PATH: o caminho resolvido muda e uma nova
+      engine é criada; as engines de outros caminhos são descartadas.
+    - Restore de backup: invalidate_engine() fecha o pool do caminho.
+    - Shutdown: dispose_engines() (registrado via atexit).
+
+PRAGMAs de conexão vêm do perfil selecionado em database.pragmas
+(WAL + synchronous=NORMAL por padrão).
+
+Migrações pendentes são aplicadas na criação da engine de um banco
+em arquivo que já tem o schema base, então a CLI recebe os índices
+e constraints das migrações sem depender do startup da TUI.
+"""
+
+import atexit
+import logging
 import os
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import event
+from sqlalchemy import Engine, event, text
+from sqlalchemy.pool import QueuePool
 from sqlmodel import SQLModel, create_engine
 
+from timeblock.utils.logger import get_logger
+
+from .pragmas import apply_profile, resolve_profile
+
+logger = get_logger(__name__)
+
+MEMORY_DB_PATH = ":memory:"
+POOL_SIZE = 5
+POOL_MAX_OVERFLOW = 5
+
+# Tabelas que as migrações alteram; sem elas o banco ainda não passou
+# por `init` e create_all criará o schema já completo.
+SCHEMA_TABLES = ("routines", "habits", "habitinstance", "tasks", "time_log")
+
+_engines: dict[str, Engine] = {}
+_engines_lock = threading.Lock()
+
 
 def get_db_path() -> str:
     """Retorna caminho do banco de dados via XDG Base Directory.
@@ -30,29 +70,140 @@ def get_db_path() -> str:
     return db_path
 
 
-def get_engine():
-    """Retorna engine SQLite com foreign keys habilitadas."""
-    db_path = get_db_path()
-    engine = create_engine(f"sqlite:///{db_path}", echo=False)
+def _create_engine(db_path: str) -> Engine:
+    """Cria engine SQLite com listener de PRAGMA registrado uma única vez.
+
+    Bancos em arquivo usam QueuePool com check_same_thread=False para
+    permitir reuso das conexões entre threads. ':memory:' mantém o pool
+    padrão do dialeto, pois cada conexão seria um banco distinto.
+
+    O perfil de PRAGMA (ver database.pragmas) é resolvido uma vez por
+    engine e aplicado a cada conexão nova do pool. O perfil é logado em
+    INFO só quando vem do ambiente ou do config.toml.
+    """
+    profile, source = resolve_profile()
+    in_memory = db_path == MEMORY_DB_PATH
 
-    @event.listens_for(engine, "connect")
     def set_sqlite_pragma(dbapi_conn: Any, connection_record: Any) -> None:
-        """Habilita foreign keys no SQLite."""
-        cursor = dbapi_conn.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.close()
+        """Habilita foreign keys e aplica o perfil de PRAGMA."""
+        apply_profile(dbapi_conn, profile, in_memory)
+
+    if in_memory:
+        engine = create_engine(f"sqlite:///{db_path}", echo=False)
+    else:
+        engine = create_engine(
+            f"sqlite:///{db_path}",
+            echo=False,
+            poolclass=QueuePool,
+            pool_size=POOL_SIZE,
+            max_overflow=POOL_MAX_OVERFLOW,
+            connect_args={"check_same_thread": False},
+        )
+    event.listen(engine, "connect", set_sqlite_pragma)
+    if not in_memory:
+        # Perfil default em DEBUG: a CLI loga INFO no stderr a cada comando
+        level = logging.DEBUG if source == "default" else logging.INFO
+        logger.log(level, "SQLite: perfil %s (%s) em %s", profile.name, source, db_path)
+    return engine
+
+
+def get_engine() -> Engine:
+    """Retorna engine SQLite do registro, criando-a na primeira chamada.
+
+    A engine é compartilhada por todo o processo para o caminho atual.
+    Se TIMEBLOCK_DB_PATH mudou desde a última chamada, as engines dos
+    caminhos anteriores são descartadas (testes, restore).
+
+    ':memory:' não é cacheado: cada chamada recebe engine própria,
+    preservando o isolamento esperado pelos testes.
+    """
+    db_path = get_db_path()
+    if db_path == MEMORY_DB_PATH:
+        return _create_engine(db_path)
 
+    with _engines_lock:
+        engine = _engines.get(db_path)
+        if engine is not None:
+            return engine
+
+        stale = [path for path in _engines if path != db_path]
+        for path in stale:
+            _engines.pop(path).dispose()
+
+        engine = _create_engine(db_path)
+        _engines[db_path] = engine
+
+    # Fora do lock: o runner chama get_engine() e recebe a engine acima
+    _apply_pending_migrations(engine)
     return engine
 
 
+def _apply_pending_migrations(engine: Engine) -> None:
+    """Aplica migrações pendentes na primeira engine do caminho.
+
+    Sem isto, bancos criados por uma versão anterior só recebiam os
+    índices das migrações (unicidade de instâncias, timer ativo único,
+    índices parciais de tasks) depois de abrir a TUI. Falhas são
+    registradas e não impedem o comando de continuar.
+    """
+    from timeblock.database.migrations.runner import run_pending_migrations
+
+    with engine.connect() as conn:
+        tables = set(
+            conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'table'")).scalars()
+        )
+    if not tables.issuperset(SCHEMA_TABLES):
+        return
+    try:
+        count = run_pending_migrations()
+    except Exception:
+        logger.exception("Falha ao aplicar migrações pendentes em %s", engine.url.database)
+        return
+    if count:
+        logger.debug("Migrações aplicadas na criação da engine: %d", count)
+
+
+def invalidate_engine(db_path: str | None = None) -> None:
+    """Descarta a engine cacheada de um caminho (default: caminho atual).
+
+    Usado quando o arquivo do banco é substituído por fora do pool
+    (restore de backup), garantindo que nenhuma conexão antiga seja
+    reutilizada.
+    """
+    path = db_path if db_path is not None else get_db_path()
+    with _engines_lock:
+        engine = _engines.pop(path, None)
+    if engine is not None:
+        engine.dispose()
+
+
+def dispose_engines() -> None:
+    """Fecha todos os pools do registro (hook de shutdown)."""
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+    for engine in engines:
+        engine.dispose()
+
+
+atexit.register(dispose_engines)
+
+
 @contextmanager
 def get_engine_context():
-    """Retorna engine SQLite com cleanup automático."""
+    """Retorna engine SQLite do registro.
+
+    Mantido como context manager por compatibilidade com os call sites
+    existentes. Engines cacheadas não são descartadas na saída; apenas
+    engines efêmeras (':memory:') são fechadas.
+    """
+    ephemeral = get_db_path() == MEMORY_DB_PATH
     engine = get_engine()
     try:
         yield engine
     finally:
-        engine.dispose()
+        if ephemeral:
+            engine.dispose()
 
 
 def create_db_and_tables():
@@ -63,6 +214,7 @@ def create_db_and_tables():
     """
     from timeblock.models import (  # noqa: F401  # pyright: ignore[reportUnusedImport]
         Habit,
+        HabitDayStats,
         HabitInstance,
         Routine,
         Tag,
@@ -11,7 +11,7 @@ from pathlib import Path
 from sqlmodel import SQLModel, create_engine
 
 from timeblock.database.engine import get_db_path
-from timeblock.models import Habit, HabitInstance, Routine, Task, TimeLog
+from timeblock.models import Habit, HabitDayStats, HabitInstance, Routine, Task, TimeLog
 from timeblock.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -34,12 +34,13 @@ def migrate_v2(db_path: Path | None = None) -> None:
             Routine.__table__,  # type: ignore[attr-defined]
             Habit.__table__,  # type: ignore[attr-defined]
             HabitInstance.__table__,  # type: ignore[attr-defined]
+            HabitDayStats.__table__,  # type: ignore[attr-defined]
             Task.__table__,  # type: ignore[attr-defined]
             TimeLog.__table__,  # type: ignore[attr-defined]
         ],
     )
 
-    logger.info("Tabelas v2.0 criadas: Routine, Habit, HabitInstance, Task, TimeLog")
+    logger.info("Tabelas v2.0 criadas: Routine, Habit, HabitInstance, HabitDayStats, Task, TimeLog")
 
 
 def migrate_events_to_tasks() -> int:
@@ -0,0 +1,63 @@
+"""Migração 004: índice único (habit_id, date) em habitinstance (BR-HABIT-003).
+
+Garante no schema a regra "não duplica instâncias existentes", permitindo
+geração via INSERT ... ON CONFLICT(habit_id, date) DO NOTHING em vez
+de read-then-insert.
+
+Duplicatas pré-existentes (bug da issue #2) são consolidadas antes da
+criação do índice: mantém a instância com status diferente de PENDING
+(ou a de menor id) e reaponta time_log para ela.
+
+Referências:
+    - BR-HABIT-003: Geração de instâncias idempotente
+    - ADR-026: Database path via engine.get_db_path() (SSOT)
+"""
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+INDEX_NAME = "ix_habitinstance_habit_id_date"
+
+
+def upgrade(session: Session) -> None:
+    """Aplica migração: deduplica e cria índice único."""
+    conn = session.connection()
+
+    rows = conn.execute(
+        text(
+            "SELECT id, habit_id, date, status FROM habitinstance "
+            "WHERE (habit_id, date) IN ("
+            "  SELECT habit_id, date FROM habitinstance "
+            "  GROUP BY habit_id, date HAVING COUNT(*) > 1"
+            ") ORDER BY habit_id, date, id"
+        )
+    ).all()
+
+    groups: dict[tuple, list] = {}
+    for row in rows:
+        groups.setdefault((row.habit_id, row.date), []).append(row)
+
+    for group in groups.values():
+        keeper = min(group, key=lambda r: (r.status == "PENDING", r.id))
+        for row in group:
+            if row.id == keeper.id:
+                continue
+            conn.execute(
+                text(
+                    "UPDATE time_log SET habit_instance_id = :keep WHERE habit_instance_id = :dup"
+                ),
+                {"keep": keeper.id, "dup": row.id},
+            )
+            conn.execute(text("DELETE FROM habitinstance WHERE id = :dup"), {"dup": row.id})
+
+    conn.execute(
+        text(f"CREATE UNIQUE INDEX IF NOT EXISTS {INDEX_NAME} ON habitinstance (habit_id, date)")
+    )
+
+    session.commit()
+
+
+def downgrade(session: Session) -> None:
+    """Reverte migração: remove o índice único."""
+    session.connection().execute(text(f"DROP INDEX IF EXISTS {INDEX_NAME}"))
+    session.commit()
@@ -0,0 +1,45 @@
+"""Migração 005: rollup diário habit_day_stats (BR-TUI-033).
+
+Cria a tabela de rollup (routine_id, date, done, total), instala os
+triggers que a mantêm incrementalmente e a reconstrói a partir do
+histórico de habitinstance. Idempotente: a tabela pode já ter sido
+criada vazia por create_all (CLI) antes da migração rodar.
+
+Referências:
+    - ADR-047: Design do MetricsPanel
+    - BR-TUI-033-R3: best_streak persiste o maior valor
+"""
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from timeblock.models.habit_day_stats import TRIGGERS, install_day_stats
+
+
+def upgrade(session: Session) -> None:
+    """Aplica migração: cria rollup, triggers e faz backfill."""
+    conn = session.connection()
+
+    conn.execute(
+        text(
+            "CREATE TABLE IF NOT EXISTS habit_day_stats ("
+            "  routine_id INTEGER NOT NULL REFERENCES routines (id) ON DELETE CASCADE,"
+            "  date DATE NOT NULL,"
+            "  done INTEGER NOT NULL,"
+            "  total INTEGER NOT NULL,"
+            "  PRIMARY KEY (routine_id, date)"
+            ")"
+        )
+    )
+    install_day_stats(conn)
+
+    session.commit()
+
+
+def downgrade(session: Session) -> None:
+    """Reverte migração: remove triggers e tabela."""
+    conn = session.connection()
+    for name in TRIGGERS:
+        conn.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+    conn.execute(text("DROP TABLE IF EXISTS habit_day_stats"))
+    session.commit()
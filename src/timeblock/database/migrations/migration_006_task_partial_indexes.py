@@ -0,0 +1,43 @@
+"""Migração 006: índices parciais do lifecycle de tasks (ADR-036).
+
+list_pending_tasks filtra por completed/cancelled IS NULL e as listas
+de recentes por timestamps sem índice: com histórico grande, o painel
+de tasks fazia full scan a cada refresh. Os índices parciais abaixo
+mantêm as consultas proporcionais à fila ativa e à janela de 24h.
+
+Referências:
+    - ADR-036: Task Lifecycle Evolution
+    - BR-TUI-003-R29: Tasks recentes no dashboard
+"""
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+INDEXES: dict[str, str] = {
+    "ix_tasks_pending_scheduled": (
+        "ON tasks (scheduled_datetime) "
+        "WHERE completed_datetime IS NULL AND cancelled_datetime IS NULL"
+    ),
+    "ix_tasks_completed_datetime": (
+        "ON tasks (completed_datetime) WHERE completed_datetime IS NOT NULL"
+    ),
+    "ix_tasks_cancelled_datetime": (
+        "ON tasks (cancelled_datetime) WHERE cancelled_datetime IS NOT NULL"
+    ),
+}
+
+
+def upgrade(session: Session) -> None:
+    """Aplica migração: cria índices parciais em tasks."""
+    conn = session.connection()
+    for name, definition in INDEXES.items():
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} {definition}"))
+    session.commit()
+
+
+def downgrade(session: Session) -> None:
+    """Reverte migração: remove os índices parciais."""
+    conn = session.connection()
+    for name in INDEXES:
+        conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+    session.commit()
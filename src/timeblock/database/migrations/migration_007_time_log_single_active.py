@@ -0,0 +1,54 @@
+"""Migração 007: no máximo um timer ativo (BR-TIMER-001).
+
+A regra de um timer ativo por vez era só verificada em start_timer com
+SELECT antes do INSERT: dois `timer start` concorrentes podiam passar
+pela verificação e criar dois TimeLogs RUNNING. O índice único parcial
+sobre a expressão constante (1) torna a segunda inserção um
+IntegrityError, e a busca do timer ativo passa a tocar uma única
+entrada de índice.
+
+Bancos que já tenham timers ativos duplicados mantêm o mais recente;
+os demais são cancelados antes da criação do índice.
+
+Referências:
+    - BR-TIMER-001: Single Active Timer Constraint
+"""
+
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+INDEX_NAME = "ix_time_log_single_active"
+INDEX_DEFINITION = "ON time_log ((1)) WHERE status IN ('RUNNING', 'PAUSED')"
+DUPLICATE_REASON = "Timer ativo duplicado cancelado pela migração 007"
+
+
+def upgrade(session: Session) -> None:
+    """Aplica migração: cancela duplicatas e cria o índice único parcial."""
+    conn = session.connection()
+    keep = conn.execute(
+        text(
+            "SELECT id FROM time_log WHERE status IN ('RUNNING', 'PAUSED') "
+            "ORDER BY start_time DESC, id DESC LIMIT 1"
+        )
+    ).scalar()
+    if keep is not None:
+        conn.execute(
+            text(
+                "UPDATE time_log SET status = 'CANCELLED', pause_start = NULL, "
+                "end_time = COALESCE(end_time, :now), "
+                "cancel_reason = COALESCE(cancel_reason, :reason) "
+                "WHERE status IN ('RUNNING', 'PAUSED') AND id != :keep"
+            ),
+            {"now": datetime.now(), "reason": DUPLICATE_REASON, "keep": keep},
+        )
+    conn.execute(text(f"CREATE UNIQUE INDEX IF NOT EXISTS {INDEX_NAME} {INDEX_DEFINITION}"))
+    session.commit()
+
+
+def downgrade(session: Session) -> None:
+    """Reverte migração: remove o índice único parcial."""
+    conn = session.connection()
+    conn.execute(text(f"DROP INDEX IF EXISTS {INDEX_NAME}"))
+    session.commit()
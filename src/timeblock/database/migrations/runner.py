@@ -20,6 +20,10 @@ logger = logging.getLogger(__name__)
 MIGRATIONS: list[tuple[str, str]] = [
     ("002", "timeblock.database.migrations.migration_002_task_lifecycle"),
     ("003", "timeblock.database.migrations.migration_003_best_streak"),
+    ("004", "timeblock.database.migrations.migration_004_habitinstance_unique_date"),
+    ("005", "timeblock.database.migrations.migration_005_habit_day_stats"),
+    ("006", "timeblock.database.migrations.migration_006_task_partial_indexes"),
+    ("007", "timeblock.database.migrations.migration_007_time_log_single_active"),
 ]
 
 
@@ -76,5 +80,4 @@ def run_pending_migrations() -> int:
                 logger.exception("Falha na migração %s", migration_id)
                 raise
 
-    engine.dispose()
     return applied_count
@@ -0,0 +1,221 @@
+"""Perfis de PRAGMA aplicados a cada conexão SQLite.
+
+A TUI grava a cada mudança de status e ação de timer enquanto a CLI
+pode gravar no mesmo arquivo. Com o journal DELETE padrão, um leitor
+bloqueia o escritor e vice-versa, e a CLI recebia "database is locked".
+Em WAL leitores e escritor não se bloqueiam; busy_timeout faz o segundo
+escritor esperar em vez de falhar.
+
+Seleção do perfil (primeira fonte definida vence):
+    1. $ATOMVS_SQLITE_PROFILE
+    2. [database] sqlite_profile em $XDG_CONFIG_HOME/atomvs/config.toml
+       (default ~/.config/atomvs/config.toml)
+    3. "balanced"
+
+No mesmo arquivo, [database.pragmas] sobrescreve valores individuais:
+
+    [database]
+    sqlite_profile = "balanced"
+
+    [database.pragmas]
+    mmap_size = 0
+    busy_timeout = 10000
+
+Variáveis de ambiente:
+    ATOMVS_SQLITE_PROFILE: nome do perfil (legacy, balanced, durable)
+    ATOMVS_CONFIG: caminho do config.toml (override do XDG)
+
+Perfil desconhecido, PRAGMA não suportado ou valor fora do domínio do
+SQLite gera um warning e o perfil default é usado: a configuração é lida
+dentro de get_engine(), onde um erro derrubaria qualquer comando.
+"""
+
+import os
+import tomllib
+from dataclasses import asdict, dataclass, fields, replace
+from pathlib import Path
+from typing import Any
+
+from timeblock.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_PROFILE = "balanced"
+
+# Valores aceitos pelo SQLite para os PRAGMAs textuais; entram na
+# instrução sem escape, então nada fora destes conjuntos é aceito.
+PRAGMA_CHOICES: dict[str, frozenset[str]] = {
+    "journal_mode": frozenset({"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}),
+    "synchronous": frozenset({"OFF", "NORMAL", "FULL", "EXTRA", "0", "1", "2", "3"}),
+    "temp_store": frozenset({"DEFAULT", "FILE", "MEMORY", "0", "1", "2"}),
+}
+
+
+@dataclass(frozen=True)
+class PragmaProfile:
+    """Valores de PRAGMA de um perfil.
+
+    cache_size negativo é em KiB (convenção do SQLite); mmap_size em bytes;
+    busy_timeout em milissegundos.
+    """
+
+    name: str
+    journal_mode: str
+    synchronous: str
+    mmap_size: int
+    cache_size: int
+    busy_timeout: int
+    temp_store: str
+
+    def statements(self, in_memory: bool = False) -> list[str]:
+        """PRAGMAs na ordem de aplicação.
+
+        Bancos ':memory:' ignoram journal_mode e mmap_size (não há arquivo).
+        """
+        pragmas = [
+            f"PRAGMA busy_timeout={self.busy_timeout}",
+            f"PRAGMA synchronous={self.synchronous}",
+            f"PRAGMA cache_size={self.cache_size}",
+            f"PRAGMA temp_store={self.temp_store}",
+        ]
+        if not in_memory:
+            pragmas.insert(1, f"PRAGMA journal_mode={self.journal_mode}")
+            pragmas.append(f"PRAGMA mmap_size={self.mmap_size}")
+        return pragmas
+
+
+PROFILES: dict[str, PragmaProfile] = {
+    # Comportamento anterior: journal DELETE, fsync a cada commit
+    "legacy": PragmaProfile(
+        name="legacy",
+        journal_mode="DELETE",
+        synchronous="FULL",
+        mmap_size=0,
+        cache_size=-2000,
+        busy_timeout=5000,
+        temp_store="DEFAULT",
+    ),
+    # WAL + NORMAL: commit sem fsync; durável até o próximo checkpoint
+    "balanced": PragmaProfile(
+        name="balanced",
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        mmap_size=64 * 1024 * 1024,
+        cache_size=-16000,
+        busy_timeout=5000,
+        temp_store="MEMORY",
+    ),
+    # WAL + FULL: fsync do WAL a cada commit (queda de energia)
+    "durable": PragmaProfile(
+        name="durable",
+        journal_mode="WAL",
+        synchronous="FULL",
+        mmap_size=0,
+        cache_size=-8000,
+        busy_timeout=10000,
+        temp_store="DEFAULT",
+    ),
+}
+
+
+def get_config_path() -> Path:
+    """Retorna caminho do config.toml seguindo XDG Base Directory.
+
+    Prioridade:
+        1. $ATOMVS_CONFIG
+        2. $XDG_CONFIG_HOME/atomvs/config.toml
+        3. ~/.config/atomvs/config.toml
+    """
+    env_path = os.getenv("ATOMVS_CONFIG")
+    if env_path:
+        return Path(env_path)
+    xdg_config_home = os.getenv("XDG_CONFIG_HOME")
+    base = Path(xdg_config_home) if xdg_config_home else Path.home() / ".config"
+    return base / "atomvs" / "config.toml"
+
+
+def _read_database_config() -> dict[str, Any]:
+    """Lê a seção [database] do config.toml ({} se ausente ou inválido)."""
+    path = get_config_path()
+    if not path.is_file():
+        return {}
+    try:
+        with path.open("rb") as f:
+            section = tomllib.load(f).get("database", {})
+    except (OSError, tomllib.TOMLDecodeError):
+        logger.warning("Config inválido ignorado: %s", path, exc_info=True)
+        return {}
+    return section if isinstance(section, dict) else {}
+
+
+def resolve_profile() -> tuple[PragmaProfile, str]:
+    """Resolve o perfil ativo e a fonte da escolha.
+
+    Configuração inválida não interrompe a abertura do banco: é registrada
+    em WARNING e o perfil DEFAULT_PROFILE é usado.
+
+    Returns:
+        (perfil, fonte), com fonte "env", "config" ou "default".
+    """
+    try:
+        return _profile_from_settings(_read_database_config())
+    except (ValueError, TypeError) as e:
+        logger.warning("Configuração SQLite ignorada (%s); usando perfil %s", e, DEFAULT_PROFILE)
+        return PROFILES[DEFAULT_PROFILE], "default"
+
+
+def _profile_from_settings(config: dict[str, Any]) -> tuple[PragmaProfile, str]:
+    """Monta o perfil a partir do ambiente e da seção [database].
+
+    Raises:
+        ValueError: Se o perfil, um override ou o valor de um PRAGMA é inválido.
+        TypeError: Se um override tem tipo não conversível.
+    """
+    env_name = os.getenv("ATOMVS_SQLITE_PROFILE")
+    if env_name:
+        name, source = env_name, "env"
+    elif "sqlite_profile" in config:
+        name, source = str(config["sqlite_profile"]), "config"
+    else:
+        name, source = DEFAULT_PROFILE, "default"
+
+    profile = PROFILES.get(name.lower())
+    if profile is None:
+        raise ValueError(f"Perfil SQLite desconhecido: {name} (opções: {', '.join(PROFILES)})")
+
+    overrides = config.get("pragmas", {})
+    if overrides:
+        allowed = {f.name for f in fields(PragmaProfile)} - {"name"}
+        unknown = set(overrides) - allowed
+        if unknown:
+            raise ValueError(f"PRAGMA não suportado em config: {', '.join(sorted(unknown))}")
+        current = asdict(profile)
+        typed = {key: _coerce(key, value, type(current[key])) for key, value in overrides.items()}
+        profile = replace(profile, **typed)
+        if source != "config":
+            source = f"{source}+config"
+    return profile, source
+
+
+def _coerce(key: str, value: Any, kind: type) -> Any:
+    """Converte o override para o tipo do campo e valida o domínio."""
+    if kind is int:
+        if isinstance(value, bool) or not isinstance(value, int | str):
+            raise TypeError(f"{key} deve ser inteiro, recebido {value!r}")
+        return int(value)
+    normalized = str(value).upper()
+    if normalized not in PRAGMA_CHOICES[key]:
+        options = ", ".join(sorted(PRAGMA_CHOICES[key]))
+        raise ValueError(f"Valor inválido para {key}: {value!r} (opções: {options})")
+    return normalized
+
+
+def apply_profile(dbapi_conn: Any, profile: PragmaProfile, in_memory: bool = False) -> None:
+    """Aplica foreign_keys e o perfil numa conexão DBAPI recém-aberta."""
+    cursor = dbapi_conn.cursor()
+    try:
+        cursor.execute("PRAGMA foreign_keys=ON")
+        for statement in profile.statements(in_memory):
+            cursor.execute(statement)
+    finally:
+        cursor.close()
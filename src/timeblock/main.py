@@ -1,39 +1,96 @@
 """Entry point do ATOMVS Time Planner CLI/TUI."""
 
+import importlib
 import sys
 from types import TracebackType
+from typing import ClassVar
 
+import click
 import typer
+from typer.core import TyperGroup
 
-from timeblock.commands import (
-    demo,
-    habit,
-    init,
-    reschedule,
-    routine,
-    tag,
-    task,
-    timer,
-)
 from timeblock.utils.logger import configure_logging, get_logger
 
+
+class LazyGroup(TyperGroup):
+    """Grupo raiz que importa cada comando só quando é chamado.
+
+    Os módulos de comando puxam SQLModel, todos os models, dateutil e
+    Rich; importá-los no carregamento do CLI fazia até `version` pagar
+    esse custo. Aqui o módulo é importado em get_command, na primeira
+    resolução do nome (dispatch ou --help).
+
+    Mapas nome -> (módulo, atributo), na ordem do --help:
+        lazy_commands: funções (equivalente a app.command)
+        lazy_groups: typer.Typer (equivalente a app.add_typer)
+    """
+
+    lazy_commands: ClassVar[dict[str, tuple[str, str]]] = {
+        "init": ("timeblock.commands.init", "init"),
+        "metrics": ("timeblock.commands.metrics", "show_metrics"),
+    }
+    lazy_groups: ClassVar[dict[str, tuple[str, str]]] = {
+        "routine": ("timeblock.commands.routine", "app"),
+        "habit": ("timeblock.commands.habit", "app"),
+        "task": ("timeblock.commands.task", "app"),
+        "timer": ("timeblock.commands.timer", "app"),
+        "tag": ("timeblock.commands.tag", "app"),
+        "reschedule": ("timeblock.commands.reschedule", "app"),
+        "demo": ("timeblock.commands.demo", "app"),
+    }
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Nomes para o --help sem importar os módulos de comando.
+
+        Ordem: comandos lazy, comandos registrados direto no Typer
+        (ex: version), grupos lazy.
+        """
+        lazy = {**self.lazy_commands, **self.lazy_groups}
+        eager = [name for name in super().list_commands(ctx) if name not in lazy]
+        return [*self.lazy_commands, *eager, *self.lazy_groups]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Resolve o comando, importando o módulo na primeira chamada.
+
+        O comando carregado é registrado no grupo, então resoluções
+        seguintes não passam de novo por _load.
+        """
+        command = super().get_command(ctx, cmd_name)
+        if command is None and (cmd_name in self.lazy_commands or cmd_name in self.lazy_groups):
+            command = self._load(cmd_name)
+            self.add_command(command, cmd_name)
+        return command
+
+    def _load(self, cmd_name: str) -> click.Command:
+        """Importa o módulo e converte o Typer/função em click.Command."""
+        if cmd_name in self.lazy_groups:
+            module_name, attr = self.lazy_groups[cmd_name]
+            sub_app = getattr(importlib.import_module(module_name), attr)
+            command: click.Command = typer.main.get_group(sub_app)
+        else:
+            module_name, attr = self.lazy_commands[cmd_name]
+            single = typer.Typer(add_completion=False)
+            single.command(cmd_name)(getattr(importlib.import_module(module_name), attr))
+            command = typer.main.get_command(single)
+        command.name = cmd_name
+        return command
+
+
 app = typer.Typer(
     name="timeblock",
     help="TimeBlock Planner - Gerenciador de tempo via CLI",
     add_completion=False,
+    cls=LazyGroup,
 )
 
-# Comandos base
-app.command("init")(init.init)
-
-# Comandos por recurso
-app.add_typer(routine.app, name="routine")
-app.add_typer(habit.app, name="habit")
-app.add_typer(task.app, name="task")
-app.add_typer(timer.app, name="timer")
-app.add_typer(tag.app, name="tag")
-app.add_typer(reschedule.app, name="reschedule")
-app.add_typer(demo.app, name="demo")
+
+@app.callback()
+def _root() -> None:
+    """Callback vazio que força o Typer a montar um grupo.
+
+    Com só `version` registrado no Typer, ele geraria um comando único
+    em vez de grupo; o callback força o LazyGroup que resolve os lazy.
+    """
 
 
 @app.command()
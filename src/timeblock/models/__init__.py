@@ -3,6 +3,7 @@
 from .enums import DoneSubstatus, NotDoneSubstatus, SkipReason, Status
 from .event import ChangeLog, ChangeType, Event, EventStatus, PauseLog
 from .habit import Habit, Recurrence
+from .habit_day_stats import HabitDayStats
 from .habit_instance import HabitInstance
 from .routine import Routine
 from .tag import Tag
@@ -22,6 +23,7 @@ __all__ = [
     "Habit",
     "Recurrence",
     "HabitInstance",
+    "HabitDayStats",
     # Status enums
     "Status",
     "DoneSubstatus",
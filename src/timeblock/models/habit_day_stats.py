@@ -0,0 +1,117 @@
+"""HabitDayStats model - rollup diário de completude por rotina (BR-TUI-033).
+
+Uma linha por (routine_id, date) com done/total das instâncias do dia.
+Mantida incrementalmente por triggers SQLite em habitinstance (insert,
+delete, mudança de status/data/hábito) e em habits (troca de rotina):
+qualquer caminho de escrita — services, upsert de instâncias, TUI, CLI —
+atualiza o rollup na mesma transação, sem recomputar a janela.
+
+Os triggers são instalados junto com a tabela (create_all) e pela
+migração 005, que também reconstrói o rollup a partir do histórico.
+"""
+
+from datetime import date as date_type
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection
+from sqlmodel import Field, SQLModel
+
+DONE = "DONE"  # Status.DONE persistido pelo nome do enum
+
+_ADD_INSTANCE = f"""
+    INSERT INTO habit_day_stats (routine_id, date, done, total)
+    SELECT routine_id, NEW.date, NEW.status = '{DONE}', 1 FROM habits WHERE id = NEW.habit_id
+    ON CONFLICT (routine_id, date) DO UPDATE
+    SET done = done + excluded.done, total = total + 1;
+"""
+
+_REMOVE_INSTANCE = f"""
+    UPDATE habit_day_stats
+    SET done = done - (OLD.status = '{DONE}'), total = total - 1
+    WHERE date = OLD.date
+      AND routine_id = (SELECT routine_id FROM habits WHERE id = OLD.habit_id);
+"""
+
+TRIGGERS: dict[str, str] = {
+    "trg_habit_day_stats_insert": f"""
+    AFTER INSERT ON habitinstance
+    BEGIN {_ADD_INSTANCE} END
+    """,
+    "trg_habit_day_stats_delete": f"""
+    AFTER DELETE ON habitinstance
+    BEGIN {_REMOVE_INSTANCE} END
+    """,
+    "trg_habit_day_stats_update": f"""
+    AFTER UPDATE OF status, date, habit_id ON habitinstance
+    WHEN OLD.status IS NOT NEW.status
+      OR OLD.date IS NOT NEW.date
+      OR OLD.habit_id IS NOT NEW.habit_id
+    BEGIN {_REMOVE_INSTANCE} {_ADD_INSTANCE} END
+    """,
+    "trg_habit_day_stats_routine": f"""
+    AFTER UPDATE OF routine_id ON habits
+    WHEN OLD.routine_id IS NOT NEW.routine_id
+    BEGIN
+        UPDATE habit_day_stats
+        SET done = done - (
+                SELECT COUNT(*) FROM habitinstance
+                WHERE habit_id = NEW.id AND date = habit_day_stats.date AND status = '{DONE}'
+            ),
+            total = total - (
+                SELECT COUNT(*) FROM habitinstance
+                WHERE habit_id = NEW.id AND date = habit_day_stats.date
+            )
+        WHERE routine_id = OLD.routine_id
+          AND date IN (SELECT date FROM habitinstance WHERE habit_id = NEW.id);
+        INSERT INTO habit_day_stats (routine_id, date, done, total)
+        SELECT NEW.routine_id, date, SUM(status = '{DONE}'), COUNT(*)
+        FROM habitinstance WHERE habit_id = NEW.id GROUP BY date
+        ON CONFLICT (routine_id, date) DO UPDATE
+        SET done = done + excluded.done, total = total + excluded.total;
+    END
+    """,
+}
+
+
+class HabitDayStats(SQLModel, table=True):
+    """Contagem diária de instâncias concluídas/totais de uma rotina."""
+
+    __tablename__ = "habit_day_stats"  # type: ignore[assignment]
+
+    routine_id: int = Field(foreign_key="routines.id", primary_key=True, ondelete="CASCADE")
+    date: date_type = Field(primary_key=True)
+    done: int = Field(default=0)
+    total: int = Field(default=0)
+
+
+def install_day_stats(conn: Connection) -> None:
+    """Cria os triggers do rollup e o reconstrói a partir de habitinstance."""
+    for name, body in TRIGGERS.items():
+        conn.execute(text(f"CREATE TRIGGER IF NOT EXISTS {name} {body}"))
+    rebuild_day_stats(conn)
+
+
+def rebuild_day_stats(conn: Connection) -> None:
+    """Recalcula o rollup inteiro com um INSERT ... SELECT agregado."""
+    conn.execute(text("DELETE FROM habit_day_stats"))
+    conn.execute(
+        text(
+            "INSERT INTO habit_day_stats (routine_id, date, done, total) "
+            f"SELECT h.routine_id, i.date, SUM(i.status = '{DONE}'), COUNT(*) "
+            "FROM habitinstance i JOIN habits h ON h.id = i.habit_id "
+            "GROUP BY h.routine_id, i.date"
+        )
+    )
+
+
+@event.listens_for(SQLModel.metadata, "after_create")
+def _install_on_create(target: Any, connection: Connection, **kw: Any) -> None:
+    """Instala triggers quando create_all cria a tabela de rollup.
+
+    Disparado no nível do metadata (após todas as tabelas) para que
+    habitinstance e habits já existam ao criar os triggers.
+    """
+    tables = kw.get("tables") or []
+    if HabitDayStats.__table__ in tables:  # type: ignore[attr-defined]
+        install_day_stats(connection)
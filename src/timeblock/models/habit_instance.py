@@ -4,6 +4,7 @@ from datetime import date as date_type
 from datetime import datetime, time
 from typing import TYPE_CHECKING, Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 from .enums import DoneSubstatus, NotDoneSubstatus, SkipReason, Status
@@ -22,6 +23,8 @@ class HabitInstance(SQLModel, table=True):
     """
 
     __tablename__ = "habitinstance"  # pyright: ignore[reportAssignmentType]
+    # BR-HABIT-003: uma instância por (habit_id, date) — migração 004
+    __table_args__ = (Index("ix_habitinstance_habit_id_date", "habit_id", "date", unique=True),)
 
     id: int | None = Field(default=None, primary_key=True)
     habit_id: int = Field(foreign_key="habits.id")
@@ -3,6 +3,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
+from sqlalchemy import Index, text
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -20,6 +21,26 @@ class Task(SQLModel, table=True):
     """
 
     __tablename__ = "tasks"  # pyright: ignore[reportAssignmentType]
+    # Índices parciais do lifecycle (migração 006): pendentes por agenda,
+    # concluídas/canceladas por timestamp. O histórico encerrado não
+    # entra no índice de pendentes, que fica do tamanho da fila ativa.
+    __table_args__ = (
+        Index(
+            "ix_tasks_pending_scheduled",
+            "scheduled_datetime",
+            sqlite_where=text("completed_datetime IS NULL AND cancelled_datetime IS NULL"),
+        ),
+        Index(
+            "ix_tasks_completed_datetime",
+            "completed_datetime",
+            sqlite_where=text("completed_datetime IS NOT NULL"),
+        ),
+        Index(
+            "ix_tasks_cancelled_datetime",
+            "cancelled_datetime",
+            sqlite_where=text("cancelled_datetime IS NOT NULL"),
+        ),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     title: str = Field(index=True, min_length=1, max_length=200)
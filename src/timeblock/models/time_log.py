@@ -2,6 +2,7 @@
 
 from datetime import datetime
 
+from sqlalchemy import Index, text
 from sqlmodel import Field, SQLModel
 
 from timeblock.models.enums import TimerStatus
@@ -12,9 +13,20 @@ class TimeLog(SQLModel, table=True):
 
     Cada TimeLog representa uma sessão de tracking.
     Uma HabitInstance pode ter múltiplas sessões (BR-TIMER-004).
+
+    BR-TIMER-001 é garantida pelo banco: o índice único parcial sobre a
+    expressão constante (1) admite no máximo uma linha RUNNING/PAUSED.
     """
 
     __tablename__ = "time_log"  # pyright: ignore[reportAssignmentType]
+    __table_args__ = (
+        Index(
+            "ix_time_log_single_active",
+            text("(1)"),
+            unique=True,
+            sqlite_where=text("status IN ('RUNNING', 'PAUSED')"),
+        ),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
 
@@ -2,6 +2,7 @@
 
 from timeblock.services.habit_instance_service import HabitInstanceService
 from timeblock.services.habit_service import HabitService
+from timeblock.services.metrics_service import MetricsService
 from timeblock.services.routine_service import RoutineService
 from timeblock.services.tag_service import TagService
 from timeblock.services.task_service import TaskService
@@ -10,6 +11,7 @@ from timeblock.services.timer_service import TimerService
 __all__ = [
     "HabitInstanceService",
     "HabitService",
+    "MetricsService",
     "RoutineService",
     "TagService",
     "TaskService",
@@ -1,21 +1,61 @@
 """BackupService - Backup automático do banco de dados (BR-DATA-001).
 
 Cria cópia timestamped do SQLite no startup e shutdown da TUI.
-Mantém as N cópias mais recentes e remove as antigas.
+
+A cópia usa a API de backup do SQLite (consistente mesmo com escritas
+concorrentes) e pode rodar em background via start_backup, com espera
+limitada no shutdown.
+
+Armazenamento endereçado por conteúdo:
+    backups/
+        timeblock-YYYYMMDD-HHMMSS-{label}.json   manifesto (lista de chunks)
+        objects/ab/abcdef...                     chunk comprimido (zlib)
+
+O snapshot é cortado em chunks de CHUNK_SIZE bytes (múltiplo do
+page_size do SQLite), identificados pelo SHA-256. Entre dois backups só
+mudam as páginas tocadas, então cada backup novo grava poucos chunks.
+Retenção avô-pai-filho: os KEEP_LAST backups mais recentes e o mais
+recente de cada uma das últimas KEEP_HOURLY horas, KEEP_DAILY dias e
+KEEP_WEEKLY semanas. Cópias
+completas antigas (timeblock-*.db) continuam listáveis e restauráveis.
 """
 
+import hashlib
+import json
 import os
+import re
 import shutil
+import sqlite3
+import threading
+import zlib
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
 
-from timeblock.database.engine import get_db_path
+from timeblock.database.engine import get_db_path, invalidate_engine
 from timeblock.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-MAX_BACKUPS = 50
 BACKUP_DIR_NAME = "backups"
+OBJECTS_DIR_NAME = "objects"
+MANIFEST_SUFFIX = ".json"
+CHUNK_SIZE = 64 * 1024
+COMPRESSION_LEVEL = 6
+KEEP_LAST = 10
+KEEP_HOURLY = 24
+KEEP_DAILY = 30
+KEEP_WEEKLY = 26
+BACKUP_PAGES_PER_STEP = 256
+BACKUP_STEP_SLEEP = 0.001
+MAX_BACKUP_RESTARTS = 3
+PARTIAL_SUFFIX = ".partial"
+FINGERPRINT_FILE = ".last-backup"
+SHUTDOWN_BACKUP_TIMEOUT = 3.0
+
+_BACKUP_NAME = re.compile(r"^timeblock-(\d{8}-\d{6})(?:-.+)?\.(?:json|db)$")
+# Serializa escrita e coleta de chunks entre threads (BackupJob, restore)
+_store_lock = threading.Lock()
 
 
 def get_backup_dir() -> Path:
@@ -40,13 +80,19 @@ def get_backup_dir() -> Path:
 
 
 def create_backup(label: str = "") -> Path | None:
-    """Cria backup do banco com timestamp.
+    """Cria backup consistente do banco com timestamp.
+
+    O snapshot (ver _snapshot) é gravado como chunks deduplicados no
+    armazenamento e o manifesto é escrito por último: um backup
+    interrompido nunca aparece em list_backups. Se o banco não mudou
+    desde o último backup, nada é gravado.
 
     Args:
         label: Sufixo opcional (ex: 'startup', 'shutdown').
 
     Returns:
-        Path do backup criado ou None se banco não existe.
+        Path do manifesto criado, ou None se o banco não existe ou está
+        inalterado desde o último backup.
     """
     db_path = Path(get_db_path())
     if not db_path.exists():
@@ -54,47 +100,321 @@ def create_backup(label: str = "") -> Path | None:
 
     backup_dir = get_backup_dir()
     backup_dir.mkdir(exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    suffix = f"-{label}" if label else ""
-    backup_name = f"timeblock-{timestamp}{suffix}.db"
-    backup_path = backup_dir / backup_name
-
-    shutil.copy2(db_path, backup_path)
-    _cleanup_old_backups(backup_dir)
-    logger.info("Backup criado: %s", backup_path)
+    with _store_lock:
+        fingerprint = _fingerprint(db_path)
+        if _last_backup_matches(backup_dir, fingerprint):
+            logger.info("Backup ignorado: banco inalterado desde o último backup")
+            return None
+
+        now = datetime.now()
+        suffix = f"-{label}" if label else ""
+        backup_name = f"timeblock-{now:%Y%m%d-%H%M%S}{suffix}{MANIFEST_SUFFIX}"
+        backup_path = backup_dir / backup_name
+
+        snapshot = backup_dir / (backup_name + PARTIAL_SUFFIX)
+        try:
+            _snapshot(db_path, snapshot)
+            manifest = _store_chunks(snapshot, backup_dir / OBJECTS_DIR_NAME)
+        finally:
+            snapshot.unlink(missing_ok=True)
+        manifest.update(created=now.isoformat(timespec="seconds"), label=label)
+        _write_atomic(backup_path, json.dumps(manifest).encode())
+        (backup_dir / FINGERPRINT_FILE).write_text(f"{fingerprint} {backup_name}")
+        _cleanup_old_backups(backup_dir, current=backup_name)
+    logger.info(
+        "Backup criado: %s (%d chunks, %d bytes)",
+        backup_path,
+        len(manifest["chunks"]),
+        manifest["size"],
+    )
     return backup_path
 
 
-def _cleanup_old_backups(backup_dir: Path) -> None:
-    """Remove backups antigos mantendo apenas MAX_BACKUPS."""
-    backups = sorted(backup_dir.glob("timeblock-*.db"), key=lambda p: p.stat().st_mtime)
-    while len(backups) > MAX_BACKUPS:
-        oldest = backups.pop(0)
-        oldest.unlink()
+def _object_path(objects_dir: Path, key: str) -> Path:
+    """Caminho do chunk no store, particionado pelos 2 primeiros hex do hash."""
+    return objects_dir / key[:2] / key
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Grava em arquivo temporário e renomeia (nunca deixa arquivo truncado)."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+def _store_chunks(snapshot: Path, objects_dir: Path) -> dict:
+    """Grava os chunks ainda ausentes do snapshot e retorna o manifesto."""
+    digest = hashlib.sha256()
+    chunks: list[str] = []
+    size = 0
+    with snapshot.open("rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+            size += len(chunk)
+            key = hashlib.sha256(chunk).hexdigest()
+            path = _object_path(objects_dir, key)
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                _write_atomic(path, zlib.compress(chunk, COMPRESSION_LEVEL))
+            chunks.append(key)
+    return {"size": size, "sha256": digest.hexdigest(), "chunks": chunks}
+
+
+class _BackupRestartError(Exception):
+    """Escritas concorrentes reiniciaram a cópia paginada vezes demais."""
+
+
+def _snapshot(db_path: Path, dest: Path) -> None:
+    """Copia o banco para dest com sqlite3.Connection.backup.
+
+    A cópia avança em passos de BACKUP_PAGES_PER_STEP páginas, soltando
+    o lock de leitura entre passos para não bloquear a TUI nem a CLI.
+    Se outro processo grava no meio, o SQLite reinicia a cópia, então o
+    resultado é sempre um estado commitado. Após MAX_BACKUP_RESTARTS
+    reinícios, faz a cópia num passo único (uma transação de leitura).
+    """
+    restarts = 0
+    last_remaining: int | None = None
+
+    def _progress(status: int, remaining: int, total: int) -> None:
+        nonlocal restarts, last_remaining
+        if last_remaining is not None and remaining > last_remaining:
+            restarts += 1
+            if restarts > MAX_BACKUP_RESTARTS:
+                raise _BackupRestartError
+        last_remaining = remaining
+
+    with closing(sqlite3.connect(db_path)) as src, closing(sqlite3.connect(dest)) as dst:
+        try:
+            src.backup(
+                dst, pages=BACKUP_PAGES_PER_STEP, progress=_progress, sleep=BACKUP_STEP_SLEEP
+            )
+        except _BackupRestartError:
+            logger.info("Backup reiniciado %d vezes; copiando em passo único", restarts)
+            src.backup(dst)
+
+
+def _fingerprint(db_path: Path) -> str:
+    """SHA-256 do arquivo principal e do -wal (estado commitado em disco).
+
+    Um checkpoint muda os arquivos sem mudar o conteúdo lógico; nesse
+    caso o backup é refeito, nunca pulado indevidamente.
+    """
+    digest = hashlib.sha256()
+    for path in (db_path, db_path.with_name(db_path.name + "-wal")):
+        if path.exists():
+            with path.open("rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _last_backup_matches(backup_dir: Path, fingerprint: str) -> bool:
+    """True se o último backup registrado existe e tem o mesmo fingerprint."""
+    state = backup_dir / FINGERPRINT_FILE
+    if not state.exists():
+        return False
+    last_fingerprint, _, last_name = state.read_text().partition(" ")
+    return last_fingerprint == fingerprint and (backup_dir / last_name).exists()
+
+
+class BackupJob:
+    """create_backup em thread de fundo, com espera limitada.
+
+    A thread é daemon: se o processo encerrar antes do fim, resta apenas
+    o arquivo parcial, removido no próximo _cleanup_old_backups.
+    """
+
+    def __init__(self, label: str = "") -> None:
+        self.label = label
+        self.result: Path | None = None
+        self._thread = threading.Thread(target=self._run, name=f"backup-{label}", daemon=True)
+
+    def _run(self) -> None:
+        """Corpo da thread: registra a falha em vez de propagá-la."""
+        try:
+            self.result = create_backup(self.label)
+        except Exception:
+            logger.exception("Falha no backup em background: label=%s", self.label)
+
+    def start(self) -> "BackupJob":
+        """Inicia a thread e retorna o próprio job."""
+        self._thread.start()
+        return self
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Espera até timeout segundos; True se o backup terminou."""
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+
+def start_backup(label: str = "") -> BackupJob:
+    """Inicia backup em background (ver BackupJob)."""
+    return BackupJob(label).start()
+
+
+def _parse_backup_name(name: str) -> datetime | None:
+    """Timestamp do nome do backup, ou None se não é um backup."""
+    match = _BACKUP_NAME.match(name)
+    if match is None:
+        return None
+    try:
+        return datetime.strptime(match.group(1), "%Y%m%d-%H%M%S")
+    except ValueError:
+        return None
+
+
+def _scan_backups(backup_dir: Path) -> list[tuple[datetime, str]]:
+    """(timestamp, nome) dos backups, mais recente primeiro.
+
+    Usa apenas os nomes do diretório (sem stat por arquivo).
+    """
+    entries = []
+    for name in os.listdir(backup_dir):
+        stamp = _parse_backup_name(name)
+        if stamp is not None:
+            entries.append((stamp, name))
+    entries.sort(reverse=True)
+    return entries
+
+
+def _retained(entries: list[tuple[datetime, str]]) -> set[str]:
+    """Nomes mantidos pela retenção avô-pai-filho.
+
+    Mantém os KEEP_LAST mais recentes (ex: pre-restore seguido de
+    shutdown na mesma hora) e, em cada nível, o backup mais recente de
+    cada um dos últimos N períodos (hora, dia, semana ISO) com backup.
+    """
+    tiers = (
+        (KEEP_HOURLY, lambda stamp: (stamp.date(), stamp.hour)),
+        (KEEP_DAILY, lambda stamp: stamp.date()),
+        (KEEP_WEEKLY, lambda stamp: stamp.isocalendar()[:2]),
+    )
+    keep = {name for _, name in entries[:KEEP_LAST]}
+    for limit, period in tiers:
+        seen: set = set()
+        for stamp, name in entries:
+            key = period(stamp)
+            if key in seen:
+                continue
+            if len(seen) == limit:
+                break
+            seen.add(key)
+            keep.add(name)
+    return keep
+
+
+def _cleanup_old_backups(backup_dir: Path, current: str | None = None) -> None:
+    """Aplica a retenção avô-pai-filho e remove chunks órfãos.
+
+    O backup recém-criado (current) é sempre mantido, mesmo empatado no
+    segundo com outros. Também remove arquivos parciais deixados por
+    backups interrompidos.
+    """
+    for name in os.listdir(backup_dir):
+        if name.startswith("timeblock-") and name.endswith((PARTIAL_SUFFIX, ".tmp")):
+            (backup_dir / name).unlink(missing_ok=True)
+
+    entries = _scan_backups(backup_dir)
+    keep = _retained(entries)
+    if current is not None:
+        keep.add(current)
+    removed = [name for _, name in entries if name not in keep]
+    for name in removed:
+        (backup_dir / name).unlink(missing_ok=True)
+    if any(name.endswith(MANIFEST_SUFFIX) for name in removed):
+        _collect_garbage(backup_dir, [name for _, name in entries if name in keep])
+
+
+def _collect_garbage(backup_dir: Path, names: list[str]) -> None:
+    """Remove chunks não referenciados pelos manifestos restantes."""
+    referenced: set[str] = set()
+    for name in names:
+        if name.endswith(MANIFEST_SUFFIX):
+            referenced.update(_read_manifest(backup_dir / name)["chunks"])
+    objects_dir = backup_dir / OBJECTS_DIR_NAME
+    if not objects_dir.is_dir():
+        return
+    removed = 0
+    for prefix in os.listdir(objects_dir):
+        for key in os.listdir(objects_dir / prefix):
+            if key not in referenced:
+                (objects_dir / prefix / key).unlink(missing_ok=True)
+                removed += 1
+    logger.info("Backups: %d chunks órfãos removidos", removed)
+
+
+def _read_manifest(path: Path) -> dict:
+    """Lê um manifesto de backup (.json) com a lista de chunks."""
+    manifest: dict = json.loads(path.read_text())
+    return manifest
 
 
 def list_backups() -> list[Path]:
     """Lista backups existentes ordenados por data (mais recente primeiro)."""
     backup_dir = get_backup_dir()
     backup_dir.mkdir(exist_ok=True)
-    return sorted(backup_dir.glob("timeblock-*.db"), key=lambda p: p.stat().st_mtime, reverse=True)
+    return [backup_dir / name for _, name in _scan_backups(backup_dir)]
+
+
+def export_backup(backup_path: Path, dest: Path) -> Path:
+    """Reconstrói um backup como arquivo SQLite comum em dest.
+
+    Aceita manifestos (.json) e cópias completas antigas (.db).
+
+    Raises:
+        ValueError: Se chunks estão ausentes ou o conteúdo não confere
+            com o SHA-256 do manifesto.
+    """
+    if backup_path.suffix != MANIFEST_SUFFIX:
+        shutil.copy2(backup_path, dest)
+        return dest
+
+    manifest = _read_manifest(backup_path)
+    objects_dir = backup_path.parent / OBJECTS_DIR_NAME
+    digest = hashlib.sha256()
+    try:
+        with dest.open("wb") as out:
+            for key in manifest["chunks"]:
+                chunk = zlib.decompress(_object_path(objects_dir, key).read_bytes())
+                digest.update(chunk)
+                out.write(chunk)
+    except (OSError, zlib.error) as e:
+        dest.unlink(missing_ok=True)
+        raise ValueError(f"Backup corrompido: {backup_path.name}") from e
+    if digest.hexdigest() != manifest["sha256"]:
+        dest.unlink(missing_ok=True)
+        raise ValueError(f"Backup corrompido: {backup_path.name}")
+    return dest
 
 
 def restore_backup(backup_path: Path) -> bool:
-    logger.info("Restaurando backup: %s", backup_path)
     """Restaura banco a partir de um backup.
 
+    O backup é reconstruído e verificado antes de tocar no banco atual;
+    só então cria o backup de segurança (pre-restore) e troca o arquivo.
+
     Args:
         backup_path: Caminho do backup a restaurar.
 
     Returns:
         True se restaurou com sucesso.
+
+    Raises:
+        ValueError: Se o backup está corrompido (banco atual intacto).
     """
+    logger.info("Restaurando backup: %s", backup_path)
     db_path = Path(get_db_path())
     if not backup_path.exists():
         return False
 
+    staged = db_path.with_name(db_path.name + ".restore" + PARTIAL_SUFFIX)
+    export_backup(backup_path, staged)
     # Backup de segurança antes de restaurar
     create_backup(label="pre-restore")
-    shutil.copy2(backup_path, db_path)
+    invalidate_engine()
+    # WAL/SHM do banco anterior seriam reaplicados sobre o arquivo restaurado
+    for suffix in ("-wal", "-shm"):
+        db_path.with_name(db_path.name + suffix).unlink(missing_ok=True)
+    staged.replace(db_path)
     return True
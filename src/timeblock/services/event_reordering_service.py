@@ -1,6 +1,9 @@
 """Serviço para detecção de conflitos de eventos."""
 
+import heapq
+from collections.abc import Iterator
 from datetime import date, datetime, timedelta
+from itertools import groupby
 
 from sqlmodel import Session, or_, select
 
@@ -93,6 +96,9 @@ class EventReorderingService:
         Obtém todos os conflitos detectados em um dia específico.
 
         Útil para visualização geral dos conflitos da agenda do dia.
+        Carrega os intervalos do dia com uma query por tipo de entidade
+        e encontra os pares sobrepostos por varredura (sweep line) em
+        O(n log n + k), sem pares duplicados.
 
         Args:
             target_date: Data para verificar conflitos
@@ -103,75 +109,61 @@ class EventReorderingService:
         """
 
         def _get_conflicts(sess: Session) -> list[Conflict]:
-            all_conflicts = []
-
-            # Busca todos os eventos do dia
             day_start = datetime.combine(target_date, datetime.min.time())
             day_end = datetime.combine(target_date, datetime.max.time())
+            intervals = EventReorderingService._load_intervals(sess, day_start, day_end)
+            conflicts = list(EventReorderingService._iter_overlaps(intervals))
+            logger.debug("Conflitos do dia %s: %d", target_date, len(conflicts))
+            return conflicts
 
-            # Busca todas as tasks do dia
-            task_stmt = select(Task).where(Task.scheduled_datetime.between(day_start, day_end))  # type: ignore[attr-defined]
-            tasks = list(sess.exec(task_stmt).all())
+        if session is not None:
+            return _get_conflicts(session)
 
-            # Busca todas as instâncias de hábitos do dia
-            habit_stmt = select(HabitInstance).where(HabitInstance.date == target_date)
-            habits = list(sess.exec(habit_stmt).all())
+        with get_engine_context() as engine, Session(engine) as sess:
+            return _get_conflicts(sess)
 
-            # Busca todos os eventos do dia
-            event_stmt = select(Event).where(
-                or_(
-                    Event.scheduled_start.between(day_start, day_end),  # type: ignore[attr-defined]
-                    Event.scheduled_end.between(day_start, day_end),  # type: ignore[attr-defined]
-                    (Event.scheduled_start <= day_start) & (Event.scheduled_end >= day_end),
-                )
-            )
-            events = list(sess.exec(event_stmt).all())
-
-            # Verifica cada task contra os outros
-            for task in tasks:
-                task_conflicts = EventReorderingService.detect_conflicts(
-                    task.id,  # type: ignore[arg-type]
-                    "task",
-                    session=sess,
-                )
-                all_conflicts.extend(task_conflicts)
-
-            # Verifica cada instância de hábito contra os outros
-            for habit in habits:
-                habit_conflicts = EventReorderingService.detect_conflicts(
-                    habit.id,  # type: ignore[arg-type]
-                    "habit_instance",
-                    session=sess,
-                )
-                all_conflicts.extend(habit_conflicts)
-
-            # Verifica cada evento contra os outros
-            for event in events:
-                event_conflicts = EventReorderingService.detect_conflicts(
-                    event.id,  # type: ignore[arg-type]
-                    "event",
-                    session=sess,
-                )
-                all_conflicts.extend(event_conflicts)
-
-            # Remove conflitos duplicados (A vs B e B vs A)
-            unique_conflicts = []
-            seen_pairs = set()
-
-            for conflict in all_conflicts:
-                pair = tuple(
-                    sorted(
-                        [
-                            (conflict.triggered_event_id, conflict.triggered_event_type),
-                            (conflict.conflicting_event_id, conflict.conflicting_event_type),
-                        ]
-                    )
-                )
-                if pair not in seen_pairs:
-                    seen_pairs.add(pair)
-                    unique_conflicts.append(conflict)
+    @staticmethod
+    def get_conflicts_for_range(
+        start_date: date,
+        end_date: date,
+        session: Session | None = None,
+    ) -> dict[date, list[Conflict]]:
+        """
+        Obtém conflitos de um período, agrupados por dia.
+
+        Carrega o período inteiro com uma query por tipo de entidade e
+        faz uma única varredura. Cada conflito é atribuído ao dia em que
+        o segundo evento começa; dias sem conflitos não aparecem.
 
-            return unique_conflicts
+        Args:
+            start_date: Primeiro dia do período (inclusivo)
+            end_date: Último dia do período (inclusivo)
+            session: Optional session (for tests/transactions)
+
+        Returns:
+            Dict ordenado por data com os conflitos de cada dia
+
+        Raises:
+            ValueError: Se start_date > end_date
+        """
+        if start_date > end_date:
+            raise ValueError("start_date must be before or equal to end_date")
+
+        def _get_conflicts(sess: Session) -> dict[date, list[Conflict]]:
+            range_start = datetime.combine(start_date, datetime.min.time())
+            range_end = datetime.combine(end_date, datetime.max.time())
+            intervals = EventReorderingService._load_intervals(sess, range_start, range_end)
+
+            by_day: dict[date, list[Conflict]] = {}
+            overlaps = EventReorderingService._iter_overlaps(intervals)
+            # Eventos iniciados antes do período contam no primeiro dia
+            for day, day_conflicts in groupby(
+                overlaps, key=lambda c: max(c.conflicting_start.date(), start_date)
+            ):
+                by_day.setdefault(day, []).extend(day_conflicts)
+
+            logger.debug("Conflitos de %s a %s: %d dia(s)", start_date, end_date, len(by_day))
+            return by_day
 
         if session is not None:
             return _get_conflicts(session)
@@ -179,6 +171,74 @@ class EventReorderingService:
         with get_engine_context() as engine, Session(engine) as sess:
             return _get_conflicts(sess)
 
+    @staticmethod
+    def _load_intervals(
+        session: Session, range_start: datetime, range_end: datetime
+    ) -> list[tuple[datetime, datetime, int, str]]:
+        """Carrega intervalos (start, end, id, tipo) do período.
+
+        Uma query por tipo de entidade. Itens sem horário completo são
+        descartados.
+        """
+        items: list[tuple[Task | HabitInstance | Event, str]] = []
+
+        task_stmt = select(Task).where(
+            Task.scheduled_datetime.between(range_start, range_end)  # type: ignore[attr-defined]
+        )
+        items.extend((task, "task") for task in session.exec(task_stmt).all())
+
+        habit_stmt = select(HabitInstance).where(
+            HabitInstance.date.between(range_start.date(), range_end.date())  # type: ignore[attr-defined]
+        )
+        items.extend((habit, "habit_instance") for habit in session.exec(habit_stmt).all())
+
+        event_stmt = select(Event).where(
+            or_(
+                Event.scheduled_start.between(range_start, range_end),  # type: ignore[attr-defined]
+                Event.scheduled_end.between(range_start, range_end),  # type: ignore[attr-defined]
+                (Event.scheduled_start <= range_start) & (Event.scheduled_end >= range_end),
+            )
+        )
+        items.extend((evt, "event") for evt in session.exec(event_stmt).all())
+
+        intervals: list[tuple[datetime, datetime, int, str]] = []
+        for item, item_type in items:
+            start, end = EventReorderingService._get_event_times(item, item_type)
+            if start and end and item.id is not None:
+                intervals.append((start, end, item.id, item_type))
+        return intervals
+
+    @staticmethod
+    def _iter_overlaps(
+        intervals: list[tuple[datetime, datetime, int, str]],
+    ) -> Iterator[Conflict]:
+        """Encontra pares sobrepostos por varredura ordenada por início.
+
+        Mantém um heap dos intervalos ativos indexado pelo fim: ao avançar
+        para um novo início, descarta os que já terminaram e emite um
+        conflito com cada ativo restante. Cada par é emitido uma única
+        vez, com o evento que começou antes como disparador, em ordem
+        crescente de início do segundo evento.
+        """
+        active: list[tuple[datetime, datetime, int, str]] = []
+
+        for start, end, item_id, item_type in sorted(intervals):
+            while active and active[0][0] <= start:
+                heapq.heappop(active)
+            for act_end, act_start, act_id, act_type in active:
+                yield Conflict(
+                    triggered_event_id=act_id,
+                    triggered_event_type=act_type,
+                    conflicting_event_id=item_id,
+                    conflicting_event_type=item_type,
+                    conflict_type=ConflictType.OVERLAP,
+                    triggered_start=act_start,
+                    triggered_end=act_end,
+                    conflicting_start=start,
+                    conflicting_end=end,
+                )
+            heapq.heappush(active, (end, start, item_id, item_type))
+
     @staticmethod
     def _get_event_by_type(
         session: Session, event_id: int, event_type: str
@@ -1,17 +1,21 @@
 """Service para gerenciamento de instâncias de hábitos."""
 
+from collections.abc import Iterable, Sequence
 from datetime import date, time, timedelta
 
-from sqlmodel import Session, select
+from sqlalchemy import literal, tuple_
+from sqlalchemy.dialects.sqlite import Insert, insert
+from sqlalchemy.orm import contains_eager, selectinload
+from sqlmodel import Session, col, select
 
 from timeblock.database import get_engine_context
 from timeblock.models import Habit, HabitInstance, Recurrence
 from timeblock.models.enums import DoneSubstatus, NotDoneSubstatus, SkipReason, Status
-from timeblock.models.time_log import TimeLog
 from timeblock.utils.logger import get_logger
 
 from .event_reordering_models import Conflict
 from .event_reordering_service import EventReorderingService
+from .timer_service import TimerService
 
 logger = get_logger(__name__)
 
@@ -48,6 +52,8 @@ class HabitInstanceService:
         habit_id: int | None = None,
         date_start: date | None = None,
         date_end: date | None = None,
+        routine_id: int | None = None,
+        load_habit: bool = False,
         session: Session | None = None,
     ) -> list[HabitInstance]:
         """Lista instâncias com filtros opcionais.
@@ -58,6 +64,10 @@ class HabitInstanceService:
             habit_id: Filtra por hábito específico
             date_start: Data inicial do período
             date_end: Data final do período
+            routine_id: Filtra por rotina (JOIN com habits no SQL)
+            load_habit: Carrega inst.habit junto (sem lazy load por
+                instância). Com routine_id, vem no próprio JOIN;
+                sem, via selectinload (uma query extra).
             session: Sessão opcional
 
         Returns:
@@ -67,6 +77,13 @@ class HabitInstanceService:
         def _list(sess: Session) -> list[HabitInstance]:
             statement = select(HabitInstance)
 
+            if routine_id is not None:
+                statement = statement.join(Habit).where(Habit.routine_id == routine_id)
+                if load_habit:
+                    statement = statement.options(contains_eager(HabitInstance.habit))  # type: ignore[arg-type]
+            elif load_habit:
+                statement = statement.options(selectinload(HabitInstance.habit))  # type: ignore[arg-type]
+
             if habit_id is not None:
                 statement = statement.where(HabitInstance.habit_id == habit_id)
 
@@ -85,6 +102,81 @@ class HabitInstanceService:
         with get_engine_context() as engine, Session(engine) as sess:
             return _list(sess)
 
+    def list_instances_page(
+        self,
+        habit_id: int | None = None,
+        date_start: date | None = None,
+        date_end: date | None = None,
+        status: Status | None = None,
+        limit: int = 50,
+        after: int | None = None,
+        session: Session | None = None,
+    ) -> list[HabitInstance]:
+        """Página de instâncias ordenada por (date, scheduled_start, id).
+
+        BR-HABITINSTANCE-006: Listagem de Instâncias.
+
+        Paginação por keyset a partir da instância `after` (última da
+        página anterior): o custo por página independe do histórico.
+        Status filtrado em SQL e inst.habit carregado no mesmo JOIN.
+
+        Args:
+            habit_id: Filtra por hábito específico
+            date_start: Data inicial do período
+            date_end: Data final do período
+            status: Filtra por status (None = todos)
+            limit: Tamanho máximo da página
+            after: ID da última instância da página anterior
+            session: Sessão opcional
+
+        Returns:
+            Até `limit` instâncias, com habit carregado.
+
+        Raises:
+            ValueError: Se limit < 1 ou instância `after` não existe.
+        """
+        if limit < 1:
+            raise ValueError("limit must be >= 1")
+
+        def _page(sess: Session) -> list[HabitInstance]:
+            statement = (
+                select(HabitInstance).join(Habit).options(contains_eager(HabitInstance.habit))  # type: ignore[arg-type]
+            )
+            if habit_id is not None:
+                statement = statement.where(HabitInstance.habit_id == habit_id)
+            if date_start is not None:
+                statement = statement.where(HabitInstance.date >= date_start)
+            if date_end is not None:
+                statement = statement.where(HabitInstance.date <= date_end)
+            if status is not None:
+                statement = statement.where(HabitInstance.status == status)
+            if after is not None:
+                anchor = sess.get(HabitInstance, after)
+                if anchor is None:
+                    raise ValueError(f"HabitInstance {after} not found")
+                statement = statement.where(
+                    tuple_(
+                        col(HabitInstance.date),
+                        col(HabitInstance.scheduled_start),
+                        col(HabitInstance.id),
+                    )
+                    > tuple_(
+                        literal(anchor.date), literal(anchor.scheduled_start), literal(anchor.id)
+                    )
+                )
+            statement = statement.order_by(
+                col(HabitInstance.date),
+                col(HabitInstance.scheduled_start),
+                col(HabitInstance.id),
+            ).limit(limit)
+            return list(sess.exec(statement).all())
+
+        if session is not None:
+            return _page(session)
+
+        with get_engine_context() as engine, Session(engine) as sess:
+            return _page(sess)
+
     @staticmethod
     def generate_instances(
         habit_id: int,
@@ -92,44 +184,92 @@ class HabitInstanceService:
         end_date: date,
         session: Session | None = None,
     ) -> list[HabitInstance]:
-        """Gera instâncias de hábito para período."""
+        """Gera instâncias de hábito para período (BR-HABIT-003).
+
+        Delegado para generate_instances_bulk com um único hábito.
+        """
         logger.info(
-            f"Gerando instâncias para habit_id={habit_id}, período={start_date} até {end_date}"
+            "Gerando instâncias para habit_id=%s, período=%s até %s",
+            habit_id,
+            start_date,
+            end_date,
         )
+        return HabitInstanceService.generate_instances_bulk(
+            [habit_id], start_date, end_date, session=session
+        )
+
+    @staticmethod
+    def generate_instances_bulk(
+        habit_ids: Iterable[int],
+        start_date: date,
+        end_date: date,
+        session: Session | None = None,
+    ) -> list[HabitInstance]:
+        """Gera instâncias de vários hábitos para período numa transação.
+
+        Set-based: busca as datas existentes com uma query de intervalo,
+        calcula as datas faltantes em memória e insere todas com um único
+        executemany. As linhas criadas são recarregadas com uma query,
+        sem refresh por linha. Idempotente (BR-HABIT-003).
+
+        Args:
+            habit_ids: IDs dos hábitos (e.g. todos os hábitos de uma rotina)
+            start_date: Data inicial (inclusiva)
+            end_date: Data final (inclusiva)
+            session: Sessão opcional
+
+        Returns:
+            Instâncias criadas, ordenadas por data e habit_id.
+
+        Raises:
+            ValueError: Se algum hábito não existe.
+        """
+        ids = list(dict.fromkeys(habit_ids))
 
         def _generate(sess: Session) -> list[HabitInstance]:
-            habit = sess.get(Habit, habit_id)
-            if not habit:
-                logger.error(f"Hábito não encontrado: habit_id={habit_id}")
-                raise ValueError(f"Habit {habit_id} not found")
-
-            instances = []
-            current = start_date
-            while current <= end_date:
-                if HabitInstanceService._should_create_for_date(habit.recurrence, current):
-                    existing = sess.exec(
-                        select(HabitInstance)
-                        .where(HabitInstance.habit_id == habit_id)
-                        .where(HabitInstance.date == current)
-                    ).first()
-                    if existing is None:
-                        instance = HabitInstance(
-                            habit_id=habit_id,
-                            date=current,
-                            scheduled_start=habit.scheduled_start,
-                            scheduled_end=habit.scheduled_end,
-                            status=Status.PENDING,
-                        )
-                        sess.add(instance)
-                        instances.append(instance)
-
-                current += timedelta(days=1)
+            if not ids:
+                return []
+
+            habits = {h.id: h for h in sess.exec(select(Habit).where(col(Habit.id).in_(ids))).all()}
+            for habit_id in ids:
+                if habit_id not in habits:
+                    logger.error("Hábito não encontrado: habit_id=%s", habit_id)
+                    raise ValueError(f"Habit {habit_id} not found")
+
+            existing = set(
+                sess.exec(
+                    select(col(HabitInstance.habit_id), col(HabitInstance.date))
+                    .where(col(HabitInstance.habit_id).in_(ids))
+                    .where(col(HabitInstance.date) >= start_date)
+                    .where(col(HabitInstance.date) <= end_date)
+                ).all()
+            )
+
+            rows = HabitInstanceService._build_instance_rows(
+                list(habits.values()), start_date, end_date, skip=existing
+            )
 
+            if not rows:
+                logger.info("Nenhuma instância nova para habit_ids=%s", ids)
+                return []
+
+            sess.execute(_insert_skipping_existing(), rows)
             sess.commit()
-            for instance in instances:
-                sess.refresh(instance)
 
-            logger.info(f"Criadas {len(instances)} instâncias para habit_id={habit_id}")
+            created = {(r["habit_id"], r["date"]) for r in rows}
+            instances = [
+                inst
+                for inst in sess.exec(
+                    select(HabitInstance)
+                    .where(col(HabitInstance.habit_id).in_(ids))
+                    .where(HabitInstance.date >= start_date)
+                    .where(HabitInstance.date <= end_date)
+                    .order_by(col(HabitInstance.date), col(HabitInstance.habit_id))
+                ).all()
+                if (inst.habit_id, inst.date) in created
+            ]
+
+            logger.info("Criadas %d instâncias para habit_ids=%s", len(instances), ids)
             return instances
 
         if session is not None:
@@ -138,6 +278,77 @@ class HabitInstanceService:
         with get_engine_context() as engine, Session(engine) as sess:
             return _generate(sess)
 
+    @staticmethod
+    def upsert_instances(
+        habits: Sequence[Habit],
+        start_date: date,
+        end_date: date,
+        session: Session | None = None,
+    ) -> int:
+        """Garante instâncias PENDING para hábitos no período (BR-HABIT-003).
+
+        Usa INSERT ... ON CONFLICT(habit_id, date) DO NOTHING apoiado no
+        índice único da migração 004: um único statement por janela, sem
+        leitura prévia, seguro contra execuções concorrentes (e.g. duas
+        TUIs abertas). Com sessão fornecida não faz commit; o chamador
+        controla a transação.
+
+        Args:
+            habits: Hábitos já carregados
+            start_date: Data inicial (inclusiva)
+            end_date: Data final (inclusiva)
+            session: Sessão opcional
+
+        Returns:
+            Número de instâncias efetivamente criadas.
+        """
+        rows = HabitInstanceService._build_instance_rows(habits, start_date, end_date)
+        if not rows:
+            return 0
+
+        statement = _insert_skipping_existing().returning(col(HabitInstance.id))
+
+        def _upsert(sess: Session) -> int:
+            return len(sess.execute(statement, rows).all())
+
+        if session is not None:
+            return _upsert(session)
+
+        with get_engine_context() as engine, Session(engine) as sess:
+            created = _upsert(sess)
+            sess.commit()
+            return created
+
+    @staticmethod
+    def _build_instance_rows(
+        habits: Sequence[Habit],
+        start_date: date,
+        end_date: date,
+        skip: set[tuple[int, date]] | None = None,
+    ) -> list[dict]:
+        """Calcula em memória as linhas de instância aplicáveis ao período."""
+        rows: list[dict] = []
+        current = start_date
+        while current <= end_date:
+            for habit in habits:
+                if habit.id is None:
+                    continue
+                if skip and (habit.id, current) in skip:
+                    continue
+                if not HabitInstanceService._should_create_for_date(habit.recurrence, current):
+                    continue
+                rows.append(
+                    {
+                        "habit_id": habit.id,
+                        "date": current,
+                        "scheduled_start": habit.scheduled_start,
+                        "scheduled_end": habit.scheduled_end,
+                        "status": Status.PENDING,
+                    }
+                )
+            current += timedelta(days=1)
+        return rows
+
     @staticmethod
     def adjust_instance_time(
         instance_id: int,
@@ -161,21 +372,26 @@ class HabitInstanceService:
             Tupla (instância atualizada, lista de conflitos detectados ou None)
         """
         logger.debug(
-            f"Ajustando horário instance_id={instance_id}, new_start={new_start}, new_end={new_end}"
+            "Ajustando horário instance_id=%s, new_start=%s, new_end=%s",
+            instance_id,
+            new_start,
+            new_end,
         )
 
         # Validação
         if new_start is not None and new_end is not None and new_start >= new_end:
             logger.warning(
-                f"Horário inválido para instance_id={instance_id}: "
-                f"start={new_start} >= end={new_end}"
+                "Horário inválido para instance_id=%s: start=%s >= end=%s",
+                instance_id,
+                new_start,
+                new_end,
             )
             raise ValueError("Start time must be before end time")
 
         def _adjust(sess: Session) -> tuple[HabitInstance, bool]:
             instance = sess.get(HabitInstance, instance_id)
             if not instance:
-                logger.error(f"Instância não encontrada: instance_id={instance_id}")
+                logger.error("Instância não encontrada: instance_id=%s", instance_id)
                 raise ValueError(f"HabitInstance {instance_id} not found")
 
             time_changed = False
@@ -190,8 +406,10 @@ class HabitInstanceService:
 
             if time_changed:
                 logger.info(
-                    f"Horário ajustado para instance_id={instance_id}, "
-                    f"novo horário={instance.scheduled_start}-{instance.scheduled_end}"
+                    "Horário ajustado para instance_id=%s, novo horário=%s-%s",
+                    instance_id,
+                    instance.scheduled_start,
+                    instance.scheduled_end,
                 )
 
             sess.add(instance)
@@ -216,8 +434,9 @@ class HabitInstanceService:
 
             if conflicts:
                 logger.warning(
-                    f"Conflitos detectados para instance_id={instance_id}: "
-                    f"{len(conflicts)} conflito(s)"
+                    "Conflitos detectados para instance_id=%s: %s conflito(s)",
+                    instance_id,
+                    len(conflicts),
                 )
 
         return instance, conflicts
@@ -252,41 +471,40 @@ class HabitInstanceService:
             - completion_percentage → None
         """
         logger.debug(
-            f"Skip habit_instance_id={habit_instance_id}, "
-            f"reason={skip_reason.value}, note={skip_note}"
+            "Skip habit_instance_id=%s, reason=%s, note=%s",
+            habit_instance_id,
+            skip_reason.value,
+            skip_note,
         )
 
         def _skip(sess: Session) -> HabitInstance:
             # 1. Validação: nota <= 500 chars
             if skip_note and len(skip_note) > 500:
                 logger.warning(
-                    f"Skip note muito longa para instance_id={habit_instance_id}: "
-                    f"{len(skip_note)} chars"
+                    "Skip note muito longa para instance_id=%s: %s chars",
+                    habit_instance_id,
+                    len(skip_note),
                 )
                 raise ValueError("Skip note must be <= 500 characters")
 
             # 2. Buscar HabitInstance
             instance = sess.get(HabitInstance, habit_instance_id)
             if not instance:
-                logger.error(f"HabitInstance não encontrada: {habit_instance_id}")
+                logger.error("HabitInstance não encontrada: %s", habit_instance_id)
                 raise ValueError(f"HabitInstance {habit_instance_id} not found")
 
-            # 3. Validação: não pode ter timer ativo
-            statement = select(TimeLog).where(
-                TimeLog.habit_instance_id == habit_instance_id,
-                TimeLog.end_time.is_(None),  # type: ignore
-            )
-            active_timer = sess.exec(statement).first()
-            if active_timer:
+            # 3. Validação: não pode ter timer ativo (RUNNING/PAUSED; um
+            # timer resetado fica CANCELLED sem end_time e não bloqueia)
+            if TimerService.get_active_timer(habit_instance_id, session=sess):
                 logger.warning(
-                    f"Tentativa de skip com timer ativo: instance_id={habit_instance_id}"
+                    "Tentativa de skip com timer ativo: instance_id=%s", habit_instance_id
                 )
                 raise ValueError("Cannot skip with active timer. Stop timer first.")
 
             # 4. Validação: não pode skip se já completada
             if instance.status == Status.DONE:
                 logger.warning(
-                    f"Tentativa de skip de instance completada: instance_id={habit_instance_id}"
+                    "Tentativa de skip de instance completada: instance_id=%s", habit_instance_id
                 )
                 raise ValueError("Cannot skip completed instance")
 
@@ -309,7 +527,9 @@ class HabitInstanceService:
             sess.refresh(instance)
 
             logger.info(
-                f"Instance skipped: instance_id={habit_instance_id}, reason={skip_reason.value}"
+                "Instance skipped: instance_id=%s, reason=%s",
+                habit_instance_id,
+                skip_reason.value,
             )
             return instance
 
@@ -346,14 +566,16 @@ class HabitInstanceService:
             - completion_percentage → valor fornecido ou None
         """
         logger.debug(
-            f"Marcando como completa: instance_id={instance_id}, substatus={done_substatus.value}"
+            "Marcando como completa: instance_id=%s, substatus=%s",
+            instance_id,
+            done_substatus.value,
         )
 
         def _mark(sess: Session) -> HabitInstance | None:
             instance = sess.get(HabitInstance, instance_id)
             if not instance:
                 logger.warning(
-                    f"Tentativa de completar instância inexistente: instance_id={instance_id}"
+                    "Tentativa de completar instância inexistente: instance_id=%s", instance_id
                 )
                 return None
 
@@ -374,7 +596,9 @@ class HabitInstanceService:
             sess.refresh(instance)
 
             logger.info(
-                f"Instância completada: instance_id={instance_id}, substatus={done_substatus.value}"
+                "Instância completada: instance_id=%s, substatus=%s",
+                instance_id,
+                done_substatus.value,
             )
             return instance
 
@@ -393,13 +617,13 @@ class HabitInstanceService:
 
         DEPRECATED: Use skip_habit_instance() com categoria para BR-HABIT-SKIP-001.
         """
-        logger.debug(f"Marcando como pulada: instance_id={instance_id}")
+        logger.debug("Marcando como pulada: instance_id=%s", instance_id)
 
         def _mark(sess: Session) -> HabitInstance | None:
             instance = sess.get(HabitInstance, instance_id)
             if not instance:
                 logger.warning(
-                    f"Tentativa de pular instância inexistente: instance_id={instance_id}"
+                    "Tentativa de pular instância inexistente: instance_id=%s", instance_id
                 )
                 return None
 
@@ -408,7 +632,7 @@ class HabitInstanceService:
             sess.commit()
             sess.refresh(instance)
 
-            logger.info(f"Instância pulada: instance_id={instance_id}")
+            logger.info("Instância pulada: instance_id=%s", instance_id)
             return instance
 
         if session is not None:
@@ -444,3 +668,14 @@ class HabitInstanceService:
             return weekday == 6
 
         return False
+
+
+def _insert_skipping_existing() -> Insert:
+    """INSERT que ignora só o conflito no índice único (habit_id, date).
+
+    Diferente de INSERT OR IGNORE, violações de NOT NULL, CHECK ou FK
+    continuam levantando erro.
+    """
+    return insert(HabitInstance).on_conflict_do_nothing(
+        index_elements=[col(HabitInstance.habit_id), col(HabitInstance.date)]
+    )
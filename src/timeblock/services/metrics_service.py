@@ -0,0 +1,253 @@
+"""Serviço de métricas de completude de rotina (BR-TUI-033).
+
+Constrói, a partir do rollup habit_day_stats, um array denso por dia
+com somas de prefixo: qualquer janela (7/14/30/90/365 dias) custa O(1)
+depois de um build O(dias), sem carregar instâncias ORM.
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from sqlmodel import Session, col, select
+
+from timeblock.database import get_engine_context
+from timeblock.models import HabitDayStats
+from timeblock.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class Streak:
+    """Sequência de dias consecutivos com 100% dos hábitos DONE."""
+
+    start: date
+    end: date
+
+    @property
+    def length(self) -> int:
+        """Número de dias da sequência."""
+        return (self.end - self.start).days + 1
+
+
+class CompletionHistory:
+    """Histórico diário denso de uma rotina com somas de prefixo.
+
+    Índice i corresponde a start + i dias. Dias sem instâncias contam
+    como ausentes: não entram na média e quebram streaks.
+    """
+
+    def __init__(self, start: date, end: date, days: dict[date, tuple[int, int]]) -> None:
+        """Monta os arrays em O(dias) a partir de {data: (done, total)}."""
+        self.start = start
+        self.end = end
+        size = max((end - start).days + 1, 0)
+        self._done = [0] * size
+        self._total = [0] * size
+        for day, (done, total) in days.items():
+            if start <= day <= end:
+                self._done[(day - start).days] = done
+                self._total[(day - start).days] = total
+
+        # Prefixos: soma das porcentagens diárias e dias com instâncias
+        self._pct_prefix = [0.0] * (size + 1)
+        self._active_prefix = [0] * (size + 1)
+        # run[i]: tamanho da sequência 100% que termina em i
+        self._run = [0] * size
+        for i in range(size):
+            total = self._total[i]
+            full = total > 0 and self._done[i] == total
+            self._pct_prefix[i + 1] = self._pct_prefix[i] + (
+                self._done[i] / total * 100 if total else 0.0
+            )
+            self._active_prefix[i + 1] = self._active_prefix[i] + (1 if total else 0)
+            self._run[i] = (self._run[i - 1] + 1 if i else 1) if full else 0
+
+        # run_stop[i]: último índice da sequência que contém i
+        self._run_stop = list(range(size))
+        for i in range(size - 2, -1, -1):
+            if self._run[i] and self._run[i + 1]:
+                self._run_stop[i] = self._run_stop[i + 1]
+
+        self._run_max = self._build_sparse_table(self._run)
+
+    @staticmethod
+    def _build_sparse_table(values: list[int]) -> list[list[int]]:
+        """Sparse table para máximo em intervalo em O(1)."""
+        table = [values]
+        width = 1
+        while width * 2 <= len(values):
+            prev = table[-1]
+            table.append([max(prev[i], prev[i + width]) for i in range(len(prev) - width)])
+            width *= 2
+        return table
+
+    def _range_max(self, lo: int, hi: int) -> int:
+        """Máximo de run[lo..hi] (inclusivo)."""
+        if lo > hi:
+            return 0
+        level = (hi - lo + 1).bit_length() - 1
+        row = self._run_max[level]
+        return max(row[lo], row[hi - (1 << level) + 1])
+
+    def _index(self, day: date) -> int:
+        return (day - self.start).days
+
+    def day(self, day: date) -> tuple[int, int]:
+        """Retorna (done, total) do dia; (0, 0) fora do histórico."""
+        i = self._index(day)
+        if 0 <= i < len(self._total):
+            return self._done[i], self._total[i]
+        return 0, 0
+
+    def _window(self, window: int, end: date | None) -> tuple[int, int]:
+        """Converte janela em fatia [lo, hi) dos arrays."""
+        if window < 1:
+            raise ValueError("window deve ser >= 1")
+        last = self._index(end or self.end)
+        hi = min(last, len(self._total) - 1) + 1
+        lo = max(last - window + 1, 0)
+        return lo, max(hi, lo)
+
+    def active_days(self, window: int, end: date | None = None) -> int:
+        """Dias com instâncias nos últimos `window` dias até `end`. O(1).
+
+        Raises:
+            ValueError: Se window < 1.
+        """
+        lo, hi = self._window(window, end)
+        return self._active_prefix[hi] - self._active_prefix[lo]
+
+    def completion_rate(self, window: int, end: date | None = None) -> int:
+        """Média das porcentagens diárias nos últimos `window` dias até `end`.
+
+        Apenas dias com instâncias entram na média. O(1).
+
+        Raises:
+            ValueError: Se window < 1.
+        """
+        lo, hi = self._window(window, end)
+        active = self._active_prefix[hi] - self._active_prefix[lo]
+        if not active:
+            return 0
+        return int((self._pct_prefix[hi] - self._pct_prefix[lo]) / active)
+
+    def current_streak(self, today: date | None = None) -> int:
+        """Streak que termina em `today` (0 se o dia não está 100%). O(1)."""
+        i = self._index(today or self.end)
+        if 0 <= i < len(self._run):
+            return self._run[i]
+        return 0
+
+    def best_streak_between(self, start: date, end: date) -> int:
+        """Maior streak contido em [start, end], cortando nas bordas. O(1).
+
+        Raises:
+            ValueError: Se start > end.
+        """
+        if start > end:
+            raise ValueError("start deve ser anterior ou igual a end")
+        lo = max(self._index(start), 0)
+        hi = min(self._index(end), len(self._run) - 1)
+        if lo > hi:
+            return 0
+        # Sequência que atravessa `start` conta só a partir de lo; as
+        # seguintes começam dentro do período e run[] já as mede certo.
+        if not self._run[lo]:
+            return self._range_max(lo, hi)
+        first_end = min(self._run_stop[lo], hi)
+        return max(first_end - lo + 1, self._range_max(first_end + 1, hi))
+
+    def streak_history(self) -> list[Streak]:
+        """Lista todas as sequências 100% em ordem cronológica. O(dias)."""
+        streaks: list[Streak] = []
+        for i, run in enumerate(self._run):
+            ends_here = run and (i + 1 == len(self._run) or not self._run[i + 1])
+            if ends_here:
+                end = self.start + timedelta(days=i)
+                streaks.append(Streak(start=end - timedelta(days=run - 1), end=end))
+        return streaks
+
+
+class MetricsService:
+    """Serviço de métricas de completude por rotina."""
+
+    @staticmethod
+    def load_history(
+        routine_id: int,
+        start: date | None = None,
+        end: date | None = None,
+        session: Session | None = None,
+    ) -> CompletionHistory:
+        """Carrega o histórico diário da rotina com uma query no rollup.
+
+        Args:
+            routine_id: ID da rotina
+            start: Data inicial (default: primeiro dia com instâncias)
+            end: Data final (default: hoje)
+            session: Sessão opcional
+
+        Returns:
+            CompletionHistory cobrindo [start, end].
+        """
+        end = end or date.today()
+
+        def _load(sess: Session) -> CompletionHistory:
+            statement = (
+                select(col(HabitDayStats.date), col(HabitDayStats.done), col(HabitDayStats.total))
+                .where(col(HabitDayStats.routine_id) == routine_id)
+                .where(col(HabitDayStats.date) <= end)
+                .where(col(HabitDayStats.total) > 0)
+                .order_by(col(HabitDayStats.date))
+            )
+            if start is not None:
+                statement = statement.where(col(HabitDayStats.date) >= start)
+            rows = sess.exec(statement).all()
+            days = {d: (done, total) for d, done, total in rows}
+            first = start or (rows[0][0] if rows else end)
+            logger.debug(
+                "Histórico carregado: routine_id=%s, %d dias com dados", routine_id, len(days)
+            )
+            return CompletionHistory(first, end, days)
+
+        if session is not None:
+            return _load(session)
+
+        with get_engine_context() as engine, Session(engine) as sess:
+            return _load(sess)
+
+    @staticmethod
+    def completion_rate(
+        routine_id: int,
+        window: int,
+        end: date | None = None,
+        session: Session | None = None,
+    ) -> int:
+        """Completude média (%) nos últimos `window` dias até `end`."""
+        end = end or date.today()
+        history = MetricsService.load_history(
+            routine_id, end - timedelta(days=window - 1), end, session=session
+        )
+        return history.completion_rate(window, end)
+
+    @staticmethod
+    def streak_history(routine_id: int, session: Session | None = None) -> list[Streak]:
+        """Todas as sequências 100% da rotina, em ordem cronológica."""
+        return MetricsService.load_history(routine_id, session=session).streak_history()
+
+    @staticmethod
+    def best_streak_between(
+        routine_id: int,
+        start: date,
+        end: date,
+        session: Session | None = None,
+    ) -> int:
+        """Maior streak contido no período [start, end].
+
+        Raises:
+            ValueError: Se start > end.
+        """
+        if start > end:
+            raise ValueError("start deve ser anterior ou igual a end")
+        history = MetricsService.load_history(routine_id, start, end, session=session)
+        return history.best_streak_between(start, end)
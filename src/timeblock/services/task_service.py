@@ -2,6 +2,7 @@
 
 from datetime import datetime
 
+from sqlalchemy import literal, tuple_
 from sqlmodel import Session, col, select
 
 from timeblock.database import get_engine_context
@@ -13,6 +14,8 @@ from .event_reordering_service import EventReorderingService
 
 logger = get_logger(__name__)
 
+TASK_STATUSES = ("pending", "completed", "cancelled")
+
 
 class TaskService:
     """Serviço de gerenciamento de tasks (ADR-036)."""
@@ -90,17 +93,91 @@ class TaskService:
         with get_engine_context() as engine, Session(engine) as sess:
             return _list(sess)
 
+    @staticmethod
+    def list_tasks_page(
+        start: datetime | None = None,
+        end: datetime | None = None,
+        status: str | None = None,
+        limit: int = 50,
+        after: int | None = None,
+        session: Session | None = None,
+    ) -> list[Task]:
+        """Página de tasks ordenada por (scheduled_datetime, id).
+
+        Paginação por keyset: a próxima página começa depois da task
+        `after` (última da página anterior), então o custo por página
+        não depende de quantas tasks vieram antes. Filtro de status em
+        SQL, com a precedência de derived_status (BR-TASK-007).
+
+        Args:
+            start: Início do período (scheduled_datetime)
+            end: Fim do período (scheduled_datetime)
+            status: "pending", "completed" ou "cancelled" (None = todas)
+            limit: Tamanho máximo da página
+            after: ID da última task da página anterior
+            session: Sessão opcional
+
+        Returns:
+            Até `limit` tasks.
+
+        Raises:
+            ValueError: Se limit < 1, status inválido ou task `after` não existe.
+        """
+        if limit < 1:
+            raise ValueError("limit must be >= 1")
+        if status is not None and status not in TASK_STATUSES:
+            raise ValueError(f"Invalid status: {status}")
+
+        def _page(sess: Session) -> list[Task]:
+            statement = select(Task)
+            if status == "pending":
+                statement = statement.where(
+                    col(Task.completed_datetime).is_(None),
+                    col(Task.cancelled_datetime).is_(None),
+                )
+            elif status == "completed":
+                statement = statement.where(
+                    col(Task.completed_datetime).is_not(None),
+                    col(Task.cancelled_datetime).is_(None),
+                )
+            elif status == "cancelled":
+                statement = statement.where(col(Task.cancelled_datetime).is_not(None))
+            if start:
+                statement = statement.where(Task.scheduled_datetime >= start)
+            if end:
+                statement = statement.where(Task.scheduled_datetime <= end)
+            if after is not None:
+                anchor = sess.get(Task, after)
+                if anchor is None:
+                    raise ValueError(f"Task {after} not found")
+                statement = statement.where(
+                    tuple_(col(Task.scheduled_datetime), col(Task.id))
+                    > tuple_(literal(anchor.scheduled_datetime), literal(anchor.id))
+                )
+            statement = statement.order_by(col(Task.scheduled_datetime), col(Task.id)).limit(limit)
+            return list(sess.exec(statement).all())
+
+        if session is not None:
+            return _page(session)
+        with get_engine_context() as engine, Session(engine) as sess:
+            return _page(sess)
+
     @staticmethod
     def list_pending_tasks(session: Session | None = None) -> list[Task]:
         """Lista tasks pendentes (não concluídas e não canceladas).
 
         BR-TASK-009: tasks canceladas são excluídas da lista de pendentes.
+        Ordenadas por scheduled_datetime (índice parcial ix_tasks_pending_scheduled).
         """
 
         def _list(sess: Session) -> list[Task]:
-            statement = select(Task).where(
-                col(Task.completed_datetime).is_(None),
-                col(Task.cancelled_datetime).is_(None),
+            statement = (
+                select(Task)
+                .where(
+                    col(Task.completed_datetime).is_(None),
+                    col(Task.cancelled_datetime).is_(None),
+                )
+                .order_by(col(Task.scheduled_datetime))
             )
             return list(sess.exec(statement).all())
 
@@ -2,7 +2,8 @@
 
 from datetime import date, datetime, time, timedelta
 
-from sqlmodel import Session, select
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, col, select
 
 from timeblock.database.engine import get_engine_context
 from timeblock.models.enums import DoneSubstatus, Status, TimerStatus
@@ -12,6 +13,20 @@ from timeblock.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+ACTIVE_STATUSES = (TimerStatus.RUNNING, TimerStatus.PAUSED)
+
+
+def _find_active_timer(sess: Session) -> TimeLog | None:
+    """Busca o timer ativo (BR-TIMER-001).
+
+    O planner resolve o IN por ix_time_log_status (SEARCH status=?); o
+    índice parcial ix_time_log_single_active não serve à busca, mas
+    garante no máximo uma linha RUNNING/PAUSED, então o SEARCH toca uma
+    entrada, independente do tamanho do histórico de time_log.
+    """
+    statement = select(TimeLog).where(col(TimeLog.status).in_(ACTIVE_STATUSES))
+    return sess.exec(statement).first()
+
 
 class TimerService:
     """Service para operações de timer.
@@ -114,11 +129,7 @@ class TimerService:
                 raise ValueError(f"HabitInstance {habit_instance_id} not found")
 
             # BR-TIMER-001: Verificar se já existe timer ativo
-            statement = select(TimeLog).where(
-                TimeLog.status.in_([TimerStatus.RUNNING, TimerStatus.PAUSED])  # type: ignore[union-attr]
-            )
-            existing_timer = sess.exec(statement).first()
-            if existing_timer:
+            if _find_active_timer(sess):
                 raise ValueError("Timer already active")
 
             timelog = TimeLog(
@@ -127,7 +138,12 @@ class TimerService:
                 status=TimerStatus.RUNNING,
             )
             sess.add(timelog)
-            sess.commit()
+            try:
+                sess.commit()
+            except IntegrityError as e:
+                # Outro processo iniciou um timer entre a verificação e o commit
+                sess.rollback()
+                raise ValueError("Timer already active") from e
             sess.refresh(timelog)
             logger.info(
                 "Timer iniciado: timelog_id=%s, instance_id=%s", timelog.id, habit_instance_id
@@ -163,7 +179,7 @@ class TimerService:
             if not timelog:
                 raise ValueError(f"TimeLog {timelog_id} not found")
 
-            if timelog.status not in [TimerStatus.RUNNING, TimerStatus.PAUSED]:
+            if timelog.status not in ACTIVE_STATUSES:
                 raise ValueError("Timer not active")
 
             # Se estava pausado, acumula última pausa
@@ -396,11 +412,11 @@ class TimerService:
         """
 
         def _get(sess: Session) -> TimeLog | None:
-            statement = select(TimeLog).where(
-                TimeLog.habit_instance_id == habit_instance_id,
-                TimeLog.status.in_([TimerStatus.RUNNING, TimerStatus.PAUSED]),  # type: ignore[union-attr]
-            )
-            return sess.exec(statement).first()
+            # Há no máximo um timer ativo: basta comparar a instância dele
+            timer = _find_active_timer(sess)
+            if timer and timer.habit_instance_id == habit_instance_id:
+                return timer
+            return None
 
         if session is not None:
             return _get(session)
@@ -421,17 +437,11 @@ class TimerService:
             TimeLog ativo ou None
         """
 
-        def _get(sess: Session) -> TimeLog | None:
-            statement = select(TimeLog).where(
-                TimeLog.status.in_([TimerStatus.RUNNING, TimerStatus.PAUSED])  # type: ignore[union-attr]
-            )
-            return sess.exec(statement).first()
-
         if session is not None:
-            return _get(session)
+            return _find_active_timer(session)
 
         with get_engine_context() as engine, Session(engine) as sess:
-            return _get(sess)
+            return _find_active_timer(sess)
 
     def log_manual(
         self,
@@ -1,18 +1,19 @@
 """ATOMVS - Aplicação TUI"""
 
+import asyncio
+import importlib
+import time
 from pathlib import PurePath
 from typing import Any, ClassVar
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
+from textual.widget import Widget
 
-from timeblock.services.backup_service import create_backup
+from timeblock.database.engine import dispose_engines
+from timeblock.services.backup_service import SHUTDOWN_BACKUP_TIMEOUT, start_backup
 from timeblock.tui.screens.dashboard import DashboardScreen
-from timeblock.tui.screens.habits import HabitsScreen
-from timeblock.tui.screens.routines import RoutinesScreen
-from timeblock.tui.screens.tasks import TasksScreen
-from timeblock.tui.screens.timer import TimerScreen
 from timeblock.tui.widgets.header_bar import HeaderBar
 from timeblock.tui.widgets.help_overlay import HelpOverlay
 from timeblock.tui.widgets.nav_bar import NavBar
@@ -37,6 +38,15 @@ SCREEN_IDS = {
     "timer": "timer-view",
 }
 
+# Screens além do Dashboard: importadas, construídas e montadas na
+# primeira visita (action_switch_screen), fora do caminho de startup.
+LAZY_SCREENS = {
+    "routines": ("timeblock.tui.screens.routines", "RoutinesScreen"),
+    "habits": ("timeblock.tui.screens.habits", "HabitsScreen"),
+    "tasks": ("timeblock.tui.screens.tasks", "TasksScreen"),
+    "timer": ("timeblock.tui.screens.timer", "TimerScreen"),
+}
+
 
 class TimeBlockApp(App):
     """ATOMVS TimeBlock - TUI Interface."""
@@ -65,27 +75,43 @@ class TimeBlockApp(App):
 
     active_screen: str = "dashboard"
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._created_at = time.perf_counter()
+        self.first_paint_ms: float | None = None
+
     def compose(self) -> ComposeResult:
         """Compõe layout: sidebar | (header + content)."""
         with Horizontal(id="main-layout"):
             yield NavBar(id="sidebar")
             with Vertical(id="content-area"):
                 yield HeaderBar(id="header-bar")
-                yield Container(
-                    DashboardScreen(id="dashboard-view"),
-                    RoutinesScreen(id="routines-view"),
-                    HabitsScreen(id="habits-view"),
-                    TasksScreen(id="tasks-view"),
-                    TimerScreen(id="timer-view"),
-                    id="screen-container",
-                )
+                yield Container(DashboardScreen(id="dashboard-view"), id="screen-container")
         yield StatusBar()
 
     def on_mount(self) -> None:
-        """Oculta todas as screens exceto Dashboard."""
+        """Agenda a medição do primeiro paint do Dashboard."""
         logger.info("TUI inicializada — screen: dashboard")
-        for name, screen_id in SCREEN_IDS.items():
-            self.query_one(f"#{screen_id}").display = name == "dashboard"
+        self.call_after_refresh(self._record_first_paint)
+
+    def _record_first_paint(self) -> None:
+        """Registra tempo da construção do app até o primeiro paint."""
+        self.first_paint_ms = (time.perf_counter() - self._created_at) * 1000
+        logger.info("Dashboard pintado em %.0f ms", self.first_paint_ms)
+
+    async def _get_or_mount_screen(self, screen: str) -> Widget:
+        """Retorna a screen, importando e montando na primeira visita."""
+        screen_id = SCREEN_IDS[screen]
+        mounted = self.query(f"#{screen_id}")
+        if mounted:
+            return mounted.first(Widget)
+        module_name, class_name = LAZY_SCREENS[screen]
+        screen_cls: type[Widget] = getattr(importlib.import_module(module_name), class_name)
+        widget = screen_cls(id=screen_id)
+        widget.display = False
+        await self.query_one("#screen-container").mount(widget)
+        logger.debug("Screen montada na primeira visita: %s", screen)
+        return widget
 
     def _handle_exception(self, error: Exception) -> None:
         """Loga exceções não capturadas antes de delegar ao Textual.
@@ -103,15 +129,26 @@ class TimeBlockApp(App):
         super()._handle_exception(error)
 
     async def action_switch_screen(self, screen: str) -> None:
-        """Alterna a screen ativa via display toggle."""
+        """Alterna a screen ativa via display toggle.
+
+        Screens ocultas têm seus intervals pausados (pause_intervals) e
+        retomados ao voltar (resume_intervals), quando implementam.
+        """
         if screen not in SCREENS or screen == self.active_screen:
             return
 
-        self.query_one(f"#{SCREEN_IDS[self.active_screen]}").display = False
+        new_screen = await self._get_or_mount_screen(screen)
+        old_screen = self.query_one(f"#{SCREEN_IDS[self.active_screen]}")
+        old_screen.display = False
+        pause = getattr(old_screen, "pause_intervals", None)
+        if pause is not None:
+            pause()
 
         self.active_screen = screen
-        new_screen = self.query_one(f"#{SCREEN_IDS[screen]}")
         new_screen.display = True
+        resume = getattr(new_screen, "resume_intervals", None)
+        if resume is not None:
+            resume()
 
         refresh = getattr(new_screen, "refresh_data", None)
         if refresh is not None:
@@ -153,7 +190,17 @@ class TimeBlockApp(App):
             self.set_focus(None)
 
     async def action_quit(self) -> None:
-        """Faz backup e encerra a aplicação."""
+        """Faz backup e encerra a aplicação.
+
+        O backup roda em thread; a espera é limitada para que um banco
+        grande não trave o encerramento.
+        """
         logger.info("Encerrando TUI — backup de shutdown")
-        create_backup(label="shutdown")
+        job = start_backup(label="shutdown")
+        if not await asyncio.to_thread(job.wait, SHUTDOWN_BACKUP_TIMEOUT):
+            logger.warning(
+                "Backup de shutdown não terminou em %.1fs; encerrando sem ele",
+                SHUTDOWN_BACKUP_TIMEOUT,
+            )
+        dispose_engines()
         self.exit()
@@ -3,103 +3,92 @@
 Responsabilidade única: buscar dados via services e transformar
 em dicts para consumo dos panels. Nenhuma lógica de apresentação.
 
+Cada leitura existe uma vez, como _read_*(session, ...). Os load_*
+são wrappers de uma sessão sobre elas (via _run) e o dashboard usa
+load_dashboard_snapshot, que compõe as mesmas _read_* numa sessão;
+os dois caminhos não têm como divergir.
+
 Referências:
     - RF-003: Split Phase (FOWLER, 2018, p. 154)
     - BR-TUI-009: Service Layer Sharing
 """
 
-from datetime import date, datetime, timedelta
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date, timedelta
 from typing import Any
 
+from sqlalchemy import case, func
 from sqlmodel import Session, col, select
 
-from timeblock.models.enums import Status, TimerStatus
+from timeblock.models.enums import Status
 from timeblock.models.habit import Habit
+from timeblock.models.habit_day_stats import HabitDayStats
 from timeblock.models.habit_instance import HabitInstance
 from timeblock.models.routine import Routine
 from timeblock.models.time_log import TimeLog
 from timeblock.services.habit_instance_service import HabitInstanceService
+from timeblock.services.metrics_service import MetricsService
 from timeblock.services.routine_service import RoutineService
 from timeblock.services.task_service import TaskService
 from timeblock.services.timer_service import TimerService
+from timeblock.tui.screens.dashboard.timer_state import TimerState, format_timer
 from timeblock.tui.session import service_action
 from timeblock.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_NO_ROUTINE: tuple[int | None, str] = (None, "")
 
-def ensure_today_instances() -> int:
-    """Garante instâncias para todos os hábitos aplicáveis ao dia (DT-023).
 
-    Chamado no startup da TUI e na detecção de virada de dia.
-    Para cada hábito da rotina ativa cuja recurrence bate com hoje
-    e que ainda não tem instância, gera via INSERT direto.
-    Idempotente — chamadas repetidas não duplicam.
+def _run[T](read: Callable[[Session], T], default: T, name: str) -> T:
+    """Executa read numa sessão via service_action; default em erro ou vazio."""
+    try:
+        result, error = service_action(read)
+    except Exception:
+        logger.exception("Falha em %s", name)
+        return default
+    if error or not result:
+        return default
+    return result
 
-    Returns:
-        Número de instâncias criadas.
-    """
 
-    def _ensure(s: Session) -> int:
-        routine = RoutineService(s).get_active_routine()
-        if not routine or not routine.id:
-            return 0
+def _upsert_window(s: Session, routine: Routine | None, days: int, end: date) -> int:
+    """Upsert das instâncias dos hábitos da rotina em [today - days, end].
 
-        habits = list(s.exec(select(Habit).where(Habit.routine_id == routine.id)).all())
-        if not habits:
-            return 0
+    O início nunca é anterior ao created_at da rotina (BR-TUI-033-R8).
+    Um único statement apoiado no índice único (habit_id, date): seguro
+    contra duas TUIs abertas ao mesmo tempo e idempotente.
+    """
+    if routine is None or routine.id is None:
+        return 0
+    start = max(date.today() - timedelta(days=days), routine.created_at.date())
+    if start > end:
+        return 0
+    habits = list(s.exec(select(Habit).where(Habit.routine_id == routine.id)).all())
+    if not habits:
+        return 0
+    return HabitInstanceService.upsert_instances(habits, start, end, session=s)
 
-        today = date.today()
-        habit_ids = [h.id for h in habits if h.id is not None]
 
-        existing_ids = set(
-            s.exec(
-                select(HabitInstance.habit_id)
-                .where(HabitInstance.date == today)
-                .where(col(HabitInstance.habit_id).in_(habit_ids))
-            ).all()
-        )
+def ensure_today_instances() -> int:
+    """Garante instâncias para todos os hábitos aplicáveis ao dia (DT-023).
 
-        created = 0
-        for habit in habits:
-            if habit.id is None:
-                continue
-            if habit.id in existing_ids:
-                continue
-            if not HabitInstanceService._should_create_for_date(habit.recurrence, today):
-                continue
-            s.add(
-                HabitInstance(
-                    habit_id=habit.id,
-                    date=today,
-                    scheduled_start=habit.scheduled_start,
-                    scheduled_end=habit.scheduled_end,
-                    status=Status.PENDING,
-                )
-            )
-            created += 1
-
-        return created
+    Atalho para ensure_startup_instances(days=0), usado na virada de dia.
+    Idempotente.
 
-    try:
-        result, error = service_action(_ensure)
-        if error or result is None:
-            return 0
-        return result
-    except Exception:
-        logger.exception("Falha em ensure_today_instances")
-        return 0
+    Returns:
+        Número de instâncias criadas.
+    """
+    return ensure_startup_instances(days=0)
 
 
 def ensure_period_instances(routine_id: int | None = None, days: int = 7) -> int:
     """Gera instâncias PENDING retroativas para dias sem registro (BR-TUI-033-R8).
 
-    Para cada dia no período [today - days, yesterday], verifica hábitos
-    da rotina que deveriam ter instâncias (conforme recurrence) mas não têm.
-    Cria instâncias PENDING para esses dias.
-
-    Não cria para hoje (ensure_today_instances cuida disso).
-    Não cria para datas anteriores ao created_at da rotina.
+    Para o período [today - days, yesterday], gera instâncias dos hábitos
+    da rotina conforme recurrence com um único upsert para a janela.
+    Não cria para hoje nem para datas anteriores ao created_at da rotina.
     Idempotente.
 
     Args:
@@ -111,62 +100,37 @@ def ensure_period_instances(routine_id: int | None = None, days: int = 7) -> int
     """
     if routine_id is None:
         return 0
+    yesterday = date.today() - timedelta(days=1)
+    return _run(
+        lambda s: _upsert_window(s, s.get(Routine, routine_id), days, yesterday),
+        0,
+        "ensure_period_instances",
+    )
 
-    def _ensure(s: Session) -> int:
-        routine = s.exec(select(Routine).where(Routine.id == routine_id)).first()
-        if not routine:
-            return 0
-
-        habits = list(s.exec(select(Habit).where(Habit.routine_id == routine_id)).all())
-        if not habits:
-            return 0
-
-        today = date.today()
-        boundary = routine.created_at.date()
-        habit_ids = [h.id for h in habits if h.id is not None]
-
-        created = 0
-        for day_offset in range(1, days + 1):
-            d = today - timedelta(days=day_offset)
-            if d < boundary:
-                break
-
-            existing_ids = set(
-                s.exec(
-                    select(HabitInstance.habit_id)
-                    .where(HabitInstance.date == d)
-                    .where(col(HabitInstance.habit_id).in_(habit_ids))
-                ).all()
-            )
-
-            for habit in habits:
-                if habit.id is None:
-                    continue
-                if habit.id in existing_ids:
-                    continue
-                if not HabitInstanceService._should_create_for_date(habit.recurrence, d):
-                    continue
-                s.add(
-                    HabitInstance(
-                        habit_id=habit.id,
-                        date=d,
-                        scheduled_start=habit.scheduled_start,
-                        scheduled_end=habit.scheduled_end,
-                        status=Status.PENDING,
-                    )
-                )
-                created += 1
-
-        return created
 
-    try:
-        result, error = service_action(_ensure)
-        if error or result is None:
-            return 0
-        return result
-    except Exception:
-        logger.exception("Falha em ensure_period_instances")
-        return 0
+def ensure_startup_instances(days: int = 7) -> int:
+    """Garante instâncias de hoje e retroativas numa única sessão (DT-023, BR-TUI-033-R8).
+
+    Equivale a ensure_today_instances() + ensure_period_instances() com
+    uma leitura da rotina ativa e um único upsert cobrindo
+    [max(today - days, created_at), today].
+
+    Returns:
+        Número de instâncias criadas.
+    """
+    return _run(
+        lambda s: _upsert_window(s, RoutineService(s).get_active_routine(), days, date.today()),
+        0,
+        "ensure_startup_instances",
+    )
+
+
+def _read_active_routine(s: Session) -> tuple[int | None, str]:
+    """Lê rotina ativa como (id, nome) na sessão fornecida."""
+    routine = RoutineService(s).get_active_routine()
+    if not routine:
+        return None, ""
+    return routine.id, routine.name
 
 
 def load_active_routine() -> tuple[int | None, str]:
@@ -176,21 +140,66 @@ def load_active_routine() -> tuple[int | None, str]:
     os demais loaders e prevenção de DetachedInstanceError
     em futuras expansões que acessem relationships.
     """
+    return _run(_read_active_routine, _NO_ROUTINE, "load_active_routine")
 
-    def _load(s: Session) -> tuple[int | None, str]:
-        routine = RoutineService(s).get_active_routine()
-        if not routine:
-            return None, ""
-        return routine.id, routine.name
 
-    try:
-        result, error = service_action(_load)
-        if error or not result:
-            return None, ""
-        return result
-    except Exception:
-        logger.exception("Falha em load_active_routine")
-        return None, ""
+def _read_instances(s: Session, routine_id: int | None, active_timer: TimeLog | None) -> list[dict]:
+    """Lê instâncias do dia na sessão fornecida (ver load_instances)."""
+    # Sem rotina ativa = sem instâncias a exibir (DT-048)
+    if routine_id is None:
+        return []
+
+    # Filtro por rotina no SQL com habit carregado no JOIN (DT-049)
+    today = date.today()
+    result = HabitInstanceService().list_instances(
+        date_start=today,
+        date_end=today,
+        routine_id=routine_id,
+        load_habit=True,
+        session=s,
+    )
+    if not result:
+        return []
+
+    # Timer ativo sobrescreve status da instância (DT-055)
+    timer_instance_id = active_timer.habit_instance_id if active_timer else None
+    timer_status_str = active_timer.status.value if active_timer and active_timer.status else None
+
+    instances: list[dict] = []
+    for inst in result:
+        ss = inst.scheduled_start
+        se = inst.scheduled_end
+        start_min = (ss.hour * 60 + ss.minute) if ss else 0
+        end_min = (se.hour * 60 + se.minute) if se else start_min + 60
+        name = ""
+        if inst.habit:
+            name = inst.habit.title
+        elif hasattr(inst, "habit_id"):
+            name = f"Hábito #{inst.habit_id}"
+
+        # Sobrescrever status com timer se aplicável (DT-055)
+        if inst.id == timer_instance_id and timer_status_str:
+            status = timer_status_str
+        else:
+            status = inst.status.value if inst.status else "pending"
+
+        substatus = None
+        if hasattr(inst, "done_substatus") and inst.done_substatus:
+            substatus = inst.done_substatus.value
+        elif hasattr(inst, "not_done_substatus") and inst.not_done_substatus:
+            substatus = inst.not_done_substatus.value
+        instances.append(
+            {
+                "id": inst.id,
+                "name": name,
+                "start_minutes": start_min,
+                "end_minutes": end_min,
+                "status": status,
+                "substatus": substatus,
+                "actual_minutes": getattr(inst, "actual_duration", None),
+            }
+        )
+    return sorted(instances, key=lambda i: i["start_minutes"])
 
 
 def load_instances(routine_id: int | None = None) -> list[dict]:
@@ -205,80 +214,108 @@ def load_instances(routine_id: int | None = None) -> list[dict]:
     Args:
         routine_id: Se fornecido, filtra por rotina (DT-049).
     """
+    return _run(
+        lambda s: _read_instances(s, routine_id, TimerService.get_any_active_timer(session=s)),
+        [],
+        "load_instances",
+    )
 
-    def _load(s: Session) -> list[dict]:
-        # Sem rotina ativa = sem instâncias a exibir (DT-048)
-        if routine_id is None:
-            return []
-
-        today = date.today()
-        result = HabitInstanceService().list_instances(date_start=today, date_end=today, session=s)
-        if not result:
-            return []
-
-        # Filtrar por rotina (DT-049)
-        if routine_id is not None:
-            result = [inst for inst in result if inst.habit and inst.habit.routine_id == routine_id]
-            if not result:
-                return []
-
-        # Detectar timer ativo para sobrescrever status (DT-055)
-        active_timer = s.exec(
-            select(TimeLog).where(
-                TimeLog.status.in_(  # type: ignore[union-attr]
-                    [TimerStatus.RUNNING, TimerStatus.PAUSED]
-                )
-            )
-        ).first()
-        timer_instance_id = active_timer.habit_instance_id if active_timer else None
-        timer_status_str = (
-            active_timer.status.value if active_timer and active_timer.status else None
+
+def _read_metrics(s: Session, routine_id: int) -> dict:
+    """Calcula métricas na sessão fornecida (ver load_metrics).
+
+    Lê o rollup habit_day_stats via MetricsService: uma linha por dia
+    exibido, janelas por soma de prefixo, sem escrever no banco.
+    """
+    today = date.today()
+    history = MetricsService.load_history(routine_id, today - timedelta(days=29), today, session=s)
+    if not history.active_days(30):
+        return {}
+    streak, all_time_best = _read_streaks(s, routine_id, today)
+
+    # BR-TUI-033-R3: best_streak persistido continua valendo como piso
+    routine = s.get(Routine, routine_id)
+    best_streak = max(getattr(routine, "best_streak", 0) or 0, all_time_best)
+    day_names = ["Seg", "Ter", "Qua", "Qui", "Sex", "Sab", "Dom"]
+    checks_by_day = _read_week_checks(s, routine_id, today - timedelta(days=6), today)
+    week_data = []
+    for i in range(6, -1, -1):
+        d = today - timedelta(days=i)
+        done_d, total_d = history.day(d)
+        checks = checks_by_day.get(d, "")
+        week_data.append((day_names[d.weekday()], done_d, total_d, checks))
+    return {
+        "streak": streak,
+        "best_streak": best_streak,
+        "pct_7d": history.completion_rate(7),
+        "pct_14d": history.completion_rate(14),
+        "pct_30d": history.completion_rate(30),
+        "week_data": week_data,
+    }
+
+
+def _read_week_checks(s: Session, routine_id: int, start: date, end: date) -> dict[date, str]:
+    """Marca "v"/"." por instância, na ordem do dia (horário agendado).
+
+    O rollup só guarda contagens; a faixa semanal precisa do status de
+    cada instância para manter a mesma ordem dos hábitos na agenda.
+    """
+    rows = s.exec(
+        select(col(HabitInstance.date), col(HabitInstance.status))
+        .join(Habit, col(Habit.id) == col(HabitInstance.habit_id))
+        .where(Habit.routine_id == routine_id)
+        .where(HabitInstance.date >= start)
+        .where(HabitInstance.date <= end)
+        .order_by(
+            col(HabitInstance.date),
+            col(HabitInstance.scheduled_start),
+            col(HabitInstance.id),
         )
+    ).all()
+    checks: dict[date, str] = {}
+    for day, status in rows:
+        checks[day] = checks.get(day, "") + ("v" if status == Status.DONE else ".")
+    return checks
 
-        instances: list[dict] = []
-        for inst in result:
-            ss = inst.scheduled_start
-            se = inst.scheduled_end
-            start_min = (ss.hour * 60 + ss.minute) if ss else 0
-            end_min = (se.hour * 60 + se.minute) if se else start_min + 60
-            name = ""
-            if inst.habit:
-                name = inst.habit.title
-            elif hasattr(inst, "habit_id"):
-                name = f"Hábito #{inst.habit_id}"
-
-            # Sobrescrever status com timer se aplicável (DT-055)
-            if inst.id == timer_instance_id and timer_status_str:
-                status = timer_status_str
-            else:
-                status = inst.status.value if inst.status else "pending"
-
-            substatus = None
-            if hasattr(inst, "done_substatus") and inst.done_substatus:
-                substatus = inst.done_substatus.value
-            elif hasattr(inst, "not_done_substatus") and inst.not_done_substatus:
-                substatus = inst.not_done_substatus.value
-            instances.append(
-                {
-                    "id": inst.id,
-                    "name": name,
-                    "start_minutes": start_min,
-                    "end_minutes": end_min,
-                    "status": status,
-                    "substatus": substatus,
-                    "actual_minutes": getattr(inst, "actual_duration", None),
-                }
-            )
-        return sorted(instances, key=lambda i: i["start_minutes"])
 
-    try:
-        result, error = service_action(_load)
-        if error or not result:
-            return []
-        return result
-    except Exception:
-        logger.exception("Falha ao carregar instâncias")
-        return []
+def _read_streaks(s: Session, routine_id: int, today: date) -> tuple[int, int]:
+    """Retorna (streak atual, melhor streak histórico) a partir do rollup.
+
+    Gaps-and-islands: dias 100% consecutivos compartilham o mesmo valor
+    de julianday(date) - row_number(). O streak atual é a ilha que
+    termina hoje; o melhor é a maior ilha de todo o histórico.
+    """
+    full_days = (
+        select(
+            col(HabitDayStats.date).label("day"),
+            (
+                func.julianday(HabitDayStats.date)
+                - func.row_number().over(order_by=col(HabitDayStats.date))
+            ).label("island"),
+        )
+        .where(HabitDayStats.routine_id == routine_id)
+        .where(HabitDayStats.total > 0)
+        .where(HabitDayStats.done == HabitDayStats.total)
+        .where(HabitDayStats.date <= today)
+        .subquery()
+    )
+    islands = (
+        select(
+            func.count().label("length"),
+            func.max(full_days.c.day).label("last_day"),
+        )
+        .group_by(full_days.c.island)
+        .subquery()
+    )
+    current, best = s.exec(
+        select(
+            func.coalesce(
+                func.max(case((islands.c.last_day == today, islands.c.length), else_=0)), 0
+            ),
+            func.coalesce(func.max(islands.c.length), 0),
+        )
+    ).one()
+    return current, best
 
 
 def load_metrics(routine_id: int | None = None) -> dict:
@@ -286,95 +323,13 @@ def load_metrics(routine_id: int | None = None) -> dict:
 
     Retorna dict com streak, best_streak, pct_7d, pct_30d, week_data.
     Filtrado por routine_id para consistência com load_instances.
+    Custo proporcional aos dias exibidos (rollup habit_day_stats);
+    best_streak considera todo o histórico, não só a janela de 30 dias.
     """
     if routine_id is None:
         return {}
 
-    def _load(s: Session) -> dict:
-        today = date.today()
-        habits = list(s.exec(select(Habit).where(Habit.routine_id == routine_id)).all())
-        if not habits:
-            return {}
-        habit_ids = [h.id for h in habits if h.id is not None]
-        start_30d = today - timedelta(days=29)
-        instances = list(
-            s.exec(
-                select(HabitInstance)
-                .where(col(HabitInstance.habit_id).in_(habit_ids))
-                .where(HabitInstance.date >= start_30d)
-                .where(HabitInstance.date <= today)
-            ).all()
-        )
-        if not instances:
-            return {}
-        by_day: dict[date, list] = {}
-        for inst in instances:
-            by_day.setdefault(inst.date, []).append(inst)
-        day_pcts: dict[date, float] = {}
-        for d, day_insts in by_day.items():
-            total = len(day_insts)
-            done = sum(1 for i in day_insts if i.status == Status.DONE)
-            day_pcts[d] = (done / total * 100) if total > 0 else 0
-        streak = 0
-        check_date = today
-        while check_date >= start_30d:
-            if check_date in day_pcts and day_pcts[check_date] == 100:
-                streak += 1
-                check_date -= timedelta(days=1)
-            else:
-                break
-        window_best = 0
-        current_streak = 0
-        for d in sorted(day_pcts.keys()):
-            if day_pcts[d] == 100:
-                current_streak += 1
-                window_best = max(window_best, current_streak)
-            else:
-                current_streak = 0
-
-        # BR-TUI-033-R3: best_streak persistido no banco
-        routine = s.get(Routine, routine_id)
-        persisted_best = getattr(routine, "best_streak", 0) or 0
-        best_streak = max(persisted_best, window_best)
-        if routine and best_streak > persisted_best:
-            routine.best_streak = best_streak
-            s.add(routine)
-            s.commit()
-        start_7d = today - timedelta(days=6)
-        start_14d = today - timedelta(days=13)
-        pcts_7d = [day_pcts[d] for d in day_pcts if d >= start_7d]
-        pcts_14d = [day_pcts[d] for d in day_pcts if d >= start_14d]
-        pcts_30d = list(day_pcts.values())
-        pct_7d = int(sum(pcts_7d) / len(pcts_7d)) if pcts_7d else 0
-        pct_14d = int(sum(pcts_14d) / len(pcts_14d)) if pcts_14d else 0
-        pct_30d = int(sum(pcts_30d) / len(pcts_30d)) if pcts_30d else 0
-        day_names = ["Seg", "Ter", "Qua", "Qui", "Sex", "Sab", "Dom"]
-        week_data = []
-        for i in range(6, -1, -1):
-            d = today - timedelta(days=i)
-            day_name = day_names[d.weekday()]
-            day_insts = by_day.get(d, [])
-            total_d = len(day_insts)
-            done_d = sum(1 for inst in day_insts if inst.status == Status.DONE)
-            checks = "".join("v" if inst.status == Status.DONE else "." for inst in day_insts)
-            week_data.append((day_name, done_d, total_d, checks))
-        return {
-            "streak": streak,
-            "best_streak": best_streak,
-            "pct_7d": pct_7d,
-            "pct_14d": pct_14d,
-            "pct_30d": pct_30d,
-            "week_data": week_data,
-        }
-
-    try:
-        result, error = service_action(_load)
-        if error or not result:
-            return {}
-        return result
-    except Exception:
-        logger.exception("Falha em load_metrics")
-        return {}
+    return _run(lambda s: _read_metrics(s, routine_id), {}, "load_metrics")
 
 
 def _task_proximity(days: int) -> str:
@@ -428,6 +383,36 @@ def _build_task_dict(task: Any, status: str, proximity: str | None = None) -> di
     }
 
 
+def _read_tasks(s: Session) -> list[dict]:
+    """Lê tasks do dashboard na sessão fornecida (ver load_tasks)."""
+    # Pendentes + overdue (sem filtro temporal)
+    pending = TaskService.list_pending_tasks(session=s)
+    active_tasks: list[dict] = []
+    for task in pending:
+        status = task.derived_status  # "overdue" ou "pending"
+        active_tasks.append(_build_task_dict(task, status))
+
+    # Concluídas recentes (últimas 24h)
+    completed = TaskService.list_recently_completed_tasks(hours=24, session=s)
+    recent_tasks: list[dict] = []
+    for task in completed:
+        recent_tasks.append(_build_task_dict(task, "completed", "Concluída"))
+
+    # Canceladas recentes (últimas 24h)
+    cancelled = TaskService.list_recently_cancelled_tasks(hours=24, session=s)
+    for task in cancelled:
+        recent_tasks.append(_build_task_dict(task, "cancelled", "Cancelada"))
+
+    # Pendentes/overdue têm prioridade, recentes preenchem o restante
+    limit = 9
+    result = active_tasks[:limit]
+    remaining = limit - len(result)
+    if remaining > 0:
+        result.extend(recent_tasks[:remaining])
+
+    return sorted(result, key=lambda t: (0 if t["status"] == "overdue" else 1, t["days"]))
+
+
 def load_tasks() -> list[dict]:
     """Carrega tasks para o dashboard (BR-TUI-003-R29).
 
@@ -436,43 +421,36 @@ def load_tasks() -> list[dict]:
     Toda extração de dados é feita dentro do callback para consistência
     com os demais loaders e prevenção de DetachedInstanceError.
     """
+    return _run(_read_tasks, [], "load_tasks")
 
-    def _load(s: Session) -> list[dict]:
-        # Pendentes + overdue (sem filtro temporal)
-        pending = TaskService.list_pending_tasks(session=s)
-        active_tasks: list[dict] = []
-        for task in pending:
-            status = task.derived_status  # "overdue" ou "pending"
-            active_tasks.append(_build_task_dict(task, status))
-
-        # Concluídas recentes (últimas 24h)
-        completed = TaskService.list_recently_completed_tasks(hours=24, session=s)
-        recent_tasks: list[dict] = []
-        for task in completed:
-            recent_tasks.append(_build_task_dict(task, "completed", "Concluída"))
-
-        # Canceladas recentes (últimas 24h)
-        cancelled = TaskService.list_recently_cancelled_tasks(hours=24, session=s)
-        for task in cancelled:
-            recent_tasks.append(_build_task_dict(task, "cancelled", "Cancelada"))
-
-        # Pendentes/overdue têm prioridade, recentes preenchem o restante
-        limit = 9
-        result = active_tasks[:limit]
-        remaining = limit - len(result)
-        if remaining > 0:
-            result.extend(recent_tasks[:remaining])
-
-        return sorted(result, key=lambda t: (0 if t["status"] == "overdue" else 1, t["days"]))
 
-    try:
-        result, error = service_action(_load)
-        if error or not result:
-            return []
-        return result
-    except Exception:
-        logger.exception("Falha ao carregar tasks")
-        return []
+def _read_timer_state(s: Session, timer: TimeLog | None) -> TimerState | None:
+    """Monta TimerState do TimeLog ativo, buscando o nome do hábito."""
+    if not timer or not timer.status:
+        return None
+
+    name = ""
+    if timer.habit_instance_id:
+        inst = s.exec(
+            select(HabitInstance).where(HabitInstance.id == timer.habit_instance_id)
+        ).first()
+        if inst and inst.habit:
+            name = inst.habit.title
+
+    return TimerState.from_timelog(timer, name)
+
+
+def load_active_timer_state() -> TimerState | None:
+    """Carrega o TimeLog ativo e o nome do hábito como TimerState.
+
+    Usado pelo TimerStateCache do dashboard: uma leitura por recarga,
+    nenhuma por tick (DT-016).
+    """
+    return _run(
+        lambda s: _read_timer_state(s, TimerService.get_any_active_timer(session=s)),
+        None,
+        "load_active_timer_state",
+    )
 
 
 def load_active_timer() -> dict[str, Any] | None:
@@ -482,44 +460,51 @@ def load_active_timer() -> dict[str, Any] | None:
         - id, status, elapsed (str MM:SS ou HH:MM:SS), name (str), habit_instance_id
     Ou None se nenhum timer ativo.
     """
+    state = load_active_timer_state()
+    if state is None:
+        return None
+    return format_timer(state)
 
-    def _load(s: Session) -> dict[str, Any] | None:
-        timer = TimerService.get_any_active_timer(session=s)
-        if not timer or not timer.status:
-            return None
 
-        total_elapsed = (datetime.now() - timer.start_time).total_seconds()
-        paused_total: float = timer.paused_duration or 0
-        if timer.status == TimerStatus.PAUSED and timer.pause_start:
-            paused_total += (datetime.now() - timer.pause_start).total_seconds()
-        elapsed_secs = max(int(total_elapsed - paused_total), 0)
-        minutes, seconds = divmod(elapsed_secs, 60)
-        hours, minutes = divmod(minutes, 60)
+@dataclass(frozen=True)
+class DashboardSnapshot:
+    """Dados de todos os panels do dashboard lidos numa única sessão."""
 
-        name = ""
-        if timer.habit_instance_id:
-            inst = s.exec(
-                select(HabitInstance).where(HabitInstance.id == timer.habit_instance_id)
-            ).first()
-            if inst and inst.habit:
-                name = inst.habit.title
-
-        return {
-            "id": timer.id,
-            "status": timer.status.value,
-            "elapsed": f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-            if hours
-            else f"{minutes:02d}:{seconds:02d}",
-            "elapsed_seconds": elapsed_secs,
-            "name": name,
-            "habit_instance_id": timer.habit_instance_id,
-        }
+    routine_id: int | None = None
+    routine_name: str = ""
+    instances: list[dict] = field(default_factory=list)
+    tasks: list[dict] = field(default_factory=list)
+    timer: TimerState | None = None
+    metrics: dict = field(default_factory=dict)
 
-    try:
-        result, error = service_action(_load)
-        if error or not result:
-            return None
-        return result
-    except Exception:
-        logger.exception("Falha em load_active_timer")
-        return None
+
+def _read_snapshot(s: Session) -> DashboardSnapshot:
+    """Monta o snapshot reaproveitando rotina, hábitos e timer ativo."""
+    routine_id, routine_name = _read_active_routine(s)
+    active_timer = TimerService.get_any_active_timer(session=s)
+
+    metrics: dict = {}
+    if routine_id is not None:
+        metrics = _read_metrics(s, routine_id)
+
+    return DashboardSnapshot(
+        routine_id=routine_id,
+        routine_name=routine_name,
+        instances=_read_instances(s, routine_id, active_timer),
+        tasks=_read_tasks(s),
+        timer=_read_timer_state(s, active_timer),
+        metrics=metrics,
+    )
+
+
+def load_dashboard_snapshot() -> DashboardSnapshot:
+    """Carrega todos os dados do dashboard com um único checkout de conexão.
+
+    Compõe os mesmos _read_* dos loaders por panel numa sessão, uma
+    transação, com resultados intermediários (rotina, TimeLog ativo)
+    compartilhados entre os panels.
+
+    Returns:
+        DashboardSnapshot; vazio em caso de erro.
+    """
+    return _run(_read_snapshot, DashboardSnapshot(), "load_dashboard_snapshot")
@@ -3,6 +3,11 @@
 Responsabilidade única: composição de layout, rastreamento de foco
 e despacho de operações para loader e crud modules.
 
+Leituras do banco rodam em thread worker (grupo "dashboard-refresh",
+exclusivo): o event loop só aplica o snapshot recebido via mensagem.
+Um refresh novo cancela o anterior; resultados de gerações antigas
+são descartados.
+
 Referências:
     - BR-TUI-003: Dashboard Screen
     - ADR-034: Dashboard-first CRUD
@@ -16,13 +21,18 @@ from typing import Any
 from sqlmodel import Session
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.events import Key
+from textual.message import Message
+from textual.timer import Timer
 from textual.widgets import Static
+from textual.worker import Worker, get_current_worker
 
+from timeblock.database.change_watcher import DataVersionWatcher
 from timeblock.database.engine import create_db_and_tables
 from timeblock.models import HabitInstance
 from timeblock.services.task_service import TaskService
 from timeblock.services.timer_service import TimerService
 from timeblock.tui.screens.dashboard import crud_habits, crud_routines, crud_tasks, loader
+from timeblock.tui.screens.dashboard.timer_state import TimerStateCache
 from timeblock.tui.session import service_action
 from timeblock.tui.widgets.agenda_panel import AgendaPanel
 from timeblock.tui.widgets.confirm_dialog import ConfirmDialog
@@ -36,6 +46,11 @@ from timeblock.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+REFRESH_GROUP = "dashboard-refresh"
+# Intervalo do poll de PRAGMA data_version (mudanças via CLI)
+CHANGE_POLL_INTERVAL = 0.5
+LOADING_LABEL = "atualizando…"
+
 
 class DashboardScreen(Static):
     """Dashboard coordinator: compose + focus tracking + dispatch."""
@@ -46,6 +61,22 @@ class DashboardScreen(Static):
         self._active_routine_id: int | None = None
         self._active_routine_name: str = ""
         self._current_date: date = date.today()
+        self._timer_cache = TimerStateCache(loader.load_active_timer_state)
+        self._refresh_generation = 0
+        self._intervals: list[Timer] = []
+        self._watcher: DataVersionWatcher | None = None
+        self._ensure_pending = False
+
+    class SnapshotLoaded(Message):
+        """Snapshot carregado pelo worker de refresh (BR-TUI-009)."""
+
+        def __init__(self, snapshot: loader.DashboardSnapshot, generation: int) -> None:
+            self.snapshot = snapshot
+            self.generation = generation
+            super().__init__()
+
+    class DatabaseChanged(Message):
+        """Outra conexão (ex: CLI) fez commit no banco (BR-TUI-009)."""
 
     @staticmethod
     def get_no_routine_label() -> str:
@@ -72,15 +103,32 @@ class DashboardScreen(Static):
     def on_mount(self) -> None:
         """Inicializa o dashboard (DT-023: garante instâncias do dia)."""
         create_db_and_tables()
-        loader.ensure_today_instances()
-        routine_id, _ = loader.load_active_routine()
-        loader.ensure_period_instances(routine_id, days=7)
-        self.refresh_data()
+        self._watcher = DataVersionWatcher.open()
+        self.refresh_data(ensure_days=7)
         self.app.set_focus(None)
         # BR-TUI-003-R15: auto-scroll na hora atual
         self.set_timer(0.5, self._autoscroll_agenda)
-        self.set_interval(1, self._tick_timer)
-        self.set_interval(60, self._refresh_agenda)
+        self._intervals = [
+            self.set_interval(1, self._tick_timer),
+            self.set_interval(60, self._refresh_agenda),
+        ]
+        if self._watcher is not None:
+            self._intervals.append(self.set_interval(CHANGE_POLL_INTERVAL, self._poll_changes))
+
+    def on_unmount(self) -> None:
+        """Fecha a conexão do watcher de mudanças."""
+        if self._watcher is not None:
+            self._watcher.close()
+
+    def pause_intervals(self) -> None:
+        """Pausa tick do timer e refresh periódico enquanto oculto."""
+        for interval in self._intervals:
+            interval.pause()
+
+    def resume_intervals(self) -> None:
+        """Retoma os intervals ao voltar (o app dispara refresh_data)."""
+        for interval in self._intervals:
+            interval.resume()
 
     def _autoscroll_agenda(self) -> None:
         """Auto-scroll da agenda na hora atual (BR-TUI-003-R15)."""
@@ -167,7 +215,16 @@ class DashboardScreen(Static):
         crud_routines.open_select_routine(self.app, self._on_crud_done)
 
     def _on_crud_done(self) -> None:
-        """Callback universal: refresh após qualquer operação CRUD."""
+        """Callback universal: refresh após qualquer operação CRUD.
+
+        Operações CRUD podem alterar o timer por fora dos handlers de
+        timer (e.g. done com timer ativo), então o cache é invalidado.
+        """
+        self._timer_cache.invalidate()
+        self._on_timer_action_done()
+
+    def _on_timer_action_done(self) -> None:
+        """Refresh após handler de timer que já atualizou o cache."""
         self.refresh_data()
         self._refresh_header()
 
@@ -197,8 +254,10 @@ class DashboardScreen(Static):
         timelog_id = timelog.id
 
         def on_confirm() -> None:
-            service_action(lambda s: TimerService.stop_timer(timelog_id, session=s))
-            self._on_crud_done()
+            _, error = service_action(lambda s: TimerService.stop_timer(timelog_id, session=s))
+            if not error:
+                self._timer_cache.clear()
+            self._on_timer_action_done()
 
         self.app.push_screen(
             ConfirmDialog(
@@ -256,30 +315,45 @@ class DashboardScreen(Static):
 
     def on_habits_panel_timer_start_request(self, message: HabitsPanel.TimerStartRequest) -> None:
         """Recebe TimerStartRequest e inicia timer via TimerService."""
-        service_action(lambda s: TimerService.start_timer(message.instance_id, session=s))
-        self._on_crud_done()
+        timelog, error = service_action(
+            lambda s: TimerService.start_timer(message.instance_id, session=s)
+        )
+        if timelog and not error:
+            item = self.query_one(HabitsPanel).get_item_by_id(message.instance_id)
+            self._timer_cache.start(timelog, item["name"] if item else "")
+        self._on_timer_action_done()
 
     def on_timer_panel_timer_pause_request(self, message: TimerPanel.TimerPauseRequest) -> None:
         """Recebe TimerPauseRequest e pausa timer via TimerService."""
-        service_action(lambda s: TimerService.pause_timer(message.timer_id, session=s))
-        self._on_crud_done()
+        timelog, _ = service_action(lambda s: TimerService.pause_timer(message.timer_id, session=s))
+        self._timer_cache.apply(timelog)
+        self._on_timer_action_done()
 
     def on_timer_panel_timer_resume_request(self, message: TimerPanel.TimerResumeRequest) -> None:
         """Recebe TimerResumeRequest e retoma timer via TimerService."""
-        service_action(lambda s: TimerService.resume_timer(message.timer_id, session=s))
-        self._on_crud_done()
+        timelog, _ = service_action(
+            lambda s: TimerService.resume_timer(message.timer_id, session=s)
+        )
+        self._timer_cache.apply(timelog)
+        self._on_timer_action_done()
 
     def on_timer_panel_timer_stop_request(self, message: TimerPanel.TimerStopRequest) -> None:
         """Recebe TimerStopRequest e para timer via TimerService."""
-        service_action(lambda s: TimerService.stop_timer(message.timer_id, session=s))
-        self._on_crud_done()
+        _, error = service_action(lambda s: TimerService.stop_timer(message.timer_id, session=s))
+        if not error:
+            self._timer_cache.clear()
+        self._on_timer_action_done()
 
     def on_timer_panel_timer_cancel_request(self, message: TimerPanel.TimerCancelRequest) -> None:
         """Recebe TimerCancelRequest e abre ConfirmDialog antes de cancelar."""
 
         def on_confirm() -> None:
-            service_action(lambda s: TimerService.cancel_timer(message.timer_id, session=s))
-            self._on_crud_done()
+            _, error = service_action(
+                lambda s: TimerService.cancel_timer(message.timer_id, session=s)
+            )
+            if not error:
+                self._timer_cache.clear()
+            self._on_timer_action_done()
 
         self.app.push_screen(
             ConfirmDialog(
@@ -312,41 +386,154 @@ class DashboardScreen(Static):
             crud_tasks.open_create_task(self.app, self._on_crud_done)
 
     def _refresh_agenda(self) -> None:
-        """Atualiza agenda e hábitos a cada 60s (DT-015, DT-023).
+        """Tick de 60s: virada de dia e marcador de hora (DT-015, DT-023).
 
-        Detecta virada de dia e gera instâncias faltantes.
+        Na virada de dia gera instâncias faltantes e recarrega. Fora
+        disso só re-renderiza a agenda (marcador da hora atual), sem
+        I/O: mudanças no banco chegam por DatabaseChanged. Sem watcher
+        (banco ':memory:'), mantém a recarga periódica.
         """
         today = date.today()
         if today != self._current_date:
             self._current_date = today
-            loader.ensure_today_instances()
+            self._timer_cache.invalidate()
+            self.refresh_data(ensure_days=0)
+            self._refresh_header()
+            return
+        if self._watcher is None:
+            self._timer_cache.invalidate()
             self.refresh_data()
             return
-
-        instances = loader.load_instances(self._active_routine_id)
         try:
-            self.query_one(AgendaPanel).update_data(instances)
-            self.query_one(HabitsPanel).update_data(instances)
+            self.query_one(AgendaPanel).refresh_clock()
         except Exception:
-            logger.debug("Panels indisponíveis durante refresh")
+            logger.debug("Agenda indisponível para re-render")
+
+    def _poll_changes(self) -> None:
+        """Posta DatabaseChanged se outra conexão fez commit.
+
+        Pausado enquanto um refresh grava instâncias (ensure): o commit
+        dele seria lido como externo antes de _mark_ensured absorvê-lo.
+        """
+        if self._ensure_pending:
+            return
+        if self._watcher is not None and self._watcher.changed():
+            self.post_message(self.DatabaseChanged())
+
+    def on_dashboard_screen_database_changed(self, message: DatabaseChanged) -> None:
+        """Recarrega o snapshot após commit externo.
+
+        Invalida o cache do timer (pode ter sido iniciado/parado via
+        CLI); o snapshot o reabastece. O header também lê o banco
+        (streak, progresso) e é recarregado junto.
+        """
+        message.stop()
+        logger.debug("Banco alterado por outra conexão; recarregando dashboard")
+        self._timer_cache.invalidate()
+        self.refresh_data()
+        self._refresh_header()
 
     def _tick_timer(self) -> None:
-        """Atualiza TimerPanel a cada segundo (DT-015)."""
-        timer = loader.load_active_timer()
+        """Atualiza TimerPanel a cada segundo (DT-015).
+
+        Usa o TimerStateCache: o elapsed é recalculado em memória,
+        sem I/O por tick. Com o cache invalidado, aguarda o snapshot
+        em voo em vez de consultar o banco no event loop.
+        """
+        if self._timer_cache.stale:
+            return
+        timer = self._timer_cache.snapshot()
         try:
             self.query_one(TimerPanel).update_data(timer)
         except Exception:
             logger.debug("TimerPanel indisponível durante tick")
 
-    def refresh_data(self) -> None:
-        """Carrega dados via loader e distribui para panels."""
-        routine_id, routine_name = loader.load_active_routine()
-        self._active_routine_id = routine_id
-        self._active_routine_name = routine_name
+    def refresh_data(self, ensure_days: int | None = None) -> Worker[None]:
+        """Agenda recarga do dashboard em thread worker.
+
+        Não bloqueia o event loop: o snapshot volta via SnapshotLoaded.
+        Chamadas sucessivas coalescem — o worker anterior é cancelado
+        e seu resultado, se chegar, é descartado pela geração.
+
+        Os commits feitos até aqui (em geral a escrita da própria TUI que
+        motivou o refresh) são marcados como vistos no watcher: a leitura
+        abaixo já os inclui, então o poll não dispara uma segunda recarga.
+        Com ensure_days, a escrita do worker é marcada depois dela, via
+        _mark_ensured, e o poll fica pausado até lá.
+
+        Args:
+            ensure_days: Se informado, gera instâncias faltantes de
+                [hoje - ensure_days, hoje] antes de ler (startup e
+                virada de dia).
+
+        Returns:
+            Worker do refresh (aguardável em testes).
+        """
+        if self._watcher is not None:
+            self._watcher.mark_seen()
+            if ensure_days is not None:
+                self._ensure_pending = True
+        self._refresh_generation += 1
+        generation = self._refresh_generation
+        self._set_loading(True)
+        return self.run_worker(
+            lambda: self._load_snapshot(generation, ensure_days),
+            name=REFRESH_GROUP,
+            group=REFRESH_GROUP,
+            exclusive=True,
+            thread=True,
+            exit_on_error=False,
+        )
+
+    def _load_snapshot(self, generation: int, ensure_days: int | None) -> None:
+        """Corpo do worker: lê o banco fora do event loop."""
+        if ensure_days is not None:
+            try:
+                loader.ensure_startup_instances(days=ensure_days)
+            finally:
+                self.app.call_from_thread(self._mark_ensured)
+        snapshot = loader.load_dashboard_snapshot()
+        if not get_current_worker().is_cancelled:
+            self.post_message(self.SnapshotLoaded(snapshot, generation))
+
+    def _mark_ensured(self) -> None:
+        """Absorve o commit do ensure e retoma o poll (no event loop).
+
+        O watcher só pode ser usado na thread do event loop, então o
+        worker chama isto via call_from_thread antes de ler o snapshot.
+        """
+        if self._watcher is not None:
+            self._watcher.mark_seen()
+        self._ensure_pending = False
+
+    def on_dashboard_screen_snapshot_loaded(self, message: SnapshotLoaded) -> None:
+        """Aplica snapshot da geração mais recente; descarta os obsoletos."""
+        message.stop()
+        if message.generation != self._refresh_generation:
+            logger.debug("Snapshot obsoleto descartado: geração %d", message.generation)
+            return
+        self._set_loading(False)
+        self._apply_snapshot(message.snapshot)
+
+    def _set_loading(self, loading: bool) -> None:
+        """Indicador de refresh em voo no rodapé da agenda."""
+        try:
+            self.query_one("#agenda-column").border_subtitle = LOADING_LABEL if loading else ""
+        except Exception:
+            logger.debug("Agenda indisponível para indicador de carga")
+
+    def _apply_snapshot(self, snapshot: loader.DashboardSnapshot) -> None:
+        """Distribui snapshot para os panels (event loop, sem I/O).
+
+        O timer lido no snapshot também reabastece o TimerStateCache.
+        """
+        self._active_routine_id = snapshot.routine_id
+        self._active_routine_name = snapshot.routine_name
 
-        instances = loader.load_instances(self._active_routine_id)
-        tasks = loader.load_tasks()
-        timer = loader.load_active_timer()
+        instances = snapshot.instances
+        tasks = snapshot.tasks
+        self._timer_cache.store(snapshot.timer)
+        timer = self._timer_cache.snapshot()
 
         try:
             self.query_one("#agenda-column").border_title = "Agenda do Dia"
@@ -358,4 +545,4 @@ class DashboardScreen(Static):
         self.query_one(HabitsPanel).update_data(instances)
         self.query_one(TasksPanel).update_data(tasks)
         self.query_one(TimerPanel).update_data(timer)
-        self.query_one(MetricsPanel).update_data(loader.load_metrics(self._active_routine_id))
+        self.query_one(MetricsPanel).update_data(snapshot.metrics)
@@ -0,0 +1,136 @@
+"""Cache em memória do timer ativo para o tick do dashboard (DT-016).
+
+O TimeLog ativo é carregado uma vez e mantido atualizado pelos handlers
+de start/pause/resume/stop do DashboardScreen. O tick de 1s apenas
+recalcula o elapsed a partir de start_time, paused_duration e
+pause_start — nenhuma query por tick.
+
+Referências:
+    - DT-016: Timer com elapsed MM:SS
+    - BR-TIMER-006: paused_duration acumulado
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from timeblock.models.enums import TimerStatus
+
+
+@dataclass
+class TimerState:
+    """Snapshot dos campos do TimeLog necessários para calcular elapsed."""
+
+    id: int | None
+    status: str
+    start_time: datetime
+    paused_duration: int
+    pause_start: datetime | None
+    name: str
+    habit_instance_id: int | None
+
+    @classmethod
+    def from_timelog(cls, timelog: Any, name: str = "") -> "TimerState":
+        """Constrói estado a partir de um TimeLog (ou objeto compatível)."""
+        status = timelog.status.value if timelog.status else TimerStatus.RUNNING.value
+        paused = status == TimerStatus.PAUSED.value
+        return cls(
+            id=timelog.id,
+            status=status,
+            start_time=timelog.start_time,
+            paused_duration=timelog.paused_duration or 0,
+            pause_start=timelog.pause_start if paused else None,
+            name=name,
+            habit_instance_id=timelog.habit_instance_id,
+        )
+
+
+class TimerStateCache:
+    """Mantém o timer ativo em memória entre ticks.
+
+    O estado é carregado do banco apenas quando marcado como stale
+    (inicialização ou após operações CRUD que podem alterar o timer
+    por fora dos handlers de timer).
+    """
+
+    def __init__(self, load_fn: Callable[[], TimerState | None]) -> None:
+        self._load_fn = load_fn
+        self._state: TimerState | None = None
+        self._stale = True
+
+    @property
+    def state(self) -> TimerState | None:
+        """Estado atual (sem recarregar)."""
+        return self._state
+
+    @property
+    def stale(self) -> bool:
+        """True se o próximo snapshot precisaria recarregar do banco."""
+        return self._stale
+
+    def invalidate(self) -> None:
+        """Marca o cache para recarga no próximo snapshot."""
+        self._stale = True
+
+    def load(self) -> None:
+        """Recarrega o timer ativo do banco (uma leitura)."""
+        self._state = self._load_fn()
+        self._stale = False
+
+    def store(self, state: TimerState | None) -> None:
+        """Substitui o estado por um já carregado (snapshot do dashboard)."""
+        self._state = state
+        self._stale = False
+
+    def start(self, timelog: Any, name: str = "") -> None:
+        """Registra timer recém-iniciado."""
+        self._state = TimerState.from_timelog(timelog, name)
+        self._stale = False
+
+    def apply(self, timelog: Any) -> None:
+        """Atualiza campos mutáveis após pause/resume, preservando o nome.
+
+        timelog None indica falha na operação: o cache é marcado stale
+        para refletir o estado real no próximo snapshot.
+        """
+        if timelog is None:
+            self._stale = True
+            return
+        name = self._state.name if self._state else ""
+        self._state = TimerState.from_timelog(timelog, name)
+
+    def clear(self) -> None:
+        """Remove timer ativo (stop/cancel)."""
+        self._state = None
+        self._stale = False
+
+    def snapshot(self, now: datetime | None = None) -> dict[str, Any] | None:
+        """Retorna dict para TimerPanel, recarregando apenas se stale."""
+        if self._stale:
+            self.load()
+        if self._state is None:
+            return None
+        return format_timer(self._state, now)
+
+
+def format_timer(state: TimerState, now: datetime | None = None) -> dict[str, Any]:
+    """Calcula elapsed e monta dict compatível com TimerPanel."""
+    now = now or datetime.now()
+    total_elapsed = (now - state.start_time).total_seconds()
+    paused_total: float = state.paused_duration
+    if state.status == TimerStatus.PAUSED.value and state.pause_start:
+        paused_total += (now - state.pause_start).total_seconds()
+    elapsed_secs = max(int(total_elapsed - paused_total), 0)
+    minutes, seconds = divmod(elapsed_secs, 60)
+    hours, minutes = divmod(minutes, 60)
+    return {
+        "id": state.id,
+        "status": state.status,
+        "elapsed": f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        if hours
+        else f"{minutes:02d}:{seconds:02d}",
+        "elapsed_seconds": elapsed_secs,
+        "name": state.name,
+        "habit_instance_id": state.habit_instance_id,
+    }
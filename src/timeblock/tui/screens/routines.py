@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import itertools
 import math
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
 
 from textual.containers import Horizontal, Vertical
+from textual.css.query import NoMatches
 from textual.events import Key
 from textual.widgets import Static
 
+from timeblock.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
 # =============================================================================
 # Utilitários puros (sem dependência de Textual)
 # =============================================================================
@@ -49,18 +55,67 @@ def calculate_visible_days(terminal_width: int) -> int:
     return 3
 
 
+# Recorrência (Recurrence.value) -> dias da semana (0=Seg); sem
+# recorrência o hábito aparece todos os dias
+RECURRENCE_DAYS: dict[str, tuple[int, ...]] = {
+    "MONDAY": (0,),
+    "TUESDAY": (1,),
+    "WEDNESDAY": (2,),
+    "THURSDAY": (3,),
+    "FRIDAY": (4,),
+    "SATURDAY": (5,),
+    "SUNDAY": (6,),
+    "WEEKDAYS": (0, 1, 2, 3, 4),
+    "WEEKENDS": (5, 6),
+    "EVERYDAY": (0, 1, 2, 3, 4, 5, 6),
+}
+
+GRID_COL_WIDTH = 16
+# Lanes lado a lado numa célula; além disso a última vira "+N"
+MAX_GRID_LANES = 3
+# Largura assumida fora de uma app montada (testes de unidade)
+DEFAULT_GRID_WIDTH = 120
+
+
 def detect_conflicts(habits: list[dict[str, Any]]) -> list[tuple[int, int]]:
     """Detecta pares de hábitos com sobreposição temporal.
 
     BR-TUI-011-R08: Conflitos exibidos lado a lado, nunca bloqueados.
-    Retorna lista de tuplas (id_a, id_b) para cada par conflitante.
+    Retorna lista de tuplas (id_a, id_b) para cada par conflitante,
+    na ordem da lista de entrada.
+
+    Sweep-line sobre os hábitos ordenados por início: cada hábito só é
+    comparado com os que ainda estão abertos. O(n log n + k) para k
+    pares, em vez de comparar todos os pares.
     """
-    conflicts: list[tuple[int, int]] = []
-    for i, a in enumerate(habits):
-        for b in habits[i + 1 :]:
-            if a["start"] < b["end"] and b["start"] < a["end"]:
-                conflicts.append((a["id"], b["id"]))
-    return conflicts
+    order = sorted(range(len(habits)), key=lambda i: habits[i]["start"])
+    active: list[int] = []
+    pairs: list[tuple[int, int]] = []
+    for i in order:
+        start, end = habits[i]["start"], habits[i]["end"]
+        active = [j for j in active if habits[j]["end"] > start]
+        pairs.extend((min(i, j), max(i, j)) for j in active if habits[j]["start"] < end)
+        active.append(i)
+    pairs.sort()
+    return [(habits[a]["id"], habits[b]["id"]) for a, b in pairs]
+
+
+def group_conflicts(habits: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+    """Agrupa hábitos sobrepostos, em ordem de início (BR-TUI-011-R08).
+
+    Um grupo fecha quando o próximo hábito começa depois do fim de
+    todos os anteriores; hábitos sem conflito formam grupos unitários.
+    """
+    groups: list[list[dict[str, Any]]] = []
+    group_end = ""
+    for habit in sorted(habits, key=lambda h: h["start"]):
+        if groups and habit["start"] < group_end:
+            groups[-1].append(habit)
+            group_end = max(group_end, habit["end"])
+        else:
+            groups.append([habit])
+            group_end = habit["end"]
+    return groups
 
 
 # =============================================================================
@@ -94,6 +149,102 @@ class RoutineBlock:
         return max(1, math.ceil(self.duration_minutes / 30))
 
 
+@dataclass(frozen=True)
+class BlockPlacement:
+    """RoutineBlock posicionado numa coluna de dia.
+
+    lane/lanes: posição lado a lado dentro do grupo de conflito
+    (lanes == 1 quando não há conflito); group: índice do grupo de
+    conflito no dia (uma linha da grade por grupo).
+    """
+
+    block: RoutineBlock
+    lane: int
+    lanes: int
+    group: int = 0
+
+
+@dataclass(frozen=True)
+class WeekGridModel:
+    """Placements da semana: days[0..6] = Seg..Dom, ordenados por início."""
+
+    days: tuple[tuple[BlockPlacement, ...], ...]
+
+
+def _to_block(habit: dict[str, Any]) -> RoutineBlock:
+    return RoutineBlock(
+        habit_name=habit.get("name", ""),
+        start=habit.get("start", ""),
+        end=habit.get("end", ""),
+        color=habit.get("color", "#CBA6F7"),
+        habit_id=habit.get("id", 0),
+    )
+
+
+def _place_day(habits: list[dict[str, Any]]) -> tuple[BlockPlacement, ...]:
+    """Posiciona os hábitos de um dia: primeira lane livre no grupo."""
+    placements: list[BlockPlacement] = []
+    for index, group in enumerate(group_conflicts(habits)):
+        lane_ends: list[str] = []
+        lane_of: list[int] = []
+        for habit in group:
+            for lane, lane_end in enumerate(lane_ends):
+                if habit["start"] >= lane_end:
+                    lane_ends[lane] = habit["end"]
+                    lane_of.append(lane)
+                    break
+            else:
+                lane_of.append(len(lane_ends))
+                lane_ends.append(habit["end"])
+        placements.extend(
+            BlockPlacement(_to_block(habit), lane, len(lane_ends), index)
+            for habit, lane in zip(group, lane_of, strict=True)
+        )
+    return tuple(placements)
+
+
+def build_week_model(habits: list[dict[str, Any]]) -> WeekGridModel:
+    """Distribui os hábitos pelos dias da recorrência e posiciona conflitos.
+
+    Hábitos sem start/end não entram na grade.
+    """
+    per_day: list[list[dict[str, Any]]] = [[] for _ in range(7)]
+    for habit in habits:
+        if not habit.get("start") or not habit.get("end"):
+            continue
+        for day in RECURRENCE_DAYS.get(habit.get("recurrence") or "EVERYDAY", ()):
+            per_day[day].append(habit)
+    return WeekGridModel(days=tuple(_place_day(day) for day in per_day))
+
+
+def _join_lanes(cells: list[str]) -> str:
+    """Divide a largura da coluna entre as lanes, separadas por │.
+
+    Acima de MAX_GRID_LANES, a última lane mostra "+N" com a contagem
+    de hábitos que não couberam.
+    """
+    if len(cells) > MAX_GRID_LANES:
+        hidden = len(cells) - MAX_GRID_LANES + 1
+        cells = [*cells[: MAX_GRID_LANES - 1], f"+{hidden}"]
+    width = max(1, (GRID_COL_WIDTH - len(cells) + 1) // len(cells))
+    return "│".join(cell[:width] for cell in cells)
+
+
+def habits_fingerprint(habits: list[dict[str, Any]]) -> tuple:
+    """Campos dos hábitos que afetam a grade (chave do cache)."""
+    return tuple(
+        (
+            h.get("id"),
+            h.get("name"),
+            h.get("start"),
+            h.get("end"),
+            h.get("color"),
+            h.get("recurrence"),
+        )
+        for h in habits
+    )
+
+
 # =============================================================================
 # RoutinesScreen - Widget principal
 # =============================================================================
@@ -121,6 +272,8 @@ class RoutinesScreen(Static, can_focus=True):
         super().__init__(**kwargs)
         self._routines = routines or []
         self._habits = habits if habits is not None else []
+        self._grid_model: WeekGridModel | None = None
+        self._grid_key: tuple | None = None
         self._selected_habit: dict[str, Any] | None = None
         self._data_loaded = False
         self.focused_day: int = 0
@@ -131,12 +284,14 @@ class RoutinesScreen(Static, can_focus=True):
         """Compõe layout da tela de rotinas."""
         with Vertical():
             yield Static(self.get_header_text(), id="routines-header")
-            if self._habits:
-                with Horizontal():
-                    yield Static(self._render_grid(), id="routines-grid")
-                    yield Static(self._render_detail_panel(), id="routines-detail")
-            else:
-                yield Static(self.get_empty_message(), id="routines-empty")
+            # Grade e mensagem de vazio sempre compostas; set_habits alterna
+            with Horizontal(id="routines-body") as body:
+                body.display = bool(self._habits)
+                yield Static(self._render_grid(), id="routines-grid")
+                yield Static(self._render_detail_panel(), id="routines-detail")
+            empty = Static(self.get_empty_message(), id="routines-empty")
+            empty.display = not self._habits
+            yield empty
 
     # =========================================================================
     # BR-TUI-011-R04: Navegação na grade
@@ -148,10 +303,12 @@ class RoutinesScreen(Static, can_focus=True):
         if key == "right":
             if self.focused_day < 6:
                 self.focused_day += 1
+                self._refresh_grid()
             event.prevent_default()
         elif key == "left":
             if self.focused_day > 0:
                 self.focused_day -= 1
+                self._refresh_grid()
             event.prevent_default()
         elif key == "down":
             self.focused_block += 1
@@ -169,6 +326,7 @@ class RoutinesScreen(Static, can_focus=True):
         elif key == "shift+t" or key == "T":
             self.current_week_offset = 0
             self.focused_day = 0
+            self._refresh_grid()
             event.prevent_default()
 
     # =========================================================================
@@ -264,18 +422,22 @@ class RoutinesScreen(Static, can_focus=True):
         """Mensagem quando rotina não possui hábitos."""
         return "Nenhum hábito. Pressione [n] para criar"
 
+    def set_habits(self, habits: list[dict[str, Any]]) -> None:
+        """Troca os hábitos da rotina exibida (troca de rotina ou CRUD)."""
+        self._habits = habits
+        self._refresh_grid()
+
+    def get_grid_model(self) -> WeekGridModel:
+        """Modelo da grade, recalculado só quando os hábitos mudam."""
+        key = habits_fingerprint(self._habits)
+        if self._grid_model is None or key != self._grid_key:
+            self._grid_model = build_week_model(self._habits)
+            self._grid_key = key
+        return self._grid_model
+
     def get_rendered_blocks(self) -> list[RoutineBlock]:
         """Retorna blocos renderizados na grade."""
-        return [
-            RoutineBlock(
-                habit_name=h.get("name", ""),
-                start=h.get("start", ""),
-                end=h.get("end", ""),
-                color=h.get("color", "#CBA6F7"),
-                habit_id=h.get("id", 0),
-            )
-            for h in self._habits
-        ]
+        return [_to_block(h) for h in self._habits]
 
     # =========================================================================
     # BR-TUI-011-R11: Refresh
@@ -285,15 +447,72 @@ class RoutinesScreen(Static, can_focus=True):
         """Recarrega dados ao receber foco."""
         self._data_loaded = True
 
+    def on_resize(self) -> None:
+        """Re-renderiza para a largura atual (BR-TUI-011-R10).
+
+        Reusa o modelo em cache: só o recorte de dias visíveis muda.
+        """
+        self._refresh_grid()
+
     # =========================================================================
     # Rendering helpers (internos)
     # =========================================================================
 
+    def _visible_days(self) -> int:
+        """Dias visíveis para a largura do terminal (BR-TUI-011-R10)."""
+        width = self.app.size.width if self.is_mounted else DEFAULT_GRID_WIDTH
+        return calculate_visible_days(width)
+
+    def _visible_window(self) -> range:
+        """Dias visíveis em torno de focused_day, sem sair de Seg..Dom."""
+        visible = self._visible_days()
+        start = min(max(0, self.focused_day - visible // 2), 7 - visible)
+        return range(start, start + visible)
+
+    def _refresh_grid(self) -> None:
+        """Atualiza a grade, se montada, e alterna com a mensagem de vazio."""
+        if not self.is_mounted:
+            return
+        try:
+            body = self.query_one("#routines-body", Horizontal)
+            grid = self.query_one("#routines-grid", Static)
+            empty = self.query_one("#routines-empty", Static)
+        except NoMatches:
+            logger.debug("Grade de rotinas ainda não composta")
+            return
+        body.display = bool(self._habits)
+        empty.display = not self._habits
+        grid.update(self._render_grid())
+
     def _render_grid(self) -> str:
-        """Renderiza grade temporal (placeholder)."""
+        """Renderiza período, dias visíveis e blocos por dia.
+
+        A janela de dias acompanha focused_day. Cada grupo de conflito
+        ocupa uma linha, com os hábitos em ordem de início separados
+        por │ (BR-TUI-011-R08).
+        """
+        window = self._visible_window()
+        model = self.get_grid_model()
+        day_labels = self.get_day_labels()
         period = self.get_week_period()
-        labels = "  ".join(self.get_day_labels())
-        return f"{period}\n{labels}"
+        labels = " ".join(day_labels[day].ljust(GRID_COL_WIDTH) for day in window).rstrip()
+
+        columns: list[list[str]] = []
+        for day in window:
+            rows = itertools.groupby(model.days[day], key=lambda p: p.group)
+            columns.append(
+                [
+                    _join_lanes([f"{p.block.start} {p.block.habit_name}" for p in group])
+                    for _, group in rows
+                ]
+            )
+
+        lines = [period, labels]
+        height = max((len(col) for col in columns), default=0)
+        for y in range(height):
+            cells = [col[y] if y < len(col) else "" for col in columns]
+            lines.append(" ".join(cell.ljust(GRID_COL_WIDTH) for cell in cells).rstrip())
+        return "\n".join(lines)
 
     def _render_detail_panel(self) -> str:
         """Renderiza painel de detalhes (placeholder)."""
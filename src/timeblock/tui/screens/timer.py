@@ -4,11 +4,13 @@ Exibe contagem em tempo real com atualização a cada segundo.
 Suporta start, pause, resume, stop e cancel via keybindings.
 """
 
+import time
 from typing import ClassVar
 
 from textual.binding import Binding
 from textual.containers import Vertical
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Static
 
@@ -34,6 +36,8 @@ class TimerScreen(Widget):
     elapsed_seconds: reactive[int] = reactive(0)
     _timelog_id: int | None = None
     _expected_minutes: int = 0
+    _tick_interval: Timer | None = None
+    _hidden_at: float | None = None
 
     def compose(self):
         """Compõe layout do TimerScreen."""
@@ -47,9 +51,23 @@ class TimerScreen(Widget):
 
     def on_mount(self) -> None:
         """Inicia timer de atualização."""
-        self.set_interval(self.TIMER_INTERVAL, self._tick)
+        self._tick_interval = self.set_interval(self.TIMER_INTERVAL, self._tick)
         self._refresh_display()
 
+    def pause_intervals(self) -> None:
+        """Pausa o tick enquanto a screen está oculta."""
+        if self._tick_interval is not None:
+            self._tick_interval.pause()
+        self._hidden_at = time.monotonic()
+
+    def resume_intervals(self) -> None:
+        """Retoma o tick, somando o tempo em que ficou oculta."""
+        if self._hidden_at is not None and self.timer_state == "running":
+            self.elapsed_seconds += int(time.monotonic() - self._hidden_at)
+        self._hidden_at = None
+        if self._tick_interval is not None:
+            self._tick_interval.resume()
+
     def _tick(self) -> None:
         """Incrementa elapsed a cada segundo (apenas quando running)."""
         if self.timer_state == "running":
@@ -5,26 +5,125 @@ BR-TUI-003-R15: Auto-scroll na hora atual.
 BR-TUI-031: Scroll horizontal para multi-coluna.
 BR-TUI-032: Renderização de blocos contínuos com granularidade de 15min.
 
+As colunas de horas e de blocos usam a Line API do Textual: o
+compositor pede só as linhas visíveis ao render_line, então um redraw
+custa O(viewport) e não O(dia). update_data recalcula o layout de
+blocos (AgendaLayout, memoizado por fingerprint das instâncias); o
+tick de minuto invalida apenas as linhas do marcador de hora atual.
+
 Referências:
     - HUMBLE; FARLEY, 2010, p. 179 (Humble Object Pattern)
     - A lógica pura de renderização está em agenda_renderer.py.
 """
 
+from collections.abc import Callable
+from datetime import datetime
 from typing import Any
 
 from textual.containers import ScrollableContainer
+from textual.content import Content
+from textual.geometry import Region, Size
+from textual.strip import Strip
+from textual.visual import Visual
 from textual.widget import Widget
-from textual.widgets import Static
 
 from timeblock.tui.widgets.agenda_renderer import (
-    build_agenda_content,
+    HOURS_WIDTH,
+    AgendaLayout,
+    build_agenda_layout,
     compute_agenda_range,
+    marker_line,
+    render_block_line,
+    render_hour_line,
 )
 
 # Re-export para backward compatibility (test_agenda_range.py importa daqui)
 __all__ = ["AgendaPanel", "compute_agenda_range"]
 
 
+class _AgendaLines(Widget):
+    """Coluna da agenda renderizada linha a linha, com cache de Strip.
+
+    A linha y corresponde à linha de 15min `layout.line_start + y`;
+    line_markup recebe esse índice e devolve o markup da linha. Strips
+    ficam em cache até o layout ou a largura mudarem, ou até a linha
+    ser invalidada.
+    """
+
+    def __init__(self, line_markup: Callable[[int], str], **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._line_markup = line_markup
+        self._layout = build_agenda_layout([])
+        self._strips: dict[int, Strip] = {}
+        self._strips_width = 0
+
+    def set_layout(self, layout: AgendaLayout) -> None:
+        """Troca o layout e descarta as linhas em cache (no-op se igual)."""
+        if layout is self._layout:
+            return
+        self._layout = layout
+        self._strips.clear()
+        self.refresh(layout=True)
+
+    def invalidate_lines(self, *lines: int) -> None:
+        """Descarta e repinta linhas de 15min específicas."""
+        for li in lines:
+            y = li - self._layout.line_start
+            if 0 <= y < self._layout.height:
+                self._strips.pop(y, None)
+                self.refresh(Region(0, y, self.size.width, 1))
+
+    def get_content_height(self, container: Size, viewport: Size, width: int) -> int:
+        """Altura virtual: uma linha por linha de 15min do layout."""
+        return self._layout.height
+
+    def render_line(self, y: int) -> Strip:
+        """Strip da linha y do widget (Line API), do cache ou renderizada."""
+        width = self.size.width
+        if width != self._strips_width:
+            self._strips.clear()
+            self._strips_width = width
+        strip = self._strips.get(y)
+        if strip is None:
+            if not 0 <= y < self._layout.height:
+                return Strip.blank(width, self.visual_style.rich_style)
+            markup = self._line_markup(self._layout.line_start + y)
+            strip = Visual.to_strips(
+                self, Content.from_markup(markup), width, 1, self.visual_style
+            )[0]
+            self._strips[y] = strip
+        return strip
+
+
+class AgendaHours(_AgendaLines):
+    """Coluna fixa de horas com marcador da hora atual (BR-TUI-003-R15)."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(lambda li: render_hour_line(li, self._now), **kwargs)
+        self._now = datetime.now()
+
+    def set_clock(self, now: datetime) -> None:
+        """Move o marcador: invalida só a linha antiga e a nova."""
+        previous = marker_line(self._now)
+        self._now = now
+        self.invalidate_lines(previous, marker_line(now))
+
+    def get_content_width(self, container: Size, viewport: Size) -> int:
+        """Largura fixa da régua de horas."""
+        return HOURS_WIDTH
+
+
+class AgendaBlocks(_AgendaLines):
+    """Coluna de blocos, scrollável na horizontal (BR-TUI-031)."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(lambda li: render_block_line(self._layout, li), **kwargs)
+
+    def get_content_width(self, container: Size, viewport: Size) -> int:
+        """Largura dos blocos; maior que o viewport ativa o scroll horizontal."""
+        return self._layout.content_width
+
+
 class AgendaPanel(Widget):
     can_focus = True
     """Agenda com horas fixas e blocos scrolláveis horizontalmente (BR-TUI-031)."""
@@ -35,9 +134,9 @@ class AgendaPanel(Widget):
 
     def compose(self):
         """Estrutura interna: horas fixas + blocos scrolláveis (ADR-041-19)."""
-        yield Static(id="agenda-hours")
+        yield AgendaHours(id="agenda-hours")
         with ScrollableContainer(id="agenda-blocks-scroll", can_focus=False):
-            yield Static(id="agenda-blocks")
+            yield AgendaBlocks(id="agenda-blocks")
 
     def update_data(self, instances: list[dict]) -> None:
         """Recebe instâncias do coordinator e renderiza."""
@@ -45,19 +144,19 @@ class AgendaPanel(Widget):
         self._refresh_content()
 
     def _refresh_content(self) -> None:
-        """Atualiza horas e blocos nos widgets filhos."""
-        hours_lines, blocks_lines, content_width = build_agenda_content(
-            self._instances,
-        )
-        self.query_one("#agenda-hours", Static).update("\n".join(hours_lines))
-        blocks_widget = self.query_one("#agenda-blocks", Static)
-        blocks_widget.styles.min_width = content_width
-        blocks_widget.update("\n".join(blocks_lines))
+        """Aplica o layout das instâncias; com layout igual, mantém o cache."""
+        layout = build_agenda_layout(self._instances)
+        hours = self.query_one(AgendaHours)
+        hours.set_clock(datetime.now())
+        hours.set_layout(layout)
+        self.query_one(AgendaBlocks).set_layout(layout)
+
+    def refresh_clock(self) -> None:
+        """Atualiza o marcador da hora atual sem tocar nos blocos."""
+        self.query_one(AgendaHours).set_clock(datetime.now())
 
     def scroll_to_current_time(self) -> None:
         """Auto-scroll para posicionar hora atual no terco superior (BR-TUI-003-R15)."""
-        from datetime import datetime
-
         now = datetime.now()
         current_slot = (now.hour * 60 + now.minute) // 30
         range_start, _ = compute_agenda_range(self._instances)
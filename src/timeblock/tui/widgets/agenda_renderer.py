@@ -9,6 +9,7 @@ Referências:
     - ADR-041: Redesign de blocos da Agenda
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from timeblock.tui.colors import (
@@ -46,6 +47,14 @@ def compute_agenda_range(instances: list[dict]) -> tuple[int, int]:
     return range_start, range_end
 
 
+def _slot_span(inst: dict) -> tuple[int, int]:
+    """Slots de 30min [início, fim) ocupados pelo evento (mínimo 1)."""
+    sm = inst.get("start_minutes", 0)
+    em = inst.get("end_minutes", sm + 60)
+    si = sm // 30
+    return si, max(si + 1, -(-em // 30))
+
+
 def assign_columns(
     sorted_inst: list[dict],
 ) -> tuple[dict[int, int], dict[int, int]]:
@@ -54,6 +63,7 @@ def assign_columns(
     Algoritmo greedy: cada evento recebe a primeira coluna livre.
     Eventos no mesmo grupo de sobreposição compartilham a mesma
     contagem total de colunas para manter largura consistente.
+    Grupos via sweep-line: O(n log n), sem mapa por slot.
 
     Returns:
         col_of: id(inst) -> índice da coluna (0-based)
@@ -76,85 +86,105 @@ def assign_columns(
             col_of[id(inst)] = len(col_ends)
             col_ends.append(em)
 
-    # Union-Find para grupos de sobreposição
-    parent: dict[int, int] = {}
+    # Sweep-line: eventos que compartilham um slot de 30min formam um
+    # grupo; em ordem de slot inicial, um grupo fecha quando o próximo
+    # evento começa depois do fim de todos os anteriores.
+    total_cols_of: dict[int, int] = {}
+    group: list[dict] = []
+    group_end = 0
+    group_cols = 0
+    for inst in sorted(sorted_inst, key=lambda i: _slot_span(i)[0]):
+        si, ei = _slot_span(inst)
+        if group and si >= group_end:
+            for member in group:
+                total_cols_of[id(member)] = group_cols
+            group, group_end, group_cols = [], 0, 0
+        group.append(inst)
+        group_end = max(group_end, ei)
+        group_cols = max(group_cols, col_of[id(inst)] + 1)
+    for member in group:
+        total_cols_of[id(member)] = group_cols
 
-    def find(x: int) -> int:
-        while parent.get(x, x) != x:
-            parent[x] = parent.get(parent[x], parent[x])
-            x = parent[x]
-        return x
+    return col_of, total_cols_of
 
-    def union(a: int, b: int) -> None:
-        ra, rb = find(a), find(b)
-        if ra != rb:
-            parent[ra] = rb
 
-    # Agrupar eventos que compartilham slots
-    slot_events: dict[int, list[dict]] = {}
-    for inst in sorted_inst:
-        sm = inst.get("start_minutes", 0)
-        em = inst.get("end_minutes", sm + 60)
-        si = sm // 30
-        ei = max(si + 1, -(-em // 30))
-        for s in range(si, ei):
-            if s not in slot_events:
-                slot_events[s] = []
-            slot_events[s].append(inst)
-
-    for events in slot_events.values():
-        if len(events) > 1:
-            first = id(events[0])
-            for e in events[1:]:
-                union(first, id(e))
-
-    # Max colunas por grupo
-    group_max: dict[int, int] = {}
-    for inst in sorted_inst:
-        root = find(id(inst))
-        col = col_of[id(inst)]
-        group_max[root] = max(group_max.get(root, 0), col + 1)
+# Layout de blocos (BR-TUI-032-R13/R14)
+MIN_COL_WIDTH = 18
+IDEAL_WIDTH = 38  # largura ideal para coluna única
+HOURS_WIDTH = 7  # "  HH:MM"
 
-    total_cols_of: dict[int, int] = {}
-    for inst in sorted_inst:
-        total_cols_of[id(inst)] = group_max[find(id(inst))]
+# Campos da instância que afetam layout ou markup dos blocos
+LAYOUT_FIELDS = ("id", "start_minutes", "end_minutes", "status", "substatus", "name")
+LAYOUT_CACHE_SIZE = 16
 
-    return col_of, total_cols_of
 
+@dataclass(frozen=True)
+class AgendaLayout:
+    """Posição dos blocos por linha de 15min, independente da hora atual.
 
-def build_agenda_content(
-    instances: list[dict],
-    now: datetime | None = None,
-) -> tuple[list[str], list[str], int]:
-    """Monta conteúdo separando horas (fixas) e blocos (scrolláveis).
+    Calculado uma vez por update_data; a renderização por linha
+    (render_hour_line / render_block_line) consulta só as linhas
+    visíveis.
 
-    Cada linha visual = 15 minutos (BR-TUI-032). Labels a cada 30min.
-    R10: linha do end_minutes ainda tem cor.
-    R12: título de bloco consecutivo substitui corpo do anterior.
+    Attributes:
+        line_start: Primeira linha de 15min da régua.
+        line_end: Última linha de 15min da régua (inclusive).
+        line_info: linha -> [(inst, role, col)] para linhas com blocos.
+        line_cols: linha -> total de colunas do grupo naquela linha.
+        content_width: Largura em chars da coluna de blocos.
+    """
 
-    Args:
-        instances: Lista de dicts com start_minutes, end_minutes, name, status, substatus.
-        now: Hora atual para marcador. Se None, usa datetime.now().
+    line_start: int
+    line_end: int
+    line_info: dict[int, list[tuple[dict, str, int]]] = field(default_factory=dict)
+    line_cols: dict[int, int] = field(default_factory=dict)
+    content_width: int = 0
 
-    Returns:
-        hours_lines: linhas da coluna de horas
-        blocks_lines: linhas da coluna de blocos
-        content_width: largura total em chars da coluna de blocos
+    @property
+    def height(self) -> int:
+        """Número de linhas da régua."""
+        return self.line_end - self.line_start + 1
+
+
+def column_width(n_cols: int) -> int:
+    """Largura de cada coluna numa linha com n_cols colunas."""
+    gap = n_cols - 1  # BR-TUI-032-R14
+    return max(MIN_COL_WIDTH, (IDEAL_WIDTH - gap) // n_cols)
+
+
+_layout_cache: dict[tuple, AgendaLayout] = {}
+
+
+def layout_fingerprint(instances: list[dict]) -> tuple:
+    """Chave do layout: LAYOUT_FIELDS de cada instância, em ordem."""
+    return tuple(tuple(inst.get(f) for f in LAYOUT_FIELDS) for inst in instances)
+
+
+def build_agenda_layout(instances: list[dict]) -> AgendaLayout:
+    """Layout memoizado pelo fingerprint das instâncias.
+
+    Snapshots sem mudança na agenda (ex: recarga após commit que só
+    altera tasks) devolvem o mesmo objeto, sem recalcular colunas.
     """
-    if now is None:
-        now = datetime.now()
+    key = layout_fingerprint(instances)
+    layout = _layout_cache.get(key)
+    if layout is None:
+        layout = _compute_layout(instances)
+        if len(_layout_cache) >= LAYOUT_CACHE_SIZE:
+            del _layout_cache[next(iter(_layout_cache))]
+        _layout_cache[key] = layout
+    return layout
 
-    cur_h, cur_m = now.hour, now.minute
-    hours_out: list[str] = []
-    blocks_out: list[str] = []
-    min_col_w = 18  # BR-TUI-032-R13
-    fw = 38  # largura ideal para coluna única
-    max_content_w = 0
 
+def _compute_layout(instances: list[dict]) -> AgendaLayout:
+    """Atribui blocos às linhas de 15min (BR-TUI-032).
+
+    R10: linha do end_minutes ainda tem cor.
+    Custo proporcional às instâncias, não à altura da régua.
+    """
     sorted_inst = sorted(instances, key=lambda x: x.get("start_minutes", 0))
     col_of, total_cols_of = assign_columns(sorted_inst)
 
-    # Mapa: linha de 15min -> [(inst, role, col)]
     line_info: dict[int, list[tuple[dict, str, int]]] = {}
     for inst in sorted_inst:
         sm = inst.get("start_minutes", 0)
@@ -175,85 +205,121 @@ def build_agenda_content(
             role = "start" if li == start_line else "body"
             line_info[li].append((inst, role, col))
 
-    def _time_label(h: int, m: int) -> str:
-        if h == cur_h and m <= cur_m < m + 30:
-            return f"[bold {C_ACCENT}]{now.strftime('%H:%M')}[/bold {C_ACCENT}]"
-        return f"[dim]{h:02d}:{m:02d}[/dim]"
-
     range_start, range_end = compute_agenda_range(instances)
     line_start = range_start * 2
     line_end = range_end * 2 + 1
 
-    for li in range(line_start, line_end + 1):
-        minute = li * 15
-        h = minute // 60
-        m = minute % 60
-        show_label = m % 30 == 0
+    line_cols: dict[int, int] = {}
+    content_width = 0
+    for li, entries in line_info.items():
+        if not line_start <= li <= line_end:
+            continue
+        n_cols = max(total_cols_of[id(e[0])] for e in entries)
+        line_cols[li] = n_cols
+        content_width = max(content_width, n_cols * column_width(n_cols) + n_cols)
+
+    return AgendaLayout(line_start, line_end, line_info, line_cols, content_width)
 
-        if show_label:
-            hours_out.append(f"  {_time_label(h, m)}")
-        else:
-            hours_out.append("       ")
 
-        entries = line_info.get(li, [])
+def marker_line(now: datetime) -> int:
+    """Linha de 15min cujo label mostra a hora atual (label a cada 30min)."""
+    return (now.hour * 60 + now.minute - now.minute % 30) // 15
 
-        if not entries:
-            blocks_out.append("")
-            continue
 
-        n_cols = max(total_cols_of[id(e[0])] for e in entries)
-        gap = n_cols - 1  # BR-TUI-032-R14
-        col_w = max(min_col_w, (fw - gap) // n_cols)
-        line_w = n_cols * col_w + gap + 1
-        max_content_w = max(max_content_w, line_w)
-
-        # Indexar por coluna; "start" vence "body" (R12)
-        col_map: dict[int, tuple[dict, str]] = {}
-        for inst, role, col in entries:
-            if col not in col_map or role == "start":
-                col_map[col] = (inst, role)
-
-        parts: list[str] = []
-        for c in range(n_cols):
-            if c in col_map:
-                inst, role = col_map[c]
-                nm = inst.get("name", "")
-                st = inst.get("status", "pending")
-                sub = inst.get("substatus")
-                color = status_color(st, sub)
-                icon = status_icon(st, sub)
-                fc = fill_char(st, sub)
-                bold = is_bold_status(st)
-                fcolor = fill_color(st, sub)
-
-                if role == "start":
-                    # accent bar + título C_TEXT + ícone (BR-TUI-032-R4)
-                    accent_w = 0  # sem accent bar no título (#34 / #40)
-                    separator_w = 3  # " \u00b7 "
-                    icon_w = len(icon)
-                    max_nm = max(1, col_w - accent_w - separator_w - icon_w)
-                    if len(nm) > max_nm:
-                        display_nm = nm[: max(1, max_nm - 1)] + "\u2026"
-                    else:
-                        display_nm = nm
-                    visual_w = accent_w + len(display_nm) + separator_w + icon_w
-                    pad = " " * max(0, col_w - visual_w)
-                    if bold:
-                        parts.append(
-                            f"[bold {color}]{icon}[/bold {color}]"
-                            f" [bold {C_TEXT}]{display_nm}[/bold {C_TEXT}]"
-                            f"{pad}"
-                        )
-                    else:
-                        parts.append(
-                            f"[{color}]{icon}[/{color}] [{C_TEXT}]{display_nm}[/{C_TEXT}]{pad}"
-                        )
-                else:
-                    # Corpo: accent bar + fill (BR-TUI-032-R5)
-                    parts.append(f"[dim]\u00b7[/dim] [{fcolor}]{fc * (col_w - 2)}[/{fcolor}]")
+def render_hour_line(li: int, now: datetime) -> str:
+    """Markup da coluna de horas na linha li (label a cada 30min)."""
+    minute = li * 15
+    h, m = divmod(minute, 60)
+    if m % 30:
+        return " " * HOURS_WIDTH
+    if li == marker_line(now):
+        return f"  [bold {C_ACCENT}]{now.strftime('%H:%M')}[/bold {C_ACCENT}]"
+    return f"  [dim]{h:02d}:{m:02d}[/dim]"
+
+
+def render_block_line(layout: AgendaLayout, li: int) -> str:
+    """Markup da coluna de blocos na linha li ("" sem blocos).
+
+    R12: título de bloco consecutivo substitui corpo do anterior.
+    """
+    entries = layout.line_info.get(li)
+    if not entries:
+        return ""
+
+    n_cols = layout.line_cols[li]
+    col_w = column_width(n_cols)
+
+    # Indexar por coluna; "start" vence "body" (R12)
+    col_map: dict[int, tuple[dict, str]] = {}
+    for inst, role, col in entries:
+        if col not in col_map or role == "start":
+            col_map[col] = (inst, role)
+
+    parts: list[str] = []
+    for c in range(n_cols):
+        if c not in col_map:
+            parts.append(" " * col_w)
+            continue
+        inst, role = col_map[c]
+        nm = inst.get("name", "")
+        st = inst.get("status", "pending")
+        sub = inst.get("substatus")
+        color = status_color(st, sub)
+        icon = status_icon(st, sub)
+
+        if role == "start":
+            # accent bar + título C_TEXT + ícone (BR-TUI-032-R4)
+            accent_w = 0  # sem accent bar no título (#34 / #40)
+            separator_w = 3  # " \u00b7 "
+            icon_w = len(icon)
+            max_nm = max(1, col_w - accent_w - separator_w - icon_w)
+            if len(nm) > max_nm:
+                display_nm = nm[: max(1, max_nm - 1)] + "\u2026"
+            else:
+                display_nm = nm
+            visual_w = accent_w + len(display_nm) + separator_w + icon_w
+            pad = " " * max(0, col_w - visual_w)
+            if is_bold_status(st):
+                parts.append(
+                    f"[bold {color}]{icon}[/bold {color}]"
+                    f" [bold {C_TEXT}]{display_nm}[/bold {C_TEXT}]"
+                    f"{pad}"
+                )
             else:
-                parts.append(" " * col_w)
+                parts.append(f"[{color}]{icon}[/{color}] [{C_TEXT}]{display_nm}[/{C_TEXT}]{pad}")
+        else:
+            # Corpo: accent bar + fill (BR-TUI-032-R5)
+            fc = fill_char(st, sub)
+            fcolor = fill_color(st, sub)
+            parts.append(f"[dim]\u00b7[/dim] [{fcolor}]{fc * (col_w - 2)}[/{fcolor}]")
+
+    return f" {' '.join(parts)}"
+
 
-        blocks_out.append(f" {' '.join(parts)}")
+def build_agenda_content(
+    instances: list[dict],
+    now: datetime | None = None,
+) -> tuple[list[str], list[str], int]:
+    """Monta conteúdo separando horas (fixas) e blocos (scrolláveis).
+
+    Cada linha visual = 15 minutos (BR-TUI-032). Labels a cada 30min.
+    Renderiza o dia inteiro; o AgendaPanel usa build_agenda_layout e
+    renderiza só as linhas visíveis.
+
+    Args:
+        instances: Lista de dicts com start_minutes, end_minutes, name, status, substatus.
+        now: Hora atual para marcador. Se None, usa datetime.now().
+
+    Returns:
+        hours_lines: linhas da coluna de horas
+        blocks_lines: linhas da coluna de blocos
+        content_width: largura total em chars da coluna de blocos
+    """
+    if now is None:
+        now = datetime.now()
 
-    return hours_out, blocks_out, max_content_w
+    layout = build_agenda_layout(instances)
+    lines = range(layout.line_start, layout.line_end + 1)
+    hours_out = [render_hour_line(li, now) for li in lines]
+    blocks_out = [render_block_line(layout, li) for li in lines]
+    return hours_out, blocks_out, layout.content_width
@@ -47,6 +47,10 @@ class HabitsPanel(FocusablePanel):
             return None
         return self._instances[self._cursor_index]
 
+    def get_item_by_id(self, instance_id: int) -> dict | None:
+        """Retorna item com o id informado ou None."""
+        return next((i for i in self._instances if i.get("id") == instance_id), None)
+
     def on_key(self, event: Key) -> None:
         """Captura navegação e quick actions."""
         if event.key == "s":
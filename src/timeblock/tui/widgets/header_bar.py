@@ -3,6 +3,9 @@
 Widget fino: delega busca de dados a header_data e formatação a header_renderer.
 Responsabilidade única: lifecycle Textual e orquestração.
 
+A busca roda em thread worker exclusivo; o resultado volta via
+ContentLoaded e é renderizado no event loop.
+
 Referências:
     - ADR-052 (Redesign do conteúdo interno do HeaderBar)
     - BR-TUI-035 (Conteúdo interno do HeaderBar)
@@ -10,15 +13,12 @@ Referências:
 
 from datetime import date, datetime
 
+from textual.message import Message
 from textual.reactive import reactive
 from textual.widgets import Static
+from textual.worker import get_current_worker
 
-from timeblock.tui.widgets.header_data import (
-    compute_daily_tasks_progress,
-    compute_weekly_habits_progress,
-    fetch_active_routine,
-    find_next_pending_item,
-)
+from timeblock.tui.widgets.header_data import HeaderMetrics, compute_header_metrics
 from timeblock.tui.widgets.header_renderer import (
     build_habits_progress,
     build_header_content,
@@ -73,30 +73,53 @@ class HeaderBar(Static):
         """Reage à mudança de screen."""
         self._refresh_content()
 
-    def _refresh_content(self) -> None:
-        """Orquestra busca de dados e renderização.
+    class ContentLoaded(Message):
+        """Dados do header prontos para renderização."""
 
-        BR-TUI-035 regra 24: uma única chamada ao RoutineService
-        alimenta tanto o border_title quanto a seção de hábitos.
-        """
+        def __init__(self, content: HeaderMetrics) -> None:
+            self.content = content
+            super().__init__()
+
+    def _refresh_content(self) -> None:
+        """Atualiza a data e agenda a busca de dados em thread worker."""
         today = date.today()
         now = datetime.now()
 
         self._update_border_subtitle(today)
+        self.run_worker(
+            lambda: self._load_content(now),
+            name="header-refresh",
+            group="header-refresh",
+            exclusive=True,
+            thread=True,
+            exit_on_error=False,
+        )
 
-        routine = fetch_active_routine()
-        self.border_title = routine.name if routine else "Sem rotina ativa"
+    def _load_content(self, now: datetime) -> None:
+        """Corpo do worker: busca dados e devolve via mensagem.
+
+        BR-TUI-035 regra 24: uma única sessão alimenta tanto o
+        border_title quanto as seções de conteúdo.
+        """
+        content = compute_header_metrics(now)
+        if not get_current_worker().is_cancelled:
+            self.post_message(self.ContentLoaded(content))
+
+    def on_header_bar_content_loaded(self, message: ContentLoaded) -> None:
+        """Renderiza dados recebidos do worker."""
+        message.stop()
+        self._show_content(message.content)
+
+    def _show_content(self, content: HeaderMetrics) -> None:
+        """Monta o conteúdo do header a partir dos dados já carregados."""
+        self.border_title = content.routine_name or "Sem rotina ativa"
 
         content_width = self._get_content_width()
 
-        habits_section = build_habits_progress(
-            *compute_weekly_habits_progress(routine, today),
-        )
-        tasks_section = build_tasks_progress(
-            *compute_daily_tasks_progress(today),
-        )
+        habits_section = build_habits_progress(content.habits_done, content.habits_expected)
+        tasks_section = build_tasks_progress(content.tasks_completed, content.tasks_total)
 
-        next_name, next_minutes = find_next_pending_item(routine, now)
+        next_name, next_minutes = content.next_name, content.next_minutes
         if next_name and len(next_name) > 20:
             next_name = truncate_next_name(next_name, 20)
         next_section = build_next_item(next_name, next_minutes)
@@ -1,10 +1,12 @@
 """Funções de busca e computação de dados para o HeaderBar.
 
-Responsabilidade única: acessar a service layer e retornar
-dados agregados prontos para consumo pelo renderer.
+Responsabilidade única: acessar o banco e retornar dados agregados
+prontos para consumo pelo renderer.
 
-Cada função recebe dependências explícitas (sem estado global)
-e retorna tuplas simples — sem markup Rich, sem lógica de UI.
+Todas as métricas do header são calculadas numa única sessão, com
+agregados SQL (COUNT/SUM, ORDER BY ... LIMIT 1) filtrados por rotina
+e data — o custo não cresce com o histórico de tasks e instâncias.
+Sem markup Rich, sem lógica de UI.
 
 Referências:
     - BR-TUI-035: Conteúdo interno do HeaderBar
@@ -12,200 +14,186 @@ Referências:
     - MARTIN, R. Clean Code, 2008, cap. 10 (Classes)
 """
 
+from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta
 
+from sqlalchemy import and_, case, func, or_
+from sqlmodel import Session, col, select
+
 from timeblock.models.enums import Status
-from timeblock.models.routine import Routine
-from timeblock.services.habit_instance_service import HabitInstanceService
-from timeblock.services.habit_service import HabitService
+from timeblock.models.habit import Habit
+from timeblock.models.habit_instance import HabitInstance
+from timeblock.models.task import Task
 from timeblock.services.routine_service import RoutineService
-from timeblock.services.task_service import TaskService
 from timeblock.tui.session import service_action
 from timeblock.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-def fetch_active_routine() -> Routine | None:
-    """Retorna rotina ativa ou None."""
-    try:
-        result, error = service_action(
-            lambda s: RoutineService(s).get_active_routine(),
-        )
-        if error or not result:
-            return None
-        return result
-    except Exception:
-        logger.debug("Exceção em fetch_active_routine", exc_info=True)
-        return None
+@dataclass(frozen=True)
+class HeaderMetrics:
+    """Dados agregados do HeaderBar (BR-TUI-035).
+
+    habits_* e tasks_* seguem o contrato de build_*_progress:
+    (0, 0) significa "sem dados" e vira placeholder dim.
+    """
 
+    routine_name: str | None = None
+    habits_done: int = 0
+    habits_expected: int = 0
+    tasks_completed: int = 0
+    tasks_total: int = 0
+    next_name: str | None = None
+    next_minutes: int | None = None
 
-def compute_weekly_habits_progress(
-    routine: Routine | None,
-    today: date,
-) -> tuple[int, int]:
-    """Calcula progresso semanal de hábitos (BR-TUI-035 regras 1-5).
+
+def compute_header_metrics(now: datetime) -> HeaderMetrics:
+    """Calcula todas as métricas do header numa única sessão.
 
     Args:
-        routine: rotina ativa ou None.
-        today: data de referência.
+        now: momento atual (data de referência = now.date()).
 
     Returns:
-        (done_count, total_expected). (0, 0) se sem rotina.
+        HeaderMetrics; vazio em caso de erro.
     """
-    if routine is None:
-        return 0, 0
-
     try:
-        monday = today - timedelta(days=today.weekday())
-        days_elapsed = (today - monday).days + 1
-
-        habits_result, error = service_action(
-            lambda s: HabitService(s).list_habits(routine_id=routine.id),
-        )
-        if error or not habits_result:
-            return 0, 0
-
-        total_expected = len(habits_result) * days_elapsed
-
-        svc = HabitInstanceService()
-        instances = svc.list_instances(date_start=monday, date_end=today)
-        done_count = sum(1 for i in instances if i.status == Status.DONE)
-
-        return done_count, total_expected
+        result, error = service_action(lambda s: _read_header_metrics(s, now))
+        if error or result is None:
+            return HeaderMetrics()
+        return result
     except Exception:
-        logger.debug("Exceção em compute_weekly_habits_progress", exc_info=True)
-        return 0, 0
-
+        logger.debug("Exceção em compute_header_metrics", exc_info=True)
+        return HeaderMetrics()
 
-def compute_daily_tasks_progress(today: date) -> tuple[int, int]:
-    """Calcula progresso de tarefas do dia (BR-TUI-035 regras 6-10).
 
-    Args:
-        today: data de referência.
+def _read_header_metrics(s: Session, now: datetime) -> HeaderMetrics:
+    """Monta HeaderMetrics com uma query por seção."""
+    today = now.date()
+    routine = RoutineService(s).get_active_routine()
+    routine_id = routine.id if routine else None
+
+    habits_done, habits_expected = _weekly_habits_progress(s, routine_id, today)
+    tasks_completed, tasks_total = _daily_tasks_progress(s, today)
+    next_name, next_minutes = _pick_closest(
+        _next_habit(s, routine_id, now),
+        _next_task(s, now),
+        now,
+    )
+
+    return HeaderMetrics(
+        routine_name=routine.name if routine else None,
+        habits_done=habits_done,
+        habits_expected=habits_expected,
+        tasks_completed=tasks_completed,
+        tasks_total=tasks_total,
+        next_name=next_name,
+        next_minutes=next_minutes,
+    )
+
+
+def _weekly_habits_progress(s: Session, routine_id: int | None, today: date) -> tuple[int, int]:
+    """Progresso semanal de hábitos da rotina (BR-TUI-035 regras 1-5).
 
     Returns:
-        (completed_today, total_today). (0, 0) se sem tarefas.
+        (done_count, total_expected). (0, 0) se sem rotina.
     """
-    try:
-        all_tasks, error = service_action(
-            lambda s: TaskService.list_tasks(session=s),
-        )
-        if error or not all_tasks:
-            return 0, 0
-
-        today_start = datetime.combine(today, time.min)
-        today_end = datetime.combine(today, time.max)
-
-        relevant = [
-            t
-            for t in all_tasks
-            if (
-                t.completed_datetime is not None
-                and today_start <= t.completed_datetime <= today_end
-            )
-            or (
-                t.completed_datetime is None
-                and t.cancelled_datetime is None
-                and t.scheduled_datetime <= today_end
-            )
-        ]
-
-        completed = sum(
-            1
-            for t in relevant
-            if t.completed_datetime is not None and today_start <= t.completed_datetime <= today_end
-        )
+    if routine_id is None:
+        return 0, 0
 
-        return completed, len(relevant)
-    except Exception:
-        logger.debug("Exceção em compute_daily_tasks_progress", exc_info=True)
+    monday = today - timedelta(days=today.weekday())
+    days_elapsed = (today - monday).days + 1
+
+    habit_count = s.exec(
+        select(func.count(col(Habit.id))).where(Habit.routine_id == routine_id)
+    ).one()
+    if not habit_count:
         return 0, 0
 
+    done_count = s.exec(
+        select(func.count(col(HabitInstance.id)))
+        .join(Habit)
+        .where(
+            Habit.routine_id == routine_id,
+            HabitInstance.date >= monday,
+            HabitInstance.date <= today,
+            HabitInstance.status == Status.DONE,
+        )
+    ).one()
 
-def find_next_pending_item(
-    routine: Routine | None,
-    now: datetime,
-) -> tuple[str | None, int | None]:
-    """Identifica próximo item pendente hoje (BR-TUI-035 regras 11-17).
+    return done_count, habit_count * days_elapsed
 
-    Compara próximo hábito vs próxima tarefa. Hábito tem prioridade
-    em caso de empate (regra 15).
 
-    Args:
-        routine: rotina ativa ou None.
-        now: momento atual.
+def _daily_tasks_progress(s: Session, today: date) -> tuple[int, int]:
+    """Progresso de tarefas do dia (BR-TUI-035 regras 6-10).
+
+    Relevantes: concluídas hoje + pendentes agendadas até o fim do dia.
 
     Returns:
-        (name, minutes_until) ou (None, None) se sem próximo.
+        (completed_today, total_today). (0, 0) se sem tarefas.
     """
-    today = now.date()
+    today_start = datetime.combine(today, time.min)
     today_end = datetime.combine(today, time.max)
 
-    next_habit = _find_next_habit(routine, today, now)
-    next_task = _find_next_task(today_end, now)
+    completed_today = col(Task.completed_datetime).between(today_start, today_end)
+    pending_due = and_(
+        col(Task.completed_datetime).is_(None),
+        col(Task.cancelled_datetime).is_(None),
+        col(Task.scheduled_datetime) <= today_end,
+    )
 
-    return _pick_closest(next_habit, next_task, now)
+    total, completed = s.exec(
+        select(
+            func.count(col(Task.id)),
+            func.coalesce(func.sum(case((completed_today, 1), else_=0)), 0),
+        ).where(or_(completed_today, pending_due))
+    ).one()
 
+    return completed, total
 
-def _find_next_habit(
-    routine: Routine | None,
-    today: date,
-    now: datetime,
+
+def _next_habit(
+    s: Session, routine_id: int | None, now: datetime
 ) -> tuple[str | None, datetime | None]:
-    """Retorna (nome, datetime) do próximo hábito pendente ou (None, None)."""
-    if routine is None:
+    """Retorna (nome, datetime) do próximo hábito pendente hoje ou (None, None)."""
+    if routine_id is None:
         return None, None
 
-    try:
-        svc = HabitInstanceService()
-        instances = svc.list_instances(date_start=today, date_end=today)
-
-        best_name: str | None = None
-        best_dt: datetime | None = None
-
-        for inst in instances:
-            if inst.status != Status.PENDING:
-                continue
-            inst_dt = datetime.combine(today, inst.scheduled_start)
-            if inst_dt <= now:
-                continue
-            if best_dt is None or inst_dt < best_dt:
-                best_dt = inst_dt
-                habit = inst.habit
-                best_name = habit.title if habit else str(inst.habit_id)
-
-        return best_name, best_dt
-    except Exception:
-        logger.debug("Exceção em _find_next_habit", exc_info=True)
+    row = s.exec(
+        select(col(Habit.title), col(HabitInstance.scheduled_start))
+        .join(Habit)
+        .where(
+            Habit.routine_id == routine_id,
+            HabitInstance.date == now.date(),
+            HabitInstance.status == Status.PENDING,
+            HabitInstance.scheduled_start > now.time(),
+        )
+        .order_by(col(HabitInstance.scheduled_start))
+        .limit(1)
+    ).first()
+    if row is None:
         return None, None
-
-
-def _find_next_task(
-    today_end: datetime,
-    now: datetime,
-) -> tuple[str | None, datetime | None]:
-    """Retorna (título, datetime) da próxima tarefa pendente ou (None, None)."""
-    try:
-        tasks, error = service_action(
-            lambda s: TaskService.list_pending_tasks(session=s),
+    title, start = row
+    return title, datetime.combine(now.date(), start)
+
+
+def _next_task(s: Session, now: datetime) -> tuple[str | None, datetime | None]:
+    """Retorna (título, datetime) da próxima tarefa pendente hoje ou (None, None)."""
+    today_end = datetime.combine(now.date(), time.max)
+    row = s.exec(
+        select(Task.title, Task.scheduled_datetime)
+        .where(
+            col(Task.completed_datetime).is_(None),
+            col(Task.cancelled_datetime).is_(None),
+            Task.scheduled_datetime > now,
+            col(Task.scheduled_datetime) <= today_end,
         )
-        if error or not tasks:
-            return None, None
-
-        best_name: str | None = None
-        best_dt: datetime | None = None
-
-        for t in tasks:
-            if now < t.scheduled_datetime <= today_end:
-                if best_dt is None or t.scheduled_datetime < best_dt:
-                    best_dt = t.scheduled_datetime
-                    best_name = t.title
-
-        return best_name, best_dt
-    except Exception:
-        logger.debug("Exceção em _find_next_task", exc_info=True)
+        .order_by(col(Task.scheduled_datetime))
+        .limit(1)
+    ).first()
+    if row is None:
         return None, None
+    return row[0], row[1]
 
 
 def _pick_closest(
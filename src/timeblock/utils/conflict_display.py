@@ -1,5 +1,7 @@
 """Utilitários para exibir conflitos de eventos."""
 
+from datetime import date
+
 from rich.console import Console
 from rich.table import Table
 
@@ -20,6 +22,44 @@ def display_conflicts(conflicts: list[Conflict], console: Console) -> None:
 
     console.print(f"\n[yellow]⚠ {len(conflicts)} conflito(s) detectado(s)[/yellow]\n")
 
+    console.print(_build_table(conflicts))
+    _print_hint(console)
+
+
+def display_conflicts_by_day(
+    conflicts_by_day: dict[date, list[Conflict]], console: Console
+) -> None:
+    """
+    Exibe conflitos de um período, uma tabela por dia.
+
+    Args:
+        conflicts_by_day: Conflitos agrupados por data (dias sem conflito omitidos)
+        console: Console do Rich para output
+    """
+    if not conflicts_by_day:
+        console.print("[green]✓ Nenhum conflito detectado no período[/green]")
+        return
+
+    total = sum(len(conflicts) for conflicts in conflicts_by_day.values())
+    console.print(f"\n[yellow]⚠ {total} conflito(s) em {len(conflicts_by_day)} dia(s)[/yellow]")
+
+    for day, conflicts in conflicts_by_day.items():
+        console.print(f"\n[bold]{day.isoformat()}[/bold] — {len(conflicts)} conflito(s)")
+        console.print(_build_table(conflicts))
+
+    _print_hint(console)
+
+
+def _print_hint(console: Console) -> None:
+    """Exibe dica de comandos para ajustar eventos."""
+    console.print(
+        "\n[dim]Use comandos específicos (habit adjust, task update) "
+        "para ajustar eventos conforme necessário[/dim]\n"
+    )
+
+
+def _build_table(conflicts: list[Conflict]) -> Table:
+    """Monta tabela Rich com os pares em conflito."""
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("Evento 1", style="cyan")
     table.add_column("Horário", style="cyan")
@@ -51,8 +91,4 @@ def display_conflicts(conflicts: list[Conflict], console: Console) -> None:
             f"{overlap_minutes} min",
         )
 
-    console.print(table)
-    console.print(
-        "\n[dim]Use comandos específicos (habit adjust, task update) "
-        "para ajustar eventos conforme necessário[/dim]\n"
-    )
+    return table
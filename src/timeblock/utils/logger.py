@@ -3,6 +3,13 @@
 Formato dual: texto legível no console (stderr), JSON Lines no arquivo.
 Caminhos seguem XDG Base Directory Specification.
 
+O arquivo não é escrito na thread que loga: o handler do logger só
+enfileira o registro (mensagem já interpolada) e uma thread de fundo
+serializa o JSON, escreve em lotes e faz um flush por lote. Assim a
+I/O de log nunca entra na latência de uma tecla na TUI. Mensagens
+devem usar formatação lazy com %s (`logger.info("id=%s", x)`), nunca
+f-strings: com o nível desabilitado, nada é formatado (regra G do ruff).
+
 Uso:
     # No entrypoint (uma vez):
     from timeblock.utils.logger import configure_logging
@@ -23,10 +30,13 @@ Referências:
     - XDG Base Directory Specification (freedesktop.org)
 """
 
+import copy
 import logging
 import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import QueueHandler, RotatingFileHandler
 from pathlib import Path
 
 from pythonjsonlogger.json import JsonFormatter  # type: ignore[import-not-found]
@@ -40,6 +50,110 @@ _CONSOLE_DATE_FORMAT = "%H:%M:%S"
 # Campos incluídos no JSON Lines (arquivo)
 _JSON_FORMAT = "%(asctime)s %(name)s %(levelname)s %(message)s"
 
+# Registros escritos por lote antes de um flush do arquivo
+LOG_BATCH_SIZE = 256
+
+_STOP = object()
+
+
+class _BatchedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler que só faz flush quando o lote termina."""
+
+    def flush(self) -> None:
+        """No-op: o flush fica para flush_batch()."""
+
+    def flush_batch(self) -> None:
+        """Descarrega o buffer do stream no arquivo."""
+        super().flush()
+
+
+class _LogWriter:
+    """Thread de fundo que drena a fila para o handler de arquivo.
+
+    Bloqueia até o primeiro registro, pega o que mais houver na fila
+    (até LOG_BATCH_SIZE) e faz um único flush por lote.
+    """
+
+    def __init__(self, log_queue: queue.Queue, handler: _BatchedRotatingFileHandler) -> None:
+        self.queue: queue.Queue = log_queue
+        self.handler = handler
+        self._thread = threading.Thread(target=self._run, name="timeblock-log-writer", daemon=True)
+
+    def start(self) -> None:
+        """Inicia a thread de escrita."""
+        self._thread.start()
+
+    def is_alive(self) -> bool:
+        """True enquanto a thread drena a fila (até stop())."""
+        return self._thread.is_alive()
+
+    def stop(self) -> None:
+        """Escreve o que está na fila, encerra a thread e fecha o arquivo."""
+        if self.is_alive():
+            self.queue.put(_STOP)
+            self._thread.join()
+        self.handler.close()
+
+    def _run(self) -> None:
+        """Loop da thread: lote -> handle por registro -> um flush -> task_done.
+
+        task_done só é chamado após o flush, então queue.join() volta
+        com tudo já no arquivo. Termina ao encontrar _STOP.
+        """
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < LOG_BATCH_SIZE:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = False
+            for record in batch:
+                if record is _STOP:
+                    stop = True
+                else:
+                    self.handler.handle(record)
+            self.handler.flush_batch()
+            for _ in batch:
+                self.queue.task_done()
+            if stop:
+                return
+
+
+class _AsyncFileHandler(QueueHandler):
+    """Handler do logger: enfileira o registro e retorna.
+
+    A mensagem e o traceback são resolvidos aqui, na thread que loga,
+    porque os argumentos podem mudar (ou não ser thread-safe) depois
+    da chamada. Serializar o JSON e escrever fica para o _LogWriter.
+    """
+
+    def __init__(self, file_handler: _BatchedRotatingFileHandler) -> None:
+        log_queue: queue.Queue = queue.Queue()
+        super().__init__(log_queue)
+        self.writer = _LogWriter(log_queue, file_handler)
+        self.writer.start()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Cópia do registro com mensagem interpolada e traceback em texto."""
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+    def flush(self) -> None:
+        """Espera a thread de fundo escrever tudo o que foi enfileirado."""
+        if self.writer.is_alive():
+            self.writer.queue.join()
+
+    def close(self) -> None:
+        """Drena a fila, encerra a thread de fundo e fecha o arquivo."""
+        self.writer.stop()
+        super().close()
+
 
 def _get_log_dir() -> Path:
     """Retorna diretório de logs seguindo XDG Base Directory.
@@ -82,7 +196,7 @@ def configure_logging(
     Args:
         level: nível mínimo (env ATOMVS_LOG_LEVEL ou "INFO")
         console: habilita handler stderr (default: True para CLI, False para TUI)
-        log_file: habilita handler JSON Lines em arquivo
+        log_file: habilita handler JSON Lines em arquivo (escrito em thread de fundo)
         max_bytes: tamanho máximo antes de rotação (10MB)
         backup_count: backups mantidos na rotação (5)
     """
@@ -120,15 +234,16 @@ def configure_logging(
         file_path = _get_log_file()
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        file_handler = RotatingFileHandler(
+        file_handler = _BatchedRotatingFileHandler(
             filename=file_path,
             maxBytes=max_bytes,
             backupCount=backup_count,
             encoding="utf-8",
         )
-        file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(JsonFormatter(fmt=_JSON_FORMAT, json_ensure_ascii=False))
-        root.addHandler(file_handler)
+        async_handler = _AsyncFileHandler(file_handler)
+        async_handler.setLevel(logging.DEBUG)
+        root.addHandler(async_handler)
 
     root.propagate = False
 
@@ -171,4 +286,6 @@ def _reset_for_testing() -> None:
     global _configured
     _configured = False
     root = logging.getLogger("timeblock")
+    for handler in root.handlers:
+        handler.close()
     root.handlers.clear()
@@ -7,6 +7,7 @@ from pytest_bdd import given, parsers, scenarios, then, when
 from sqlmodel import Session
 
 from timeblock.models import Habit, HabitInstance, Recurrence, Routine
+from timeblock.models.enums import TimerStatus
 from timeblock.models.time_log import TimeLog
 from timeblock.services.timer_service import TimerService
 
@@ -78,6 +79,7 @@ def create_timelogs(session: Session, context):
             start_time=start,
             end_time=end,
             duration_seconds=3600,
+            status=TimerStatus.DONE,
         )
         session.add(timelog)
         timelogs.append(timelog)
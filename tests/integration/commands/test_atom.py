@@ -5,13 +5,16 @@ BRs validadas:
 - BR-HABITINSTANCE-006: Listagem de Instâncias
 """
 
+from datetime import date, time, timedelta
 from pathlib import Path
 
 import pytest
-from sqlmodel import SQLModel, create_engine
+from sqlmodel import Session, SQLModel, create_engine
 from typer.testing import CliRunner
 
 from timeblock.commands.habit.atom import _validate_log_mode, atom_app
+from timeblock.models import Habit, Recurrence, Routine
+from timeblock.services.habit_instance_service import HabitInstanceService
 
 runner = CliRunner()
 
@@ -103,6 +106,55 @@ class TestBRHabitInstance006Listagem:
         assert result.exit_code == 1
 
 
+class TestBRHabitInstance006Paginacao:
+    """BR-HABITINSTANCE-006: Listagem paginada (--limit/--after)."""
+
+    @staticmethod
+    def _seed(db_path: Path, days: int) -> int:
+        engine = create_engine(f"sqlite:///{db_path}")
+        with Session(engine) as session:
+            routine = Routine(name="Rotina")
+            session.add(routine)
+            session.commit()
+            habit = Habit(
+                routine_id=routine.id,
+                title="Leitura",
+                scheduled_start=time(8, 0),
+                scheduled_end=time(9, 0),
+                recurrence=Recurrence.EVERYDAY,
+            )
+            session.add(habit)
+            session.commit()
+            assert habit.id is not None
+            HabitInstanceService.generate_instances(
+                habit.id, date(2026, 3, 2), date(2026, 3, 1) + timedelta(days=days), session
+            )
+            habit_id = habit.id
+        engine.dispose()
+        return habit_id
+
+    def test_br_habitinstance_006_limit_and_after(self, isolated_db):
+        """BR-HABITINSTANCE-006: Primeira página indica --after; a seguinte continua."""
+        habit_id = self._seed(isolated_db, 5)
+
+        first = runner.invoke(atom_app, ["list", str(habit_id), "--limit", "3"])
+        assert first.exit_code == 0
+        assert "02/03" in first.output and "04/03" in first.output
+        assert "05/03" not in first.output
+        assert "--after 3" in first.output
+
+        second = runner.invoke(atom_app, ["list", str(habit_id), "-n", "3", "--after", "3"])
+        assert second.exit_code == 0
+        assert "05/03" in second.output and "06/03" in second.output
+        assert "04/03" not in second.output
+        assert "--after" not in second.output
+
+    def test_br_habitinstance_006_invalid_limit(self, isolated_db):
+        """BR-HABITINSTANCE-006: --limit menor que 1 é rejeitado."""
+        result = runner.invoke(atom_app, ["list", "--limit", "0"])
+        assert result.exit_code == 1
+
+
 class TestBRTimer007LogManual:
     """Testes para BR-TIMER-007: Log Manual via CLI."""
 
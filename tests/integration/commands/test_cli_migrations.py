@@ -0,0 +1,132 @@
+"""Testes de integração: CLI aplica migrações pendentes.
+
+Bancos criados por uma versão anterior não têm os índices das
+migrações 004, 006 e 007. A CLI não passa pelo startup da TUI, então
+as migrações são aplicadas na criação da engine.
+
+Referências:
+    - BR-HABIT-003: Geração de instâncias idempotente
+    - ADR-026: Test Database Isolation Strategy
+"""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session, SQLModel, create_engine
+from typer.testing import CliRunner
+
+from timeblock.database.migrations import migration_004_habitinstance_unique_date as m004
+from timeblock.database.migrations import migration_006_task_partial_indexes as m006
+from timeblock.database.migrations import migration_007_time_log_single_active as m007
+from timeblock.main import app
+from timeblock.models import Routine
+
+MIGRATION_INDEXES = {m004.INDEX_NAME, m007.INDEX_NAME, *m006.INDEXES}
+
+
+@pytest.fixture
+def legacy_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Banco pré-migrações: schema base, rotina ativa, sem índices novos."""
+    db_path = tmp_path / "legacy.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        for name in MIGRATION_INDEXES:
+            session.connection().execute(text(f"DROP INDEX {name}"))
+        session.add(Routine(name="Rotina", is_active=True))
+        session.commit()
+    engine.dispose()
+    monkeypatch.setenv("TIMEBLOCK_DB_PATH", str(db_path))
+    return db_path
+
+
+def _indexes(db_path: Path) -> set[str]:
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'").fetchall()
+    return {name for (name,) in rows}
+
+
+class TestBRCLIMigrations:
+    """Integration: comandos CLI em banco criado antes das migrações."""
+
+    def test_habit_create_generates_on_legacy_db(self, legacy_db: Path) -> None:
+        """`habit create --generate` não falha por falta do índice único."""
+        result = CliRunner().invoke(
+            app,
+            [
+                "habit",
+                "create",
+                "--title",
+                "Leitura",
+                "--start",
+                "08:00",
+                "--end",
+                "09:00",
+                "--repeat",
+                "EVERYDAY",
+                "--routine",
+                "1",
+                "--generate",
+                "1",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        with sqlite3.connect(legacy_db) as conn:
+            (count,) = conn.execute("SELECT count(*) FROM habitinstance").fetchone()
+        assert count > 0
+
+    def test_any_command_applies_migration_indexes(self, legacy_db: Path) -> None:
+        """Primeiro comando que abre o banco cria os índices das migrações."""
+        assert not MIGRATION_INDEXES & _indexes(legacy_db)
+
+        result = CliRunner().invoke(app, ["task", "list"])
+
+        assert result.exit_code == 0, result.output
+        assert MIGRATION_INDEXES <= _indexes(legacy_db)
+
+    def test_uninitialized_db_is_left_alone(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Sem schema base (antes do init), nenhuma migração é registrada."""
+        db_path = tmp_path / "empty.db"
+        monkeypatch.setenv("TIMEBLOCK_DB_PATH", str(db_path))
+
+        CliRunner().invoke(app, ["task", "list"])
+
+        with sqlite3.connect(db_path) as conn:
+            tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master")}
+        assert "schema_migrations" not in tables
+
+    def test_cli_db_rejects_second_active_timer(self, legacy_db: Path) -> None:
+        """Após um comando CLI, o banco garante BR-TIMER-001 (migração 007)."""
+        CliRunner().invoke(app, ["task", "list"])
+
+        with sqlite3.connect(legacy_db) as conn:
+            insert = "INSERT INTO time_log (status, start_time) VALUES (?, '2025-01-01 09:00')"
+            conn.execute(insert, ("RUNNING",))
+            with pytest.raises(sqlite3.IntegrityError):
+                conn.execute(insert, ("PAUSED",))
+
+    def test_cli_db_task_queries_use_partial_indexes(self, legacy_db: Path) -> None:
+        """Após um comando CLI, as consultas de tasks usam os índices da migração 006."""
+        CliRunner().invoke(app, ["task", "list"])
+
+        queries = {
+            "ix_tasks_pending_scheduled": (
+                "SELECT * FROM tasks WHERE completed_datetime IS NULL "
+                "AND cancelled_datetime IS NULL ORDER BY scheduled_datetime"
+            ),
+            "ix_tasks_completed_datetime": (
+                "SELECT * FROM tasks WHERE completed_datetime >= '2025-01-01'"
+            ),
+            "ix_tasks_cancelled_datetime": (
+                "SELECT * FROM tasks WHERE cancelled_datetime >= '2025-01-01'"
+            ),
+        }
+        with sqlite3.connect(legacy_db) as conn:
+            for index, query in queries.items():
+                plan = " ".join(r[-1] for r in conn.execute(f"EXPLAIN QUERY PLAN {query}"))
+                assert index in plan
@@ -0,0 +1,80 @@
+"""Testes de integração para o comando metrics.
+
+Referências:
+    - BR-TUI-033: MetricsPanel (streak, completude)
+"""
+
+from datetime import date, time, timedelta
+from pathlib import Path
+
+from sqlmodel import Session, create_engine
+from typer.testing import CliRunner
+
+from timeblock.main import app
+from timeblock.models import Habit, HabitInstance, Recurrence, Routine
+from timeblock.models.enums import Status
+
+
+def _seed(db_path: Path) -> None:
+    """Rotina ativa com 10 dias DONE seguidos de um dia PENDING (hoje)."""
+    engine = create_engine(f"sqlite:///{db_path}")
+    with Session(engine) as session:
+        routine = Routine(name="Manhã", is_active=True)
+        session.add(routine)
+        session.commit()
+        habit = Habit(
+            routine_id=routine.id,
+            title="Leitura",
+            scheduled_start=time(8, 0),
+            scheduled_end=time(9, 0),
+            recurrence=Recurrence.EVERYDAY,
+        )
+        session.add(habit)
+        session.commit()
+        today = date.today()
+        for offset in range(11):
+            session.add(
+                HabitInstance(
+                    habit_id=habit.id,
+                    date=today - timedelta(days=offset),
+                    scheduled_start=time(8, 0),
+                    scheduled_end=time(9, 0),
+                    status=Status.PENDING if offset == 0 else Status.DONE,
+                )
+            )
+        session.commit()
+    engine.dispose()
+
+
+class TestMetricsCommand:
+    """Comando timeblock metrics."""
+
+    def test_metrics_shows_windows_and_streaks(
+        self, cli_runner: CliRunner, isolated_db: Path
+    ) -> None:
+        """Mostra completude por janela e melhor streak."""
+        _seed(isolated_db)
+
+        result = cli_runner.invoke(app, ["metrics", "-w", "7", "-w", "90", "--history"])
+
+        assert result.exit_code == 0, result.output
+        assert "Manhã" in result.output
+        assert "7d" in result.output
+        assert "90d" in result.output
+        assert "85%" in result.output  # 6 DONE + 1 PENDING nos últimos 7 dias
+        assert "Streak atual: 0" in result.output
+        assert "Melhor streak: 10" in result.output
+        assert "(10 dias)" in result.output
+
+    def test_metrics_without_routine(self, cli_runner: CliRunner, isolated_db: Path) -> None:
+        """Sem rotina ativa retorna erro."""
+        result = cli_runner.invoke(app, ["metrics"])
+
+        assert result.exit_code == 1
+        assert "Rotina não encontrada" in result.output
+
+    def test_metrics_rejects_invalid_window(self, cli_runner: CliRunner, isolated_db: Path) -> None:
+        """Janela menor que 1 é rejeitada."""
+        result = cli_runner.invoke(app, ["metrics", "--window", "0"])
+
+        assert result.exit_code == 1
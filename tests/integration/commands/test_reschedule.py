@@ -66,3 +66,60 @@ class TestBRReorder001DeteccaoConflitos:
         result = runner.invoke(main_app, ["reschedule", "conflicts", "--date", "2030-01-01"])
         assert result.exit_code == 0
         # Sem conflitos para data futura vazia
+
+
+class TestRescheduleConflictsRange:
+    """Testes para reschedule conflicts --from/--to."""
+
+    def test_range_empty_period(self, isolated_db):
+        """Período sem eventos informa ausência de conflitos."""
+        result = runner.invoke(
+            main_app,
+            ["reschedule", "conflicts", "--from", "2030-01-01", "--to", "2030-01-31"],
+        )
+        assert result.exit_code == 0
+        assert "Nenhum conflito" in result.output
+
+    def test_range_reports_days_with_conflicts(self, isolated_db):
+        """Conflitos são listados por dia."""
+        from datetime import datetime
+
+        from sqlmodel import Session
+
+        from timeblock.models import Task
+
+        engine = create_engine(f"sqlite:///{isolated_db}")
+        with Session(engine) as session:
+            for day in (3, 9):
+                for minute in (0, 30):
+                    start = datetime(2030, 1, day, 10, minute)
+                    session.add(
+                        Task(title="T", scheduled_datetime=start, original_scheduled_datetime=start)
+                    )
+            session.commit()
+        engine.dispose()
+
+        result = runner.invoke(
+            main_app,
+            ["reschedule", "conflicts", "--from", "2030-01-01", "--to", "2030-01-31"],
+        )
+        assert result.exit_code == 0
+        assert "2030-01-03" in result.output
+        assert "2030-01-09" in result.output
+        assert "2 conflito(s) em 2 dia(s)" in result.output
+
+    def test_range_inverted_dates(self, isolated_db):
+        """--from posterior a --to retorna erro."""
+        result = runner.invoke(
+            main_app,
+            ["reschedule", "conflicts", "--from", "2030-01-31", "--to", "2030-01-01"],
+        )
+        assert result.exit_code == 1
+
+    def test_range_invalid_format(self, isolated_db):
+        """Data inválida em --from retorna erro."""
+        result = runner.invoke(
+            main_app, ["reschedule", "conflicts", "--from", "x", "--to", "2030-01-01"]
+        )
+        assert result.exit_code == 1
+        assert "inválido" in result.output.lower()
@@ -15,6 +15,7 @@ import pytest
 from typer.testing import CliRunner
 
 from timeblock.main import app
+from timeblock.services.task_service import TaskService
 
 
 @pytest.fixture
@@ -149,6 +150,8 @@ class TestBRTaskListing:
     - BR-TASK-CMD-LIST-002: Múltiplas tasks
     - BR-TASK-CMD-LIST-003: Filtro de pendentes
     - BR-TASK-CMD-LIST-004: Range de datas
+    - BR-TASK-CMD-LIST-005: Paginação
+    - BR-TASK-CMD-LIST-006: Filtros de status
     """
 
     def test_br_task_cmd_list_001_empty(self, runner: CliRunner, isolated_db: None) -> None:
@@ -234,6 +237,61 @@ class TestBRTaskListing:
         # ASSERT
         assert result.exit_code == 0
 
+    def test_br_task_cmd_list_005_pagination(self, runner: CliRunner, isolated_db: None) -> None:
+        """
+        Integration: --limit pagina e --after continua da última task.
+
+        DADO: Três tasks em horários distintos
+        QUANDO: Usuário lista com --limit 2 e depois --after
+        ENTÃO: Cada página traz as tasks seguintes, sem repetir
+
+        Referências:
+            - BR-TASK-CMD-LIST-005: Paginação
+        """
+        # ARRANGE
+        base = datetime.now() + timedelta(days=1)
+        for i in range(3):
+            dt = (base + timedelta(hours=i)).strftime("%Y-%m-%d %H:%M")
+            runner.invoke(app, ["task", "create", "-t", f"Paged {i}", "-D", dt])
+        # ACT
+        first = runner.invoke(app, ["task", "list", "--limit", "2"])
+        second = runner.invoke(app, ["task", "list", "--limit", "2", "--after", "2"])
+        # ASSERT
+        assert first.exit_code == 0
+        assert "Paged 0" in first.stdout and "Paged 1" in first.stdout
+        assert "Paged 2" not in first.stdout
+        assert "--after 2" in first.stdout
+        assert second.exit_code == 0
+        assert "Paged 2" in second.stdout
+        assert "Paged 1" not in second.stdout
+
+    def test_br_task_cmd_list_006_status_filters(
+        self, runner: CliRunner, isolated_db: None
+    ) -> None:
+        """
+        Integration: --cancelled lista apenas canceladas; filtros são exclusivos.
+
+        DADO: Uma task pendente e uma cancelada
+        QUANDO: Usuário lista com --cancelled
+        ENTÃO: Apenas a cancelada aparece
+
+        Referências:
+            - BR-TASK-CMD-LIST-006: Filtros de status
+        """
+        # ARRANGE
+        dt = (datetime.now() + timedelta(hours=1)).strftime("%Y-%m-%d %H:%M")
+        runner.invoke(app, ["task", "create", "-t", "Keep", "-D", dt])
+        runner.invoke(app, ["task", "create", "-t", "Drop", "-D", dt])
+        TaskService.cancel_task(2)
+        # ACT
+        result = runner.invoke(app, ["task", "list", "--cancelled"])
+        both = runner.invoke(app, ["task", "list", "--pending", "--cancelled"])
+        # ASSERT
+        assert result.exit_code == 0
+        assert "Drop" in result.stdout
+        assert "Keep" not in result.stdout
+        assert both.exit_code == 1
+
 
 class TestBRTaskCheck:
     """
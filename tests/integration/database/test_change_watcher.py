@@ -0,0 +1,109 @@
+"""Integration tests para DataVersionWatcher (BR-TUI-009).
+
+Commits de outra conexão ou de outro processo (CLI) mudam
+`PRAGMA data_version`; leituras e escritas da própria conexão não.
+"""
+
+import sqlite3
+import subprocess
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from timeblock.database.change_watcher import DataVersionWatcher
+from timeblock.database.engine import dispose_engines
+
+
+@pytest.fixture
+def db_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Banco em arquivo em WAL com uma tabela."""
+    path = tmp_path / "watch.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE log (n INTEGER)")
+    monkeypatch.setenv("TIMEBLOCK_DB_PATH", str(path))
+    dispose_engines()
+    yield path
+    dispose_engines()
+
+
+def _insert(db_path: Path, n: int = 1) -> None:
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("INSERT INTO log (n) VALUES (?)", (n,))
+
+
+class TestBRTUI009ChangeWatcher:
+    """Integration: detecção de commits externos via data_version."""
+
+    def test_br_tui_009_unchanged_database(self, db_path: Path) -> None:
+        """Sem commits externos, changed() é False."""
+        watcher = DataVersionWatcher(db_path)
+
+        assert watcher.changed() is False
+        assert watcher.changed() is False
+        watcher.close()
+
+    def test_br_tui_009_commit_from_other_connection(self, db_path: Path) -> None:
+        """Commit de outra conexão é reportado uma única vez."""
+        watcher = DataVersionWatcher(db_path)
+
+        _insert(db_path)
+
+        assert watcher.changed() is True
+        assert watcher.changed() is False
+        watcher.close()
+
+    def test_br_tui_009_commit_from_other_process(self, db_path: Path) -> None:
+        """Commit de outro processo (padrão da CLI) é detectado."""
+        watcher = DataVersionWatcher(db_path)
+        script = (
+            "import sqlite3, sys\n"
+            "with sqlite3.connect(sys.argv[1]) as conn:\n"
+            "    conn.execute('INSERT INTO log (n) VALUES (2)')\n"
+        )
+
+        subprocess.run([sys.executable, "-c", script, str(db_path)], check=True)
+
+        assert watcher.changed() is True
+        watcher.close()
+
+    def test_br_tui_009_mark_seen_absorbs_commits(self, db_path: Path) -> None:
+        """mark_seen() absorve commits anteriores; os seguintes são reportados."""
+        watcher = DataVersionWatcher(db_path)
+
+        _insert(db_path)
+        watcher.mark_seen()
+        assert watcher.changed() is False
+
+        _insert(db_path, 2)
+        assert watcher.changed() is True
+        watcher.close()
+
+    def test_br_tui_009_open_uses_configured_path(self, db_path: Path) -> None:
+        """open() observa o banco de TIMEBLOCK_DB_PATH."""
+        watcher = DataVersionWatcher.open()
+
+        assert watcher is not None
+        assert watcher.db_path == db_path
+        watcher.close()
+
+    def test_br_tui_009_open_without_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """':memory:' ou arquivo inexistente: sem watcher."""
+        monkeypatch.setenv("TIMEBLOCK_DB_PATH", ":memory:")
+        assert DataVersionWatcher.open() is None
+
+        monkeypatch.setenv("TIMEBLOCK_DB_PATH", str(tmp_path / "nao-existe.db"))
+        assert DataVersionWatcher.open() is None
+
+    def test_br_tui_009_closed_watcher(self, db_path: Path) -> None:
+        """Após close(), changed() é False e close() é idempotente."""
+        watcher = DataVersionWatcher(db_path)
+        watcher.close()
+        _insert(db_path)
+
+        assert watcher.changed() is False
+        watcher.close()
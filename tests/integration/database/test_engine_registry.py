@@ -0,0 +1,82 @@
+"""Integration tests para o registro de engines por processo.
+
+Valida que get_engine()/get_engine_context() reutilizam a mesma engine
+para o mesmo caminho, que a troca de TIMEBLOCK_DB_PATH invalida o cache
+e que o hook de shutdown fecha os pools.
+
+Referências:
+    - ADR-026: Database path via engine.get_db_path() (SSOT)
+    - ADR-040: Unified database path
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
+
+from timeblock.database.engine import (
+    _engines,
+    dispose_engines,
+    get_engine,
+    get_engine_context,
+    invalidate_engine,
+)
+
+
+@pytest.fixture
+def db_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Banco em arquivo temporário com registro limpo."""
+    path = tmp_path / "registry.db"
+    monkeypatch.setenv("TIMEBLOCK_DB_PATH", str(path))
+    dispose_engines()
+    yield path
+    dispose_engines()
+
+
+class TestBRDbEngineRegistry:
+    """Integration: engine cacheada por caminho (BR-DB-ENGINE-*)."""
+
+    def test_br_db_engine_001_same_path_reuses_engine(self, db_path: Path) -> None:
+        """Chamadas repetidas retornam a mesma engine."""
+        with get_engine_context() as first, get_engine_context() as second:
+            assert first is second
+        assert get_engine() is first
+
+    def test_br_db_engine_002_uses_queue_pool(self, db_path: Path) -> None:
+        """Bancos em arquivo usam QueuePool."""
+        assert isinstance(get_engine().pool, QueuePool)
+
+    def test_br_db_engine_003_foreign_keys_enabled(self, db_path: Path) -> None:
+        """Listener de PRAGMA continua ativo nas conexões do pool."""
+        with get_engine().connect() as conn:
+            assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+
+    def test_br_db_engine_004_env_change_invalidates(
+        self, db_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Troca de TIMEBLOCK_DB_PATH cria nova engine e descarta a anterior."""
+        old = get_engine()
+        monkeypatch.setenv("TIMEBLOCK_DB_PATH", str(tmp_path / "other.db"))
+        new = get_engine()
+        assert new is not old
+        assert str(db_path) not in _engines
+
+    def test_br_db_engine_005_invalidate_engine(self, db_path: Path) -> None:
+        """invalidate_engine() força criação de nova engine."""
+        old = get_engine()
+        invalidate_engine()
+        assert get_engine() is not old
+
+    def test_br_db_engine_006_dispose_engines_clears_registry(self, db_path: Path) -> None:
+        """Hook de shutdown esvazia o registro."""
+        get_engine()
+        dispose_engines()
+        assert not _engines
+
+    def test_br_db_engine_007_memory_not_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """':memory:' recebe engine própria a cada chamada."""
+        monkeypatch.setenv("TIMEBLOCK_DB_PATH", ":memory:")
+        assert get_engine() is not get_engine()
+        assert ":memory:" not in _engines
@@ -0,0 +1,101 @@
+"""Integration tests para a migração 004 (índice único habit_id, date).
+
+Referências:
+    - BR-HABIT-003: Geração de instâncias idempotente
+"""
+
+from collections.abc import Iterator
+from datetime import date, time
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine, text
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, SQLModel, create_engine
+
+from timeblock.database.migrations import migration_004_habitinstance_unique_date as m004
+from timeblock.models import Habit, Recurrence, Routine
+
+
+@pytest.fixture
+def legacy_engine(tmp_path: Path) -> Iterator[Engine]:
+    """Banco sem o índice único, com duplicatas pré-existentes."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.connection().execute(text(f"DROP INDEX {m004.INDEX_NAME}"))
+        routine = Routine(name="Rotina")
+        session.add(routine)
+        session.commit()
+        habit = Habit(
+            routine_id=routine.id,
+            title="Leitura",
+            scheduled_start=time(8, 0),
+            scheduled_end=time(9, 0),
+            recurrence=Recurrence.EVERYDAY,
+        )
+        session.add(habit)
+        session.commit()
+        conn = session.connection()
+        for status in ("PENDING", "DONE", "PENDING"):
+            conn.execute(
+                text(
+                    "INSERT INTO habitinstance "
+                    "(habit_id, date, scheduled_start, scheduled_end, status) "
+                    "VALUES (:h, :d, '08:00:00', '09:00:00', :s)"
+                ),
+                {"h": habit.id, "d": date(2025, 1, 6).isoformat(), "s": status},
+            )
+        conn.execute(
+            text(
+                "INSERT INTO time_log (habit_instance_id, start_time, paused_duration) "
+                "VALUES (3, '2025-01-06 08:00:00', 0)"
+            )
+        )
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+class TestBRHabit003UniqueIndexMigration:
+    """Integration: migração 004 consolida duplicatas e cria índice único."""
+
+    def test_br_habit_003_dedup_keeps_non_pending(self, legacy_engine: Engine) -> None:
+        """Mantém a instância DONE e reaponta time_log para ela."""
+        with Session(legacy_engine) as session:
+            m004.upgrade(session)
+            rows = session.connection().execute(text("SELECT id, status FROM habitinstance")).all()
+            log_target = (
+                session.connection()
+                .execute(text("SELECT habit_instance_id FROM time_log"))
+                .scalar_one()
+            )
+
+        assert [(r.id, r.status) for r in rows] == [(2, "DONE")]
+        assert log_target == 2
+
+    def test_br_habit_003_index_rejects_duplicates(self, legacy_engine: Engine) -> None:
+        """Após upgrade, (habit_id, date) duplicado viola o índice."""
+        with Session(legacy_engine) as session:
+            m004.upgrade(session)
+            with pytest.raises(IntegrityError):
+                session.connection().execute(
+                    text(
+                        "INSERT INTO habitinstance "
+                        "(habit_id, date, scheduled_start, scheduled_end, status) "
+                        "VALUES (1, '2025-01-06', '08:00:00', '09:00:00', 'PENDING')"
+                    )
+                )
+
+    def test_br_habit_003_downgrade_drops_index(self, legacy_engine: Engine) -> None:
+        """downgrade remove o índice."""
+        with Session(legacy_engine) as session:
+            m004.upgrade(session)
+            m004.downgrade(session)
+            names = (
+                session.connection()
+                .execute(text("SELECT name FROM sqlite_master WHERE type = 'index'"))
+                .scalars()
+                .all()
+            )
+        assert m004.INDEX_NAME not in names
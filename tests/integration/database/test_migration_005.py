@@ -0,0 +1,108 @@
+"""Integration tests para a migração 005 (rollup habit_day_stats).
+
+Referências:
+    - BR-TUI-033-R3: best_streak persiste o maior valor
+"""
+
+from collections.abc import Iterator
+from datetime import time
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine, text
+from sqlmodel import Session, SQLModel, create_engine
+
+from timeblock.database.migrations import migration_005_habit_day_stats as m005
+from timeblock.models import Habit, Recurrence, Routine
+
+INSERT_INSTANCE = text(
+    "INSERT INTO habitinstance "
+    "(habit_id, date, scheduled_start, scheduled_end, status) "
+    "VALUES (:h, :d, '08:00:00', '09:00:00', :s)"
+)
+
+
+def _stats(session: Session) -> list[tuple]:
+    rows = session.connection().execute(
+        text("SELECT routine_id, date, done, total FROM habit_day_stats ORDER BY date")
+    )
+    return [tuple(r) for r in rows]
+
+
+@pytest.fixture
+def legacy_engine(tmp_path: Path) -> Iterator[Engine]:
+    """Banco sem rollup nem triggers, com histórico de instâncias."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        m005.downgrade(session)
+        routine = Routine(name="Rotina")
+        session.add(routine)
+        session.commit()
+        for title in ("Leitura", "Treino"):
+            session.add(
+                Habit(
+                    routine_id=routine.id,
+                    title=title,
+                    scheduled_start=time(8, 0),
+                    scheduled_end=time(9, 0),
+                    recurrence=Recurrence.EVERYDAY,
+                )
+            )
+        session.commit()
+        conn = session.connection()
+        for habit_id, day, status in (
+            (1, "2025-01-06", "DONE"),
+            (2, "2025-01-06", "DONE"),
+            (1, "2025-01-07", "DONE"),
+            (2, "2025-01-07", "PENDING"),
+        ):
+            conn.execute(INSERT_INSTANCE, {"h": habit_id, "d": day, "s": status})
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+class TestBRTUI033DayStatsMigration:
+    """Integration: migração 005 cria e reconstrói o rollup."""
+
+    def test_br_tui_033_upgrade_backfills_history(self, legacy_engine: Engine) -> None:
+        """Backfill agrega done/total por rotina e dia."""
+        with Session(legacy_engine) as session:
+            m005.upgrade(session)
+            stats = _stats(session)
+
+        assert stats == [(1, "2025-01-06", 2, 2), (1, "2025-01-07", 1, 2)]
+
+    def test_br_tui_033_upgrade_installs_triggers(self, legacy_engine: Engine) -> None:
+        """Após upgrade, escritas em habitinstance atualizam o rollup."""
+        with Session(legacy_engine) as session:
+            m005.upgrade(session)
+            conn = session.connection()
+            conn.execute(text("UPDATE habitinstance SET status = 'DONE' WHERE id = 4"))
+            conn.execute(INSERT_INSTANCE, {"h": 1, "d": "2025-01-08", "s": "PENDING"})
+            stats = _stats(session)
+
+        assert stats[1:] == [(1, "2025-01-07", 2, 2), (1, "2025-01-08", 0, 1)]
+
+    def test_br_tui_033_upgrade_rebuilds_empty_table(self, legacy_engine: Engine) -> None:
+        """Tabela criada vazia por create_all (CLI) é reconstruída."""
+        with Session(legacy_engine) as session:
+            SQLModel.metadata.tables["habit_day_stats"].create(session.connection())
+            m005.upgrade(session)
+            stats = _stats(session)
+
+        assert len(stats) == 2
+
+    def test_br_tui_033_downgrade_drops_rollup(self, legacy_engine: Engine) -> None:
+        """downgrade remove tabela e triggers."""
+        with Session(legacy_engine) as session:
+            m005.upgrade(session)
+            m005.downgrade(session)
+            names = (
+                session.connection()
+                .execute(text("SELECT name FROM sqlite_master WHERE name LIKE '%day_stats%'"))
+                .scalars()
+                .all()
+            )
+        assert names == []
@@ -0,0 +1,89 @@
+"""Integration tests para a migração 006 (índices parciais em tasks).
+
+Referências:
+    - ADR-036: Task Lifecycle Evolution
+"""
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine, text
+from sqlmodel import Session, SQLModel, col, create_engine, select
+
+from timeblock.database.migrations import migration_006_task_partial_indexes as m006
+from timeblock.models import Task
+from timeblock.services.task_service import TaskService
+
+
+def _index_names(session: Session) -> set[str]:
+    rows = session.connection().execute(
+        text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'tasks'")
+    )
+    return set(rows.scalars().all())
+
+
+def _plan(session: Session, statement) -> str:
+    compiled = statement.compile(
+        dialect=session.get_bind().dialect, compile_kwargs={"literal_binds": True}
+    )
+    rows = session.connection().execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    return " ".join(row[-1] for row in rows)
+
+
+@pytest.fixture
+def legacy_engine(tmp_path: Path) -> Iterator[Engine]:
+    """Banco com tasks sem os índices parciais."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        m006.downgrade(session)
+    yield engine
+    engine.dispose()
+
+
+class TestBRTaskPartialIndexesMigration:
+    """Integration: migração 006 cria índices usados pelo painel de tasks."""
+
+    def test_upgrade_creates_indexes(self, legacy_engine: Engine) -> None:
+        """upgrade cria os três índices parciais; é idempotente."""
+        with Session(legacy_engine) as session:
+            assert not set(m006.INDEXES) & _index_names(session)
+            m006.upgrade(session)
+            m006.upgrade(session)
+            assert set(m006.INDEXES) <= _index_names(session)
+
+    def test_downgrade_drops_indexes(self, legacy_engine: Engine) -> None:
+        """downgrade remove os índices."""
+        with Session(legacy_engine) as session:
+            m006.upgrade(session)
+            m006.downgrade(session)
+            assert not set(m006.INDEXES) & _index_names(session)
+
+    def test_panel_queries_use_partial_indexes(self, legacy_engine: Engine) -> None:
+        """Consultas de pendentes e recentes usam os índices parciais."""
+        cutoff = datetime(2025, 1, 1) - timedelta(hours=24)
+        with Session(legacy_engine) as session:
+            m006.upgrade(session)
+            pending = select(Task).where(
+                col(Task.completed_datetime).is_(None),
+                col(Task.cancelled_datetime).is_(None),
+            )
+            completed = select(Task).where(col(Task.completed_datetime) >= cutoff)
+            cancelled = select(Task).where(col(Task.cancelled_datetime) >= cutoff)
+
+            assert "ix_tasks_pending_scheduled" in _plan(session, pending)
+            assert "ix_tasks_completed_datetime" in _plan(session, completed)
+            assert "ix_tasks_cancelled_datetime" in _plan(session, cancelled)
+
+    def test_pending_ordered_by_schedule(self, legacy_engine: Engine) -> None:
+        """list_pending_tasks retorna em ordem de agenda."""
+        base = datetime(2025, 1, 6, 9, 0)
+        with Session(legacy_engine) as session:
+            m006.upgrade(session)
+            for hours in (3, 1, 2):
+                TaskService.create_task(f"T{hours}", base + timedelta(hours=hours), session=session)
+            titles = [t.title for t in TaskService.list_pending_tasks(session=session)]
+
+        assert titles == ["T1", "T2", "T3"]
@@ -0,0 +1,110 @@
+"""Integration tests para a migração 007 (índice de timer ativo único).
+
+Referências:
+    - BR-TIMER-001: Single Active Timer Constraint
+"""
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine, text
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, SQLModel, col, create_engine, select
+
+from timeblock.database.migrations import migration_007_time_log_single_active as m007
+from timeblock.models import TimeLog
+from timeblock.models.enums import TimerStatus
+
+
+def _index_names(session: Session) -> set[str]:
+    rows = session.connection().execute(
+        text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'time_log'")
+    )
+    return set(rows.scalars().all())
+
+
+def _plan(session: Session, statement) -> str:
+    compiled = statement.compile(
+        dialect=session.get_bind().dialect, compile_kwargs={"literal_binds": True}
+    )
+    rows = session.connection().execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    return " ".join(row[-1] for row in rows)
+
+
+@pytest.fixture
+def legacy_engine(tmp_path: Path) -> Iterator[Engine]:
+    """Banco com time_log sem o índice único parcial."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        m007.downgrade(session)
+    yield engine
+    engine.dispose()
+
+
+class TestBRTimerSingleActiveMigration:
+    """Integration: migração 007 garante BR-TIMER-001 no banco."""
+
+    def test_upgrade_creates_index(self, legacy_engine: Engine) -> None:
+        """upgrade cria o índice; é idempotente."""
+        with Session(legacy_engine) as session:
+            assert m007.INDEX_NAME not in _index_names(session)
+            m007.upgrade(session)
+            m007.upgrade(session)
+            assert m007.INDEX_NAME in _index_names(session)
+
+    def test_upgrade_cancels_duplicate_active_timers(self, legacy_engine: Engine) -> None:
+        """Mantém o timer ativo mais recente e cancela os demais."""
+        base = datetime(2025, 1, 1, 9, 0)
+        with Session(legacy_engine) as session:
+            session.add_all(
+                [
+                    TimeLog(start_time=base, status=TimerStatus.RUNNING),
+                    TimeLog(start_time=base + timedelta(hours=2), status=TimerStatus.PAUSED),
+                    TimeLog(start_time=base + timedelta(hours=1), status=TimerStatus.RUNNING),
+                    TimeLog(start_time=base, end_time=base, status=TimerStatus.DONE),
+                ]
+            )
+            session.commit()
+
+            m007.upgrade(session)
+
+            logs = session.exec(select(TimeLog).order_by(col(TimeLog.id))).all()
+            assert [log.status for log in logs] == [
+                TimerStatus.CANCELLED,
+                TimerStatus.PAUSED,
+                TimerStatus.CANCELLED,
+                TimerStatus.DONE,
+            ]
+            assert logs[0].cancel_reason == m007.DUPLICATE_REASON
+            assert logs[0].end_time is not None
+
+    def test_index_rejects_second_active_timer(self, legacy_engine: Engine) -> None:
+        """Após upgrade, uma segunda linha ativa viola o índice."""
+        with Session(legacy_engine) as session:
+            m007.upgrade(session)
+            session.add(TimeLog(start_time=datetime.now(), status=TimerStatus.RUNNING))
+            session.commit()
+            session.add(TimeLog(start_time=datetime.now(), status=TimerStatus.PAUSED))
+            with pytest.raises(IntegrityError):
+                session.commit()
+
+    def test_active_lookup_uses_index(self, legacy_engine: Engine) -> None:
+        """Busca do timer ativo é SEARCH por ix_time_log_status, nunca SCAN."""
+        with Session(legacy_engine) as session:
+            m007.upgrade(session)
+            statement = select(TimeLog).where(
+                col(TimeLog.status).in_([TimerStatus.RUNNING, TimerStatus.PAUSED])
+            )
+            plan = _plan(session, statement)
+            assert "SEARCH time_log USING INDEX ix_time_log_status (status=?)" in plan
+            assert "SCAN" not in plan
+
+    def test_downgrade_drops_index(self, legacy_engine: Engine) -> None:
+        """downgrade remove o índice."""
+        with Session(legacy_engine) as session:
+            m007.upgrade(session)
+            m007.downgrade(session)
+            assert m007.INDEX_NAME not in _index_names(session)
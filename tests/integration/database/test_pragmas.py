@@ -0,0 +1,183 @@
+"""Integration tests para os perfis de PRAGMA SQLite.
+
+Valida a seleção do perfil (env, config.toml, default), os valores
+aplicados às conexões do pool e que escritas concorrentes de dois
+processos não falham com "database is locked".
+"""
+
+import multiprocessing
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from timeblock.database.engine import dispose_engines, get_engine
+from timeblock.database.pragmas import PROFILES, resolve_profile
+
+
+@pytest.fixture
+def db_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Banco em arquivo, sem config.toml nem perfil no ambiente."""
+    path = tmp_path / "pragmas.db"
+    monkeypatch.setenv("TIMEBLOCK_DB_PATH", str(path))
+    monkeypatch.setenv("ATOMVS_CONFIG", str(tmp_path / "config.toml"))
+    monkeypatch.delenv("ATOMVS_SQLITE_PROFILE", raising=False)
+    dispose_engines()
+    yield path
+    dispose_engines()
+
+
+def _pragma(name: str) -> object:
+    with get_engine().connect() as conn:
+        return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def _write_rows(worker: int, count: int, errors: "multiprocessing.Queue") -> None:
+    """Processo escritor: uma transação curta por linha (padrão da CLI/TUI)."""
+    failures = 0
+    engine = get_engine()
+    for i in range(count):
+        try:
+            with engine.begin() as conn:
+                conn.execute(
+                    text("INSERT INTO log (worker, n) VALUES (:w, :n)"), {"w": worker, "n": i}
+                )
+        except OperationalError:
+            failures += 1
+    dispose_engines()
+    errors.put(failures)
+
+
+class TestBRDbPragmaProfile:
+    """Integration: perfil de PRAGMA por conexão (BR-DB-PRAGMA-*)."""
+
+    def test_br_db_pragma_001_default_profile_is_wal(self, db_path: Path) -> None:
+        """Sem configuração, conexões usam WAL + synchronous=NORMAL."""
+        profile, source = resolve_profile()
+
+        assert (profile.name, source) == ("balanced", "default")
+        assert _pragma("journal_mode") == "wal"
+        assert _pragma("synchronous") == 1  # NORMAL
+        assert _pragma("busy_timeout") == profile.busy_timeout
+        assert _pragma("cache_size") == profile.cache_size
+        assert _pragma("temp_store") == 2  # MEMORY
+        assert _pragma("foreign_keys") == 1
+
+    def test_br_db_pragma_002_env_selects_profile(
+        self, db_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """ATOMVS_SQLITE_PROFILE seleciona o perfil."""
+        monkeypatch.setenv("ATOMVS_SQLITE_PROFILE", "legacy")
+
+        assert resolve_profile() == (PROFILES["legacy"], "env")
+        assert _pragma("journal_mode") == "delete"
+        assert _pragma("synchronous") == 2  # FULL
+
+    def test_br_db_pragma_003_config_file_with_overrides(
+        self, db_path: Path, tmp_path: Path
+    ) -> None:
+        """config.toml escolhe o perfil e sobrescreve PRAGMAs individuais."""
+        (tmp_path / "config.toml").write_text(
+            '[database]\nsqlite_profile = "durable"\n\n[database.pragmas]\nbusy_timeout = 1234\n'
+        )
+
+        profile, source = resolve_profile()
+
+        assert (profile.name, source) == ("durable", "config")
+        assert profile.busy_timeout == 1234
+        assert _pragma("busy_timeout") == 1234
+
+    @pytest.mark.parametrize(
+        ("env_profile", "config", "reason"),
+        [
+            ("turbo", "", "turbo"),
+            (None, "[database.pragmas]\nlocking_mode = 'EXCLUSIVE'\n", "locking_mode"),
+            (None, "[database.pragmas]\njournal_mode = 'WAL; DROP TABLE x'\n", "journal_mode"),
+            (None, "[database.pragmas]\nsynchronous = 'FAST'\n", "synchronous"),
+            (None, "[database.pragmas]\ntemp_store = 5\n", "temp_store"),
+            (None, "[database.pragmas]\nbusy_timeout = 'longo'\n", "longo"),
+        ],
+    )
+    def test_br_db_pragma_004_invalid_configuration(
+        self,
+        db_path: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+        env_profile: str | None,
+        config: str,
+        reason: str,
+    ) -> None:
+        """Configuração inválida gera warning e cai no perfil default."""
+        if env_profile:
+            monkeypatch.setenv("ATOMVS_SQLITE_PROFILE", env_profile)
+        (tmp_path / "config.toml").write_text(config)
+
+        with caplog.at_level("WARNING", logger="timeblock.database.pragmas"):
+            profile, source = resolve_profile()
+
+        assert (profile, source) == (PROFILES["balanced"], "default")
+        [record] = caplog.records
+        assert reason in record.getMessage()
+
+    def test_br_db_pragma_004_invalid_configuration_opens_database(
+        self, db_path: Path, tmp_path: Path
+    ) -> None:
+        """get_engine() não falha com config inválido; aplica o default."""
+        (tmp_path / "config.toml").write_text("[database.pragmas]\nsynchronous = 'FAST'\n")
+
+        assert _pragma("journal_mode") == "wal"
+        assert _pragma("synchronous") == 1
+
+    def test_br_db_pragma_004_valid_values_normalized(self, db_path: Path, tmp_path: Path) -> None:
+        """Valores textuais válidos são aceitos sem diferenciar maiúsculas."""
+        (tmp_path / "config.toml").write_text(
+            "[database.pragmas]\nsynchronous = 'full'\ntemp_store = 2\n"
+        )
+
+        profile, _ = resolve_profile()
+
+        assert (profile.synchronous, profile.temp_store) == ("FULL", "2")
+
+    def test_br_db_pragma_005_profile_logged(
+        self, db_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Perfil default é registrado em DEBUG, fora do stderr da CLI."""
+        with caplog.at_level("DEBUG", logger="timeblock.database.engine"):
+            get_engine()
+
+        [record] = [r for r in caplog.records if "perfil" in r.getMessage()]
+        assert "perfil balanced (default)" in record.getMessage()
+        assert record.levelname == "DEBUG"
+
+    def test_br_db_pragma_005_configured_profile_logged_info(
+        self, db_path: Path, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Perfil vindo do ambiente ou do config.toml é registrado em INFO."""
+        monkeypatch.setenv("ATOMVS_SQLITE_PROFILE", "durable")
+
+        with caplog.at_level("INFO", logger="timeblock.database.engine"):
+            get_engine()
+
+        assert "perfil durable (env)" in caplog.text
+
+    def test_br_db_pragma_006_concurrent_writers_not_locked(self, db_path: Path) -> None:
+        """Dois processos gravando ao mesmo tempo não recebem SQLITE_BUSY."""
+        with get_engine().begin() as conn:
+            conn.execute(text("CREATE TABLE log (worker INTEGER, n INTEGER)"))
+        dispose_engines()
+
+        ctx = multiprocessing.get_context("spawn")
+        errors = ctx.Queue()
+        workers = [ctx.Process(target=_write_rows, args=(w, 200, errors)) for w in (1, 2)]
+        for proc in workers:
+            proc.start()
+        for proc in workers:
+            proc.join(timeout=60)
+
+        assert [errors.get(timeout=5) for _ in workers] == [0, 0]
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("SELECT count(*) FROM log").fetchone() == (400,)
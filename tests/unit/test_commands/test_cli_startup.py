@@ -0,0 +1,150 @@
+"""Testes de tempo de startup do CLI (BR-CLI-MAIN-002).
+
+Scripts chamam `timeblock` dezenas de vezes; o custo de import domina.
+Os módulos de comando (e com eles SQLModel, models, dateutil, Rich) só
+são importados quando o comando é despachado.
+
+Medição via `python -X importtime`, que escreve no stderr uma linha por
+módulo com o tempo cumulativo em microssegundos.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import typer
+
+from timeblock.main import LazyGroup, app
+
+# Import de timeblock.main como fração do import eager de todos os
+# comandos (antes do LazyGroup ~1.0; medido ~0.1). Relativo ao mesmo
+# ambiente para não depender da velocidade da máquina nem da carga.
+STARTUP_BUDGET_RATIO = 0.35
+
+EAGER_IMPORT = "import timeblock.main, " + ", ".join(
+    f"timeblock.commands.{name}"
+    for name in (
+        "init",
+        "metrics",
+        "routine",
+        "habit",
+        "task",
+        "timer",
+        "tag",
+        "reschedule",
+        "demo",
+    )
+)
+
+HEAVY_MODULES = (
+    "sqlmodel",
+    "sqlalchemy",
+    "dateutil",
+    "rich.console",
+    "timeblock.models",
+    "timeblock.services",
+    "timeblock.commands",
+)
+
+
+def _importtime(args: list[str], tmp_path: Path) -> dict[str, int]:
+    """Executa o Python com -X importtime e retorna {módulo: cumulativo_us}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "ATOMVS_LOG_FILE": str(tmp_path / "cli.log")},
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def _timeblock_import_us(statement: str, tmp_path: Path) -> int:
+    """Tempo cumulativo dos imports de primeiro nível de timeblock.*."""
+    modules = _importtime(["-c", statement], tmp_path)
+    top_level = set(statement.removeprefix("import ").split(", "))
+    return sum(us for name, us in modules.items() if name in top_level)
+
+
+def _heavy(modules: dict[str, int]) -> list[str]:
+    return sorted(
+        name
+        for name in modules
+        if any(name == heavy or name.startswith(f"{heavy}.") for heavy in HEAVY_MODULES)
+    )
+
+
+class TestBRCLIMainStartup:
+    """Unit: startup do CLI (BR-CLI-MAIN-002)."""
+
+    def test_br_cli_main_002_import_skips_command_modules(self, tmp_path: Path) -> None:
+        """Importar o entry point não carrega comandos nem dependências pesadas."""
+        modules = _importtime(["-c", "import timeblock.main"], tmp_path)
+
+        assert _heavy(modules) == []
+
+    def test_br_cli_main_002_version_skips_command_modules(self, tmp_path: Path) -> None:
+        """`timeblock version` roda sem importar SQLModel nem os comandos."""
+        modules = _importtime(["-m", "timeblock.main", "version"], tmp_path)
+
+        assert _heavy(modules) == []
+
+    def test_br_cli_main_002_dispatch_imports_only_target(self, tmp_path: Path) -> None:
+        """Despachar `tag --help` importa só o módulo do comando chamado."""
+        # importlib.import_module não aparece no -X importtime; lê sys.modules
+        script = (
+            "import sys\n"
+            "from timeblock.main import main\n"
+            "sys.argv = ['timeblock', 'tag', '--help']\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sorted(m for m in sys.modules if m.startswith('timeblock.commands.')))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "ATOMVS_LOG_FILE": str(tmp_path / "cli.log")},
+        )
+
+        assert result.stdout.splitlines()[-1] == "['timeblock.commands.tag']"
+
+    def test_br_cli_main_002_import_within_budget(self, tmp_path: Path) -> None:
+        """Import de timeblock.main custa < STARTUP_BUDGET_RATIO do eager.
+
+        Runs intercalados, menor de três de cada, para não falhar por
+        ruído de CPU.
+        """
+        lazy, eager = [], []
+        for _ in range(3):
+            lazy.append(_timeblock_import_us("import timeblock.main", tmp_path))
+            eager.append(_timeblock_import_us(EAGER_IMPORT, tmp_path))
+
+        ratio = min(lazy) / min(eager)
+        assert ratio < STARTUP_BUDGET_RATIO, (
+            f"startup {min(lazy) / 1000:.0f}ms vs eager {min(eager) / 1000:.0f}ms"
+        )
+
+    def test_br_cli_main_002_all_lazy_commands_resolve(self) -> None:
+        """Todo nome registrado no LazyGroup resolve para um comando."""
+        group = typer.main.get_command(app)
+        assert isinstance(group, LazyGroup)
+        ctx = typer.Context(group)
+
+        names = group.list_commands(ctx)
+
+        assert set(LazyGroup.lazy_commands) | set(LazyGroup.lazy_groups) | {"version"} == set(names)
+        for name in names:
+            command = group.get_command(ctx, name)
+            assert command is not None
+            assert command.name == name
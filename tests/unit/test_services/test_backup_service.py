@@ -1,25 +1,67 @@
 """Testes para BR-DATA-001: Backup Automático do Banco de Dados."""
 
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import closing
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
+from timeblock.services import backup_service
 from timeblock.services.backup_service import (
-    MAX_BACKUPS,
+    KEEP_DAILY,
+    KEEP_HOURLY,
+    KEEP_LAST,
+    KEEP_WEEKLY,
+    OBJECTS_DIR_NAME,
     _cleanup_old_backups,
     create_backup,
+    export_backup,
     get_backup_dir,
     list_backups,
     restore_backup,
+    start_backup,
 )
 
 
+def _make_db(path: Path, value: str = "test data") -> Path:
+    """Cria banco SQLite real com uma linha."""
+    with closing(sqlite3.connect(path)) as conn:
+        conn.execute("CREATE TABLE IF NOT EXISTS t (x TEXT)")
+        conn.execute("INSERT INTO t VALUES (?)", (value,))
+        conn.commit()
+    return path
+
+
+def _rows(path: Path) -> list[tuple]:
+    with closing(sqlite3.connect(path)) as conn:
+        return conn.execute("SELECT x FROM t").fetchall()
+
+
+def _export(backup: Path) -> Path:
+    """Reconstrói o backup como arquivo SQLite ao lado do armazenamento."""
+    return export_backup(backup, backup.parent.parent / f"{backup.stem}.restored.db")
+
+
+def _manifest_chunks(manifest: Path) -> list[str]:
+    return json.loads(manifest.read_text())["chunks"]
+
+
+def _objects(backup_dir: Path) -> list[Path]:
+    return [p for p in (backup_dir / OBJECTS_DIR_NAME).glob("*/*") if p.is_file()]
+
+
 class TestBRData001BackupAutomatico:
     """BR-DATA-001: Backup automático do SQLite."""
 
     def test_br_data_001_backup_created_with_timestamp(self, tmp_path: Path) -> None:
         """Backup criado com timestamp no nome."""
-        db_file = tmp_path / "timeblock.db"
-        db_file.write_text("test data")
+        db_file = _make_db(tmp_path / "timeblock.db")
         with patch("timeblock.services.backup_service.get_db_path", return_value=str(db_file)):
             with patch(
                 "timeblock.services.backup_service.get_backup_dir",
@@ -28,12 +70,11 @@ class TestBRData001BackupAutomatico:
                 result = create_backup(label="startup")
         assert result is not None
         assert "timeblock-" in result.name
-        assert "-startup.db" in result.name
+        assert result.name.endswith("-startup.json")
 
     def test_br_data_001_label_in_filename(self, tmp_path: Path) -> None:
         """Label aparece no nome do arquivo."""
-        db_file = tmp_path / "timeblock.db"
-        db_file.write_text("test data")
+        db_file = _make_db(tmp_path / "timeblock.db")
         with patch("timeblock.services.backup_service.get_db_path", return_value=str(db_file)):
             with patch(
                 "timeblock.services.backup_service.get_backup_dir",
@@ -41,17 +82,29 @@ class TestBRData001BackupAutomatico:
             ):
                 result = create_backup(label="shutdown")
         assert result is not None
-        assert "-shutdown.db" in result.name
+        assert result.name.endswith("-shutdown.json")
 
     def test_br_data_001_rotation_removes_old(self, tmp_path: Path) -> None:
-        """Rotação remove backups excedentes."""
+        """Rotação avô-pai-filho: horas recentes, um por dia, um por semana."""
         backup_dir = tmp_path / "backups"
         backup_dir.mkdir()
-        for i in range(MAX_BACKUPS + 3):
-            (backup_dir / f"timeblock-2026010{i:02d}-120000.db").write_text(f"backup {i}")
+        newest = datetime(2026, 6, 30, 23, 0)
+        stamps = [newest - timedelta(hours=h) for h in range(24 * 200)]
+        for stamp in stamps:
+            (backup_dir / f"timeblock-{stamp:%Y%m%d-%H%M%S}.db").write_text("data")
+
         _cleanup_old_backups(backup_dir)
-        remaining = list(backup_dir.glob("timeblock-*.db"))
-        assert len(remaining) == MAX_BACKUPS
+
+        remaining = {p.name for p in backup_dir.glob("timeblock-*.db")}
+        assert len(remaining) <= KEEP_LAST + KEEP_HOURLY + KEEP_DAILY + KEEP_WEEKLY
+        # Últimas 24 horas: todas
+        assert all(f"timeblock-{s:%Y%m%d-%H%M%S}.db" in remaining for s in stamps[:KEEP_HOURLY])
+        # 10 dias atrás: só o último backup do dia
+        day = (newest - timedelta(days=10)).strftime("%Y%m%d")
+        assert sorted(n for n in remaining if day in n) == [f"timeblock-{day}-230000.db"]
+        # Semanas antigas: um por semana, até KEEP_WEEKLY semanas
+        weeks = {datetime.strptime(n[10:25], "%Y%m%d-%H%M%S").isocalendar()[:2] for n in remaining}
+        assert len(weeks) == KEEP_WEEKLY
 
     def test_br_data_001_missing_db_returns_none(self, tmp_path: Path) -> None:
         """Banco inexistente retorna None sem erro."""
@@ -64,10 +117,8 @@ class TestBRData001BackupAutomatico:
 
     def test_br_data_001_restore_creates_pre_restore(self, tmp_path: Path) -> None:
         """Restore cria pre-restore antes de sobrescrever."""
-        db_file = tmp_path / "timeblock.db"
-        db_file.write_text("current data")
-        backup_file = tmp_path / "backup.db"
-        backup_file.write_text("old data")
+        db_file = _make_db(tmp_path / "timeblock.db", "current data")
+        backup_file = _make_db(tmp_path / "backup.db", "old data")
         backup_dir = tmp_path / "backups"
         with patch("timeblock.services.backup_service.get_db_path", return_value=str(db_file)):
             with patch("timeblock.services.backup_service.get_backup_dir", return_value=backup_dir):
@@ -75,6 +126,8 @@ class TestBRData001BackupAutomatico:
         assert result is True
         pre_restores = list(backup_dir.glob("*pre-restore*"))
         assert len(pre_restores) == 1
+        assert _rows(_export(pre_restores[0])) == [("current data",)]
+        assert _rows(db_file) == [("old data",)]
 
     def test_br_data_001_list_backups_ordered(self, tmp_path: Path) -> None:
         """list_backups retorna ordenado por data (mais recente primeiro)."""
@@ -99,16 +152,315 @@ class TestBRData001BackupAutomatico:
         assert backup_dir.name == "backups"
 
     def test_br_data_001_max_backups_respected(self, tmp_path: Path) -> None:
-        """MAX_BACKUPS é respeitado após múltiplos backups."""
-        db_file = tmp_path / "timeblock.db"
-        db_file.write_text("test data")
+        """Backups na mesma hora ficam limitados a KEEP_LAST (+ o recém-criado)."""
+        db_file = _make_db(tmp_path / "timeblock.db")
         backup_dir = tmp_path / "backups"
         with patch("timeblock.services.backup_service.get_db_path", return_value=str(db_file)):
             with patch("timeblock.services.backup_service.get_backup_dir", return_value=backup_dir):
-                for i in range(MAX_BACKUPS + 5):
-                    create_backup(label=f"test{i}")
-        remaining = list(backup_dir.glob("timeblock-*.db"))
-        assert len(remaining) <= MAX_BACKUPS
+                for i in range(KEEP_LAST + 5):
+                    _make_db(db_file, f"row {i}")
+                    last = create_backup(label=f"test{i}")
+                remaining = list_backups()
+        assert len(remaining) <= KEEP_LAST + 1
+        assert last in remaining
+
+
+class TestBRData001WalMode:
+    """BR-DATA-001: Backup e restore com journal_mode=WAL."""
+
+    def test_br_data_001_backup_includes_wal_commits(self, tmp_path: Path) -> None:
+        """Commits ainda no -wal entram no backup (API de backup lê pelo WAL)."""
+        db_file = tmp_path / "timeblock.db"
+        writer = sqlite3.connect(db_file)
+        writer.execute("PRAGMA journal_mode=WAL")
+        writer.execute("PRAGMA wal_autocheckpoint=0")
+        writer.execute("CREATE TABLE t (x INTEGER)")
+        writer.execute("INSERT INTO t VALUES (42)")
+        writer.commit()
+        assert (tmp_path / "timeblock.db-wal").stat().st_size > 0
+
+        with patch("timeblock.services.backup_service.get_db_path", return_value=str(db_file)):
+            with patch(
+                "timeblock.services.backup_service.get_backup_dir",
+                return_value=tmp_path / "backups",
+            ):
+                result = create_backup()
+        writer.close()
+
+        assert result is not None
+        with closing(sqlite3.connect(_export(result))) as backup:
+            assert backup.execute("SELECT x FROM t").fetchall() == [(42,)]
+
+    def test_br_data_001_restore_drops_stale_wal(self, tmp_path: Path) -> None:
+        """Restore remove -wal/-shm do banco substituído."""
+        db_file = _make_db(tmp_path / "timeblock.db", "current")
+        backup = _make_db(tmp_path / "backup.db", "restored")
+        (tmp_path / "timeblock.db-wal").write_text("stale")
+        (tmp_path / "timeblock.db-shm").write_text("stale")
+
+        with patch("timeblock.services.backup_service.get_db_path", return_value=str(db_file)):
+            with patch(
+                "timeblock.services.backup_service.get_backup_dir",
+                return_value=tmp_path / "backups",
+            ):
+                assert restore_backup(backup)
+
+        assert _rows(db_file) == [("restored",)]
+        assert not (tmp_path / "timeblock.db-wal").exists()
+        assert not (tmp_path / "timeblock.db-shm").exists()
+
+
+class TestBRData001OnlineBackup:
+    """BR-DATA-001: Backup online via API de backup do SQLite."""
+
+    @pytest.fixture
+    def db_file(self, tmp_path: Path) -> Iterator[Path]:
+        db_file = _make_db(tmp_path / "timeblock.db")
+        with (
+            patch("timeblock.services.backup_service.get_db_path", return_value=str(db_file)),
+            patch(
+                "timeblock.services.backup_service.get_backup_dir",
+                return_value=tmp_path / "backups",
+            ),
+        ):
+            yield db_file
+
+    def test_br_data_001_unchanged_db_skipped(self, db_file: Path) -> None:
+        """Banco inalterado desde o último backup não gera nova cópia."""
+        first = create_backup(label="startup")
+
+        assert first is not None
+        assert create_backup(label="shutdown") is None
+
+        _make_db(db_file, "nova linha")
+        assert create_backup(label="shutdown") is not None
+
+    def test_br_data_001_skip_requires_existing_backup(self, db_file: Path) -> None:
+        """Se o último backup foi removido, o backup é refeito."""
+        first = create_backup()
+        assert first is not None
+        first.unlink()
+
+        assert create_backup() is not None
+
+    def test_br_data_001_consistent_under_concurrent_writes(self, db_file: Path) -> None:
+        """Backup durante escritas contínuas é íntegro e tem estado commitado."""
+        with closing(sqlite3.connect(db_file)) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE pad (blob BLOB)")
+            conn.executemany("INSERT INTO pad VALUES (?)", [(b"x" * 4000,)] * 2000)
+            conn.commit()
+        stop = threading.Event()
+
+        def _writer() -> None:
+            with closing(sqlite3.connect(db_file, timeout=5)) as conn:
+                while not stop.is_set():
+                    conn.execute("INSERT INTO t VALUES ('w')")
+                    conn.commit()
+
+        thread = threading.Thread(target=_writer)
+        thread.start()
+        try:
+            result = create_backup()
+        finally:
+            stop.set()
+            thread.join()
+
+        assert result is not None
+        with closing(sqlite3.connect(_export(result))) as backup:
+            assert backup.execute("PRAGMA integrity_check").fetchone() == ("ok",)
+            assert backup.execute("SELECT count(*) FROM pad").fetchone() == (2000,)
+        assert not list(result.parent.glob("*.partial"))
+
+    def test_br_data_001_restarts_fall_back_to_single_step(
+        self, db_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Reinícios em excesso terminam com cópia em passo único."""
+        calls: list[dict] = []
+        real_backup = sqlite3.Connection.backup
+
+        class _Source:
+            def __init__(self, conn: sqlite3.Connection) -> None:
+                self._conn = conn
+
+            def backup(self, target, **kwargs) -> None:
+                calls.append(kwargs)
+                progress = kwargs.get("progress")
+                if progress is not None:
+                    for remaining in [5, 4, 5, 4, 5, 4, 5, 4, 5]:
+                        progress(0, remaining, 10)
+                real_backup(self._conn, target)
+
+            def close(self) -> None:
+                self._conn.close()
+
+        real_connect = sqlite3.connect
+        monkeypatch.setattr(
+            backup_service.sqlite3,
+            "connect",
+            lambda path, *a, **kw: (
+                _Source(real_connect(path, *a, **kw))
+                if Path(path) == db_file
+                else real_connect(path, *a, **kw)
+            ),
+        )
+
+        result = create_backup()
+
+        assert result is not None
+        assert len(calls) == 2
+        assert calls[1] == {}
+        assert _rows(_export(result)) == [("test data",)]
+
+    def test_br_data_001_partial_backups_cleaned(self, db_file: Path, tmp_path: Path) -> None:
+        """Cópias parciais de backups interrompidos são removidas."""
+        backup_dir = tmp_path / "backups"
+        backup_dir.mkdir()
+        stale = backup_dir / "timeblock-20260101-120000.db.partial"
+        stale.write_text("interrompido")
+
+        result = create_backup()
+
+        assert not stale.exists()
+        assert list_backups() == [result]
+
+    def test_br_data_001_background_job_bounded_wait(
+        self, db_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """wait() respeita o timeout sem bloquear até o fim do backup."""
+        release = threading.Event()
+        real_create = backup_service.create_backup
+
+        def _slow_create(label: str = "") -> Path | None:
+            release.wait(5)
+            return real_create(label)
+
+        monkeypatch.setattr(backup_service, "create_backup", _slow_create)
+
+        job = start_backup(label="shutdown")
+        started = time.perf_counter()
+        assert job.wait(timeout=0.05) is False
+        assert time.perf_counter() - started < 1
+
+        release.set()
+        assert job.wait(timeout=5) is True
+        assert job.result is not None
+        assert job.result.name.endswith("-shutdown.json")
+
+
+class TestBRData001BackupStore:
+    """BR-DATA-001: Armazenamento deduplicado e comprimido de backups."""
+
+    @pytest.fixture
+    def db_file(self, tmp_path: Path) -> Iterator[Path]:
+        db_file = tmp_path / "timeblock.db"
+        with closing(sqlite3.connect(db_file)) as conn:
+            conn.execute("CREATE TABLE t (x TEXT)")
+            conn.executemany(
+                "INSERT INTO t VALUES (?)", [(f"linha {i} " * 40,) for i in range(5000)]
+            )
+            conn.commit()
+        with (
+            patch("timeblock.services.backup_service.get_db_path", return_value=str(db_file)),
+            patch(
+                "timeblock.services.backup_service.get_backup_dir",
+                return_value=tmp_path / "backups",
+            ),
+        ):
+            yield db_file
+
+    def test_br_data_001_unchanged_chunks_deduplicated(self, db_file: Path) -> None:
+        """Segundo backup após uma alteração pequena grava poucos chunks."""
+        first = create_backup(label="a")
+        assert first is not None
+        before = len(_objects(first.parent))
+
+        with closing(sqlite3.connect(db_file)) as conn:
+            conn.execute("UPDATE t SET x = 'alterada' WHERE rowid = 1")
+            conn.commit()
+        second = create_backup(label="b")
+
+        assert second is not None
+        assert before > 10
+        assert len(_objects(first.parent)) - before <= 2
+        assert _rows(_export(second))[0] == ("alterada",)
+
+    def test_br_data_001_chunks_compressed(self, db_file: Path) -> None:
+        """Chunks ocupam menos que o banco original."""
+        result = create_backup()
+
+        assert result is not None
+        stored = sum(p.stat().st_size for p in _objects(result.parent))
+        assert stored < db_file.stat().st_size / 4
+
+    def test_br_data_001_orphan_chunks_collected(self, db_file: Path, tmp_path: Path) -> None:
+        """Chunks referenciados só por manifestos removidos são apagados."""
+        backup_dir = tmp_path / "backups"
+        old = create_backup()
+        assert old is not None
+        old_chunks = set(_manifest_chunks(old))
+        aged = old.with_name("timeblock-20200101-120000.json")
+        old.rename(aged)
+        with closing(sqlite3.connect(db_file)) as conn:
+            conn.execute("DELETE FROM t")
+            conn.commit()
+            conn.execute("VACUUM")
+        # Backups antigos suficientes para tirar o de 2020 de todos os níveis
+        for i in range(KEEP_DAILY):
+            stamp = datetime(2021, 1, 4) + timedelta(weeks=i)
+            (backup_dir / f"timeblock-{stamp:%Y%m%d-%H%M%S}.db").write_text("data")
+
+        current = create_backup()
+
+        assert not aged.exists()
+        remaining = {p.name for p in _objects(backup_dir)}
+        assert remaining == set(_manifest_chunks(current))
+        assert not old_chunks & remaining
+
+    def test_br_data_001_corrupted_backup_not_restored(self, db_file: Path) -> None:
+        """Chunk corrompido impede o restore e preserva o banco atual."""
+        backup = create_backup()
+        assert backup is not None
+        chunk = _objects(backup.parent)[0]
+        chunk.write_bytes(b"lixo")
+        before = db_file.read_bytes()
+
+        with pytest.raises(ValueError, match="corrompido"):
+            restore_backup(backup)
+
+        assert db_file.read_bytes() == before
+
+    def test_br_data_001_legacy_full_copies_supported(self, db_file: Path, tmp_path: Path) -> None:
+        """Cópias completas antigas (.db) são listadas e restauráveis."""
+        backup_dir = tmp_path / "backups"
+        backup_dir.mkdir()
+        legacy = _make_db(backup_dir / "timeblock-20200101-120000-shutdown.db", "antiga")
+        current = create_backup()
+
+        assert list_backups() == [current, legacy]
+        assert restore_backup(legacy)
+        assert _rows(db_file) == [("antiga",)]
+
+    def test_br_data_001_cleanup_does_not_stat_backups(
+        self, db_file: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Rotação usa os nomes dos arquivos, sem stat por backup."""
+        backup_dir = tmp_path / "backups"
+        backup_dir.mkdir()
+        for h in range(200):
+            stamp = datetime(2026, 1, 1) + timedelta(hours=h)
+            (backup_dir / f"timeblock-{stamp:%Y%m%d-%H%M%S}.db").write_text("data")
+        stats: list[Path] = []
+        real_stat = Path.stat
+
+        def _counting_stat(self: Path, *args, **kwargs):
+            stats.append(self)
+            return real_stat(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "stat", _counting_stat)
+        _cleanup_old_backups(backup_dir)
+
+        assert len(stats) < 5
 
 
 class TestBRData001XDGPath:
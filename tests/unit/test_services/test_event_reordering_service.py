@@ -259,3 +259,171 @@ class TestGetConflictsForDay:
             date(2025, 10, 24), session=session
         )
         assert len(conflicts) == 1
+
+    def test_get_conflicts_sweep_emits_each_pair_once(self, session: Session) -> None:
+        """Three mutually overlapping tasks yield exactly three pairs."""
+        from datetime import date
+
+        for minute in (0, 20, 40):
+            start = datetime(2025, 10, 24, 10, minute)
+            session.add(
+                Task(
+                    title=f"T{minute}", scheduled_datetime=start, original_scheduled_datetime=start
+                )
+            )
+        session.add(
+            Task(
+                title="Later",
+                scheduled_datetime=datetime(2025, 10, 24, 15, 0),
+                original_scheduled_datetime=datetime(2025, 10, 24, 15, 0),
+            )
+        )
+        session.commit()
+
+        conflicts = EventReorderingService.get_conflicts_for_day(
+            date(2025, 10, 24), session=session
+        )
+
+        pairs = {frozenset({c.triggered_event_id, c.conflicting_event_id}) for c in conflicts}
+        assert len(conflicts) == 3
+        assert len(pairs) == 3
+        assert all(c.triggered_start <= c.conflicting_start for c in conflicts)
+
+    def test_get_conflicts_touching_intervals_do_not_conflict(self, session: Session) -> None:
+        """Interval ending exactly when another starts is not an overlap."""
+        from datetime import date
+
+        for hour in (10, 11):
+            start = datetime(2025, 10, 24, hour, 0)
+            session.add(
+                Task(title=f"T{hour}", scheduled_datetime=start, original_scheduled_datetime=start)
+            )
+        session.commit()
+
+        conflicts = EventReorderingService.get_conflicts_for_day(
+            date(2025, 10, 24), session=session
+        )
+        assert conflicts == []
+
+    def test_get_conflicts_query_count_constant(self, session: Session, test_engine) -> None:
+        """One SELECT per entity type, regardless of item count."""
+        from datetime import date
+
+        from sqlalchemy import event
+
+        for minute in range(0, 60, 5):
+            start = datetime(2025, 10, 24, 10, minute)
+            session.add(
+                Task(
+                    title=f"T{minute}", scheduled_datetime=start, original_scheduled_datetime=start
+                )
+            )
+        session.commit()
+        selects: list[str] = []
+
+        def _count(conn, cursor, statement, parameters, context, executemany) -> None:
+            if statement.lstrip().upper().startswith("SELECT"):
+                selects.append(statement)
+
+        event.listen(test_engine, "before_cursor_execute", _count)
+        try:
+            conflicts = EventReorderingService.get_conflicts_for_day(
+                date(2025, 10, 24), session=session
+            )
+        finally:
+            event.remove(test_engine, "before_cursor_execute", _count)
+
+        assert len(conflicts) > 0
+        assert len(selects) == 3
+
+
+class TestGetConflictsForRange:
+    """Tests for get_conflicts_for_range."""
+
+    @staticmethod
+    def _add_overlapping_tasks(session: Session, day: int) -> None:
+        for minute in (0, 30):
+            start = datetime(2025, 10, day, 10, minute)
+            session.add(
+                Task(
+                    title=f"D{day}-{minute}",
+                    scheduled_datetime=start,
+                    original_scheduled_datetime=start,
+                )
+            )
+
+    def test_range_groups_conflicts_by_day(self, session: Session) -> None:
+        """Conflicts are grouped per day, empty days omitted."""
+        from datetime import date
+
+        self._add_overlapping_tasks(session, 3)
+        self._add_overlapping_tasks(session, 7)
+        session.commit()
+
+        by_day = EventReorderingService.get_conflicts_for_range(
+            date(2025, 10, 1), date(2025, 10, 31), session=session
+        )
+
+        assert list(by_day) == [date(2025, 10, 3), date(2025, 10, 7)]
+        assert all(len(conflicts) == 1 for conflicts in by_day.values())
+
+    def test_range_matches_per_day_results(self, session: Session) -> None:
+        """Range result for a day equals get_conflicts_for_day."""
+        from datetime import date
+
+        self._add_overlapping_tasks(session, 3)
+        session.commit()
+
+        by_day = EventReorderingService.get_conflicts_for_range(
+            date(2025, 10, 1), date(2025, 10, 5), session=session
+        )
+        single = EventReorderingService.get_conflicts_for_day(date(2025, 10, 3), session=session)
+
+        assert by_day[date(2025, 10, 3)] == single
+
+    def test_range_excludes_days_outside_window(self, session: Session) -> None:
+        """Items outside the window are not loaded."""
+        from datetime import date
+
+        self._add_overlapping_tasks(session, 3)
+        session.commit()
+
+        by_day = EventReorderingService.get_conflicts_for_range(
+            date(2025, 10, 4), date(2025, 10, 10), session=session
+        )
+        assert by_day == {}
+
+    def test_range_query_count_independent_of_days(self, session: Session, test_engine) -> None:
+        """One SELECT per entity type for the whole range."""
+        from datetime import date
+
+        from sqlalchemy import event
+
+        for day in range(1, 29):
+            self._add_overlapping_tasks(session, day)
+        session.commit()
+        selects: list[str] = []
+
+        def _count(conn, cursor, statement, parameters, context, executemany) -> None:
+            if statement.lstrip().upper().startswith("SELECT"):
+                selects.append(statement)
+
+        event.listen(test_engine, "before_cursor_execute", _count)
+        try:
+            by_day = EventReorderingService.get_conflicts_for_range(
+                date(2025, 10, 1), date(2025, 10, 31), session=session
+            )
+        finally:
+            event.remove(test_engine, "before_cursor_execute", _count)
+
+        assert len(by_day) == 28
+        assert len(selects) == 3
+
+    def test_range_invalid_order_raises(self) -> None:
+        """start_date after end_date is rejected."""
+        from datetime import date
+
+        import pytest
+
+        with pytest.raises(ValueError):
+            EventReorderingService.get_conflicts_for_range(date(2025, 10, 5), date(2025, 10, 1))
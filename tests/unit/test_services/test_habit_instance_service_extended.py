@@ -9,7 +9,9 @@ BRs validadas:
 from datetime import date, time, timedelta
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 
 from timeblock.models import Habit, HabitInstance, Recurrence, Routine, Status
@@ -180,6 +182,278 @@ class TestGenerateInstancesIdempotency:
         )
 
 
+class TestGenerateInstancesBulk:
+    """Testa generate_instances_bulk(). Validates BR-HABIT-003 (set-based)."""
+
+    def test_bulk_generates_for_many_habits(
+        self, everyday_habit: Habit, weekdays_habit: Habit
+    ) -> None:
+        """Gera instâncias de vários hábitos numa única chamada."""
+        assert everyday_habit.id is not None and weekdays_habit.id is not None
+        monday = date(2026, 3, 2)
+        sunday = monday + timedelta(days=6)
+
+        instances = HabitInstanceService.generate_instances_bulk(
+            [everyday_habit.id, weekdays_habit.id], monday, sunday
+        )
+
+        assert len(instances) == 7 + 5
+        assert all(inst.id is not None for inst in instances)
+        assert [inst.date for inst in instances] == sorted(inst.date for inst in instances)
+
+    def test_bulk_only_fills_missing_dates(self, everyday_habit: Habit) -> None:
+        """Datas já existentes são puladas; apenas lacunas são criadas."""
+        assert everyday_habit.id is not None
+        start = date(2026, 3, 2)
+        HabitInstanceService.generate_instances(everyday_habit.id, start, start)
+
+        created = HabitInstanceService.generate_instances_bulk(
+            [everyday_habit.id], start, start + timedelta(days=2)
+        )
+
+        assert [inst.date for inst in created] == [
+            start + timedelta(days=1),
+            start + timedelta(days=2),
+        ]
+
+    def test_bulk_missing_habit_raises(self, everyday_habit: Habit) -> None:
+        """Hábito inexistente aborta a geração."""
+        assert everyday_habit.id is not None
+        with pytest.raises(ValueError, match="not found"):
+            HabitInstanceService.generate_instances_bulk(
+                [everyday_habit.id, 99999], date.today(), date.today()
+            )
+
+    def test_bulk_statement_count_independent_of_range(
+        self, everyday_habit: Habit, test_engine: Engine
+    ) -> None:
+        """Número de statements não cresce com o tamanho do período."""
+        assert everyday_habit.id is not None
+        statements: list[str] = []
+
+        def _count(conn, cursor, statement, parameters, context, executemany) -> None:
+            if statement.lstrip().upper().startswith(("SELECT", "INSERT")):
+                statements.append(statement)
+
+        event.listen(test_engine, "before_cursor_execute", _count)
+        try:
+            created = HabitInstanceService.generate_instances_bulk(
+                [everyday_habit.id], date(2026, 1, 1), date(2026, 12, 31)
+            )
+        finally:
+            event.remove(test_engine, "before_cursor_execute", _count)
+
+        assert len(created) == 365
+        assert len(statements) <= 6
+
+
+class TestUpsertInstances:
+    """Testa upsert_instances(). Validates BR-HABIT-003 (índice único)."""
+
+    def test_upsert_returns_created_count(self, everyday_habit: Habit) -> None:
+        """Retorna quantas instâncias foram efetivamente inseridas."""
+        start = date(2026, 3, 2)
+
+        created = HabitInstanceService.upsert_instances(
+            [everyday_habit], start, start + timedelta(days=4)
+        )
+
+        assert created == 5
+
+    def test_upsert_is_idempotent(self, everyday_habit: Habit, session: Session) -> None:
+        """Segunda chamada no mesmo período não insere nada nem duplica."""
+        start = date(2026, 3, 2)
+        end = start + timedelta(days=2)
+        HabitInstanceService.upsert_instances([everyday_habit], start, end)
+
+        again = HabitInstanceService.upsert_instances([everyday_habit], start, end)
+
+        assert again == 0
+        rows = session.exec(
+            select(HabitInstance).where(HabitInstance.habit_id == everyday_habit.id)
+        ).all()
+        assert len(rows) == 3
+
+    def test_upsert_does_not_ignore_other_violations(
+        self, everyday_habit: Habit, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Só o conflito (habit_id, date) é ignorado; NOT NULL ainda falha."""
+        start = date(2026, 3, 2)
+        invalid_row = {
+            "habit_id": everyday_habit.id,
+            "date": start,
+            "scheduled_start": None,
+            "scheduled_end": time(8, 0),
+            "status": Status.PENDING,
+        }
+        monkeypatch.setattr(
+            HabitInstanceService, "_build_instance_rows", lambda *args, **kwargs: [invalid_row]
+        )
+
+        with pytest.raises(IntegrityError):
+            HabitInstanceService.upsert_instances([everyday_habit], start, start)
+
+
+class TestListInstancesEager:
+    """Testa list_instances com routine_id e load_habit. Validates BR-HABITINSTANCE-006."""
+
+    @staticmethod
+    def _count_selects(engine: Engine, fn) -> tuple[object, int]:
+        selects: list[str] = []
+
+        def _count(conn, cursor, statement, parameters, context, executemany) -> None:
+            if statement.lstrip().upper().startswith("SELECT"):
+                selects.append(statement)
+
+        event.listen(engine, "before_cursor_execute", _count)
+        try:
+            result = fn()
+        finally:
+            event.remove(engine, "before_cursor_execute", _count)
+        return result, len(selects)
+
+    def test_routine_filter_pushed_to_sql(
+        self, everyday_habit: Habit, weekdays_habit: Habit
+    ) -> None:
+        """Apenas instâncias da rotina pedida são retornadas."""
+        assert everyday_habit.id is not None and weekdays_habit.id is not None
+        monday = date(2026, 3, 2)
+        HabitInstanceService.generate_instances_bulk(
+            [everyday_habit.id, weekdays_habit.id], monday, monday
+        )
+
+        instances = HabitInstanceService().list_instances(
+            date_start=monday, date_end=monday, routine_id=everyday_habit.routine_id
+        )
+
+        assert [inst.habit_id for inst in instances] == [everyday_habit.id]
+
+    def test_routine_with_load_habit_single_query(
+        self, everyday_habit: Habit, session: Session, test_engine: Engine
+    ) -> None:
+        """routine_id + load_habit: uma query, sem lazy load por instância."""
+        start = date(2026, 3, 2)
+        for offset in range(5):
+            session.add(
+                Habit(
+                    routine_id=everyday_habit.routine_id,
+                    title=f"Extra {offset}",
+                    scheduled_start=time(10 + offset, 0),
+                    scheduled_end=time(10 + offset, 30),
+                    recurrence=Recurrence.EVERYDAY,
+                )
+            )
+        session.commit()
+        habit_ids = [
+            h.id
+            for h in session.exec(
+                select(Habit).where(Habit.routine_id == everyday_habit.routine_id)
+            ).all()
+        ]
+        HabitInstanceService.generate_instances_bulk(habit_ids, start, start)
+
+        def _list_and_touch() -> list[str]:
+            instances = HabitInstanceService().list_instances(
+                date_start=start,
+                date_end=start,
+                routine_id=everyday_habit.routine_id,
+                load_habit=True,
+            )
+            return [inst.habit.title for inst in instances if inst.habit]
+
+        titles, count = self._count_selects(test_engine, _list_and_touch)
+
+        assert len(titles) == 6
+        assert count == 1
+
+    def test_load_habit_without_routine_uses_selectin(
+        self, everyday_habit: Habit, weekdays_habit: Habit, test_engine: Engine
+    ) -> None:
+        """load_habit sem routine_id: duas queries, independente do volume."""
+        assert everyday_habit.id is not None and weekdays_habit.id is not None
+        monday = date(2026, 3, 2)
+        HabitInstanceService.generate_instances_bulk(
+            [everyday_habit.id, weekdays_habit.id], monday, monday + timedelta(days=6)
+        )
+
+        def _list_and_touch() -> list[str]:
+            instances = HabitInstanceService().list_instances(
+                date_start=monday, date_end=monday + timedelta(days=6), load_habit=True
+            )
+            return [inst.habit.title for inst in instances if inst.habit]
+
+        titles, count = self._count_selects(test_engine, _list_and_touch)
+
+        assert len(titles) == 12
+        assert count == 2
+
+
+class TestListInstancesPage:
+    """Testa list_instances_page (keyset). Validates BR-HABITINSTANCE-006."""
+
+    def test_pages_cover_all_in_order(self, everyday_habit: Habit, weekdays_habit: Habit) -> None:
+        """Páginas encadeadas por after cobrem tudo, sem repetir, em ordem."""
+        assert everyday_habit.id is not None and weekdays_habit.id is not None
+        monday = date(2026, 3, 2)
+        HabitInstanceService.generate_instances_bulk(
+            [everyday_habit.id, weekdays_habit.id], monday, monday + timedelta(days=13)
+        )
+        service = HabitInstanceService()
+
+        seen: list[HabitInstance] = []
+        after = None
+        while page := service.list_instances_page(limit=5, after=after):
+            seen.extend(page)
+            after = page[-1].id
+
+        keys = [(inst.date, inst.scheduled_start, inst.id) for inst in seen]
+        assert len(seen) == 24  # 14 EVERYDAY + 10 WEEKDAYS
+        assert keys == sorted(keys)
+        assert len({inst.id for inst in seen}) == 24
+
+    def test_status_filter_in_sql(self, everyday_habit: Habit, session: Session) -> None:
+        """Filtro de status é aplicado antes do limit."""
+        assert everyday_habit.id is not None
+        start = date(2026, 3, 2)
+        instances = HabitInstanceService.generate_instances(
+            everyday_habit.id, start, start + timedelta(days=9), session=session
+        )
+        for inst in instances[:7]:
+            inst.status = Status.DONE
+        session.commit()
+
+        page = HabitInstanceService().list_instances_page(
+            habit_id=everyday_habit.id, status=Status.PENDING, limit=5
+        )
+
+        assert [inst.date for inst in page] == [start + timedelta(days=d) for d in (7, 8, 9)]
+
+    def test_page_loads_habit_in_single_query(
+        self, everyday_habit: Habit, test_engine: Engine
+    ) -> None:
+        """Página com habit carregado em uma única query."""
+        assert everyday_habit.id is not None
+        start = date(2026, 3, 2)
+        HabitInstanceService.generate_instances(everyday_habit.id, start, start + timedelta(30))
+
+        def _page_and_touch() -> list[str]:
+            page = HabitInstanceService().list_instances_page(limit=10)
+            return [inst.habit.title for inst in page if inst.habit]
+
+        titles, count = TestListInstancesEager._count_selects(test_engine, _page_and_touch)
+
+        assert len(titles) == 10
+        assert count == 1
+
+    def test_invalid_arguments(self, everyday_habit: Habit) -> None:
+        """limit < 1 e after inexistente são inválidos."""
+        service = HabitInstanceService()
+        with pytest.raises(ValueError):
+            service.list_instances_page(limit=0)
+        with pytest.raises(ValueError, match="not found"):
+            service.list_instances_page(after=9999)
+
+
 class TestMarkCompleted:
     """Testa método mark_completed(). Validates BR-HABITINSTANCE-001."""
 
@@ -4,12 +4,18 @@ Skip de HabitInstance com categorização.
 Valida regras de negócio para skip com SkipReason e nota opcional.
 """
 
-from datetime import date, datetime, time
+from datetime import date, datetime, time, timedelta
 
 import pytest
 from sqlmodel import Session
 
-from timeblock.models.enums import DoneSubstatus, NotDoneSubstatus, SkipReason, Status
+from timeblock.models.enums import (
+    DoneSubstatus,
+    NotDoneSubstatus,
+    SkipReason,
+    Status,
+    TimerStatus,
+)
 from timeblock.models.habit import Habit, Recurrence
 from timeblock.models.habit_instance import HabitInstance
 from timeblock.models.routine import Routine
@@ -339,6 +345,45 @@ class TestBRHabitSkip001Errors:
                 session=session,
             )
 
+    def test_br_skip_001_scenario_009b_reset_timer_does_not_block(
+        self, session: Session, habit: Habit
+    ):
+        """CENÁRIO 9b: Timer resetado (CANCELLED sem end_time) não bloqueia skip."""
+        assert habit.id is not None
+
+        # DADO: Instance com timer resetado
+        instance = HabitInstance(
+            habit_id=habit.id,
+            date=date.today(),
+            scheduled_start=time(7, 0),
+            scheduled_end=time(8, 30),
+            status=Status.PENDING,
+        )
+        session.add(instance)
+        session.commit()
+        session.refresh(instance)
+        assert instance.id is not None
+
+        timelog = TimeLog(
+            habit_instance_id=instance.id,
+            start_time=datetime.now(),
+            end_time=None,
+            status=TimerStatus.CANCELLED,
+        )
+        session.add(timelog)
+        session.commit()
+
+        # QUANDO
+        result = HabitInstanceService().skip_habit_instance(
+            habit_instance_id=instance.id,
+            skip_reason=SkipReason.HEALTH,
+            skip_note=None,
+            session=session,
+        )
+
+        # ENTÃO
+        assert result.status == Status.NOT_DONE
+
     def test_br_skip_001_scenario_010_error_already_completed(self, session: Session, habit: Habit):
         """CENÁRIO 10: Erro - Instância já completada."""
         assert habit.id is not None
@@ -431,11 +476,11 @@ class TestBRHabitSkip001AllCategories:
 
         service = HabitInstanceService()
 
-        for category in categories:
-            # Criar instance
+        for offset, category in enumerate(categories):
+            # Criar instance (uma por dia: BR-HABIT-003)
             instance = HabitInstance(
                 habit_id=habit.id,
-                date=date.today(),
+                date=date.today() + timedelta(days=offset),
                 scheduled_start=time(7, 0),
                 scheduled_end=time(8, 30),
                 status=Status.PENDING,
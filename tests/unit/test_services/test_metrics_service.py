@@ -0,0 +1,173 @@
+"""Testes para MetricsService e CompletionHistory.
+
+Valida janelas arbitrárias por soma de prefixo, streaks e leitura do
+rollup habit_day_stats.
+
+Referências:
+    - BR-TUI-033: MetricsPanel (streak, completude)
+"""
+
+import re
+from datetime import date, time, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from timeblock.models import Habit, HabitInstance, Recurrence, Routine
+from timeblock.models.enums import Status
+from timeblock.services.metrics_service import CompletionHistory, MetricsService, Streak
+
+END = date(2025, 3, 31)
+
+
+def _history(pattern: str, end: date = END) -> CompletionHistory:
+    """Histórico a partir de string: F=100%, P=50%, .=0%, espaço=sem dados."""
+    start = end - timedelta(days=len(pattern) - 1)
+    values = {"F": (2, 2), "P": (1, 2), ".": (0, 2)}
+    days = {start + timedelta(days=i): values[c] for i, c in enumerate(pattern) if c in values}
+    return CompletionHistory(start, end, days)
+
+
+class TestCompletionHistory:
+    """Janelas e streaks sobre o array denso."""
+
+    def test_completion_rate_windows(self) -> None:
+        """Média diária considera só dias com dados da janela."""
+        history = _history("FFFF  P.FF")
+
+        assert history.completion_rate(2) == 100
+        assert history.completion_rate(4) == 62  # (50 + 0 + 100 + 100) / 4
+        assert history.completion_rate(10) == 81  # 650 / 8 dias com dados
+        assert history.completion_rate(365) == 81
+        assert history.active_days(6) == 4
+
+    def test_completion_rate_with_end(self) -> None:
+        """end desloca a janela para o passado."""
+        history = _history("FFFF..")
+        assert history.completion_rate(4, end=END - timedelta(days=2)) == 100
+
+    def test_completion_rate_rejects_empty_window(self) -> None:
+        """window < 1 é inválido."""
+        with pytest.raises(ValueError):
+            _history("F").completion_rate(0)
+
+    def test_current_streak(self) -> None:
+        """Streak atual termina no último dia; gap quebra sequência."""
+        assert _history("FF FFF").current_streak() == 3
+        assert _history("FFFP").current_streak() == 0
+        assert _history("FFFP").current_streak(END - timedelta(days=1)) == 3
+
+    def test_streak_history(self) -> None:
+        """Sequências em ordem cronológica com início e fim."""
+        history = _history("FF.FFF P")
+        assert [s.length for s in history.streak_history()] == [2, 3]
+        assert history.streak_history()[0] == Streak(
+            start=END - timedelta(days=7), end=END - timedelta(days=6)
+        )
+
+    def test_best_streak_between_clips_edges(self) -> None:
+        """Sequências que cruzam as bordas são cortadas no período."""
+        history = _history("FFFFF.FF.FFF")
+        start = END - timedelta(days=11)
+
+        assert history.best_streak_between(start, END) == 5
+        assert history.best_streak_between(start + timedelta(days=2), END) == 3
+        assert (
+            history.best_streak_between(start + timedelta(days=3), start + timedelta(days=7)) == 2
+        )
+        assert history.best_streak_between(END - timedelta(days=1), END) == 2
+
+    def test_best_streak_between_matches_brute_force(self) -> None:
+        """Resultado O(1) coincide com varredura ingênua em todos os períodos."""
+        pattern = "FF.FFFF P.FFF..FFFFFF.F"
+        history = _history(pattern)
+        start = END - timedelta(days=len(pattern) - 1)
+        for lo in range(len(pattern)):
+            for hi in range(lo, len(pattern)):
+                best = max(len(run) for run in re.split("[^F]", pattern[lo : hi + 1]))
+                assert (
+                    history.best_streak_between(
+                        start + timedelta(days=lo), start + timedelta(days=hi)
+                    )
+                    == best
+                )
+
+    def test_best_streak_between_rejects_inverted_range(self) -> None:
+        """start > end é inválido."""
+        with pytest.raises(ValueError):
+            _history("F").best_streak_between(END, END - timedelta(days=1))
+
+
+def _seed(session: Session, statuses: list[Status]) -> int:
+    """Rotina com um hábito e uma instância por dia até hoje."""
+    routine = Routine(name="Rotina", is_active=True)
+    session.add(routine)
+    session.commit()
+    habit = Habit(
+        routine_id=routine.id,
+        title="Leitura",
+        scheduled_start=time(8, 0),
+        scheduled_end=time(9, 0),
+        recurrence=Recurrence.EVERYDAY,
+    )
+    session.add(habit)
+    session.commit()
+    today = date.today()
+    for offset, status in enumerate(reversed(statuses)):
+        session.add(
+            HabitInstance(
+                habit_id=habit.id,
+                date=today - timedelta(days=offset),
+                scheduled_start=time(8, 0),
+                scheduled_end=time(9, 0),
+                status=status,
+            )
+        )
+    session.commit()
+    assert routine.id is not None
+    return routine.id
+
+
+class TestMetricsService:
+    """MetricsService lê o rollup com uma query."""
+
+    def test_completion_rate_arbitrary_window(self, session: Session) -> None:
+        """Janela de 90 dias sobre histórico de 100 dias."""
+        routine_id = _seed(session, [Status.DONE] * 50 + [Status.PENDING] * 50)
+
+        assert MetricsService.completion_rate(routine_id, 90, session=session) == 44
+        assert MetricsService.completion_rate(routine_id, 7, session=session) == 0
+
+    def test_streak_history_and_best_between(self, session: Session) -> None:
+        """Histórico completo de streaks e melhor streak num período."""
+        routine_id = _seed(session, [Status.DONE] * 40 + [Status.NOT_DONE] + [Status.DONE] * 5)
+        today = date.today()
+
+        streaks = MetricsService.streak_history(routine_id, session=session)
+        assert [s.length for s in streaks] == [40, 5]
+        assert streaks[-1].end == today
+        assert (
+            MetricsService.best_streak_between(
+                routine_id, today - timedelta(days=9), today, session=session
+            )
+            == 5
+        )
+
+    def test_load_history_single_query(self, session: Session, test_engine: Engine) -> None:
+        """Build do histórico executa uma única query."""
+        routine_id = _seed(session, [Status.DONE] * 365)
+        statements: list[str] = []
+
+        def _count(conn, cursor, statement, *args) -> None:
+            statements.append(statement)
+
+        event.listen(test_engine, "before_cursor_execute", _count)
+        try:
+            history = MetricsService.load_history(routine_id, session=session)
+        finally:
+            event.remove(test_engine, "before_cursor_execute", _count)
+
+        assert len(statements) == 1
+        assert history.current_streak() == 365
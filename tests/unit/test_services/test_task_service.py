@@ -144,6 +144,51 @@ class TestListTasks:
         assert tasks[0].title == "Task 2"
 
 
+class TestListTasksPage:
+    """Testes para list_tasks_page (keyset)."""
+
+    def test_pages_cover_all_in_order(self) -> None:
+        """Páginas encadeadas por after, com empates de horário desfeitos por id."""
+        for i in range(7):
+            TaskService.create_task(f"Task {i}", datetime(2025, 10, 20 + i % 3, 10, 0))
+
+        seen = []
+        after = None
+        while page := TaskService.list_tasks_page(limit=3, after=after):
+            seen.extend(page)
+            after = page[-1].id
+
+        keys = [(t.scheduled_datetime, t.id) for t in seen]
+        assert len(seen) == 7
+        assert keys == sorted(keys)
+
+    def test_status_filters(self) -> None:
+        """Status é filtrado no SQL; cancelamento prevalece (BR-TASK-007)."""
+        pending = TaskService.create_task("Pendente", datetime(2025, 10, 20, 10, 0))
+        done = TaskService.create_task("Concluída", datetime(2025, 10, 20, 11, 0))
+        cancelled = TaskService.create_task("Cancelada", datetime(2025, 10, 20, 12, 0))
+        assert done.id and cancelled.id
+        TaskService.complete_task(done.id)
+        TaskService.complete_task(cancelled.id)
+        TaskService.cancel_task(cancelled.id)
+
+        def _titles(status: str) -> list[str]:
+            return [t.title for t in TaskService.list_tasks_page(status=status)]
+
+        assert _titles("pending") == [pending.title]
+        assert _titles("completed") == [done.title]
+        assert _titles("cancelled") == [cancelled.title]
+
+    def test_invalid_arguments(self) -> None:
+        """limit, status e after inválidos levantam ValueError."""
+        with pytest.raises(ValueError):
+            TaskService.list_tasks_page(limit=0)
+        with pytest.raises(ValueError):
+            TaskService.list_tasks_page(status="overdue")
+        with pytest.raises(ValueError, match="not found"):
+            TaskService.list_tasks_page(after=9999)
+
+
 class TestCompleteTask:
     """Testes para complete_task. Validates BR-TASK-002."""
 
@@ -16,7 +16,7 @@ import pytest
 from sqlmodel import Session
 
 from timeblock.models import Habit, HabitInstance, Recurrence, Routine, TimeLog
-from timeblock.models.enums import Status
+from timeblock.models.enums import Status, TimerStatus
 from timeblock.services.timer_service import TimerService
 
 
@@ -140,6 +140,7 @@ class TestBRTimer004:
             start_time=datetime.combine(date.today(), time(9, 0)),
             end_time=datetime.combine(date.today(), time(9, 30)),
             duration_seconds=1800,  # 30 min
+            status=TimerStatus.DONE,
         )
         session.add(timelog1)
         session.commit()
@@ -150,6 +151,7 @@ class TestBRTimer004:
             start_time=datetime.combine(date.today(), time(14, 0)),
             end_time=datetime.combine(date.today(), time(14, 25)),
             duration_seconds=1500,  # 25 min
+            status=TimerStatus.DONE,
         )
         session.add(timelog2)
         session.commit()
@@ -183,6 +185,7 @@ class TestBRTimer004:
                 start_time=datetime.combine(date.today(), time(9 + i * 2, 0)),
                 end_time=datetime.combine(date.today(), time(9 + i * 2, duration // 60)),
                 duration_seconds=duration,
+                status=TimerStatus.DONE,
             )
             session.add(timelog)
         session.commit()
@@ -215,6 +218,7 @@ class TestBRTimer004:
             start_time=datetime.combine(date.today(), time(9, 0)),
             end_time=datetime.combine(date.today(), time(9, 30)),
             duration_seconds=1800,
+            status=TimerStatus.DONE,
         )
         session.add(timelog1)
 
@@ -224,6 +228,7 @@ class TestBRTimer004:
             start_time=datetime.combine(date.today(), time(14, 0)),
             end_time=datetime.combine(date.today(), time(14, 24)),
             duration_seconds=1440,
+            status=TimerStatus.DONE,
         )
         session.add(timelog2)
         session.commit()
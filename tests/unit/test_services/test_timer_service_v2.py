@@ -4,14 +4,16 @@ Timer Service v2 Tests - BR-TIMER-001 and BR-TIMER-006.
 Tests for pause/resume/cancel functionality following ADR-021.
 """
 
-from datetime import date, time
+from datetime import date, datetime, time, timedelta
 from time import sleep
 
 import pytest
-from sqlmodel import Session
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
 
 from timeblock.models import Habit, HabitInstance, Recurrence, Routine, TimeLog
 from timeblock.models.enums import Status, TimerStatus
+from timeblock.services import timer_service
 from timeblock.services.timer_service import TimerService
 
 
@@ -96,7 +98,7 @@ class TestBRTimer001:
         )
         instance2 = HabitInstance(
             habit_id=habit.id,
-            date=date.today(),
+            date=date.today() + timedelta(days=1),
             scheduled_start=time(9, 0),
             scheduled_end=time(10, 0),
             status=Status.PENDING,
@@ -122,7 +124,7 @@ class TestBRTimer001:
         )
         instance2 = HabitInstance(
             habit_id=habit.id,
-            date=date.today(),
+            date=date.today() + timedelta(days=1),
             scheduled_start=time(9, 0),
             scheduled_end=time(10, 0),
             status=Status.PENDING,
@@ -138,6 +140,53 @@ class TestBRTimer001:
         timelog = TimerService.start_timer(instance2.id, session)
         assert timelog is not None
 
+    def test_br_timer_001_database_rejects_second_active(
+        self, session: Session, test_habit_instance: HabitInstance
+    ):
+        """The partial unique index rejects a second RUNNING/PAUSED row."""
+        timelog = TimerService.start_timer(test_habit_instance.id, session)
+        TimerService.pause_timer(timelog.id, session)
+
+        session.add(TimeLog(habit_instance_id=test_habit_instance.id, start_time=datetime.now()))
+        with pytest.raises(IntegrityError):
+            session.commit()
+
+    def test_br_timer_001_concurrent_start_raises_value_error(
+        self,
+        session: Session,
+        test_habit_instance: HabitInstance,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """A start that passes the pre-check loses the race at commit."""
+        TimerService.start_timer(test_habit_instance.id, session)
+        # Simulates another process committing between check and insert
+        monkeypatch.setattr(timer_service, "_find_active_timer", lambda sess: None)
+
+        with pytest.raises(ValueError, match="already active"):
+            TimerService.start_timer(test_habit_instance.id, session)
+
+        monkeypatch.undo()
+        active = TimerService.get_any_active_timer(session)
+        assert active is not None
+        assert len(session.exec(select(TimeLog)).all()) == 1
+
+    def test_br_timer_001_get_active_timer_other_instance(
+        self, session: Session, habit: Habit, test_habit_instance: HabitInstance
+    ):
+        """get_active_timer returns None when the active timer is elsewhere."""
+        other = HabitInstance(
+            habit_id=habit.id,
+            date=date.today() + timedelta(days=1),
+            scheduled_start=time(9, 0),
+            scheduled_end=time(10, 0),
+        )
+        session.add(other)
+        session.commit()
+        timelog = TimerService.start_timer(test_habit_instance.id, session)
+
+        assert TimerService.get_active_timer(test_habit_instance.id, session) == timelog
+        assert TimerService.get_active_timer(other.id, session) is None
+
 
 # ============================================================
 # BR-TIMER-006: Pause Tracking
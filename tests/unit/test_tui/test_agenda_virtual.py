@@ -0,0 +1,198 @@
+"""Tests para renderização virtualizada da agenda (BR-TUI-032).
+
+O layout de blocos independe da hora atual e é memoizado pelo
+fingerprint das instâncias; as colunas renderizam só as linhas
+visíveis e o tick de minuto repinta apenas o marcador.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.containers import VerticalScroll
+
+import timeblock.tui
+from timeblock.tui.widgets import agenda_panel, agenda_renderer
+from timeblock.tui.widgets.agenda_panel import AgendaBlocks, AgendaHours, AgendaPanel
+from timeblock.tui.widgets.agenda_renderer import (
+    assign_columns,
+    build_agenda_content,
+    build_agenda_layout,
+    layout_fingerprint,
+    marker_line,
+    render_block_line,
+)
+
+
+def _instance(name: str, start: int, end: int) -> dict:
+    return {
+        "name": name,
+        "start_minutes": start,
+        "end_minutes": end,
+        "status": "pending",
+        "substatus": None,
+    }
+
+
+# Dia inteiro ocupado: régua 00:00-23:59 (96 linhas)
+FULL_DAY = [_instance(f"H{h:02d}", h * 60, h * 60 + 30) for h in range(24)]
+
+
+class AgendaTestApp(App):
+    """App de teste: agenda na coluna scrollável do dashboard."""
+
+    CSS_PATH = Path(timeblock.tui.__file__).parent / "styles" / "dashboard.tcss"
+
+    def compose(self) -> ComposeResult:
+        yield VerticalScroll(AgendaPanel(id="agenda-content"), id="agenda-column")
+
+
+async def _mount_agenda(pilot) -> AgendaPanel:
+    panel = pilot.app.query_one(AgendaPanel)
+    panel.update_data(FULL_DAY)
+    await pilot.pause()
+    return panel
+
+
+class TestBRTUI032AgendaLayout:
+    """BR-TUI-032: layout de blocos separado do marcador de hora."""
+
+    def test_br_tui_032_layout_matches_full_render(self):
+        """Linhas do layout reproduzem build_agenda_content."""
+        now = datetime(2026, 3, 23, 4, 0)
+        instances = [_instance("A", 540, 600), _instance("B", 570, 660)]
+        layout = build_agenda_layout(instances)
+
+        _, blocks, width = build_agenda_content(instances, now)
+
+        assert layout.height == len(blocks)
+        assert layout.content_width == width
+        lines = range(layout.line_start, layout.line_end + 1)
+        assert [render_block_line(layout, li) for li in lines] == blocks
+
+    def test_br_tui_032_marker_line(self):
+        """Marcador fica no label de 30min que contém a hora atual."""
+        assert marker_line(datetime(2026, 3, 23, 9, 0)) == 36
+        assert marker_line(datetime(2026, 3, 23, 9, 29)) == 36
+        assert marker_line(datetime(2026, 3, 23, 9, 30)) == 38
+
+    def test_br_tui_032_full_day_layout(self):
+        """Régua cobre o dia inteiro quando há blocos de madrugada."""
+        layout = build_agenda_layout(FULL_DAY)
+
+        assert (layout.line_start, layout.line_end) == (0, 95)
+        assert render_block_line(layout, 3) == ""
+
+
+class TestBRTUI032VirtualRendering:
+    """BR-TUI-032: colunas renderizam só as linhas visíveis."""
+
+    @pytest.mark.asyncio
+    async def test_br_tui_032_only_visible_lines_rendered(self):
+        """Em terminal baixo, só as linhas do viewport são montadas."""
+        async with AgendaTestApp().run_test(size=(60, 24)) as pilot:
+            await _mount_agenda(pilot)
+            blocks = pilot.app.query_one(AgendaBlocks)
+
+            assert blocks._layout.height == 96
+            assert 0 < len(blocks._strips) < 24
+            assert max(blocks._strips) < 24
+
+    @pytest.mark.asyncio
+    async def test_br_tui_032_scroll_renders_new_lines(self):
+        """Rolar até o fim monta as linhas finais sob demanda."""
+        async with AgendaTestApp().run_test(size=(60, 24)) as pilot:
+            await _mount_agenda(pilot)
+            blocks = pilot.app.query_one(AgendaBlocks)
+
+            pilot.app.query_one("#agenda-column").scroll_end(animate=False)
+            await pilot.pause()
+
+            assert 95 in blocks._strips
+
+    @pytest.mark.asyncio
+    async def test_br_tui_032_clock_tick_keeps_blocks(self):
+        """refresh_clock não reconstrói blocos; só repinta o marcador."""
+        async with AgendaTestApp().run_test(size=(60, 24)) as pilot:
+            panel = await _mount_agenda(pilot)
+            hours = pilot.app.query_one(AgendaHours)
+            cached = dict(pilot.app.query_one(AgendaBlocks)._strips)
+
+            with (
+                patch.object(agenda_panel, "render_block_line") as blocks_render,
+                patch.object(
+                    agenda_panel, "render_hour_line", wraps=agenda_panel.render_hour_line
+                ) as hours_render,
+            ):
+                hours.set_clock(datetime(2026, 3, 23, 1, 0))
+                panel.refresh_clock()
+                await pilot.pause()
+
+            assert blocks_render.call_count == 0
+            assert hours_render.call_count <= 2
+            assert pilot.app.query_one(AgendaBlocks)._strips == cached
+
+    @pytest.mark.asyncio
+    async def test_br_tui_032_update_data_resets_cache(self):
+        """update_data troca o layout e descarta linhas antigas."""
+        async with AgendaTestApp().run_test(size=(60, 24)) as pilot:
+            panel = await _mount_agenda(pilot)
+            blocks = pilot.app.query_one(AgendaBlocks)
+            before = dict(blocks._strips)
+
+            panel.update_data([_instance("Novo", 540, 600)])
+            await pilot.pause()
+
+            assert blocks._layout.height != 96
+            assert blocks._strips != before
+
+
+class TestBRTUI032LayoutMemo:
+    """BR-TUI-032: layout memoizado por fingerprint das instâncias."""
+
+    def test_br_tui_032_equal_instances_reuse_layout(self):
+        """Cópias com os mesmos campos devolvem o mesmo layout."""
+        instances = [_instance("A", 540, 600), _instance("B", 570, 660)]
+        first = build_agenda_layout(instances)
+
+        with patch.object(agenda_renderer, "assign_columns") as assign:
+            second = build_agenda_layout([dict(i) for i in instances])
+
+        assert second is first
+        assign.assert_not_called()
+
+    def test_br_tui_032_status_change_new_layout(self):
+        """Mudança de status (cor do bloco) gera novo layout."""
+        instances = [_instance("A", 540, 600)]
+        first = build_agenda_layout(instances)
+
+        changed = [{**instances[0], "status": "done", "substatus": "full"}]
+
+        assert build_agenda_layout(changed) is not first
+        assert layout_fingerprint(changed) != layout_fingerprint(instances)
+
+    def test_br_tui_032_overlap_groups(self):
+        """Grupos de sobreposição compartilham a contagem de colunas."""
+        a, b, c = _instance("A", 540, 600), _instance("B", 570, 630), _instance("C", 720, 750)
+
+        col_of, total_cols_of = assign_columns([a, b, c])
+
+        assert (col_of[id(a)], col_of[id(b)], col_of[id(c)]) == (0, 1, 0)
+        assert (total_cols_of[id(a)], total_cols_of[id(b)], total_cols_of[id(c)]) == (2, 2, 1)
+
+    @pytest.mark.asyncio
+    async def test_br_tui_032_same_data_keeps_line_cache(self):
+        """update_data com dados iguais não descarta as linhas renderizadas."""
+        async with AgendaTestApp().run_test(size=(60, 24)) as pilot:
+            panel = await _mount_agenda(pilot)
+            blocks = pilot.app.query_one(AgendaBlocks)
+            cached = dict(blocks._strips)
+
+            with patch.object(agenda_panel, "render_block_line") as blocks_render:
+                panel.update_data([dict(i) for i in FULL_DAY])
+                await pilot.pause()
+
+            blocks_render.assert_not_called()
+            assert blocks._strips == cached
@@ -12,9 +12,14 @@ Referências:
 
 from datetime import date, datetime, time, timedelta
 from types import SimpleNamespace
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
-from timeblock.models.enums import NotDoneSubstatus, Status
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+
+from timeblock.models import Habit, HabitDayStats, HabitInstance, Routine
+from timeblock.models.enums import DoneSubstatus, NotDoneSubstatus, Status
 from timeblock.models.habit import Recurrence
 
 # =========================================================================
@@ -75,39 +80,80 @@ def _make_routine(
     )
 
 
-def _mock_period_session(
-    routine: SimpleNamespace,
-    habits: list[SimpleNamespace],
-    existing_ids_per_call: list[list[int]] | None = None,
-) -> MagicMock:
-    """Cria mock de Session para ensure_period_instances.
+def _seed_period(
+    session: Session,
+    *,
+    recurrence: Recurrence = Recurrence.EVERYDAY,
+    created_days_ago: int = 10,
+) -> int:
+    """Persiste rotina + hábito para testes de geração retroativa."""
+    routine = Routine(
+        name="Rotina Teste",
+        is_active=True,
+        created_at=datetime.now() - timedelta(days=created_days_ago),
+    )
+    session.add(routine)
+    session.commit()
+    assert routine.id is not None
+    session.add(
+        Habit(
+            routine_id=routine.id,
+            title="Hábito",
+            scheduled_start=time(8, 0),
+            scheduled_end=time(9, 0),
+            recurrence=recurrence,
+        )
+    )
+    session.commit()
+    return routine.id
+
+
+def _instances(session: Session) -> list[HabitInstance]:
+    """Lista instâncias persistidas."""
+    return list(session.exec(select(HabitInstance)).all())
+
 
-    Sequência de session.exec():
-      1. select(Routine) → .first() retorna routine
-      2. select(Habit) → .all() retorna habits
-      3+. select(HabitInstance.habit_id) por data → .all() retorna IDs existentes
+def _seed_history(
+    session: Session,
+    days: dict[int, list[Status]],
+    *,
+    best_streak: int = 0,
+) -> int:
+    """Persiste rotina com um hábito por coluna e instâncias por dia.
+
+    days mapeia "dias atrás" para o status de cada hábito naquele dia.
     """
-    session = MagicMock()
-    call_count = {"n": 0}
-    _existing = existing_ids_per_call or []
-
-    def exec_side(query):
-        call_count["n"] += 1
-        result = MagicMock()
-        if call_count["n"] == 1:
-            result.first.return_value = routine
-        elif call_count["n"] == 2:
-            result.all.return_value = habits
-        else:
-            idx = call_count["n"] - 3
-            if idx < len(_existing):
-                result.all.return_value = _existing[idx]
-            else:
-                result.all.return_value = []
-        return result
-
-    session.exec.side_effect = exec_side
-    return session
+    routine = Routine(name="Rotina Teste", is_active=True, best_streak=best_streak)
+    session.add(routine)
+    session.commit()
+    assert routine.id is not None
+    width = max((len(statuses) for statuses in days.values()), default=0)
+    habits = [
+        Habit(
+            routine_id=routine.id,
+            title=f"Hábito {i}",
+            scheduled_start=time(8, 0),
+            scheduled_end=time(9, 0),
+            recurrence=Recurrence.EVERYDAY,
+        )
+        for i in range(width)
+    ]
+    session.add_all(habits)
+    session.commit()
+    today = date.today()
+    for offset, statuses in days.items():
+        for habit, status in zip(habits, statuses, strict=False):
+            session.add(
+                HabitInstance(
+                    habit_id=habit.id,
+                    date=today - timedelta(days=offset),
+                    scheduled_start=time(8, 0),
+                    scheduled_end=time(9, 0),
+                    status=status,
+                )
+            )
+    session.commit()
+    return routine.id
 
 
 # =========================================================================
@@ -119,91 +165,91 @@ class TestBRTUI033R8RetroactiveInstances:
     """BR-TUI-033-R8: Dias sem instâncias recebem PENDING retroativo."""
 
     @patch("timeblock.tui.screens.dashboard.loader.service_action")
-    def test_br_tui_033_creates_pending_for_missing_days(self, mock_sa):
+    def test_br_tui_033_creates_pending_for_missing_days(self, mock_sa, session: Session):
         """Dias sem instância para hábito EVERYDAY geram PENDING retroativo."""
         from timeblock.tui.screens.dashboard.loader import ensure_period_instances
 
-        habit = _make_habit(habit_id=1, recurrence=Recurrence.EVERYDAY)
-        routine = _make_routine(created_at=datetime.now() - timedelta(days=10))
-        added_instances = []
-
-        def side_effect(fn):
-            session = _mock_period_session(routine, [habit])
-            session.add.side_effect = lambda obj: added_instances.append(obj)
-            return fn(session), None
+        routine_id = _seed_period(session)
+        mock_sa.side_effect = lambda fn: (fn(session), None)
 
-        mock_sa.side_effect = side_effect
-        result = ensure_period_instances(routine_id=1, days=7)
+        result = ensure_period_instances(routine_id=routine_id, days=7)
 
-        assert result >= 1, "Deveria criar instâncias retroativas"
-        assert len(added_instances) >= 1
+        assert result == 7, "Deveria criar uma instância por dia retroativo"
+        assert all(inst.status == Status.PENDING for inst in _instances(session))
 
     @patch("timeblock.tui.screens.dashboard.loader.service_action")
-    def test_br_tui_033_respects_recurrence_on_retroactive(self, mock_sa):
+    def test_br_tui_033_respects_recurrence_on_retroactive(self, mock_sa, session: Session):
         """Hábito WEEKDAYS não gera instância retroativa em sábado/domingo."""
         from timeblock.tui.screens.dashboard.loader import ensure_period_instances
 
-        habit = _make_habit(habit_id=1, recurrence=Recurrence.WEEKDAYS)
-        routine = _make_routine(created_at=datetime.now() - timedelta(days=10))
-        added_instances = []
+        routine_id = _seed_period(session, recurrence=Recurrence.WEEKDAYS)
+        mock_sa.side_effect = lambda fn: (fn(session), None)
 
-        def side_effect(fn):
-            session = _mock_period_session(routine, [habit])
-            session.add.side_effect = lambda obj: added_instances.append(obj)
-            return fn(session), None
+        ensure_period_instances(routine_id=routine_id, days=7)
 
-        mock_sa.side_effect = side_effect
-        ensure_period_instances(routine_id=1, days=7)
-
-        for inst in added_instances:
+        for inst in _instances(session):
             weekday = inst.date.weekday()
             assert weekday < 5, (
                 f"Instância criada em {inst.date} (weekday={weekday}) viola recurrence WEEKDAYS"
             )
 
     @patch("timeblock.tui.screens.dashboard.loader.service_action")
-    def test_br_tui_033_no_duplicates_on_existing_dates(self, mock_sa):
+    def test_br_tui_033_no_duplicates_on_existing_dates(self, mock_sa, session: Session):
         """Não cria instância retroativa se já existe uma para aquele dia/hábito."""
         from timeblock.tui.screens.dashboard.loader import ensure_period_instances
 
-        habit = _make_habit(habit_id=1, recurrence=Recurrence.EVERYDAY)
-        routine = _make_routine(created_at=datetime.now() - timedelta(days=10))
-
-        # Todas as datas já têm habit_id=1
-        all_existing = [[1]] * 7
-
-        def side_effect(fn):
-            session = _mock_period_session(routine, [habit], existing_ids_per_call=all_existing)
-            return fn(session), None
+        routine_id = _seed_period(session)
+        mock_sa.side_effect = lambda fn: (fn(session), None)
 
-        mock_sa.side_effect = side_effect
-        result = ensure_period_instances(routine_id=1, days=2)
+        ensure_period_instances(routine_id=routine_id, days=2)
+        result = ensure_period_instances(routine_id=routine_id, days=2)
 
         assert result == 0, "Não deveria criar duplicatas"
+        assert len(_instances(session)) == 2
 
     @patch("timeblock.tui.screens.dashboard.loader.service_action")
-    def test_br_tui_033_respects_routine_created_at_boundary(self, mock_sa):
+    def test_br_tui_033_respects_routine_created_at_boundary(self, mock_sa, session: Session):
         """Não gera instâncias para datas anteriores ao created_at da rotina."""
         from timeblock.tui.screens.dashboard.loader import ensure_period_instances
 
-        routine = _make_routine(created_at=datetime.now() - timedelta(days=3))
-        habit = _make_habit(habit_id=1, recurrence=Recurrence.EVERYDAY)
-        added_instances = []
+        routine_id = _seed_period(session, created_days_ago=3)
+        mock_sa.side_effect = lambda fn: (fn(session), None)
 
-        def side_effect(fn):
-            session = _mock_period_session(routine, [habit])
-            session.add.side_effect = lambda obj: added_instances.append(obj)
-            return fn(session), None
+        ensure_period_instances(routine_id=routine_id, days=7)
 
-        mock_sa.side_effect = side_effect
-        ensure_period_instances(routine_id=1, days=7)
-
-        routine_start = routine.created_at.date()
-        for inst in added_instances:
+        routine_start = date.today() - timedelta(days=3)
+        instances = _instances(session)
+        assert len(instances) == 3
+        for inst in instances:
             assert inst.date >= routine_start, (
                 f"Instância em {inst.date} anterior ao created_at da rotina ({routine_start})"
             )
 
+    @patch("timeblock.tui.screens.dashboard.loader.service_action")
+    def test_br_tui_033_single_statement_per_window(
+        self, mock_sa, session: Session, test_engine: Engine
+    ):
+        """Janela inteira é gerada com um único INSERT (upsert)."""
+        from timeblock.tui.screens.dashboard.loader import ensure_period_instances
+
+        routine_id = _seed_period(session, created_days_ago=60)
+        mock_sa.side_effect = lambda fn: (fn(session), None)
+        inserts: list[str] = []
+
+        def _count(conn, cursor, statement, parameters, context, executemany) -> None:
+            if statement.lstrip().upper().startswith("INSERT"):
+                inserts.append(statement)
+
+        event.listen(test_engine, "before_cursor_execute", _count)
+        try:
+            result = ensure_period_instances(routine_id=routine_id, days=30)
+        finally:
+            event.remove(test_engine, "before_cursor_execute", _count)
+
+        assert result == 30
+        assert len(inserts) == 1
+        assert "ON CONFLICT (habit_id, date) DO NOTHING" in inserts[0]
+
     def test_br_tui_033_none_routine_returns_zero(self):
         """routine_id=None retorna 0 sem erros."""
         from timeblock.tui.screens.dashboard.loader import ensure_period_instances
@@ -221,169 +267,73 @@ class TestBRTUI033R2StreakCalculation:
     """BR-TUI-033-R2: Streak conta apenas dias com DONE praticado."""
 
     @patch("timeblock.tui.screens.dashboard.loader.service_action")
-    def test_br_tui_033_streak_consecutive_done_days(self, mock_sa):
+    def test_br_tui_033_streak_consecutive_done_days(self, mock_sa, session: Session):
         """Streak = número de dias consecutivos com todos hábitos DONE."""
         from timeblock.tui.screens.dashboard.loader import load_metrics
 
-        today = date.today()
-        instances = [
-            _make_instance(
-                inst_id=i + 1, habit_id=1, inst_date=today - timedelta(days=i), status=Status.DONE
-            )
-            for i in range(3)
-        ]
-
-        def side_effect(fn):
-            session = MagicMock()
-            call_count = {"n": 0}
-
-            def exec_side(query):
-                call_count["n"] += 1
-                result = MagicMock()
-                if call_count["n"] == 1:
-                    result.all.return_value = [_make_habit()]
-                else:
-                    result.all.return_value = instances
-                return result
-
-            session.exec.side_effect = exec_side
-            session.get.return_value = _make_routine()
-            return fn(session), None
+        routine_id = _seed_history(session, {i: [Status.DONE] for i in range(3)})
+        mock_sa.side_effect = lambda fn: (fn(session), None)
 
-        mock_sa.side_effect = side_effect
-        metrics = load_metrics(routine_id=1)
+        metrics = load_metrics(routine_id=routine_id)
 
         assert metrics["streak"] == 3
 
     @patch("timeblock.tui.screens.dashboard.loader.service_action")
-    def test_br_tui_033_streak_skip_breaks_like_miss(self, mock_sa):
+    def test_br_tui_033_streak_skip_breaks_like_miss(self, mock_sa, session: Session):
         """Skip (NOT_DONE/SKIPPED) quebra streak igual a ausência."""
         from timeblock.tui.screens.dashboard.loader import load_metrics
 
-        today = date.today()
-        instances = [
-            _make_instance(inst_id=1, habit_id=1, inst_date=today, status=Status.DONE),
-            _make_instance(
-                inst_id=2,
-                habit_id=1,
-                inst_date=today - timedelta(days=1),
-                status=Status.NOT_DONE,
-                not_done_substatus=NotDoneSubstatus.SKIPPED_JUSTIFIED,
-            ),
-            _make_instance(
-                inst_id=3,
-                habit_id=1,
-                inst_date=today - timedelta(days=2),
-                status=Status.DONE,
-            ),
-        ]
-
-        def side_effect(fn):
-            session = MagicMock()
-            call_count = {"n": 0}
-
-            def exec_side(query):
-                call_count["n"] += 1
-                result = MagicMock()
-                if call_count["n"] == 1:
-                    result.all.return_value = [_make_habit()]
-                else:
-                    result.all.return_value = instances
-                return result
-
-            session.exec.side_effect = exec_side
-            session.get.return_value = _make_routine()
-            return fn(session), None
-
-        mock_sa.side_effect = side_effect
-        metrics = load_metrics(routine_id=1)
+        routine_id = _seed_history(
+            session, {0: [Status.DONE], 1: [Status.NOT_DONE], 2: [Status.DONE]}
+        )
+        mock_sa.side_effect = lambda fn: (fn(session), None)
+
+        metrics = load_metrics(routine_id=routine_id)
 
         assert metrics["streak"] == 1
 
     @patch("timeblock.tui.screens.dashboard.loader.service_action")
-    def test_br_tui_033_streak_two_misses_breaks(self, mock_sa):
+    def test_br_tui_033_streak_two_misses_breaks(self, mock_sa, session: Session):
         """Dois dias consecutivos sem DONE quebram streak (grace period)."""
         from timeblock.tui.screens.dashboard.loader import load_metrics
 
-        today = date.today()
-        instances = [
-            _make_instance(inst_id=1, habit_id=1, inst_date=today, status=Status.PENDING),
-            _make_instance(
-                inst_id=2,
-                habit_id=1,
-                inst_date=today - timedelta(days=1),
-                status=Status.PENDING,
-            ),
-            *[
-                _make_instance(
-                    inst_id=i + 3,
-                    habit_id=1,
-                    inst_date=today - timedelta(days=i + 2),
-                    status=Status.DONE,
-                )
-                for i in range(4)
-            ],
-        ]
-
-        def side_effect(fn):
-            session = MagicMock()
-            call_count = {"n": 0}
-
-            def exec_side(query):
-                call_count["n"] += 1
-                result = MagicMock()
-                if call_count["n"] == 1:
-                    result.all.return_value = [_make_habit()]
-                else:
-                    result.all.return_value = instances
-                return result
-
-            session.exec.side_effect = exec_side
-            session.get.return_value = _make_routine()
-            return fn(session), None
-
-        mock_sa.side_effect = side_effect
-        metrics = load_metrics(routine_id=1)
+        days = {0: [Status.PENDING], 1: [Status.PENDING]}
+        days.update({i + 2: [Status.DONE] for i in range(4)})
+        routine_id = _seed_history(session, days)
+        mock_sa.side_effect = lambda fn: (fn(session), None)
+
+        metrics = load_metrics(routine_id=routine_id)
 
         assert metrics["streak"] == 0
 
+    @patch("timeblock.tui.screens.dashboard.loader.service_action")
+    def test_br_tui_033_partial_day_breaks_streak(self, mock_sa, session: Session):
+        """Dia com apenas parte dos hábitos DONE não conta para o streak."""
+        from timeblock.tui.screens.dashboard.loader import load_metrics
+
+        routine_id = _seed_history(
+            session,
+            {0: [Status.DONE, Status.DONE], 1: [Status.DONE, Status.PENDING]},
+        )
+        mock_sa.side_effect = lambda fn: (fn(session), None)
+
+        metrics = load_metrics(routine_id=routine_id)
+
+        assert metrics["streak"] == 1
+
 
 class TestBRTUI033R1HeatmapTotalHabits:
     """BR-TUI-033-R1: Heatmap mostra done/total, não 0/0."""
 
     @patch("timeblock.tui.screens.dashboard.loader.service_action")
-    def test_br_tui_033_heatmap_shows_total_habits(self, mock_sa):
+    def test_br_tui_033_heatmap_shows_total_habits(self, mock_sa, session: Session):
         """Dias com instâncias PENDING mostram 0/N no heatmap, não 0/0."""
         from timeblock.tui.screens.dashboard.loader import load_metrics
 
-        today = date.today()
-        instances = [
-            _make_instance(inst_id=1, habit_id=1, inst_date=today, status=Status.PENDING),
-            _make_instance(inst_id=2, habit_id=2, inst_date=today, status=Status.PENDING),
-        ]
-
-        def side_effect(fn):
-            session = MagicMock()
-            call_count = {"n": 0}
-
-            def exec_side(query):
-                call_count["n"] += 1
-                result = MagicMock()
-                if call_count["n"] == 1:
-                    result.all.return_value = [
-                        _make_habit(habit_id=1),
-                        _make_habit(habit_id=2),
-                    ]
-                else:
-                    result.all.return_value = instances
-                return result
-
-            session.exec.side_effect = exec_side
-            session.get.return_value = _make_routine()
-            return fn(session), None
-
-        mock_sa.side_effect = side_effect
-        metrics = load_metrics(routine_id=1)
+        routine_id = _seed_history(session, {0: [Status.PENDING, Status.PENDING]})
+        mock_sa.side_effect = lambda fn: (fn(session), None)
+
+        metrics = load_metrics(routine_id=routine_id)
 
         assert metrics.get("week_data"), "week_data não pode ser vazio"
         today_entry = metrics["week_data"][-1]
@@ -391,6 +341,42 @@ class TestBRTUI033R1HeatmapTotalHabits:
         assert total == 2, f"Total deveria ser 2, obteve {total}"
         assert done == 0, f"Done deveria ser 0, obteve {done}"
 
+    @patch("timeblock.tui.screens.dashboard.loader.service_action")
+    def test_br_tui_033_heatmap_checks_follow_schedule_order(self, mock_sa, session: Session):
+        """Marcas do dia seguem o horário dos hábitos, não done primeiro."""
+        from timeblock.tui.screens.dashboard.loader import load_metrics
+
+        routine = Routine(name="Rotina Teste", is_active=True)
+        session.add(routine)
+        session.commit()
+        assert routine.id is not None
+        # Inserido fora de ordem: o hábito das 07h (PENDING) vem antes na agenda
+        for hour, status in ((9, Status.DONE), (7, Status.PENDING), (8, Status.DONE)):
+            habit = Habit(
+                routine_id=routine.id,
+                title=f"Hábito {hour}h",
+                scheduled_start=time(hour, 0),
+                scheduled_end=time(hour, 30),
+                recurrence=Recurrence.EVERYDAY,
+            )
+            session.add(habit)
+            session.commit()
+            session.add(
+                HabitInstance(
+                    habit_id=habit.id,
+                    date=date.today(),
+                    scheduled_start=time(hour, 0),
+                    scheduled_end=time(hour, 30),
+                    status=status,
+                )
+            )
+        session.commit()
+        mock_sa.side_effect = lambda fn: (fn(session), None)
+
+        metrics = load_metrics(routine_id=routine.id)
+
+        assert metrics["week_data"][-1][3] == ".vv"
+
 
 # =========================================================================
 # BR-TUI-033-R7/R13/R14: Keybinding f, footer contextual, mock text
@@ -495,41 +481,15 @@ class TestBRTUI033Completude14d:
     """BR-TUI-033: load_metrics retorna pct_14d além de pct_7d e pct_30d."""
 
     @patch("timeblock.tui.screens.dashboard.loader.service_action")
-    def test_br_tui_033_completude_14d_in_metrics(self, mock_sa):
+    def test_br_tui_033_completude_14d_in_metrics(self, mock_sa, session: Session):
         """load_metrics retorna pct_14d calculado corretamente."""
         from timeblock.tui.screens.dashboard.loader import load_metrics
 
-        today = date.today()
         # 10 dias de instâncias DONE, restante sem instância
-        instances = [
-            _make_instance(
-                inst_id=i + 1,
-                habit_id=1,
-                inst_date=today - timedelta(days=i),
-                status=Status.DONE,
-            )
-            for i in range(10)
-        ]
+        routine_id = _seed_history(session, {i: [Status.DONE] for i in range(10)})
+        mock_sa.side_effect = lambda fn: (fn(session), None)
 
-        def side_effect(fn):
-            session = MagicMock()
-            call_count = {"n": 0}
-
-            def exec_side(query):
-                call_count["n"] += 1
-                result = MagicMock()
-                if call_count["n"] == 1:
-                    result.all.return_value = [_make_habit()]
-                else:
-                    result.all.return_value = instances
-                return result
-
-            session.exec.side_effect = exec_side
-            session.get.return_value = _make_routine()
-            return fn(session), None
-
-        mock_sa.side_effect = side_effect
-        metrics = load_metrics(routine_id=1)
+        metrics = load_metrics(routine_id=routine_id)
 
         assert "pct_14d" in metrics, "load_metrics deveria retornar pct_14d"
         assert metrics["pct_14d"] > 0, "pct_14d deveria ser > 0 com 10 dias DONE"
@@ -541,102 +501,125 @@ class TestBRTUI033Completude14d:
 
 
 class TestBRTUI033R3BestStreakPersisted:
-    """BR-TUI-033-R3: best_streak persiste o maior valor no banco."""
+    """BR-TUI-033-R3: best_streak considera todo o histórico."""
 
     @patch("timeblock.tui.screens.dashboard.loader.service_action")
-    def test_br_tui_033_best_streak_from_db_when_higher(self, mock_sa):
-        """best_streak retornado é o persistido quando maior que o da janela."""
+    def test_br_tui_033_best_streak_from_db_when_higher(self, mock_sa, session: Session):
+        """best_streak retornado é o persistido quando maior que o histórico."""
         from timeblock.tui.screens.dashboard.loader import load_metrics
 
-        today = date.today()
-        # Janela atual: 2 dias DONE (streak=2, window_best=2)
-        instances = [
-            _make_instance(
-                inst_id=i + 1,
-                habit_id=1,
-                inst_date=today - timedelta(days=i),
-                status=Status.DONE,
-            )
-            for i in range(2)
-        ]
+        # Histórico: 2 dias DONE; Routine com best_streak=15 (de meses atrás)
+        routine_id = _seed_history(session, {i: [Status.DONE] for i in range(2)}, best_streak=15)
+        mock_sa.side_effect = lambda fn: (fn(session), None)
 
-        # Routine com best_streak=15 persistido (de meses atrás)
-        routine_obj = _make_routine(routine_id=1)
-        routine_obj.best_streak = 15
+        metrics = load_metrics(routine_id=routine_id)
 
-        def side_effect(fn):
-            session = MagicMock()
-            call_count = {"n": 0}
+        assert metrics["best_streak"] == 15, (
+            f"best_streak deveria ser 15 (persistido), obteve {metrics['best_streak']}"
+        )
 
-            def exec_side(query):
-                call_count["n"] += 1
-                result = MagicMock()
-                if call_count["n"] == 1:
-                    result.all.return_value = [_make_habit()]
-                else:
-                    result.all.return_value = instances
-                return result
+    @patch("timeblock.tui.screens.dashboard.loader.service_action")
+    def test_br_tui_033_best_streak_all_time_beyond_window(self, mock_sa, session: Session):
+        """Streak de 40 dias encerrado há 35 dias conta como melhor histórico."""
+        from timeblock.tui.screens.dashboard.loader import load_metrics
 
-            session.exec.side_effect = exec_side
-            session.get.return_value = routine_obj
-            return fn(session), None
+        days = {i: [Status.DONE] for i in range(35, 75)}
+        days.update({i: [Status.DONE] for i in range(3)})
+        days[3] = [Status.NOT_DONE]
+        routine_id = _seed_history(session, days, best_streak=3)
+        mock_sa.side_effect = lambda fn: (fn(session), None)
 
-        mock_sa.side_effect = side_effect
-        metrics = load_metrics(routine_id=1)
+        metrics = load_metrics(routine_id=routine_id)
 
-        assert metrics["best_streak"] == 15, (
-            f"best_streak deveria ser 15 (persistido), obteve {metrics['best_streak']}"
-        )
+        assert metrics["streak"] == 3
+        assert metrics["best_streak"] == 40
 
     @patch("timeblock.tui.screens.dashboard.loader.service_action")
-    def test_br_tui_033_best_streak_updates_db_when_new_record(self, mock_sa):
-        """Atualiza best_streak no banco quando streak atual supera o persistido."""
+    def test_br_tui_033_metrics_read_path_does_not_write(
+        self, mock_sa, session: Session, test_engine: Engine
+    ):
+        """load_metrics só lê: nenhum UPDATE/INSERT em routines."""
         from timeblock.tui.screens.dashboard.loader import load_metrics
 
-        today = date.today()
-        # 5 dias consecutivos DONE
-        instances = [
-            _make_instance(
-                inst_id=i + 1,
-                habit_id=1,
-                inst_date=today - timedelta(days=i),
-                status=Status.DONE,
-            )
-            for i in range(5)
-        ]
+        routine_id = _seed_history(session, {i: [Status.DONE] for i in range(5)}, best_streak=3)
+        mock_sa.side_effect = lambda fn: (fn(session), None)
+        writes: list[str] = []
 
-        # Routine com best_streak=3 (inferior ao atual)
-        routine_obj = _make_routine(routine_id=1)
-        routine_obj.best_streak = 3
+        def _track(conn, cursor, statement, parameters, context, executemany) -> None:
+            if not statement.lstrip().upper().startswith("SELECT"):
+                writes.append(statement)
 
-        def side_effect(fn):
-            session = MagicMock()
-            call_count = {"n": 0}
+        event.listen(test_engine, "before_cursor_execute", _track)
+        try:
+            metrics = load_metrics(routine_id=routine_id)
+        finally:
+            event.remove(test_engine, "before_cursor_execute", _track)
 
-            def exec_side(query):
-                call_count["n"] += 1
-                result = MagicMock()
-                if call_count["n"] == 1:
-                    result.all.return_value = [_make_habit()]
-                else:
-                    result.all.return_value = instances
-                return result
+        assert metrics["best_streak"] == 5
+        assert writes == []
 
-            session.exec.side_effect = exec_side
-            session.get.return_value = routine_obj
 
-            def track_commit():
-                pass
+# =========================================================================
+# Rollup habit_day_stats
+# =========================================================================
 
-            session.commit.side_effect = track_commit
-            return fn(session), None
 
-        mock_sa.side_effect = side_effect
-        metrics = load_metrics(routine_id=1)
+def _day_stats(session: Session, routine_id: int) -> dict[date, tuple[int, int]]:
+    """Lê o rollup como {data: (done, total)}."""
+    session.expire_all()
+    rows = session.exec(select(HabitDayStats).where(HabitDayStats.routine_id == routine_id)).all()
+    return {r.date: (r.done, r.total) for r in rows}
 
-        assert metrics["best_streak"] == 5, (
-            f"best_streak deveria ser 5 (novo recorde), obteve {metrics['best_streak']}"
-        )
-        assert routine_obj.best_streak == 5, (
-            "Routine.best_streak deveria ter sido atualizado para 5"
-        )
+
+class TestBRTUI033DayStatsRollup:
+    """Rollup diário mantido incrementalmente pelos triggers."""
+
+    def test_br_tui_033_rollup_tracks_status_changes(self, session: Session):
+        """Insert, mudança de status e delete atualizam done/total do dia."""
+        routine_id = _seed_history(session, {0: [Status.PENDING, Status.PENDING]})
+        today = date.today()
+        assert _day_stats(session, routine_id) == {today: (0, 2)}
+
+        first, second = _instances(session)
+        first.status = Status.DONE
+        session.add(first)
+        session.commit()
+        assert _day_stats(session, routine_id) == {today: (1, 2)}
+
+        first.status = Status.PENDING
+        session.add(first)
+        session.delete(second)
+        session.commit()
+        assert _day_stats(session, routine_id) == {today: (0, 1)}
+
+    def test_br_tui_033_rollup_tracks_service_paths(self, session: Session):
+        """mark_completed e upsert_instances atualizam o rollup."""
+        from timeblock.services.habit_instance_service import HabitInstanceService
+
+        routine_id = _seed_period(session)
+        habit = session.exec(select(Habit)).one()
+        today = date.today()
+        HabitInstanceService.upsert_instances([habit], today, today, session=session)
+        session.commit()
+        assert _day_stats(session, routine_id) == {today: (0, 1)}
+
+        instance = _instances(session)[0]
+        assert instance.id is not None
+        HabitInstanceService.mark_completed(instance.id, DoneSubstatus.FULL, session=session)
+        assert _day_stats(session, routine_id) == {today: (1, 1)}
+
+    def test_br_tui_033_rollup_follows_habit_routine_change(self, session: Session):
+        """Mover hábito de rotina transfere suas contagens."""
+        source = _seed_history(session, {0: [Status.DONE, Status.PENDING]})
+        target = Routine(name="Outra")
+        session.add(target)
+        session.commit()
+        habit = session.exec(select(Habit).where(Habit.title == "Hábito 0")).one()
+        habit.routine_id = target.id  # type: ignore[assignment]
+        session.add(habit)
+        session.commit()
+
+        today = date.today()
+        assert _day_stats(session, source) == {today: (0, 1)}
+        assert target.id is not None
+        assert _day_stats(session, target.id) == {today: (1, 1)}
@@ -0,0 +1,183 @@
+"""Tests para recarga do dashboard por commits externos (BR-TUI-009).
+
+Com banco em arquivo, o dashboard observa `PRAGMA data_version` e só
+recarrega o snapshot quando outra conexão (ex: CLI) fez commit; o tick
+de 60s não faz I/O.
+"""
+
+import asyncio
+import sqlite3
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from timeblock.database.engine import dispose_engines
+from timeblock.services.task_service import TaskService
+from timeblock.tui.app import TimeBlockApp
+from timeblock.tui.screens.dashboard import DashboardScreen, loader
+from timeblock.tui.screens.dashboard.screen import CHANGE_POLL_INTERVAL
+from timeblock.tui.session import service_action
+
+
+@pytest.fixture
+def file_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Aponta a TUI para um banco em arquivo."""
+    path = tmp_path / "tui.db"
+    monkeypatch.setenv("TIMEBLOCK_DB_PATH", str(path))
+    dispose_engines()
+    yield path
+    dispose_engines()
+
+
+async def _settle(pilot) -> None:
+    await pilot.app.workers.wait_for_complete()
+    await pilot.pause()
+
+
+class TestBRTUI009ChangeWatch:
+    """BR-TUI-009: recarga orientada a mudanças no banco."""
+
+    @pytest.mark.asyncio
+    async def test_br_tui_009_external_commit_reloads(self, file_db: Path):
+        """Commit de outra conexão dispara uma recarga do snapshot."""
+        with patch.object(
+            loader, "load_dashboard_snapshot", wraps=loader.load_dashboard_snapshot
+        ) as load:
+            async with TimeBlockApp().run_test() as pilot:
+                await _settle(pilot)
+                before = load.call_count
+
+                with sqlite3.connect(file_db) as conn:
+                    conn.execute("INSERT INTO tags (name, color) VALUES ('cli', '#fff')")
+                await asyncio.sleep(CHANGE_POLL_INTERVAL * 3)
+                await _settle(pilot)
+
+                assert load.call_count > before
+
+    @pytest.mark.asyncio
+    async def test_br_tui_009_idle_does_not_reload(self, file_db: Path):
+        """Sem commits, o poll não recarrega o snapshot."""
+        with patch.object(
+            loader, "load_dashboard_snapshot", wraps=loader.load_dashboard_snapshot
+        ) as load:
+            async with TimeBlockApp().run_test() as pilot:
+                await _settle(pilot)
+                await asyncio.sleep(CHANGE_POLL_INTERVAL * 2)
+                await _settle(pilot)
+                before = load.call_count
+
+                await asyncio.sleep(CHANGE_POLL_INTERVAL * 3)
+                await _settle(pilot)
+
+                assert load.call_count == before
+
+    @pytest.mark.asyncio
+    async def test_br_tui_009_minute_tick_without_io(self, file_db: Path):
+        """Tick de 60s no mesmo dia não recarrega quando há watcher."""
+        with patch.object(
+            loader, "load_dashboard_snapshot", return_value=loader.DashboardSnapshot()
+        ) as load:
+            async with TimeBlockApp().run_test() as pilot:
+                await _settle(pilot)
+                screen = pilot.app.query_one(DashboardScreen)
+                assert screen._watcher is not None
+                before = load.call_count
+
+                screen._refresh_agenda()
+                await _settle(pilot)
+
+                assert load.call_count == before
+
+    @pytest.mark.asyncio
+    async def test_br_tui_009_memory_db_keeps_periodic_refresh(self):
+        """Banco ':memory:' não tem watcher; tick de 60s recarrega."""
+        with patch.object(
+            loader, "load_dashboard_snapshot", return_value=loader.DashboardSnapshot()
+        ) as load:
+            async with TimeBlockApp().run_test() as pilot:
+                await _settle(pilot)
+                screen = pilot.app.query_one(DashboardScreen)
+                assert screen._watcher is None
+                before = load.call_count
+
+                screen._refresh_agenda()
+                await _settle(pilot)
+
+                assert load.call_count == before + 1
+
+    @pytest.mark.asyncio
+    async def test_br_tui_009_local_action_reloads_once(self, file_db: Path):
+        """Escrita da própria TUI gera uma recarga, não uma segunda pelo poll."""
+        with patch.object(
+            loader, "load_dashboard_snapshot", wraps=loader.load_dashboard_snapshot
+        ) as load:
+            async with TimeBlockApp().run_test() as pilot:
+                await asyncio.sleep(CHANGE_POLL_INTERVAL * 2)
+                await _settle(pilot)
+                screen = pilot.app.query_one(DashboardScreen)
+                before = load.call_count
+
+                service_action(
+                    lambda s: TaskService.create_task("Local", datetime.now(), session=s)
+                )
+                screen._on_crud_done()
+                await asyncio.sleep(CHANGE_POLL_INTERVAL * 3)
+                await _settle(pilot)
+
+                assert load.call_count == before + 1
+
+    @pytest.mark.asyncio
+    async def test_br_tui_009_external_commit_refreshes_header(self, file_db: Path):
+        """Commit externo também recarrega o header (streak, progresso)."""
+        async with TimeBlockApp().run_test() as pilot:
+            await asyncio.sleep(CHANGE_POLL_INTERVAL * 2)
+            await _settle(pilot)
+            screen = pilot.app.query_one(DashboardScreen)
+
+            with patch.object(screen, "_refresh_header") as refresh_header:
+                with sqlite3.connect(file_db) as conn:
+                    conn.execute("INSERT INTO tags (name, color) VALUES ('cli', '#fff')")
+                await asyncio.sleep(CHANGE_POLL_INTERVAL * 3)
+                await _settle(pilot)
+
+            refresh_header.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_br_tui_009_day_rollover_refreshes_header(self, file_db: Path):
+        """Virada de dia recarrega o header junto com o snapshot."""
+        async with TimeBlockApp().run_test() as pilot:
+            await _settle(pilot)
+            screen = pilot.app.query_one(DashboardScreen)
+            screen._current_date = date.today() - timedelta(days=1)
+
+            with patch.object(screen, "_refresh_header") as refresh_header:
+                screen._refresh_agenda()
+                await _settle(pilot)
+
+            refresh_header.assert_called_once()
+            assert screen._current_date == date.today()
+
+    @pytest.mark.asyncio
+    async def test_br_tui_009_startup_ensure_does_not_reload(self, file_db: Path):
+        """Escrita do ensure no startup não volta como DatabaseChanged."""
+        ensure = loader.ensure_startup_instances
+
+        def _ensure_with_write(days: int) -> int:
+            # Commit por outra conexão do pool, como o upsert real
+            with sqlite3.connect(file_db) as conn:
+                conn.execute("INSERT INTO tags (name, color) VALUES ('ensure', '#fff')")
+            return ensure(days=days)
+
+        with (
+            patch.object(loader, "ensure_startup_instances", side_effect=_ensure_with_write),
+            patch.object(DashboardScreen, "on_dashboard_screen_database_changed") as changed,
+        ):
+            async with TimeBlockApp().run_test() as pilot:
+                await _settle(pilot)
+                await asyncio.sleep(CHANGE_POLL_INTERVAL * 3)
+                await _settle(pilot)
+
+                changed.assert_not_called()
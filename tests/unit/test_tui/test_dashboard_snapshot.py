@@ -0,0 +1,142 @@
+"""Tests para load_dashboard_snapshot (BR-TUI-009).
+
+Valida que o refresh do dashboard lê todos os panels numa única
+sessão, com resultado equivalente aos loaders individuais.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import FrozenInstanceError
+from datetime import date, datetime, time, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from timeblock.models import Habit, HabitInstance, Recurrence, Routine, Task, TimeLog
+from timeblock.models.enums import Status, TimerStatus
+from timeblock.tui.screens.dashboard import loader
+
+
+@pytest.fixture
+def tui_engine(test_engine: Engine, monkeypatch: pytest.MonkeyPatch) -> Engine:
+    """Faz service_action usar a engine de teste."""
+
+    @contextmanager
+    def _ctx() -> Iterator[Engine]:
+        yield test_engine
+
+    monkeypatch.setattr("timeblock.tui.session.get_engine_context", _ctx)
+    return test_engine
+
+
+@pytest.fixture
+def seeded(session: Session) -> int:
+    """Rotina ativa com hábito, instância de hoje com timer e uma task."""
+    routine = Routine(name="Manhã", is_active=True, created_at=datetime.now() - timedelta(days=3))
+    session.add(routine)
+    session.commit()
+    habit = Habit(
+        routine_id=routine.id,
+        title="Leitura",
+        scheduled_start=time(8, 0),
+        scheduled_end=time(9, 0),
+        recurrence=Recurrence.EVERYDAY,
+    )
+    session.add(habit)
+    session.commit()
+    instance = HabitInstance(
+        habit_id=habit.id,
+        date=date.today(),
+        scheduled_start=time(8, 0),
+        scheduled_end=time(9, 0),
+        status=Status.PENDING,
+    )
+    session.add(instance)
+    session.commit()
+    session.add(
+        TimeLog(
+            habit_instance_id=instance.id,
+            start_time=datetime.now() - timedelta(minutes=5),
+            status=TimerStatus.RUNNING,
+        )
+    )
+    start = datetime.now() + timedelta(hours=2)
+    session.add(Task(title="Revisar", scheduled_datetime=start, original_scheduled_datetime=start))
+    session.commit()
+    assert routine.id is not None
+    return routine.id
+
+
+class TestBRTUI009DashboardSnapshot:
+    """BR-TUI-009: snapshot do dashboard numa sessão."""
+
+    def test_br_tui_009_snapshot_matches_individual_loaders(
+        self, tui_engine: Engine, seeded: int
+    ) -> None:
+        """Snapshot contém os mesmos dados dos loaders individuais."""
+        snapshot = loader.load_dashboard_snapshot()
+
+        assert (snapshot.routine_id, snapshot.routine_name) == loader.load_active_routine()
+        assert snapshot.instances == loader.load_instances(seeded)
+        assert snapshot.tasks == loader.load_tasks()
+        assert snapshot.metrics == loader.load_metrics(seeded)
+        assert snapshot.timer is not None
+        assert snapshot.timer.name == "Leitura"
+        assert snapshot.instances[0]["status"] == "running"
+
+    def test_br_tui_009_snapshot_single_transaction(self, tui_engine: Engine, seeded: int) -> None:
+        """Um refresh abre uma única transação (uma conexão da engine)."""
+        begins: list[object] = []
+
+        def _on_begin(conn) -> None:
+            begins.append(conn)
+
+        event.listen(tui_engine, "begin", _on_begin)
+        try:
+            loader.load_dashboard_snapshot()
+        finally:
+            event.remove(tui_engine, "begin", _on_begin)
+
+        assert len(begins) == 1
+
+    def test_br_tui_009_snapshot_without_routine(self, tui_engine: Engine) -> None:
+        """Sem rotina ativa: snapshot vazio para hábitos e métricas."""
+        snapshot = loader.load_dashboard_snapshot()
+
+        assert snapshot.routine_id is None
+        assert snapshot.instances == []
+        assert snapshot.metrics == {}
+        assert snapshot.timer is None
+
+    def test_br_tui_009_snapshot_is_immutable(self, tui_engine: Engine) -> None:
+        """Snapshot é imutável (frozen)."""
+        snapshot = loader.load_dashboard_snapshot()
+        with pytest.raises(FrozenInstanceError):
+            snapshot.routine_id = 1  # type: ignore[misc]
+
+
+class TestBRTUI033StartupInstances:
+    """DT-023 + BR-TUI-033-R8: geração de hoje e retroativa numa chamada."""
+
+    def test_br_tui_033_startup_covers_today_and_past(
+        self, tui_engine: Engine, session: Session
+    ) -> None:
+        """Cria instâncias de hoje e dos dias desde created_at."""
+        routine = Routine(name="R", is_active=True, created_at=datetime.now() - timedelta(days=2))
+        session.add(routine)
+        session.commit()
+        session.add(
+            Habit(
+                routine_id=routine.id,
+                title="H",
+                scheduled_start=time(8, 0),
+                scheduled_end=time(9, 0),
+                recurrence=Recurrence.EVERYDAY,
+            )
+        )
+        session.commit()
+
+        assert loader.ensure_startup_instances(days=7) == 3
+        assert loader.ensure_startup_instances(days=7) == 0
@@ -0,0 +1,114 @@
+"""Tests para carga do dashboard em thread worker (BR-TUI-009).
+
+Valida que leituras do banco não rodam no event loop, que refreshes
+sucessivos coalescem e que o indicador de carga é exibido.
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from timeblock.tui.app import TimeBlockApp
+from timeblock.tui.screens.dashboard import DashboardScreen, loader
+from timeblock.tui.screens.dashboard.screen import LOADING_LABEL
+from timeblock.tui.widgets.tasks_panel import TasksPanel
+
+
+def _snapshot(tag: str) -> loader.DashboardSnapshot:
+    """Snapshot mínimo identificável pela task."""
+    return loader.DashboardSnapshot(
+        tasks=[
+            {
+                "id": 1,
+                "name": tag,
+                "proximity": "Hoje",
+                "date": "",
+                "time": "--:--",
+                "status": "pending",
+                "days": 0,
+            }
+        ]
+    )
+
+
+class TestBRTUI009BackgroundRefresh:
+    """BR-TUI-009: refresh do dashboard fora do event loop."""
+
+    @pytest.mark.asyncio
+    async def test_br_tui_009_snapshot_loaded_off_event_loop(self):
+        """load_dashboard_snapshot roda em thread diferente do event loop."""
+        threads: list[threading.Thread] = []
+
+        def _fake() -> loader.DashboardSnapshot:
+            threads.append(threading.current_thread())
+            return _snapshot("worker")
+
+        with patch.object(loader, "load_dashboard_snapshot", side_effect=_fake):
+            async with TimeBlockApp().run_test() as pilot:
+                await pilot.app.workers.wait_for_complete()
+                await pilot.pause()
+                items = pilot.app.query_one(TasksPanel)._tasks
+
+        assert threads
+        assert all(t is not threading.main_thread() for t in threads)
+        assert items[0]["name"] == "worker"
+
+    @pytest.mark.asyncio
+    async def test_br_tui_009_stale_generation_discarded(self):
+        """Snapshot de geração antiga não sobrescreve o mais recente."""
+        with patch.object(loader, "load_dashboard_snapshot", return_value=_snapshot("novo")):
+            async with TimeBlockApp().run_test() as pilot:
+                await pilot.app.workers.wait_for_complete()
+                await pilot.pause()
+                screen = pilot.app.query_one(DashboardScreen)
+                current = screen._refresh_generation
+
+                screen.post_message(DashboardScreen.SnapshotLoaded(_snapshot("velho"), current - 1))
+                await pilot.pause()
+
+                assert pilot.app.query_one(TasksPanel)._tasks[0]["name"] == "novo"
+
+    @pytest.mark.asyncio
+    async def test_br_tui_009_loading_indicator(self):
+        """Indicador aparece com refresh em voo e some ao aplicar."""
+        release = threading.Event()
+
+        def _slow() -> loader.DashboardSnapshot:
+            release.wait(timeout=5)
+            return _snapshot("lento")
+
+        with patch.object(loader, "load_dashboard_snapshot", side_effect=_slow):
+            async with TimeBlockApp().run_test() as pilot:
+                agenda = pilot.app.query_one("#agenda-column")
+                assert agenda.border_subtitle == LOADING_LABEL
+
+                release.set()
+                await pilot.app.workers.wait_for_complete()
+                await pilot.pause()
+                assert agenda.border_subtitle == ""
+
+    @pytest.mark.asyncio
+    async def test_br_tui_009_refresh_coalesces(self):
+        """Refreshes em sequência aplicam apenas o último."""
+        release = threading.Event()
+        calls: list[int] = []
+
+        def _slow() -> loader.DashboardSnapshot:
+            calls.append(1)
+            release.wait(timeout=5)
+            return _snapshot(f"call-{len(calls)}")
+
+        with patch.object(loader, "load_dashboard_snapshot", side_effect=_slow):
+            async with TimeBlockApp().run_test() as pilot:
+                screen = pilot.app.query_one(DashboardScreen)
+                screen.refresh_data()
+                last = screen.refresh_data()
+                generation = screen._refresh_generation
+
+                release.set()
+                await last.wait()
+                await pilot.pause()
+
+                assert screen._refresh_generation == generation
+                assert screen.query_one("#agenda-column").border_subtitle == ""
@@ -0,0 +1,177 @@
+"""Tests para compute_header_metrics (BR-TUI-035).
+
+Valida os agregados SQL do HeaderBar: filtro por rotina, contagem de
+tarefas do dia, próximo item e número de queries constante.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import FrozenInstanceError
+from datetime import date, datetime, time, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from timeblock.models import Habit, HabitInstance, Recurrence, Routine, Task
+from timeblock.models.enums import Status
+from timeblock.tui.widgets.header_data import HeaderMetrics, compute_header_metrics
+
+# Quarta-feira: semana com 3 dias decorridos (seg, ter, qua)
+NOW = datetime(2026, 10, 14, 10, 0)
+TODAY = NOW.date()
+
+
+@pytest.fixture
+def tui_engine(test_engine: Engine, monkeypatch: pytest.MonkeyPatch) -> Engine:
+    """Faz service_action usar a engine de teste."""
+
+    @contextmanager
+    def _ctx() -> Iterator[Engine]:
+        yield test_engine
+
+    monkeypatch.setattr("timeblock.tui.session.get_engine_context", _ctx)
+    return test_engine
+
+
+def _add_habit(session: Session, routine_id: int | None, title: str, start: time) -> Habit:
+    habit = Habit(
+        routine_id=routine_id,
+        title=title,
+        scheduled_start=start,
+        scheduled_end=time(start.hour + 1, 0),
+        recurrence=Recurrence.EVERYDAY,
+    )
+    session.add(habit)
+    session.commit()
+    return habit
+
+
+def _add_instance(session: Session, habit: Habit, day: date, status: Status) -> None:
+    session.add(
+        HabitInstance(
+            habit_id=habit.id,
+            date=day,
+            scheduled_start=habit.scheduled_start,
+            scheduled_end=habit.scheduled_end,
+            status=status,
+        )
+    )
+    session.commit()
+
+
+def _add_task(session: Session, title: str, scheduled: datetime, **kwargs: object) -> None:
+    session.add(
+        Task(
+            title=title,
+            scheduled_datetime=scheduled,
+            original_scheduled_datetime=scheduled,
+            **kwargs,
+        )
+    )
+    session.commit()
+
+
+@pytest.fixture
+def routines(session: Session) -> tuple[Routine, Routine]:
+    """Rotina ativa e inativa, cada uma com hábitos próprios."""
+    active = Routine(name="Manhã", is_active=True)
+    other = Routine(name="Noite", is_active=False)
+    session.add_all([active, other])
+    session.commit()
+    return active, other
+
+
+class TestBRTUI035HeaderMetrics:
+    """BR-TUI-035: métricas do header via agregados SQL."""
+
+    def test_br_tui_035_without_routine(self, tui_engine: Engine) -> None:
+        """Sem rotina ativa: métricas vazias."""
+        assert compute_header_metrics(NOW) == HeaderMetrics()
+
+    def test_br_tui_035_habits_filtered_by_routine(
+        self, tui_engine: Engine, session: Session, routines: tuple[Routine, Routine]
+    ) -> None:
+        """Só hábitos da rotina ativa entram no progresso semanal."""
+        active, other = routines
+        reading = _add_habit(session, active.id, "Leitura", time(7, 0))
+        _add_habit(session, active.id, "Treino", time(18, 0))
+        foreign = _add_habit(session, other.id, "Meditar", time(21, 0))
+
+        _add_instance(session, reading, TODAY - timedelta(days=2), Status.DONE)
+        _add_instance(session, reading, TODAY - timedelta(days=1), Status.DONE)
+        _add_instance(session, reading, TODAY - timedelta(days=7), Status.DONE)
+        _add_instance(session, foreign, TODAY, Status.DONE)
+
+        metrics = compute_header_metrics(NOW)
+
+        assert metrics.routine_name == "Manhã"
+        assert (metrics.habits_done, metrics.habits_expected) == (2, 2 * 3)
+
+    def test_br_tui_035_tasks_progress(self, tui_engine: Engine, session: Session) -> None:
+        """Concluídas hoje + pendentes até o fim do dia; ignora futuras e canceladas."""
+        morning = datetime.combine(TODAY, time(8, 0))
+        _add_task(session, "Feita", morning, completed_datetime=morning)
+        _add_task(session, "Atrasada", morning - timedelta(days=1))
+        _add_task(session, "Tarde", datetime.combine(TODAY, time(15, 0)))
+        _add_task(session, "Amanhã", morning + timedelta(days=1))
+        _add_task(session, "Cancelada", morning, cancelled_datetime=morning)
+        _add_task(
+            session,
+            "Feita ontem",
+            morning - timedelta(days=1),
+            completed_datetime=morning - timedelta(days=1),
+        )
+
+        metrics = compute_header_metrics(NOW)
+
+        assert (metrics.tasks_completed, metrics.tasks_total) == (1, 3)
+
+    def test_br_tui_035_next_item_closest(
+        self, tui_engine: Engine, session: Session, routines: tuple[Routine, Routine]
+    ) -> None:
+        """Próximo item é o pendente mais próximo entre hábito e tarefa."""
+        active, other = routines
+        gym = _add_habit(session, active.id, "Treino", time(11, 0))
+        foreign = _add_habit(session, other.id, "Meditar", time(10, 0))
+        past = _add_habit(session, active.id, "Leitura", time(7, 0))
+        _add_instance(session, gym, TODAY, Status.PENDING)
+        _add_instance(session, foreign, TODAY, Status.PENDING)
+        _add_instance(session, past, TODAY, Status.PENDING)
+        _add_task(session, "Reunião", datetime.combine(TODAY, time(10, 30)))
+
+        metrics = compute_header_metrics(NOW)
+
+        assert (metrics.next_name, metrics.next_minutes) == ("Reunião", 30)
+
+    def test_br_tui_035_query_count_independent_of_tasks(
+        self, tui_engine: Engine, session: Session, routines: tuple[Routine, Routine]
+    ) -> None:
+        """Número de queries não cresce com o volume de tarefas."""
+        active, _ = routines
+        _add_habit(session, active.id, "Leitura", time(7, 0))
+
+        def _count_queries() -> int:
+            statements: list[str] = []
+
+            def _on_execute(conn, cursor, statement, *args) -> None:
+                statements.append(statement)
+
+            event.listen(tui_engine, "before_cursor_execute", _on_execute)
+            try:
+                compute_header_metrics(NOW)
+            finally:
+                event.remove(tui_engine, "before_cursor_execute", _on_execute)
+            return len(statements)
+
+        baseline = _count_queries()
+        for i in range(50):
+            _add_task(session, f"T{i}", datetime.combine(TODAY, time(12, 0)) - timedelta(days=i))
+
+        assert _count_queries() == baseline
+
+    def test_br_tui_035_metrics_immutable(self) -> None:
+        """HeaderMetrics é imutável (frozen)."""
+        with pytest.raises(FrozenInstanceError):
+            HeaderMetrics().habits_done = 1  # type: ignore[misc]
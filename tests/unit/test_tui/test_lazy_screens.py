@@ -0,0 +1,84 @@
+"""Tests for BR-TUI-002: montagem lazy das screens e intervals pausados.
+
+Só o Dashboard é construído no startup; as demais screens são
+importadas e montadas na primeira visita. Screens ocultas pausam seus
+intervals.
+"""
+
+import pytest
+
+from timeblock.tui.app import LAZY_SCREENS, SCREEN_IDS, TimeBlockApp
+
+
+@pytest.mark.asyncio
+class TestBRTUI002LazyScreens:
+    """BR-TUI-002: Screens montadas sob demanda."""
+
+    async def test_br_tui_002_only_dashboard_mounted_on_start(self):
+        """No startup só o Dashboard existe no content-area."""
+        async with TimeBlockApp().run_test() as pilot:
+            assert pilot.app.query("#dashboard-view")
+            for name in LAZY_SCREENS:
+                assert not pilot.app.query(f"#{SCREEN_IDS[name]}"), name
+
+    async def test_br_tui_002_first_visit_mounts_once(self):
+        """Primeira visita monta a screen; visitas seguintes reutilizam."""
+        async with TimeBlockApp().run_test() as pilot:
+            await pilot.press("2")
+            routines = pilot.app.query_one("#routines-view")
+
+            await pilot.press("1")
+            await pilot.press("2")
+
+            assert len(pilot.app.query("#routines-view")) == 1
+            assert pilot.app.query_one("#routines-view") is routines
+            assert not pilot.app.query("#timer-view")
+
+    async def test_br_tui_002_first_paint_measured(self):
+        """Tempo até o primeiro paint do Dashboard é registrado."""
+        async with TimeBlockApp().run_test() as pilot:
+            await pilot.pause()
+            assert pilot.app.first_paint_ms is not None
+            assert pilot.app.first_paint_ms > 0
+
+
+@pytest.mark.asyncio
+class TestBRTUI002HiddenIntervals:
+    """BR-TUI-002: Intervals de screens ocultas ficam pausados."""
+
+    async def test_br_tui_002_timer_interval_paused_when_hidden(self):
+        """TimerScreen oculta não roda o tick de 1s."""
+        async with TimeBlockApp().run_test() as pilot:
+            await pilot.press("5")
+            timer = pilot.app.query_one("#timer-view")
+            assert timer._tick_interval._active.is_set()
+
+            await pilot.press("1")
+            assert not timer._tick_interval._active.is_set()
+
+            await pilot.press("5")
+            assert timer._tick_interval._active.is_set()
+
+    async def test_br_tui_002_dashboard_intervals_paused_when_hidden(self):
+        """Dashboard oculto pausa tick do timer e refresh periódico."""
+        async with TimeBlockApp().run_test() as pilot:
+            dashboard = pilot.app.query_one("#dashboard-view")
+
+            await pilot.press("2")
+            assert not any(i._active.is_set() for i in dashboard._intervals)
+
+            await pilot.press("1")
+            assert all(i._active.is_set() for i in dashboard._intervals)
+
+    async def test_br_tui_002_running_timer_catches_up_after_hidden(self):
+        """Tempo oculto com timer rodando é somado ao voltar."""
+        async with TimeBlockApp().run_test() as pilot:
+            await pilot.press("5")
+            timer = pilot.app.query_one("#timer-view")
+            timer.action_start_timer()
+
+            await pilot.press("1")
+            timer._hidden_at -= 120  # simula 2 minutos oculta
+            await pilot.press("5")
+
+            assert timer.elapsed_seconds >= 120
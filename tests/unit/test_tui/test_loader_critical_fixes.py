@@ -272,12 +272,11 @@ class TestDT049LoadInstancesRoutineFilter:
     @patch("timeblock.tui.screens.dashboard.loader.HabitInstanceService")
     @patch("timeblock.tui.screens.dashboard.loader.service_action")
     def test_dt049_filters_by_routine_id(self, mock_sa, mock_his):
-        """Apenas instâncias da rotina fornecida são retornadas."""
+        """Filtro por rotina é delegado ao SQL, com habit carregado no JOIN."""
         inst_a = _make_instance(inst_id=1, title="H_A", routine_id=10)
-        inst_b = _make_instance(inst_id=2, title="H_B", routine_id=20)
 
         his_instance = MagicMock()
-        his_instance.list_instances.return_value = [inst_a, inst_b]
+        his_instance.list_instances.return_value = [inst_a]
         mock_his.return_value = his_instance
 
         def side_effect(fn):
@@ -288,6 +287,9 @@ class TestDT049LoadInstancesRoutineFilter:
         mock_sa.side_effect = side_effect
         result = load_instances(routine_id=10)
 
+        kwargs = his_instance.list_instances.call_args.kwargs
+        assert kwargs["routine_id"] == 10
+        assert kwargs["load_habit"] is True
         assert len(result) == 1
         assert result[0]["name"] == "H_A"
 
@@ -316,10 +318,8 @@ class TestDT049LoadInstancesRoutineFilter:
     @patch("timeblock.tui.screens.dashboard.loader.service_action")
     def test_dt049_no_match_returns_empty(self, mock_sa, mock_his):
         """Rotina sem instâncias retorna lista vazia."""
-        inst = _make_instance(inst_id=1, routine_id=10)
-
         his_instance = MagicMock()
-        his_instance.list_instances.return_value = [inst]
+        his_instance.list_instances.return_value = []
         mock_his.return_value = his_instance
 
         def side_effect(fn):
@@ -6,13 +6,22 @@ posicionados por recorrência, painel de detalhes e CRUD contextual.
 RED phase: todos devem FALHAR até implementação.
 """
 
+import itertools
+import random
+from unittest.mock import patch
+
 import pytest
+from textual.app import App, ComposeResult
+from textual.widgets import Static
 
+from timeblock.tui.screens import routines
 from timeblock.tui.screens.routines import (
     RoutineBlock,
     RoutinesScreen,
+    build_week_model,
     calculate_visible_days,
     detect_conflicts,
+    group_conflicts,
 )
 from timeblock.tui.widgets.timeblock_grid import calculate_block_height
 
@@ -281,6 +290,37 @@ class TestBRTUI011R08ConflictDisplay:
         detect_conflicts(habits)
         assert len(habits) == 3
 
+    def test_br_tui_011_r08_sweep_matches_pairwise(self):
+        """Sweep-line encontra exatamente os pares da comparação par a par."""
+        rnd = random.Random(11)
+        for _ in range(200):
+            habits = []
+            for i in range(rnd.randint(0, 12)):
+                start = rnd.randrange(360, 1320, 15)
+                end = start + rnd.choice([0, 15, 30, 60, 120])
+                habits.append({"id": i, "start": _hm(start), "end": _hm(end)})
+
+            expected = [
+                (a["id"], b["id"])
+                for a, b in itertools.combinations(habits, 2)
+                if a["start"] < b["end"] and b["start"] < a["end"]
+            ]
+
+            assert detect_conflicts(habits) == expected
+
+    def test_br_tui_011_r08_groups_sorted_intervals(self):
+        """Grupos reúnem sobreposições encadeadas; adjacentes ficam separados."""
+        habits = [
+            {"id": 3, "start": "09:00", "end": "10:00"},
+            {"id": 1, "start": "07:00", "end": "08:00"},
+            {"id": 2, "start": "07:30", "end": "09:00"},
+            {"id": 4, "start": "08:30", "end": "08:45"},
+        ]
+
+        groups = group_conflicts(habits)
+
+        assert [[h["id"] for h in g] for g in groups] == [[1, 2, 4], [3]]
+
 
 # =============================================================================
 # BR-TUI-011-R09: Rotina vazia
@@ -343,3 +383,186 @@ class TestBRTUI011R11Refresh:
         screen._data_loaded = False
         screen.on_focus()
         assert screen._data_loaded is True
+
+
+# =============================================================================
+# BR-TUI-011-R02/R08/R10: Modelo da grade em cache
+# =============================================================================
+
+
+def _hm(minutes: int) -> str:
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+WEEK_HABITS = [
+    {"id": 1, "name": "Academia", "start": "07:00", "end": "08:00", "recurrence": "WEEKDAYS"},
+    {"id": 2, "name": "Leitura", "start": "07:30", "end": "08:30", "recurrence": "MONDAY"},
+    {"id": 3, "name": "Feira", "start": "09:00", "end": "10:00", "recurrence": "SATURDAY"},
+]
+
+
+class RoutinesTestApp(App):
+    """App de teste para montar RoutinesScreen com hábitos."""
+
+    def compose(self) -> ComposeResult:
+        yield RoutinesScreen(habits=list(WEEK_HABITS))
+
+
+class EmptyRoutinesTestApp(App):
+    """App de teste com RoutinesScreen montada sem hábitos (lazy mount)."""
+
+    def compose(self) -> ComposeResult:
+        yield RoutinesScreen(habits=[])
+
+
+class TestBRTUI011GridModel:
+    """BR-TUI-011: placements por dia calculados uma vez por conjunto de hábitos."""
+
+    def test_br_tui_011_model_places_by_recurrence(self):
+        """Cada hábito aparece só nos dias da sua recorrência."""
+        model = build_week_model(WEEK_HABITS)
+
+        ids = [[p.block.habit_id for p in day] for day in model.days]
+
+        assert ids == [[1, 2], [1], [1], [1], [1], [3], []]
+
+    def test_br_tui_011_model_conflict_lanes(self):
+        """Conflito no mesmo dia ocupa lanes lado a lado (R08)."""
+        monday = build_week_model(WEEK_HABITS).days[0]
+
+        assert [(p.lane, p.lanes) for p in monday] == [(0, 2), (1, 2)]
+        assert build_week_model(WEEK_HABITS).days[1][0].lanes == 1
+
+    def test_br_tui_011_model_cached_until_habits_change(self):
+        """get_grid_model reusa o modelo até os hábitos mudarem."""
+        screen = RoutinesScreen(habits=list(WEEK_HABITS))
+        first = screen.get_grid_model()
+
+        assert screen.get_grid_model() is first
+
+        screen.set_habits(
+            [*WEEK_HABITS, {"id": 4, "name": "Nova", "start": "20:00", "end": "21:00"}]
+        )
+
+        assert screen.get_grid_model() is not first
+
+    def test_br_tui_011_r10_resize_reuses_model(self):
+        """Re-render por largura recorta dias sem recalcular o modelo."""
+        screen = RoutinesScreen(habits=list(WEEK_HABITS))
+        screen.get_grid_model()
+
+        with (
+            patch.object(routines, "build_week_model") as build,
+            patch.object(RoutinesScreen, "_visible_days", return_value=3),
+        ):
+            narrow = screen._render_grid()
+
+        build.assert_not_called()
+        assert "Qui" not in narrow
+        assert "07:00 A│07:30 L" in narrow
+
+    def test_br_tui_011_model_many_habits(self):
+        """Rotina com 60+ hábitos: conflitos e modelo consistentes."""
+        rnd = random.Random(3)
+        habits = []
+        for i in range(80):
+            start = rnd.randrange(360, 1320, 15)
+            habits.append({"id": i, "name": f"H{i}", "start": _hm(start), "end": _hm(start + 30)})
+
+        model = build_week_model(habits)
+
+        assert all(len(day) == 80 for day in model.days)
+        lanes = {p.block.habit_id: p.lanes for p in model.days[0]}
+        conflicting = {hid for pair in detect_conflicts(habits) for hid in pair}
+        assert {hid for hid, n in lanes.items() if n > 1} == conflicting
+
+    def test_br_tui_011_r08_many_lanes_overflow(self):
+        """Conflito com muitas lanes não estoura a coluna; excedente vira +N."""
+        habits = [
+            {"id": i, "name": f"Hábito {i}", "start": "07:00", "end": "08:00"} for i in range(20)
+        ]
+        screen = RoutinesScreen(habits=habits)
+
+        with patch.object(RoutinesScreen, "_visible_days", return_value=1):
+            grid = screen._render_grid()
+
+        row = grid.splitlines()[2]
+        assert len(row) <= routines.GRID_COL_WIDTH
+        assert row.count("│") == routines.MAX_GRID_LANES - 1
+        assert row.endswith("+18")
+
+    def test_br_tui_011_r08_chained_conflict_single_row(self):
+        """Grupo encadeado fica numa linha mesmo quando a lane 0 se repete."""
+        habits = [
+            {"id": 1, "name": "A", "start": "08:00", "end": "09:00"},
+            {"id": 2, "name": "B", "start": "08:30", "end": "10:00"},
+            {"id": 3, "name": "C", "start": "09:00", "end": "09:30"},
+            {"id": 4, "name": "D", "start": "11:00", "end": "12:00"},
+        ]
+        screen = RoutinesScreen(habits=habits)
+
+        with patch.object(RoutinesScreen, "_visible_days", return_value=1):
+            rows = screen._render_grid().splitlines()[2:]
+
+        assert [(p.lane, p.group) for p in screen.get_grid_model().days[0]] == [
+            (0, 0),
+            (1, 0),
+            (0, 0),
+            (0, 1),
+        ]
+        assert len(rows) == 2
+        assert rows[0].count("│") == 2
+        assert rows[1] == "11:00 D"
+
+    @pytest.mark.parametrize(
+        ("focused_day", "expected"),
+        [(0, ["Seg", "Ter", "Qua"]), (3, ["Qua", "Qui", "Sex"]), (6, ["Sex", "Sáb", "Dom"])],
+    )
+    def test_br_tui_011_r10_window_follows_focused_day(self, focused_day, expected):
+        """Dias visíveis acompanham focused_day, sem sair da semana."""
+        screen = RoutinesScreen(habits=list(WEEK_HABITS))
+        screen.focused_day = focused_day
+
+        with patch.object(RoutinesScreen, "_visible_days", return_value=3):
+            labels = screen._render_grid().splitlines()[1].split()
+
+        assert labels == expected
+
+    @pytest.mark.asyncio
+    async def test_br_tui_011_r10_terminal_resize_updates_grid(self):
+        """Redimensionar o terminal re-renderiza a grade com o modelo em cache."""
+        async with RoutinesTestApp().run_test(size=(130, 30)) as pilot:
+            screen = pilot.app.query_one(RoutinesScreen)
+            model = screen.get_grid_model()
+            grid = pilot.app.query_one("#routines-grid", Static)
+            assert "Dom" in str(grid.render())
+
+            await pilot.resize_terminal(90, 30)
+            await pilot.pause()
+
+            assert "Dom" not in str(grid.render())
+            assert "Sex" in str(grid.render())
+            assert screen.get_grid_model() is model
+
+    @pytest.mark.asyncio
+    async def test_br_tui_011_set_habits_on_empty_screen_shows_grid(self):
+        """Tela montada vazia exibe a grade quando recebe hábitos (R09)."""
+        async with EmptyRoutinesTestApp().run_test(size=(130, 30)) as pilot:
+            screen = pilot.app.query_one(RoutinesScreen)
+            empty = pilot.app.query_one("#routines-empty", Static)
+            grid = pilot.app.query_one("#routines-grid", Static)
+            assert empty.display
+            assert not grid.parent.display
+
+            screen.set_habits(list(WEEK_HABITS))
+            await pilot.pause()
+
+            assert not empty.display
+            assert grid.parent.display
+            assert "07:00 A" in str(grid.render())
+
+            screen.set_habits([])
+            await pilot.pause()
+
+            assert empty.display
+            assert not grid.parent.display
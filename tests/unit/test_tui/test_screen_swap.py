@@ -32,7 +32,7 @@ class TestBRTUI002ContentSwap:
         async with TimeBlockApp().run_test() as pilot:
             await pilot.press("3")
 
-            assert pilot.app.query_one("#routines-view").display is False
+            assert pilot.app.query_one("#dashboard-view").display is False
             assert pilot.app.query_one("#habits-view").display is True
 
     async def test_br_tui_002_tasks_replaces_content(self):
@@ -88,9 +88,15 @@ class TestBRTUI002ContentSwap:
                 "#timer-view",
             ]
 
-            for key in ["1", "2", "3", "4", "5"]:
+            for key in ["1", "2", "3", "4", "5", "1"]:
                 await pilot.press(key)
-                visible = sum(1 for sid in screen_ids if pilot.app.query_one(sid).display is True)
+                # Screens só existem após a primeira visita (montagem lazy)
+                visible = sum(
+                    1
+                    for sid in screen_ids
+                    for screen in pilot.app.query(sid)
+                    if screen.display is True
+                )
                 assert visible == 1, (
                     f"Esperava 1 screen visível após pressionar '{key}', encontrou {visible}"
                 )
@@ -0,0 +1,133 @@
+"""Tests for TimerStateCache (DT-016).
+
+Valida que o tick do timer calcula elapsed em memória, recarregando
+do banco apenas quando o cache é invalidado.
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from timeblock.models.enums import TimerStatus
+from timeblock.tui.screens.dashboard.timer_state import TimerState, TimerStateCache, format_timer
+
+
+def _make_timelog(
+    *,
+    status: TimerStatus = TimerStatus.RUNNING,
+    minutes: int = 5,
+    paused: int = 0,
+    pause_start: datetime | None = None,
+    now: datetime | None = None,
+) -> SimpleNamespace:
+    """Cria objeto simulando TimeLog retornado por TimerService."""
+    return SimpleNamespace(
+        id=1,
+        status=status,
+        start_time=(now or datetime.now()) - timedelta(minutes=minutes),
+        paused_duration=paused,
+        pause_start=pause_start,
+        habit_instance_id=42,
+    )
+
+
+class TestDT016TimerStateCache:
+    """DT-016: tick do timer sem I/O."""
+
+    def test_dt016_snapshot_loads_once(self) -> None:
+        """Ticks consecutivos não recarregam do banco."""
+        load_fn = MagicMock(return_value=TimerState.from_timelog(_make_timelog(), "Academia"))
+        cache = TimerStateCache(load_fn)
+
+        for _ in range(5):
+            result = cache.snapshot()
+
+        assert load_fn.call_count == 1
+        assert result is not None
+        assert result["name"] == "Academia"
+
+    def test_dt016_idle_snapshot_loads_once(self) -> None:
+        """Sem timer ativo, ticks também não geram queries."""
+        load_fn = MagicMock(return_value=None)
+        cache = TimerStateCache(load_fn)
+
+        assert cache.snapshot() is None
+        assert cache.snapshot() is None
+        assert load_fn.call_count == 1
+
+    def test_dt016_invalidate_forces_reload(self) -> None:
+        """invalidate() recarrega no próximo snapshot."""
+        load_fn = MagicMock(return_value=None)
+        cache = TimerStateCache(load_fn)
+        cache.snapshot()
+        cache.invalidate()
+        cache.snapshot()
+        assert load_fn.call_count == 2
+
+    def test_dt016_apply_pause_preserves_name(self) -> None:
+        """Pause atualiza status em memória mantendo o nome."""
+        cache = TimerStateCache(MagicMock(return_value=None))
+        cache.start(_make_timelog(), "Academia")
+        cache.apply(
+            _make_timelog(status=TimerStatus.PAUSED, pause_start=datetime.now()),
+        )
+        result = cache.snapshot()
+        assert result is not None
+        assert result["status"] == "paused"
+        assert result["name"] == "Academia"
+
+    def test_dt016_apply_none_marks_stale(self) -> None:
+        """Falha na operação de timer força recarga."""
+        load_fn = MagicMock(return_value=None)
+        cache = TimerStateCache(load_fn)
+        cache.start(_make_timelog(), "Academia")
+        cache.apply(None)
+        assert cache.snapshot() is None
+        assert load_fn.call_count == 1
+
+    def test_dt016_clear_returns_idle_without_io(self) -> None:
+        """Stop/cancel limpam o cache sem recarga."""
+        load_fn = MagicMock()
+        cache = TimerStateCache(load_fn)
+        cache.start(_make_timelog(), "Academia")
+        cache.clear()
+        assert cache.snapshot() is None
+        load_fn.assert_not_called()
+
+    def test_dt016_store_seeds_without_io(self) -> None:
+        """store() usa estado já carregado (snapshot) sem chamar load_fn."""
+        load_fn = MagicMock()
+        cache = TimerStateCache(load_fn)
+        cache.store(TimerState.from_timelog(_make_timelog(), "Academia"))
+        result = cache.snapshot()
+        assert result is not None
+        assert result["name"] == "Academia"
+        load_fn.assert_not_called()
+
+
+class TestDT054FormatTimer:
+    """DT-054: elapsed desconta pausas acumuladas e pausa corrente."""
+
+    def test_dt054_paused_subtracts_current_pause(self) -> None:
+        """Pausa corrente é descontada do elapsed."""
+        now = datetime.now()
+        state = TimerState.from_timelog(
+            _make_timelog(
+                status=TimerStatus.PAUSED,
+                minutes=10,
+                paused=60,
+                pause_start=now - timedelta(minutes=2),
+                now=now,
+            )
+        )
+        result = format_timer(state, now)
+        assert result["elapsed_seconds"] == 10 * 60 - 60 - 2 * 60
+
+    def test_dt054_running_ignores_stale_pause_start(self) -> None:
+        """pause_start só é considerado quando PAUSED."""
+        now = datetime.now()
+        state = TimerState.from_timelog(
+            _make_timelog(minutes=10, pause_start=now - timedelta(minutes=5), now=now)
+        )
+        assert state.pause_start is None
+        assert format_timer(state, now)["elapsed_seconds"] == 10 * 60
@@ -9,10 +9,14 @@ import json
 import logging
 import os
 import tempfile
+import threading
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from timeblock.utils import logger as logger_module
 from timeblock.utils.logger import (
     _reset_for_testing,
     configure_logging,
@@ -181,7 +185,10 @@ class TestLogRotation:
                 )
                 logger = get_logger("timeblock.test.rotation")
                 for i in range(50):
-                    logger.info(f"Mensagem de teste número {i} com texto extra")
+                    logger.info("Mensagem de teste número %s com texto extra", i)
+
+                for handler in logging.getLogger("timeblock").handlers:
+                    handler.flush()
 
                 backups = list(Path(tmpdir).glob("test.jsonl.*"))
                 assert len(backups) > 0
@@ -326,3 +333,125 @@ class TestBROBS001NoStderrLeak:
             f"Handlers encontrados: {console_handlers}. "
             f"Streams: {[getattr(h, 'stream', None) for h in console_handlers]}"
         )
+
+
+@pytest.fixture
+def log_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Arquivo de log temporário via ATOMVS_LOG_FILE."""
+    path = tmp_path / "async.jsonl"
+    monkeypatch.setenv("ATOMVS_LOG_FILE", str(path))
+    return path
+
+
+def _flush() -> None:
+    for handler in logging.getLogger("timeblock").handlers:
+        handler.flush()
+
+
+def _records(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestBROBS002AsyncFileLogging:
+    """BR-OBS-002: arquivo escrito por thread de fundo, fora da thread que loga."""
+
+    def test_br_obs_002_slow_disk_does_not_block_caller(self, log_path: Path):
+        """Escrita lenta no arquivo não atrasa a chamada de log."""
+        configure_logging(console=False, log_file=True)
+        original_emit = logger_module._BatchedRotatingFileHandler.emit
+
+        def slow_emit(handler, record):
+            time.sleep(0.2)
+            original_emit(handler, record)
+
+        with patch.object(logger_module._BatchedRotatingFileHandler, "emit", slow_emit):
+            start = time.perf_counter()
+            get_logger("timeblock.test.async").info("Tecla processada")
+            elapsed = time.perf_counter() - start
+            _flush()
+
+        assert elapsed < 0.1
+        assert _records(log_path)[0]["message"] == "Tecla processada"
+
+    def test_br_obs_002_records_written_by_writer_thread(self, log_path: Path):
+        """Serialização e escrita acontecem na thread timeblock-log-writer."""
+        configure_logging(console=False, log_file=True)
+        threads = []
+        original_emit = logger_module._BatchedRotatingFileHandler.emit
+
+        def recording_emit(handler, record):
+            threads.append(threading.current_thread().name)
+            original_emit(handler, record)
+
+        with patch.object(logger_module._BatchedRotatingFileHandler, "emit", recording_emit):
+            get_logger("timeblock.test.async").info("Registro")
+            _flush()
+
+        assert threads == ["timeblock-log-writer"]
+
+    def test_br_obs_002_backlog_flushed_in_batches(self, log_path: Path):
+        """Registros acumulados são escritos com um flush por lote."""
+        configure_logging(console=False, log_file=True)
+        release = threading.Event()
+        original_emit = logger_module._BatchedRotatingFileHandler.emit
+        original_flush = logger_module._BatchedRotatingFileHandler.flush_batch
+        flushes = []
+
+        def blocking_emit(handler, record):
+            release.wait()
+            original_emit(handler, record)
+
+        def counting_flush(handler):
+            flushes.append(1)
+            original_flush(handler)
+
+        with (
+            patch.object(logger_module._BatchedRotatingFileHandler, "emit", blocking_emit),
+            patch.object(logger_module._BatchedRotatingFileHandler, "flush_batch", counting_flush),
+        ):
+            logger = get_logger("timeblock.test.async")
+            for i in range(100):
+                logger.info("Registro %s", i)
+            release.set()
+            _flush()
+
+        assert len(_records(log_path)) == 100
+        assert len(flushes) <= 2
+
+    def test_br_obs_002_message_resolved_at_call_time(self, log_path: Path):
+        """Argumentos mutáveis são interpolados no momento da chamada."""
+        configure_logging(console=False, log_file=True)
+        items = ["a"]
+
+        get_logger("timeblock.test.async").info("Itens: %s", items)
+        items.append("b")
+        _flush()
+
+        assert _records(log_path)[0]["message"] == "Itens: ['a']"
+
+    def test_br_obs_002_exception_traceback_kept(self, log_path: Path):
+        """logger.exception grava o traceback no JSON."""
+        configure_logging(console=False, log_file=True)
+
+        try:
+            raise ValueError("falhou")
+        except ValueError:
+            get_logger("timeblock.test.async").exception("Erro no service")
+        _flush()
+
+        record = _records(log_path)[0]
+        assert record["message"] == "Erro no service"
+        assert "ValueError: falhou" in record["exc_info"]
+
+    def test_br_obs_002_close_drains_queue(self, log_path: Path):
+        """Fechar os handlers escreve tudo o que ainda está na fila."""
+        configure_logging(console=False, log_file=True)
+        handler = logging.getLogger("timeblock").handlers[0]
+        logger = get_logger("timeblock.test.async")
+        for i in range(500):
+            logger.info("Registro %s", i)
+
+        _reset_for_testing()
+
+        assert len(_records(log_path)) == 500
+        assert not handler.writer.is_alive()